@@ -0,0 +1,118 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+"""
+Pushes candles into full candles managers and reads a window after each new candle.
+Compares the ring buffer CandlesManager with the previous shifting arrays implementation.
+
+Usage: PYTHONPATH=. python benchmarks/candles_manager_benchmark.py [--managers 500] [--candles 1000000] [--window 200]
+"""
+import argparse
+import time
+
+import numpy as np
+
+import octobot_commons.data_util as data_util
+import octobot_commons.enums as enums
+
+import octobot_trading.exchange_data as exchange_data
+
+
+class ShiftingCandlesManager:
+    """
+    Previous CandlesManager storage: one array per price index, shifted on each new candle once full
+    and copied on each read.
+    """
+
+    def __init__(self, max_candles_count):
+        self.max_candles_count = max_candles_count
+        self.index = 0
+        self.reached_max = False
+        self.candles = [
+            np.full(max_candles_count, fill_value=np.nan, dtype=np.float64)
+            for _ in enums.PriceIndexes
+        ]
+
+    def add_new_candle(self, new_candle_data):
+        if new_candle_data[enums.PriceIndexes.IND_PRICE_TIME.value] in \
+           self.candles[enums.PriceIndexes.IND_PRICE_TIME.value]:
+            return
+        if self.reached_max:
+            self.candles = [
+                data_util.shift_value_array(values, -1, np.nan, np.float64)
+                for values in self.candles
+            ]
+        for price_index in enums.PriceIndexes:
+            self.candles[price_index.value][self.index] = new_candle_data[price_index.value]
+        if self.index < self.max_candles_count - 1:
+            self.index += 1
+        else:
+            self.reached_max = True
+
+    def get_symbol_close_candles(self, limit=-1):
+        max_limit = self.max_candles_count if self.reached_max else self.index
+        return np.array(
+            self.candles[enums.PriceIndexes.IND_PRICE_CLOSE.value][max(0, max_limit - limit): max_limit],
+            dtype=np.float64
+        )
+
+
+def _get_candle(candle_time):
+    return [candle_time, 1.0, 2.0, 0.5, 1.5, 100.0]
+
+
+def _fill(manager, max_candles_count):
+    for candle_time in range(max_candles_count):
+        manager.add_new_candle(_get_candle(candle_time))
+
+
+def _run(managers, candles_count, max_candles_count, window):
+    start_time = max_candles_count
+    t0 = time.perf_counter()
+    for candle_index in range(candles_count // len(managers)):
+        candle = _get_candle(start_time + candle_index)
+        for manager in managers:
+            manager.add_new_candle(candle)
+            manager.get_symbol_close_candles(window)
+    return time.perf_counter() - t0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="CandlesManager benchmark")
+    parser.add_argument("--managers", type=int, default=500)
+    parser.add_argument("--candles", type=int, default=1_000_000)
+    parser.add_argument("--max-candles", type=int, default=exchange_data.CandlesManager.MAX_CANDLES_COUNT)
+    parser.add_argument("--window", type=int, default=200)
+    args = parser.parse_args()
+    # CandlesManager never stores less than MAX_CANDLES_COUNT candles
+    args.max_candles = max(args.max_candles, exchange_data.CandlesManager.MAX_CANDLES_COUNT)
+
+    results = {}
+    for name, factory in (
+        ("shifting arrays", ShiftingCandlesManager),
+        ("ring buffer", lambda max_candles_count: exchange_data.CandlesManager(max_candles_count=max_candles_count)),
+    ):
+        managers = [factory(args.max_candles) for _ in range(args.managers)]
+        for manager in managers:
+            _fill(manager, args.max_candles)
+        results[name] = _run(managers, args.candles, args.max_candles, args.window)
+        print(f"{name}: {args.candles} candles over {args.managers} full managers "
+              f"({args.max_candles} candles each) in {results[name]:.2f}s "
+              f"({results[name] / args.candles * 1e6:.2f}us per candle)")
+    print(f"speedup: {results['shifting arrays'] / results['ring buffer']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
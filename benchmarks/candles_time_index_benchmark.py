@@ -0,0 +1,101 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+"""
+Micro-benchmark of candle timestamp lookups on a full CandlesManager (MAX_CANDLES_IN_RAM candles):
+- upserting the in-construction candle (websocket candle ticks)
+- de-duplicating a history refill (add_old_and_new_candles)
+Compares the time index with the previous linear scans over time_candles.
+
+Usage: PYTHONPATH=. python benchmarks/candles_time_index_benchmark.py [--iterations 10000] [--refill 500]
+"""
+import argparse
+import time
+
+import octobot_commons.enums as enums
+
+import octobot_trading.exchange_data as exchange_data
+
+
+def _scan_upsert_candle(candles_manager, updated_candle):
+    # previous CandlesManager.upsert_candle lookup
+    updated_candle_time = updated_candle[enums.PriceIndexes.IND_PRICE_TIME.value]
+    for index, candle_time in enumerate(candles_manager.time_candles):
+        if candle_time == updated_candle_time:
+            return index
+    return None
+
+
+def _scan_refill(candles_manager, candles):
+    # previous CandlesManager.add_old_and_new_candles + _should_add_new_candle checks
+    return [
+        candle
+        for candle in candles
+        if candle[enums.PriceIndexes.IND_PRICE_TIME.value] not in candles_manager.time_candles
+        and candle[enums.PriceIndexes.IND_PRICE_TIME.value] not in candles_manager.time_candles
+    ]
+
+
+def _indexed_upsert_candle(candles_manager, updated_candle):
+    candles_manager.upsert_candle(updated_candle)
+
+
+def _indexed_refill(candles_manager, candles):
+    candles_manager.add_old_and_new_candles(candles)
+
+
+def _get_candle(candle_time):
+    return [candle_time, 1.0, 2.0, 0.5, 1.5, 100.0]
+
+
+def _time(name, func, iterations, *args):
+    t0 = time.perf_counter()
+    for _ in range(iterations):
+        func(*args)
+    elapsed = time.perf_counter() - t0
+    print(f"{name}: {elapsed / iterations * 1e6:.2f}us per call")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="CandlesManager time index benchmark")
+    parser.add_argument("--iterations", type=int, default=10000)
+    parser.add_argument("--refill", type=int, default=500)
+    args = parser.parse_args()
+
+    candles_manager = exchange_data.CandlesManager()
+    candles_count = candles_manager.max_candles_count
+    candles_manager.replace_all_candles([_get_candle(candle_time) for candle_time in range(candles_count)])
+    print(f"{candles_count} candles in manager")
+
+    # the in-construction candle is the last one
+    in_construction_candle = _get_candle(candles_count - 1)
+    scan = _time("upsert_candle (linear scan)", _scan_upsert_candle, args.iterations,
+                 candles_manager, in_construction_candle)
+    indexed = _time("upsert_candle (time index)", _indexed_upsert_candle, args.iterations,
+                    candles_manager, in_construction_candle)
+    print(f"upsert_candle speedup: {scan / indexed:.2f}x")
+
+    refill_candles = [_get_candle(candle_time) for candle_time in range(candles_count - args.refill, candles_count)]
+    refill_iterations = max(1, args.iterations // args.refill)
+    scan = _time(f"{args.refill} candles refill (linear scan)", _scan_refill, refill_iterations,
+                 candles_manager, refill_candles)
+    indexed = _time(f"{args.refill} candles refill (time index)", _indexed_refill, refill_iterations,
+                    candles_manager, refill_candles)
+    print(f"refill speedup: {scan / indexed:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+"""
+Micro-benchmark of historical portfolio values storage: memory and time frame window queries of
+HistoricalPortfolioValues columns compared with the previous SortedDict of HistoricalAssetValue.
+
+Usage: PYTHONPATH=. python benchmarks/historical_portfolio_values_benchmark.py [--values 20000] [--assets 50]
+"""
+import argparse
+import time
+import tracemalloc
+
+import sortedcontainers
+
+import octobot_trading.personal_data as personal_data
+
+
+MINUTE = 60
+HOUR = 60 * MINUTE
+DAY = 24 * HOUR
+
+
+def _is_timestamp_relevant(timestamp, time_frame_seconds, sorted_available_timestamps):
+    # previous HistoricalPortfolioValueManager._is_timestamp_relevant
+    if timestamp % time_frame_seconds == 0:
+        return True
+    current_timestamp_index = sorted_available_timestamps.index(timestamp)
+    allowed_delta = time_frame_seconds / 2
+    previous_timestamp = sorted_available_timestamps[current_timestamp_index - 1] \
+        if current_timestamp_index > 0 else 0
+    next_timestamp = sorted_available_timestamps[current_timestamp_index + 1] \
+        if current_timestamp_index < len(sorted_available_timestamps) - 1 else (timestamp + allowed_delta)
+    return previous_timestamp + allowed_delta <= timestamp <= next_timestamp - allowed_delta
+
+
+def _fill_sorted_dict(rows):
+    # previous HistoricalPortfolioValueManager._load_historical_values
+    return sortedcontainers.SortedDict({
+        row[personal_data.HistoricalAssetValue.TIMESTAMP_KEY]:
+            personal_data.create_historical_asset_value_from_dict_like_object(
+                personal_data.HistoricalAssetValue, row
+            )
+        for row in rows
+    })
+
+
+def _fill_columns(rows):
+    values = personal_data.HistoricalPortfolioValues([HOUR, DAY])
+    for row in rows:
+        values.set_value(
+            row[personal_data.HistoricalAssetValue.TIMESTAMP_KEY], row[personal_data.HistoricalAssetValue.VALUES_KEY]
+        )
+    return values
+
+
+def _query_sorted_dict(values, currency, time_frame_seconds, from_timestamp, to_timestamp):
+    sorted_available_timestamps = list(values)
+    return {
+        timestamp: value.get(currency)
+        for timestamp, value in values.items()
+        if from_timestamp <= timestamp <= to_timestamp
+        and _is_timestamp_relevant(timestamp, time_frame_seconds, sorted_available_timestamps)
+    }
+
+
+def _query_columns(values, currency, time_frame_seconds, from_timestamp, to_timestamp):
+    start_index = values.timestamps.searchsorted(from_timestamp, side="left")
+    end_index = values.timestamps.searchsorted(to_timestamp, side="right")
+    relevant = values.get_time_frame_relevance(time_frame_seconds)[start_index:end_index]
+    return (
+        values.timestamps[start_index:end_index][relevant],
+        values.get_column(currency)[start_index:end_index][relevant],
+    )
+
+
+def _measure(fill, query, rows, queries):
+    t0 = time.perf_counter()
+    values = fill(rows)
+    fill_elapsed = time.perf_counter() - t0
+    del values
+    tracemalloc.start()
+    values = fill(rows)
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    t0 = time.perf_counter()
+    results = [query(values, *query_args) for query_args in queries]
+    return fill_elapsed, memory, time.perf_counter() - t0, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Historical portfolio values storage benchmark")
+    parser.add_argument("--values", type=int, default=20000)
+    parser.add_argument("--assets", type=int, default=50)
+    parser.add_argument("--queries", type=int, default=5)
+    args = parser.parse_args()
+
+    currencies = [f"COIN{index}" for index in range(args.assets)]
+    # stored documents
+    rows = [
+        {
+            personal_data.HistoricalAssetValue.TIMESTAMP_KEY: index * MINUTE,
+            personal_data.HistoricalAssetValue.VALUES_KEY: {
+                currency: (index + asset_index) / 7 for asset_index, currency in enumerate(currencies)
+            }
+        }
+        for index in range(args.values)
+    ]
+    last_timestamp = args.values * MINUTE
+    queries = [
+        (currencies[index % args.assets], (HOUR, DAY)[index % 2], last_timestamp * index // (args.queries * 2),
+         last_timestamp)
+        for index in range(args.queries)
+    ]
+    print(f"{args.values} values of {args.assets} assets, {args.queries} time frame window queries")
+    results = {}
+    for name, fill, query in (
+        ("sorted dict", _fill_sorted_dict, _query_sorted_dict),
+        ("columns", _fill_columns, _query_columns),
+    ):
+        fill_elapsed, memory, query_elapsed, query_results = results[name] = _measure(fill, query, rows, queries)
+        print(f"[{name}] insertion: {fill_elapsed:.2f}s, memory: {memory / 1e6:.1f}MB, "
+              f"queries: {query_elapsed * 1e3:.2f}ms")
+    for legacy_result, (timestamps, values) in zip(results["sorted dict"][3], results["columns"][3]):
+        assert list(legacy_result) == timestamps.tolist(), "different timestamps"
+        assert [float(value) for value in legacy_result.values()] == values.tolist(), "different values"
+    print(f"memory reduction: {results['sorted dict'][1] / results['columns'][1]:.2f}x, "
+          f"queries speedup: {results['sorted dict'][2] / results['columns'][2]:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
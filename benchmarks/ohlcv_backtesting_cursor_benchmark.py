@@ -0,0 +1,139 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+"""
+Micro-benchmark of backtesting candles selection on each backtesting clock tick, as in
+OHLCVUpdaterSimulator.handle_timestamp: OHLCVBacktestingCursor blocks compared with the previous
+ExchangeDataImporter.get_ohlcv_from_timestamps chronological cache, on a generated backtesting data file.
+
+Usage: PYTHONPATH=. python benchmarks/ohlcv_backtesting_cursor_benchmark.py [--pairs 10] [--minutes 20000]
+"""
+import argparse
+import asyncio
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+
+import octobot_backtesting.enums as backtesting_enums
+import octobot_backtesting.importers as importers
+import octobot_commons.enums as commons_enums
+
+import octobot_trading.exchange_data as exchange_data
+
+
+EXCHANGE_NAME = "binance"
+MINUTE = 60
+TIME_FRAMES = [commons_enums.TimeFrames.ONE_MINUTE, commons_enums.TimeFrames.FIFTEEN_MINUTES,
+               commons_enums.TimeFrames.ONE_HOUR, commons_enums.TimeFrames.FOUR_HOURS]
+START_TIMESTAMP = 1640995200
+
+
+async def _create_data_file(file_path, pairs, minutes):
+    open(file_path, "w").close()
+    importer = importers.ExchangeDataImporter({}, file_path)
+    importer.load_database()
+    await importer.database.initialize()
+    for pair in pairs:
+        for time_frame in TIME_FRAMES:
+            duration = commons_enums.TimeFramesMinutes[time_frame] * MINUTE
+            candles = [
+                [START_TIMESTAMP + index * duration, 100 + index, 101 + index, 99 + index, 100.5 + index, 12.5]
+                for index in range(minutes * MINUTE // duration)
+            ]
+            await importer.database.insert_all(
+                backtesting_enums.ExchangeDataTables.OHLCV,
+                timestamp=[candle[0] for candle in candles],
+                exchange_name=EXCHANGE_NAME, cryptocurrency=pair.split("/")[0], symbol=pair,
+                time_frame=time_frame.value, candle=[json.dumps(candle) for candle in candles]
+            )
+    await importer.stop()
+
+
+def _importer_selector(importer, pairs):
+    # previous OHLCVUpdaterSimulator selection
+    async def select(pair, time_frame, inferior_timestamp, superior_timestamp):
+        return [
+            ohlcv[-1]
+            for ohlcv in await importer.get_ohlcv_from_timestamps(
+                exchange_name=EXCHANGE_NAME, symbol=pair, time_frame=time_frame,
+                inferior_timestamp=inferior_timestamp, superior_timestamp=superior_timestamp
+            )
+        ]
+    return select
+
+
+def _cursor_selector(importer, pairs):
+    return exchange_data.OHLCVBacktestingCursor(importer, EXCHANGE_NAME, pairs, TIME_FRAMES).get_candles
+
+
+async def _run_clock(get_selector, file_path, pairs, minutes, trace_memory):
+    importer = importers.ExchangeDataImporter({}, file_path)
+    importer.load_database()
+    await importer.database.initialize()
+    if trace_memory:
+        tracemalloc.start()
+    t0 = time.perf_counter()
+    select = get_selector(importer, pairs)
+    selected_candles = 0
+    last_timestamp = START_TIMESTAMP - 1
+    for timestamp in range(START_TIMESTAMP, START_TIMESTAMP + minutes * MINUTE, MINUTE):
+        for pair in pairs:
+            for time_frame in TIME_FRAMES:
+                selected_candles += len(await select(
+                    pair, time_frame, last_timestamp + 1,
+                    timestamp + (MINUTE if time_frame is commons_enums.TimeFrames.ONE_MINUTE else 0)
+                ))
+        last_timestamp = timestamp
+    elapsed = time.perf_counter() - t0
+    peak_memory = 0
+    if trace_memory:
+        peak_memory = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    await importer.stop()
+    return elapsed, peak_memory, selected_candles
+
+
+async def _main(args):
+    pairs = [f"COIN{index}/USDT" for index in range(args.pairs)]
+    with tempfile.TemporaryDirectory() as directory:
+        file_path = os.path.join(directory, "benchmark.data")
+        await _create_data_file(file_path, pairs, args.minutes)
+        print(f"{args.pairs} pairs, {len(TIME_FRAMES)} time frames, {args.minutes} 1m clock ticks")
+        results = {}
+        for name, get_selector in (
+            ("importer cache", _importer_selector),
+            ("cursor", _cursor_selector),
+        ):
+            elapsed, _, selected_candles = await _run_clock(get_selector, file_path, pairs, args.minutes, False)
+            _, peak_memory, _ = await _run_clock(get_selector, file_path, pairs, args.minutes, True)
+            results[name] = elapsed, peak_memory, selected_candles
+            print(f"[{name}] clock: {elapsed:.2f}s, peak memory: {peak_memory / 1e6:.1f}MB, "
+                  f"{selected_candles} selected candles")
+        assert results["importer cache"][2] == results["cursor"][2], "different selections"
+        print(f"speedup: {results['importer cache'][0] / results['cursor'][0]:.2f}x, "
+              f"peak memory reduction: {results['importer cache'][1] / results['cursor'][1]:.2f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Backtesting candles selection benchmark")
+    parser.add_argument("--pairs", type=int, default=10)
+    parser.add_argument("--minutes", type=int, default=20000)
+    asyncio.run(_main(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+"""
+Backtesting clock benchmark of OrderBookUpdaterSimulator order books selection on a generated full-depth
+order book data file: BacktestingDataPrefetcher compared with one importer query per traded pair and
+per clock tick.
+
+Usage: PYTHONPATH=. python benchmarks/order_book_prefetch_benchmark.py [--pairs 3] [--minutes 1000] [--depth 500]
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import tempfile
+import time
+
+import octobot_backtesting.enums as backtesting_enums
+import octobot_backtesting.importers as importers
+
+import octobot_trading.util as util
+
+
+EXCHANGE_NAME = "binance"
+MINUTE = 60
+START_TIMESTAMP = 1640995200
+
+
+async def _create_data_file(file_path, pairs, minutes, depth, snapshots_per_minute):
+    open(file_path, "w").close()
+    importer = importers.ExchangeDataImporter({}, file_path)
+    importer.load_database()
+    await importer.database.initialize()
+    timestamps = [
+        START_TIMESTAMP + index * MINUTE // snapshots_per_minute
+        for index in range(minutes * snapshots_per_minute)
+    ]
+    for pair in pairs:
+        asks, bids = [], []
+        for _ in timestamps:
+            price = random.uniform(100, 200)
+            asks.append(json.dumps([[price + index * 0.01, random.random()] for index in range(depth)]))
+            bids.append(json.dumps([[price - index * 0.01, random.random()] for index in range(depth)]))
+        await importer.database.insert_all(
+            backtesting_enums.ExchangeDataTables.ORDER_BOOK,
+            timestamp=timestamps,
+            exchange_name=EXCHANGE_NAME, cryptocurrency=pair.split("/")[0], symbol=pair, asks=asks, bids=bids
+        )
+    await importer.stop()
+
+
+def _query_selector(importer):
+    # one query per pair and per clock tick
+    async def select(pair, timestamp):
+        timestamps, operations = importers.get_operations_from_timestamps(timestamp + MINUTE - 1, timestamp)
+        order_books = await importer.get_order_book(
+            exchange_name=EXCHANGE_NAME, symbol=pair, timestamps=timestamps, operations=operations
+        )
+        return min(order_books, key=lambda order_book: order_book[0]) if order_books else None
+    return select
+
+
+def _prefetcher_selector(importer):
+    prefetcher = util.BacktestingDataPrefetcher(
+        importer, backtesting_enums.ExchangeDataTables.ORDER_BOOK, EXCHANGE_NAME, MINUTE
+    )
+    return prefetcher.get_next_data
+
+
+async def _run_clock(get_selector, file_path, pairs, minutes):
+    importer = importers.ExchangeDataImporter({}, file_path)
+    importer.load_database()
+    await importer.database.initialize()
+    importer.available_data_types = [backtesting_enums.ExchangeDataTables.ORDER_BOOK]
+    t0 = time.perf_counter()
+    select = get_selector(importer)
+    selected_times = []
+    for timestamp in range(START_TIMESTAMP, START_TIMESTAMP + minutes * MINUTE, MINUTE):
+        for pair in pairs:
+            selected_times.append((await select(pair, timestamp))[0])
+    elapsed = time.perf_counter() - t0
+    await importer.stop()
+    return elapsed, selected_times
+
+
+async def _main(args):
+    pairs = [f"COIN{index}/USDT" for index in range(args.pairs)]
+    with tempfile.TemporaryDirectory() as directory:
+        file_path = os.path.join(directory, "benchmark.data")
+        await _create_data_file(file_path, pairs, args.minutes, args.depth, args.snapshots_per_minute)
+        print(f"{args.pairs} pairs, {args.minutes} 1m clock ticks, {args.snapshots_per_minute} order books "
+              f"of {args.depth} levels per minute, data file: {os.path.getsize(file_path) / 1e6:.1f}MB")
+        results = {}
+        for name, get_selector in (
+            ("query per tick", _query_selector),
+            ("prefetcher", _prefetcher_selector),
+        ):
+            elapsed, selected_times = await _run_clock(get_selector, file_path, pairs, args.minutes)
+            results[name] = elapsed, selected_times
+            print(f"[{name}] clock: {elapsed:.2f}s")
+        assert results["query per tick"][1] == results["prefetcher"][1], "different selections"
+        print(f"speedup: {results['query per tick'][0] / results['prefetcher'][0]:.2f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Backtesting order books selection benchmark")
+    parser.add_argument("--pairs", type=int, default=3)
+    parser.add_argument("--minutes", type=int, default=1000)
+    parser.add_argument("--depth", type=int, default=500)
+    parser.add_argument("--snapshots-per-minute", type=int, default=4)
+    asyncio.run(_main(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
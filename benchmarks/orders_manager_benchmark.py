@@ -0,0 +1,186 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+"""
+Micro-benchmark of OrdersManager lookups with many orders spread over many symbols:
+- get_open_orders(symbol) for each symbol
+- get_order / has_order from exchange order id
+- has_order from order id
+- get_order_from_group
+- orders status changes (which have to update indexes)
+Compares the secondary indexes with the previous scans over every order.
+
+Usage: PYTHONPATH=. python benchmarks/orders_manager_benchmark.py [--orders 20000] [--symbols 300] [--lookups 2000]
+"""
+import argparse
+import collections
+import random
+import time
+import types
+
+import octobot_trading.constants as constants
+import octobot_trading.enums as enums
+import octobot_trading.personal_data as personal_data
+
+
+class ScanOrdersManager(personal_data.OrdersManager):
+    # previous OrdersManager lookups
+    def get_order(self, order_id, exchange_order_id=None):
+        if order_id is None:
+            for order in self.orders.values():
+                if order.exchange_order_id == exchange_order_id:
+                    return order
+            raise KeyError(exchange_order_id)
+        return self.orders[order_id]
+
+    def get_order_from_group(self, group_name):
+        return [
+            order
+            for order in self.orders.values()
+            if order.order_group is not None and order.order_group.name == group_name
+        ]
+
+    def has_order(self, order_id, exchange_order_id=None) -> bool:
+        if order_id is None:
+            try:
+                self.get_order(None, exchange_order_id=exchange_order_id)
+                return True
+            except KeyError:
+                return False
+        return order_id in set(self.orders.keys())
+
+    def _select_orders(
+        self, state=None, symbol=None, since=constants.NO_DATA_LIMIT,
+        until=constants.NO_DATA_LIMIT, limit=constants.NO_DATA_LIMIT, tag=None):
+        orders = [
+            order
+            for order in self.orders.values()
+            if (
+                    (state is None or order.status == state) and
+                    (symbol is None or (symbol and order.symbol == symbol)) and
+                    (since == constants.NO_DATA_LIMIT or (since and order.timestamp >= since)) and
+                    (until == constants.NO_DATA_LIMIT or (until and order.timestamp <= until)) and
+                    (tag is None or order.tag == tag)
+            )
+        ]
+        return orders if limit == constants.NO_DATA_LIMIT else orders[0:limit]
+
+
+def _get_trader():
+    # minimal trader to create orders without any exchange
+    exchange_manager = types.SimpleNamespace(exchange=types.SimpleNamespace(get_exchange_current_time=lambda: 0))
+    return types.SimpleNamespace(simulate=True, exchange_manager=exchange_manager,
+                                 parse_order_id=lambda order_id: order_id)
+
+
+def _create_orders_manager(manager_class, orders_count, symbols, groups_count, use_indexes):
+    trader = _get_trader()
+    orders_manager = manager_class(trader)
+    if not use_indexes:
+        # previous orders storage: orders are not notifying any index
+        orders_manager._orders = collections.OrderedDict()
+    rand = random.Random(0)
+    groups = [personal_data.OneCancelsTheOtherOrderGroup(f"group_{index}", orders_manager)
+              for index in range(groups_count)]
+    for index in range(orders_count):
+        order = personal_data.Order(trader)
+        order.order_id = f"order_{index}"
+        order.exchange_order_id = f"exchange_order_{index}"
+        order.symbol = symbols[index % len(symbols)]
+        order.status = enums.OrderStatus.OPEN if rand.random() < 0.8 else enums.OrderStatus.CLOSED
+        order.order_group = groups[index % groups_count] if rand.random() < 0.1 else None
+        orders_manager.orders[order.order_id] = order
+    return orders_manager
+
+
+def _time(name, func, *args):
+    t0 = time.perf_counter()
+    func(*args)
+    elapsed = time.perf_counter() - t0
+    print(f"{name}: {elapsed * 1e3:.2f}ms")
+    return elapsed
+
+
+def _get_open_orders(orders_manager, symbols):
+    for symbol in symbols:
+        orders_manager.get_open_orders(symbol=symbol)
+
+
+def _get_orders_from_exchange_order_id(orders_manager, exchange_order_ids):
+    for exchange_order_id in exchange_order_ids:
+        if orders_manager.has_order(None, exchange_order_id=exchange_order_id):
+            orders_manager.get_order(None, exchange_order_id=exchange_order_id)
+
+
+def _has_orders(orders_manager, order_ids):
+    for order_id in order_ids:
+        orders_manager.has_order(order_id)
+
+
+def _get_orders_from_group(orders_manager, group_names):
+    for group_name in group_names:
+        orders_manager.get_order_from_group(group_name)
+
+
+def _update_statuses(orders_manager, order_ids):
+    for order_id in order_ids:
+        order = orders_manager.get_order(order_id)
+        order.status = enums.OrderStatus.PENDING_CANCEL
+        order.status = enums.OrderStatus.OPEN
+
+
+def main():
+    parser = argparse.ArgumentParser(description="OrdersManager secondary indexes benchmark")
+    parser.add_argument("--orders", type=int, default=20000)
+    parser.add_argument("--symbols", type=int, default=300)
+    parser.add_argument("--lookups", type=int, default=2000)
+    args = parser.parse_args()
+
+    symbols = [f"COIN{index}/USDT" for index in range(args.symbols)]
+    groups_count = max(1, args.orders // 100)
+    rand = random.Random(1)
+    order_indexes = [rand.randrange(args.orders) for _ in range(args.lookups)]
+    exchange_order_ids = [f"exchange_order_{index}" for index in order_indexes]
+    order_ids = [f"order_{index}" for index in order_indexes]
+    group_names = [f"group_{rand.randrange(groups_count)}" for _ in range(args.lookups)]
+    print(f"{args.orders} orders over {args.symbols} symbols, {args.lookups} lookups")
+
+    results = {}
+    for name, manager_class, use_indexes in (
+        ("scan", ScanOrdersManager, False),
+        ("indexes", personal_data.OrdersManager, True),
+    ):
+        orders_manager = _create_orders_manager(manager_class, args.orders, symbols, groups_count, use_indexes)
+        results[name] = [
+            _time(f"[{name}] get_open_orders(symbol) x {len(symbols)}", _get_open_orders, orders_manager, symbols),
+            _time(f"[{name}] has_order + get_order(exchange_order_id) x {args.lookups}",
+                  _get_orders_from_exchange_order_id, orders_manager, exchange_order_ids),
+            _time(f"[{name}] has_order(order_id) x {args.lookups}", _has_orders, orders_manager, order_ids),
+            _time(f"[{name}] get_order_from_group x {args.lookups}",
+                  _get_orders_from_group, orders_manager, group_names),
+            _time(f"[{name}] status updates x {args.lookups * 2}", _update_statuses, orders_manager, order_ids),
+        ]
+    for operation, scan, indexed in zip(
+        ("get_open_orders", "exchange_order_id lookups", "order_id lookups", "groups lookups"),
+        results["scan"], results["indexes"]
+    ):
+        print(f"{operation} speedup: {scan / indexed:.2f}x")
+    # status updates are slower as indexes have to be maintained
+    print(f"status updates indexes maintenance: "
+          f"{(results['indexes'][-1] - results['scan'][-1]) / (args.lookups * 2) * 1e6:.2f}us per update")
+
+
+if __name__ == "__main__":
+    main()
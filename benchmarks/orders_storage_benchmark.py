@@ -0,0 +1,166 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+"""
+Write amplification benchmark of OrdersStorage on a grid of open orders: each fill closes an order and creates
+a new one on the other side, both triggering an ORDERS channel update.
+Compares the open orders snapshot rewritten on each update with the orders delta log, then checks that the
+startup orders restored from the database are the same.
+
+Usage: PYTHONPATH=. python benchmarks/orders_storage_benchmark.py [--orders 500] [--fills 500]
+"""
+import argparse
+import asyncio
+import decimal
+import json
+import time
+import types
+
+import octobot_trading.enums as enums
+import octobot_trading.personal_data as personal_data
+import octobot_trading.storage as storage
+
+
+class CountingDatabase:
+    # in memory tables, counting written documents and their serialized size
+    def __init__(self):
+        self.tables = {}
+        self.written_documents = 0
+        self.written_bytes = 0
+
+    async def all(self, table_name):
+        return list(self.tables.get(table_name, []))
+
+    async def log(self, table_name, row, cache=True):
+        self._count([row])
+        self.tables.setdefault(table_name, []).append(row)
+
+    async def replace_all(self, table_name, rows, cache=True):
+        self._count(rows)
+        self.tables[table_name] = list(rows)
+
+    async def delete_all(self, table_name):
+        self.tables[table_name] = []
+
+    async def flush(self):
+        pass
+
+    def _count(self, rows):
+        self.written_documents += len(rows)
+        self.written_bytes += sum(len(json.dumps(row)) for row in rows)
+
+
+class BenchmarkOrdersStorage(storage.OrdersStorage):
+    def __init__(self, exchange_manager, database, enable_delta_log):
+        super().__init__(exchange_manager)
+        self.database = database
+        self.ENABLE_DELTA_LOG = enable_delta_log
+
+    def should_store_data(self):
+        return True
+
+    def _get_db(self):
+        return self.database
+
+    async def on_order_update(self, order_dict):
+        # storage part of _live_callback
+        if self.ENABLE_DELTA_LOG:
+            await self._log_order_update(order_dict)
+        else:
+            await self._update_history()
+
+
+def _get_exchange_manager():
+    exchange_manager = types.SimpleNamespace(
+        exchange=types.SimpleNamespace(get_exchange_current_time=lambda: 0),
+        exchange_name="binance",
+        is_backtesting=True,    # write without the storage writer
+    )
+    trader = types.SimpleNamespace(simulate=True, exchange_manager=exchange_manager, allow_artificial_orders=False,
+                                   parse_order_id=lambda order_id: order_id)
+    exchange_manager.trader = trader
+    exchange_manager.exchange_personal_data = types.SimpleNamespace(
+        orders_manager=personal_data.OrdersManager(trader)
+    )
+    return exchange_manager, trader
+
+
+def _create_order(trader, index, side, price):
+    order = personal_data.Order(trader)
+    order.order_id = f"order_{index}"
+    order.exchange_order_id = f"exchange_order_{index}"
+    order.symbol = "BTC/USDT"
+    order.side = side
+    order.origin_price = price
+    order.origin_quantity = decimal.Decimal("0.01")
+    order.total_cost = order.origin_price * order.origin_quantity
+    order.status = enums.OrderStatus.OPEN
+    return order
+
+
+async def _run(orders_count, fills, enable_delta_log):
+    exchange_manager, trader = _get_exchange_manager()
+    orders_manager = exchange_manager.exchange_personal_data.orders_manager
+    database = CountingDatabase()
+    orders_storage = BenchmarkOrdersStorage(exchange_manager, database, enable_delta_log)
+    for index in range(orders_count):
+        side = enums.TradeOrderSide.BUY if index % 2 else enums.TradeOrderSide.SELL
+        order = _create_order(trader, index, side, decimal.Decimal(20000 + index))
+        orders_manager.orders[order.order_id] = order
+    await orders_storage._update_history()
+    database.written_documents = database.written_bytes = 0
+    t0 = time.perf_counter()
+    for fill in range(fills):
+        filled_order = orders_manager.get_order(f"order_{fill}")
+        filled_order.status = enums.OrderStatus.CLOSED
+        orders_manager.orders.pop(filled_order.order_id)
+        await orders_storage.on_order_update(filled_order.to_dict())
+        side = enums.TradeOrderSide.SELL if filled_order.side is enums.TradeOrderSide.BUY \
+            else enums.TradeOrderSide.BUY
+        new_order = _create_order(trader, orders_count + fill, side, filled_order.origin_price)
+        orders_manager.orders[new_order.order_id] = new_order
+        await orders_storage.on_order_update(new_order.to_dict())
+    elapsed = time.perf_counter() - t0
+    # restart: restore startup orders from the database
+    restored_storage = BenchmarkOrdersStorage(exchange_manager, database, enable_delta_log)
+    await restored_storage.on_start()
+    return elapsed, database, restored_storage.startup_orders
+
+
+def main():
+    parser = argparse.ArgumentParser(description="OrdersStorage write amplification benchmark")
+    parser.add_argument("--orders", type=int, default=500, help="open orders")
+    parser.add_argument("--fills", type=int, default=500)
+    args = parser.parse_args()
+    print(f"{args.orders} open orders, {args.fills} fills ({args.fills * 2} order updates)")
+
+    results = {}
+    for name, enable_delta_log in (("snapshot", False), ("delta log", True)):
+        elapsed, database, startup_orders = asyncio.run(_run(args.orders, args.fills, enable_delta_log))
+        results[name] = elapsed, database, startup_orders
+        print(f"[{name}] {elapsed:.2f}s, {database.written_documents / args.fills:.1f} documents "
+              f"({database.written_bytes / args.fills / 1024:.1f}KB) written per fill, "
+              f"{len(startup_orders)} restored open orders")
+    snapshot_elapsed, snapshot_database, snapshot_orders = results["snapshot"]
+    delta_elapsed, delta_database, delta_orders = results["delta log"]
+    assert snapshot_orders == delta_orders, "restored open orders are different"
+    print(f"write amplification reduction: "
+          f"{snapshot_database.written_documents / delta_database.written_documents:.2f}x documents, "
+          f"{snapshot_database.written_bytes / delta_database.written_bytes:.2f}x bytes, "
+          f"speedup: {snapshot_elapsed / delta_elapsed:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+"""
+Micro-benchmark of PortfolioValueHolder current portfolio valuation on mark price updates with many assets,
+half of them being valued through a price bridge.
+Compares the incremental valuation with the previous evaluation of every currency on each update.
+
+Usage: PYTHONPATH=. python benchmarks/portfolio_valuation_benchmark.py [--assets 150] [--updates 5000]
+"""
+import argparse
+import decimal
+import random
+import time
+import types
+
+import octobot_trading.personal_data as personal_data
+
+
+REFERENCE_MARKET = "USDT"
+BRIDGE_CURRENCY = "BTC"
+
+
+class FullPortfolioValueHolder(personal_data.PortfolioValueHolder):
+    # previous valuation: every currency is evaluated on each update
+    def _update_portfolio_and_currencies_current_value(self):
+        self.portfolio_current_value = self._update_portfolio_current_value(
+            self.portfolio_manager.portfolio.portfolio)
+
+    def get_current_holdings_values(self):
+        holdings = self.get_current_crypto_currencies_values()
+        return {
+            currency: self._get_currency_value(self.portfolio_manager.portfolio.portfolio, currency, holdings)
+            for currency in holdings.keys()
+        }
+
+
+def _get_symbols(assets_count):
+    # half of the assets are quoted in the reference market, the other half in the bridge currency
+    return [f"{BRIDGE_CURRENCY}/{REFERENCE_MARKET}"] + [
+        f"COIN{index}/{REFERENCE_MARKET if index % 2 else BRIDGE_CURRENCY}"
+        for index in range(assets_count)
+    ]
+
+
+def _create_portfolio_manager(value_holder_class, symbols):
+    exchange_config = types.SimpleNamespace(traded_symbols=[], traded_symbol_pairs=symbols)
+    exchange_manager = types.SimpleNamespace(
+        exchange_name="benchmark", is_future=False, is_backtesting=True, exchange_config=exchange_config,
+        symbol_exists=lambda symbol: True
+    )
+    portfolio = personal_data.SpotPortfolio("benchmark", is_simulated=True)
+    for symbol in symbols:
+        currency = symbol.split("/")[0]
+        portfolio.portfolio[currency] = personal_data.SpotAsset(
+            name=currency, available=decimal.Decimal(10), total=decimal.Decimal(10)
+        )
+    portfolio.portfolio[REFERENCE_MARKET] = personal_data.SpotAsset(
+        name=REFERENCE_MARKET, available=decimal.Decimal(1000), total=decimal.Decimal(1000)
+    )
+    portfolio_manager = types.SimpleNamespace(
+        exchange_manager=exchange_manager, reference_market=REFERENCE_MARKET, portfolio=portfolio,
+        portfolio_profitability=types.SimpleNamespace(valuated_currencies=set()),
+        historical_portfolio_value_manager=None,
+    )
+    portfolio_manager.portfolio_value_holder = value_holder_class(portfolio_manager)
+    return portfolio_manager
+
+
+def _handle_mark_price_update(portfolio_manager, symbol, price):
+    # PortfolioManager.handle_mark_price_update calls without profitability computations
+    value_holder = portfolio_manager.portfolio_value_holder
+    value_holder.handle_profitability_recalculation(
+        value_holder.update_origin_crypto_currencies_values(symbol, price)
+    )
+
+
+def _run(value_holder_class, symbols, updates):
+    portfolio_manager = _create_portfolio_manager(value_holder_class, symbols)
+    for symbol in symbols:
+        _handle_mark_price_update(portfolio_manager, symbol, decimal.Decimal(2))
+    t0 = time.perf_counter()
+    for symbol, price in updates:
+        _handle_mark_price_update(portfolio_manager, symbol, price)
+    elapsed = time.perf_counter() - t0
+    value_holder = portfolio_manager.portfolio_value_holder
+    t0 = time.perf_counter()
+    for _ in range(len(updates)):
+        value_holder.get_current_holdings_values()
+    holdings_elapsed = time.perf_counter() - t0
+    return elapsed, holdings_elapsed, value_holder.portfolio_current_value, value_holder.get_current_holdings_values()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PortfolioValueHolder incremental valuation benchmark")
+    parser.add_argument("--assets", type=int, default=150)
+    parser.add_argument("--updates", type=int, default=5000)
+    args = parser.parse_args()
+
+    symbols = _get_symbols(args.assets)
+    rand = random.Random(0)
+    updates = [
+        (rand.choice(symbols), decimal.Decimal(rand.randint(1, 10000)) / 100)
+        for _ in range(args.updates)
+    ]
+    print(f"{args.assets} assets, {args.updates} mark price updates")
+    results = {}
+    for name, value_holder_class in (
+        ("full", FullPortfolioValueHolder),
+        ("incremental", personal_data.PortfolioValueHolder),
+    ):
+        elapsed, holdings_elapsed, portfolio_value, holdings_values = results[name] = \
+            _run(value_holder_class, symbols, updates)
+        print(f"[{name}] mark price updates: {elapsed * 1e3:.2f}ms ({elapsed / args.updates * 1e6:.2f}us per update), "
+              f"get_current_holdings_values: {holdings_elapsed * 1e3:.2f}ms, portfolio value: {portfolio_value}")
+    assert results["full"][2] == results["incremental"][2], "different portfolio values"
+    assert results["full"][3] == results["incremental"][3], "different holdings values"
+    print(f"mark price updates speedup: {results['full'][0] / results['incremental'][0]:.2f}x, "
+          f"get_current_holdings_values speedup: {results['full'][1] / results['incremental'][1]:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+"""
+Backtesting-like benchmark of PriceEventsManager with a grid of open limit orders per symbol:
+each candle close price (or a batch of recent trades per candle when --trades is set) is pushed to the symbol
+price events manager, every filled order is replaced by a new order on the other side of the price to keep
+the open orders count constant.
+Compares the sorted trigger index (and vectorized recent trades batches) with the previous linear scan over every
+event for every price.
+
+Usage: PYTHONPATH=. python benchmarks/price_events_benchmark.py [--symbols 3] [--orders 5000] [--candles 5000]
+       [--trades 0]
+"""
+import argparse
+import asyncio
+import decimal
+import random
+import time
+
+import octobot_trading.exchange_data as exchange_data
+from octobot_trading.enums import ExchangeConstantsOrderColumns as ECOC
+
+
+class LinearPriceEventsManager:
+    # previous PriceEventsManager events handling
+    def __init__(self):
+        self.events = []
+
+    def new_event(self, price, timestamp, trigger_above, allow_instant_fill=True):
+        event = asyncio.Event()
+        self.events.append((price, timestamp, event, trigger_above))
+        return event
+
+    def handle_recent_trades(self, recent_trades):
+        for recent_trade in recent_trades:
+            self.handle_price(decimal.Decimal(str(recent_trade[ECOC.PRICE.value])),
+                              recent_trade[ECOC.TIMESTAMP.value])
+
+    def handle_price(self, price, timestamp):
+        for event_to_set in self._check_events(price, timestamp):
+            event_to_set.set()
+            self.remove_event(event_to_set)
+
+    def remove_event(self, event_to_remove):
+        for price_event_data in self.events:
+            if event_to_remove in price_event_data:
+                return self.events.remove(price_event_data)
+
+    def _check_events(self, price, timestamp):
+        return [
+            event
+            for event_price, event_timestamp, event, trigger_above in self.events
+            if event_timestamp <= timestamp and
+            (
+                (trigger_above and event_price <= price) or
+                (not trigger_above and event_price >= price)
+            )
+        ]
+
+
+def _get_prices(candles, seed):
+    rand = random.Random(seed)
+    price = 10000.0
+    prices = []
+    for _ in range(candles):
+        price *= 1 + rand.gauss(0, 0.002)
+        prices.append(decimal.Decimal(f"{price:.2f}"))
+    return prices
+
+
+def _get_order_price(price, rand):
+    # orders are placed within 10% of the current price
+    return price * decimal.Decimal(f"{1 + rand.uniform(-0.1, 0.1):.5f}")
+
+
+def _get_recent_trades(prices, trades_per_candle, seed):
+    rand = random.Random(seed)
+    return [
+        [
+            {
+                ECOC.PRICE.value: float(price) * (1 + rand.uniform(-0.002, 0.002)),
+                ECOC.TIMESTAMP.value: timestamp,
+            }
+            for _ in range(trades_per_candle)
+        ]
+        for timestamp, price in enumerate(prices, 1)
+    ]
+
+
+def _run(manager_factory, symbols, orders, prices, recent_trades):
+    rand = random.Random(42)
+    managers = []
+    for _ in range(symbols):
+        manager = manager_factory()
+        open_events = {}
+        for _ in range(orders):
+            order_price = _get_order_price(prices[0], rand)
+            # sell orders wait for an upper price, buy orders for a lower one
+            open_events[manager.new_event(order_price, 0, order_price > prices[0], allow_instant_fill=False)] = \
+                order_price
+        managers.append((manager, open_events))
+
+    filled_orders = 0
+    t0 = time.perf_counter()
+    for timestamp, price in enumerate(prices, 1):
+        for manager, open_events in managers:
+            if recent_trades:
+                manager.handle_recent_trades(recent_trades[timestamp - 1])
+            else:
+                manager.handle_price(price, timestamp)
+            filled_events = [event for event in open_events if event.is_set()]
+            filled_orders += len(filled_events)
+            for event in filled_events:
+                open_events.pop(event)
+                order_price = _get_order_price(price, rand)
+                open_events[manager.new_event(order_price, timestamp, order_price > price,
+                                              allow_instant_fill=False)] = order_price
+            # a few orders are cancelled by strategies
+            if timestamp % 10 == 0:
+                cancelled_event = next(iter(open_events))
+                manager.remove_event(cancelled_event)
+                open_events.pop(cancelled_event)
+                order_price = _get_order_price(price, rand)
+                open_events[manager.new_event(order_price, timestamp, order_price > price,
+                                              allow_instant_fill=False)] = order_price
+    return time.perf_counter() - t0, filled_orders
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PriceEventsManager backtesting benchmark")
+    parser.add_argument("--symbols", type=int, default=3)
+    parser.add_argument("--orders", type=int, default=5000, help="open orders per symbol")
+    parser.add_argument("--candles", type=int, default=5000)
+    parser.add_argument("--trades", type=int, default=0, help="recent trades per candle, 0 to push close prices")
+    args = parser.parse_args()
+
+    prices = _get_prices(args.candles, 0)
+    recent_trades = _get_recent_trades(prices, args.trades, 1) if args.trades else None
+    print(f"{args.symbols} symbols, {args.orders} open orders per symbol, {args.candles} candles, "
+          f"{args.trades} recent trades per candle")
+    # filtering the filled events is the same for both implementations: it is included in both results
+    linear, linear_filled = _run(LinearPriceEventsManager, args.symbols, args.orders, prices, recent_trades)
+    print(f"linear scan: {linear:.2f}s ({linear_filled} filled orders)")
+    indexed, indexed_filled = _run(exchange_data.PriceEventsManager, args.symbols, args.orders, prices,
+                                   recent_trades)
+    print(f"sorted trigger index: {indexed:.2f}s ({indexed_filled} filled orders)")
+    print(f"speedup: {linear / indexed:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
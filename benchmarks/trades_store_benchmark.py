@@ -0,0 +1,195 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+"""
+Memory and aggregation benchmark of TradesManager trades history:
+- memory used by the stored trades (tracemalloc)
+- get_total_paid_fees and per-symbol trades count
+- trades lookups from order ids and completed trades PnL (all and by order id)
+Compares the compact and indexed TradesStore with the previous OrderedDict of Trade instances.
+
+Usage: PYTHONPATH=. python benchmarks/trades_store_benchmark.py [--trades 100000] [--symbols 50] [--lookups 100]
+"""
+import argparse
+import collections
+import decimal
+import gc
+import random
+import time
+import tracemalloc
+import types
+
+import octobot_trading.enums as enums
+import octobot_trading.personal_data as personal_data
+
+
+class DictTradesManager(personal_data.TradesManager):
+    # previous TradesManager trades storage and aggregations
+    def _reset_trades(self):
+        self.trades_initialized = False
+        self.trades = collections.OrderedDict()
+
+    def get_total_paid_fees(self):
+        total_fees = {}
+        for trade in self.trades.values():
+            if trade.fee is not None:
+                fee_cost = trade.fee[enums.FeePropertyColumns.COST.value]
+                fee_currency = trade.fee[enums.FeePropertyColumns.CURRENCY.value]
+                if fee_currency in total_fees:
+                    total_fees[fee_currency] += fee_cost
+                else:
+                    total_fees[fee_currency] = fee_cost
+        return total_fees
+
+    def _get_trades_count_by_symbols(self, trades=None):
+        return collections.Counter(
+            trade.symbol
+            for trade in (trades or self.trades.values())
+        )
+
+    def get_completed_trades_pnl(self, trades_history=None, selected_trades=None):
+        return self._get_trades_history_pnl(trades_history or self.get_trades(), selected_trades)
+
+    def get_trades(self, origin_order_id=None, exchange_order_id=None):
+        return [
+            trade
+            for trade in self.trades.values()
+            if (
+                (not origin_order_id or trade.origin_order_id == origin_order_id)
+                and (not exchange_order_id or trade.exchange_order_id == exchange_order_id)
+            )
+        ]
+
+
+def _get_trader():
+    # minimal trader to create trades without any exchange
+    exchange_manager = types.SimpleNamespace(exchange=types.SimpleNamespace(get_exchange_current_time=lambda: 0),
+                                             exchange_config=types.SimpleNamespace(
+                                                 is_saving_cancelled_orders_as_trade=True
+                                             ))
+    return types.SimpleNamespace(simulate=True, exchange_manager=exchange_manager,
+                                 parse_order_id=lambda order_id: order_id)
+
+
+def _create_trade(trader, index, symbols, rand):
+    trade = personal_data.Trade(trader)
+    trade.trade_id = trade.origin_order_id = f"trade_{index}"
+    trade.exchange_order_id = f"exchange_order_{index}"
+    trade.symbol = symbols[index % len(symbols)]
+    trade.currency, trade.market = trade.symbol.split("/")
+    trade.status = enums.OrderStatus.FILLED
+    trade.side = enums.TradeOrderSide.BUY if index % 2 else enums.TradeOrderSide.SELL
+    trade.trade_type = enums.TraderOrderType.BUY_LIMIT if index % 2 else enums.TraderOrderType.SELL_LIMIT
+    trade.exchange_trade_type = enums.TradeOrderType.LIMIT
+    trade.taker_or_maker = enums.ExchangeConstantsMarketPropertyColumns.MAKER.value
+    trade.executed_price = trade.origin_price = decimal.Decimal(f"{rand.uniform(1, 50000):.2f}")
+    trade.executed_quantity = trade.origin_quantity = decimal.Decimal(f"{rand.uniform(0.001, 10):.5f}")
+    trade.total_cost = trade.executed_price * trade.executed_quantity
+    trade.executed_time = trade.creation_time = 1690000000 + index
+    if index % 2:
+        # sell trades close the previous buy trade
+        trade.associated_entry_ids = [f"trade_{index - 1}"]
+    trade.fee = {
+        enums.FeePropertyColumns.COST.value: trade.total_cost * decimal.Decimal("0.001"),
+        enums.FeePropertyColumns.CURRENCY.value: trade.market,
+        enums.FeePropertyColumns.IS_FROM_EXCHANGE.value: True,
+    }
+    return trade
+
+
+def _fill(manager_class, trades_count, symbols):
+    trader = _get_trader()
+    manager_class.MAX_TRADES_COUNT = trades_count
+    trades_manager = manager_class(trader)
+    trades_manager._reset_trades()
+    rand = random.Random(0)
+    gc.collect()
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    for index in range(trades_count):
+        trades_manager.upsert_trade_instance(_create_trade(trader, index, symbols, rand))
+    elapsed = time.perf_counter() - t0
+    gc.collect()
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return trades_manager, elapsed, memory
+
+
+def _time(func, *args):
+    t0 = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - t0
+
+
+def _get_order_trades_pnl(trades_manager, order_ids):
+    return [
+        trades_manager.get_completed_trade_pnl(None, order_id).entries[0].trade_id
+        for order_id in order_ids
+    ]
+
+
+def _has_closing_trades(trades_manager, exchange_order_ids):
+    return [
+        trades_manager.has_closing_trade_with_exchange_order_id(exchange_order_id)
+        for exchange_order_id in exchange_order_ids
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="TradesManager trades storage benchmark")
+    parser.add_argument("--trades", type=int, default=100000)
+    parser.add_argument("--symbols", type=int, default=50)
+    parser.add_argument("--lookups", type=int, default=100)
+    args = parser.parse_args()
+
+    symbols = [f"COIN{index}/USDT" for index in range(args.symbols)]
+    print(f"{args.trades} trades over {args.symbols} symbols, {args.lookups} lookups")
+    rand = random.Random(1)
+    # exit trades of the most recent orders
+    order_ids = [f"trade_{args.trades - 1 - 2 * rand.randrange(args.trades // 20)}" for _ in range(args.lookups)]
+    exchange_order_ids = [f"exchange_order_{rand.randrange(args.trades)}" for _ in range(args.lookups)]
+    results = {}
+    for name, manager_class in (
+        ("ordered dict", DictTradesManager),
+        ("trades store", personal_data.TradesManager),
+    ):
+        trades_manager, elapsed, memory = _fill(manager_class, args.trades, symbols)
+        fees, fees_elapsed = _time(trades_manager.get_total_paid_fees)
+        counts, counts_elapsed = _time(trades_manager._get_trades_count_by_symbols)
+        pnls, pnls_elapsed = _time(trades_manager.get_completed_trades_pnl)
+        order_pnls, order_pnls_elapsed = _time(_get_order_trades_pnl, trades_manager, order_ids)
+        closing_trades, closing_trades_elapsed = _time(_has_closing_trades, trades_manager, exchange_order_ids)
+        results[name] = (
+            (memory, fees_elapsed, counts_elapsed, pnls_elapsed, order_pnls_elapsed, closing_trades_elapsed),
+            (fees, counts, len(pnls), order_pnls, closing_trades)
+        )
+        print(f"[{name}] insertion: {elapsed:.2f}s, memory: {memory / 1024 / 1024:.1f}MB, "
+              f"get_total_paid_fees: {fees_elapsed * 1e3:.2f}ms, count by symbol: {counts_elapsed * 1e3:.2f}ms, "
+              f"all trades pnl: {pnls_elapsed * 1e3:.2f}ms, orders pnl: {order_pnls_elapsed * 1e3:.2f}ms, "
+              f"closing trades: {closing_trades_elapsed * 1e3:.2f}ms")
+    previous, store = results["ordered dict"], results["trades store"]
+    assert previous[1] == store[1]
+    print(", ".join(
+        f"{name}: {previous_value / store_value:.2f}x"
+        for name, previous_value, store_value in zip(
+            ("memory reduction", "get_total_paid_fees speedup", "count by symbol speedup", "all trades pnl speedup",
+             "orders pnl speedup", "closing trades speedup"),
+            previous[0], store[0]
+        )
+    ))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+"""
+Micro-benchmark replaying ccxt websocket updates through CCXTWebsocketConnector callbacks.
+Updates are ccxt shaped payloads: a ccxt order book updated in place between messages,
+trades bursts and tickers including their raw "info" exchange message and candles.
+Compares the copy-on-write adapters with the previous deepcopy of each update and in place adapters.
+
+Usage: PYTHONPATH=. python benchmarks/websocket_replay_benchmark.py [--messages 2000] [--book-depth 1000]
+"""
+import argparse
+import asyncio
+import copy
+import random
+import time
+import types
+
+import ccxt.pro  # loads ccxt websocket structures
+from ccxt.async_support.base.ws import order_book as ccxt_order_book
+
+import octobot_commons.enums as commons_enums
+
+import octobot_trading.exchanges.adapters as adapters
+import octobot_trading.exchanges.connectors.ccxt.ccxt_adapter as ccxt_adapter
+import octobot_trading.exchanges.connectors.ccxt.ccxt_websocket_connector as ccxt_websocket_connector
+
+
+SYMBOL = "BTC/USDT"
+TIME_FRAME = commons_enums.TimeFrames.ONE_MINUTE
+
+
+class _InPlaceAdapter(adapters.AbstractAdapter):
+    # previous AbstractAdapter behavior: fix raw data in place
+    def fix_ohlcv(self, raw, **kwargs):
+        return raw
+
+    def fix_kline(self, raw, **kwargs):
+        return raw
+
+    def fix_ticker(self, raw, **kwargs):
+        return raw
+
+    def fix_order_book(self, raw, **kwargs):
+        return raw
+
+    def fix_public_recent_trades(self, raw, **kwargs):
+        return raw
+
+
+class LegacyCCXTAdapter(ccxt_adapter.CCXTAdapter, _InPlaceAdapter):
+    pass
+
+
+class LegacyCCXTWebsocketConnector(ccxt_websocket_connector.CCXTWebsocketConnector):
+    DEEP_COPY_UPDATES = True
+
+    async def book(self, order_book: dict, symbol=None, **kwargs):
+        await self.push_to_channel("OrderBook", symbol, order_book["asks"], order_book["bids"])
+
+    async def candle(self, candles: list, symbol=None, timeframe=None, **kwargs):
+        # previous kline copy
+        candles = candles[:-1] + [copy.deepcopy(candles[-1])]
+        await super().candle(candles, symbol=symbol, timeframe=timeframe, **kwargs)
+
+
+async def _push_to_channel(*_, **__):
+    pass
+
+
+def _create_connector(connector_class, adapter_class):
+    # only the attributes used by callbacks
+    connector = object.__new__(connector_class)
+    exchange = types.SimpleNamespace(DUMP_INCOMPLETE_LAST_CANDLE=False, get_exchange_current_time=time.time)
+    connector.exchange_manager = types.SimpleNamespace(is_future=False, exchange=exchange)
+    connector.exchange = exchange
+    connector.adapter = adapter_class(connector)
+    connector.watched_pairs = []
+    connector.min_timeframe = TIME_FRAME
+    connector._previous_open_candles = {}
+    connector._subsequent_unordered_candles_count = {}
+    connector.push_to_channel = _push_to_channel
+    return connector
+
+
+def _trade(rand, timestamp, index):
+    price = 40000 + rand.random() * 100
+    amount = rand.random()
+    return {
+        "info": {"e": "trade", "E": timestamp, "s": "BTCUSDT", "t": index, "p": f"{price}", "q": f"{amount}",
+                 "T": timestamp, "m": rand.random() > 0.5, "M": True},
+        "timestamp": timestamp, "datetime": "2022-03-28T10:22:45.123Z", "symbol": SYMBOL, "id": str(index),
+        "order": None, "type": None, "side": "buy", "takerOrMaker": None, "price": price, "amount": amount,
+        "cost": price * amount, "fee": None, "fees": [],
+    }
+
+
+def _ticker(rand, timestamp):
+    close = 40000 + rand.random() * 100
+    return {
+        "symbol": SYMBOL, "timestamp": timestamp, "datetime": "2022-03-28T10:22:45.123Z", "high": close + 10,
+        "low": close - 10, "bid": close - 1, "bidVolume": 1.2, "ask": close + 1, "askVolume": 0.8, "vwap": close,
+        "open": close - 5, "close": close, "last": close, "previousClose": None, "change": 5, "percentage": 0.01,
+        "average": close, "baseVolume": 1234.5, "quoteVolume": 1234.5 * close,
+        "info": {"e": "24hrTicker", "E": timestamp, "s": "BTCUSDT", "p": "5", "P": "0.01", "w": f"{close}",
+                 "c": f"{close}", "Q": "0.1", "b": f"{close - 1}", "B": "1.2", "a": f"{close + 1}", "A": "0.8",
+                 "o": f"{close - 5}", "h": f"{close + 10}", "l": f"{close - 10}", "v": "1234.5", "q": "4938000"},
+    }
+
+
+def _get_updates(messages, book_depth):
+    rand = random.Random(0)
+    book = ccxt_order_book.OrderBook({
+        "asks": [[40000 + index, rand.random()] for index in range(book_depth)],
+        "bids": [[39999 - index, rand.random()] for index in range(book_depth)],
+        "timestamp": 1648462965123,
+        "symbol": SYMBOL,
+    })
+
+    def _update_book():
+        # in place ccxt order book update
+        for _ in range(10):
+            book["asks"].storeArray([40000 + rand.randint(0, book_depth - 1), rand.random()])
+            book["bids"].storeArray([39999 - rand.randint(0, book_depth - 1), rand.random()])
+        return book
+
+    updates = []
+    for index in range(messages):
+        timestamp = 1648462965123 + index * 100
+        candle_time = timestamp - timestamp % 60000
+        updates.append(("ticker", lambda timestamp=timestamp: _ticker(rand, timestamp)))
+        updates.append(("recent_trades", lambda timestamp=timestamp, index=index: [
+            _trade(rand, timestamp, index * 50 + trade_index) for trade_index in range(50)
+        ]))
+        updates.append(("book", _update_book))
+        updates.append(("candle", lambda candle_time=candle_time: [
+            [candle_time, 40000, 40100, 39900, 40000 + rand.random() * 100, rand.random() * 100]
+        ]))
+    return updates
+
+
+async def _replay(connector, updates):
+    elapsed_by_feed = {}
+    for feed, get_update in updates:
+        update_data = get_update()
+        callback = getattr(connector, feed)
+        t0 = time.perf_counter()
+        # CCXTWebsocketConnector._feed_task callback call
+        await callback(
+            copy.deepcopy(update_data) if connector.DEEP_COPY_UPDATES else update_data,
+            symbol=SYMBOL, timeframe=TIME_FRAME.value
+        )
+        elapsed_by_feed[feed] = elapsed_by_feed.get(feed, 0) + time.perf_counter() - t0
+    return elapsed_by_feed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Websocket updates replay benchmark")
+    parser.add_argument("--messages", type=int, default=2000, help="messages per feed")
+    parser.add_argument("--book-depth", type=int, default=1000)
+    args = parser.parse_args()
+
+    print(f"{args.messages} messages per feed, order book depth: {args.book_depth}, 50 trades per message")
+    results = {}
+    for name, connector_class, adapter_class in (
+        ("deepcopy", LegacyCCXTWebsocketConnector, LegacyCCXTAdapter),
+        ("copy-on-write", ccxt_websocket_connector.CCXTWebsocketConnector, ccxt_adapter.CCXTAdapter),
+    ):
+        # same updates sequence for both implementations
+        updates = _get_updates(args.messages, args.book_depth)
+        elapsed_by_feed = results[name] = asyncio.run(
+            _replay(_create_connector(connector_class, adapter_class), updates)
+        )
+        print(f"[{name}] total: {sum(elapsed_by_feed.values()) * 1e3:.2f}ms, " + ", ".join(
+            f"{feed}: {elapsed / args.messages * 1e6:.2f}us per message"
+            for feed, elapsed in elapsed_by_feed.items()
+        ))
+    print(f"speedup: {sum(results['deepcopy'].values()) / sum(results['copy-on-write'].values()):.2f}x, " + ", ".join(
+        f"{feed}: {results['deepcopy'][feed] / elapsed:.2f}x"
+        for feed, elapsed in results["copy-on-write"].items()
+    ))
+
+
+if __name__ == "__main__":
+    main()
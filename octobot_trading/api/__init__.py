@@ -25,6 +25,7 @@ from octobot_trading.api import profitability
 from octobot_trading.api import orders
 from octobot_trading.api import contracts
 from octobot_trading.api import storage
+from octobot_trading.api import backtesting
 
 from octobot_trading.api.symbol_data import (
     get_symbol_data,
@@ -226,6 +227,12 @@ from octobot_trading.api.storage import (
     get_account_type_from_run_metadata,
     get_account_type_from_exchange_manager,
 )
+from octobot_trading.api.backtesting import (
+    create_backtesting_job,
+    run_parallel_backtesting_jobs,
+    is_successful_backtesting_job_result,
+    get_backtesting_job_result_trades,
+)
 
 __all__ = [
     "get_symbol_data",
@@ -403,4 +410,8 @@ __all__ = [
     "clear_transactions_storage_history",
     "clear_portfolio_storage_history",
     "clear_orders_storage_history",
+    "create_backtesting_job",
+    "run_parallel_backtesting_jobs",
+    "is_successful_backtesting_job_result",
+    "get_backtesting_job_result_trades",
 ]
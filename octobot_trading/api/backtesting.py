@@ -0,0 +1,75 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import typing
+
+import octobot_trading.backtesting as backtesting
+import octobot_trading.constants as constants
+
+
+def create_backtesting_job(config: dict,
+                           trading_config_by_trading_mode: typing.Optional[dict],
+                           exchange_name: str,
+                           data_files: list,
+                           **kwargs) -> backtesting.BacktestingJob:
+    return backtesting.BacktestingJob(
+        config=config,
+        trading_config_by_trading_mode=trading_config_by_trading_mode,
+        exchange_name=exchange_name,
+        data_files=data_files,
+        **kwargs
+    )
+
+
+async def run_parallel_backtesting_jobs(
+        jobs: list,
+        workers_count: int = None,
+        job_runner=backtesting.run_backtesting_job,
+        seed: int = 0,
+        max_jobs_per_worker: int = constants.PARALLEL_BACKTESTING_MAX_JOBS_PER_WORKER,
+        worker_recycling_memory: int = constants.PARALLEL_BACKTESTING_WORKER_RECYCLING_MEMORY
+):
+    """
+    Runs backtesting jobs on a pool of worker processes
+    :param jobs: the BacktestingJob to run
+    :param workers_count: the maximum number of worker processes, defaults to the number of cpus
+    :param job_runner: the picklable coroutine function running a job and returning its BacktestingJobResult
+    :param seed: seed of jobs without seed, incremented by their index
+    :param max_jobs_per_worker: jobs run by a worker process before being replaced
+    :param worker_recycling_memory: peak memory in bytes after which a worker process is replaced once its job is
+    done, not a limit
+    :return: an async generator of the jobs BacktestingJobResult, in completion order
+    """
+    runner = backtesting.ParallelBacktestingRunner(
+        jobs,
+        workers_count=workers_count,
+        job_runner=job_runner,
+        seed=seed,
+        max_jobs_per_worker=max_jobs_per_worker,
+        worker_recycling_memory=worker_recycling_memory,
+    )
+    async for result in runner.run():
+        yield result
+
+
+def is_successful_backtesting_job_result(result: backtesting.BacktestingJobResult) -> bool:
+    return result.is_successful()
+
+
+def get_backtesting_job_result_trades(result: backtesting.BacktestingJobResult) -> list:
+    return [
+        dict(zip(backtesting.TRADES_RESULT_COLUMNS, trade))
+        for trade in result.trades
+    ]
@@ -0,0 +1,40 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+
+from octobot_trading.backtesting import backtesting_job
+from octobot_trading.backtesting.backtesting_job import (
+    TRADES_RESULT_COLUMNS,
+    BacktestingJob,
+    BacktestingJobResult,
+)
+from octobot_trading.backtesting import backtesting_job_runner
+from octobot_trading.backtesting.backtesting_job_runner import (
+    run_backtesting_job,
+    create_job_result,
+)
+from octobot_trading.backtesting import parallel_backtesting_runner
+from octobot_trading.backtesting.parallel_backtesting_runner import (
+    ParallelBacktestingRunner,
+)
+
+__all__ = [
+    "TRADES_RESULT_COLUMNS",
+    "BacktestingJob",
+    "BacktestingJobResult",
+    "run_backtesting_job",
+    "create_job_result",
+    "ParallelBacktestingRunner",
+]
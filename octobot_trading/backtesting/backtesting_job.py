@@ -0,0 +1,61 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import dataclasses
+import typing
+
+import octobot_commons.enums as commons_enums
+
+# BacktestingJobResult.trades columns
+TRADES_RESULT_COLUMNS = ("time", "symbol", "side", "price", "quantity", "cost")
+
+
+@dataclasses.dataclass
+class BacktestingJob:
+    config: dict
+    # trading mode settings, as in ExchangeBuilder.use_trading_config_by_trading_mode
+    trading_config_by_trading_mode: typing.Optional[dict]
+    exchange_name: str
+    data_files: list
+    tentacles_setup_config: typing.Any = None
+    matrix_id: typing.Optional[str] = None
+    start_timestamp: typing.Optional[float] = None
+    end_timestamp: typing.Optional[float] = None
+    portfolio_history_time_frame: commons_enums.TimeFrames = commons_enums.TimeFrames.ONE_DAY
+    # set from the runner seed and the job index when None
+    seed: typing.Optional[int] = None
+    # set to the job index when None
+    job_id: typing.Optional[str] = None
+    # relative expected duration, only used to distribute jobs between workers
+    weight: float = 1
+
+
+@dataclasses.dataclass
+class BacktestingJobResult:
+    job_id: str
+    seed: typing.Optional[int] = None
+    # (timestamp, value in reference market) tuples
+    portfolio_history: list = dataclasses.field(default_factory=list)
+    # tuples of TRADES_RESULT_COLUMNS values
+    trades: list = dataclasses.field(default_factory=list)
+    profitability: float = 0
+    profitability_percent: float = 0
+    market_profitability_percent: float = 0
+    duration: float = 0
+    worker_pid: int = 0
+    error: typing.Optional[str] = None
+
+    def is_successful(self) -> bool:
+        return self.error is None
@@ -0,0 +1,160 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import octobot_backtesting.api as backtesting_api
+import octobot_backtesting.importers as importers
+import octobot_commons.databases as commons_databases
+
+import octobot_trading.enums as enums
+import octobot_trading.errors as errors
+import octobot_trading.exchanges as exchanges
+import octobot_trading.modes as modes
+import octobot_trading.backtesting.backtesting_job as backtesting_job
+
+
+async def run_backtesting_job(job: backtesting_job.BacktestingJob) -> backtesting_job.BacktestingJobResult:
+    """
+    Default parallel backtesting job runner: backtests the trading mode activated in job.tentacles_setup_config
+    on an exchange simulator using job.data_files
+    Requires OctoBot-Evaluators: the backtesting channels manager refreshes evaluators channels, they are created
+    when job.matrix_id has none in the current process. Evaluators are not created, strategies relying on evaluators
+    should use a job runner creating them
+    :param job: the job to run
+    :return: the job compact result
+    """
+    matrix_id, created_evaluator_channels = await _create_evaluator_channels_if_missing(job.matrix_id)
+    try:
+        return await _run_backtesting_job(job, matrix_id)
+    finally:
+        if created_evaluator_channels:
+            await _delete_evaluator_channels(matrix_id)
+
+
+async def _run_backtesting_job(job: backtesting_job.BacktestingJob, matrix_id: str) \
+        -> backtesting_job.BacktestingJobResult:
+    backtesting = await backtesting_api.initialize_backtesting(
+        job.config, exchange_ids=[], matrix_id=matrix_id, data_files=job.data_files, bot_id=job.job_id
+    )
+    exchange_manager = None
+    run_databases_provider = commons_databases.RunDatabasesProvider.instance()
+    added_run_databases = False
+    try:
+        if not run_databases_provider.has_bot_id(job.job_id):
+            # trading modes user inputs require run databases: register them without storage
+            await run_databases_provider.add_bot_id(
+                job.job_id,
+                commons_databases.RunDatabasesIdentifier(
+                    modes.get_activated_trading_mode(job.tentacles_setup_config), enable_storage=False
+                )
+            )
+            added_run_databases = True
+        # adapt backtesting channels before creating exchanges as they require the current backtesting time
+        await backtesting_api.adapt_backtesting_channels(
+            backtesting, job.config, importers.ExchangeDataImporter,
+            start_timestamp=job.start_timestamp, end_timestamp=job.end_timestamp
+        )
+        exchange_builder = exchanges.create_exchange_builder_instance(job.config, job.exchange_name) \
+            .has_matrix(matrix_id) \
+            .use_tentacles_setup_config(job.tentacles_setup_config) \
+            .set_bot_id(job.job_id) \
+            .is_simulated() \
+            .is_rest_only() \
+            .is_backtesting(backtesting) \
+            .enable_storage(False) \
+            .use_trading_config_by_trading_mode(job.trading_config_by_trading_mode)
+        exchange_manager = await exchange_builder.build()
+        backtesting.exchange_ids.append(exchange_manager.id)
+        await backtesting_api.start_backtesting(backtesting)
+        await backtesting.time_updater.finished_event.wait()
+        return create_job_result(job, exchange_manager)
+    finally:
+        if exchange_manager is not None:
+            await exchange_manager.stop()
+        if not backtesting.has_finished():
+            await backtesting_api.stop_backtesting(backtesting)
+        for importer in backtesting_api.get_importers(backtesting):
+            await backtesting_api.stop_importer(importer)
+        if added_run_databases:
+            await run_databases_provider.close(job.job_id)
+            run_databases_provider.remove_bot_id(job.job_id)
+
+
+async def _create_evaluator_channels_if_missing(matrix_id: str) -> (str, bool):
+    """
+    :param matrix_id: the job matrix id
+    :return: the matrix id of the process evaluators channels and True when they have been created
+    """
+    evaluators_api = _get_evaluators_api()
+    if matrix_id is not None and evaluators_api.matrix_channel_exists(matrix_id):
+        return matrix_id, False
+    matrix_id = evaluators_api.create_matrix()
+    await evaluators_api.create_evaluator_channels(matrix_id, is_backtesting=True)
+    return matrix_id, True
+
+
+async def _delete_evaluator_channels(matrix_id: str) -> None:
+    evaluators_api = _get_evaluators_api()
+    await evaluators_api.stop_all_evaluator_channels(matrix_id)
+    evaluators_api.del_evaluator_channels(matrix_id)
+    evaluators_api.del_matrix(matrix_id)
+
+
+def _get_evaluators_api():
+    try:
+        import octobot_evaluators.api as evaluators_api
+        return evaluators_api
+    except ImportError as err:
+        raise ImportError("OctoBot-Evaluators is required to run backtesting jobs") from err
+
+
+def create_job_result(job: backtesting_job.BacktestingJob, exchange_manager) -> backtesting_job.BacktestingJobResult:
+    """
+    :param job: the backtested job
+    :param exchange_manager: the backtested exchange manager
+    :return: the job compact result
+    """
+    portfolio_manager = exchange_manager.exchange_personal_data.portfolio_manager
+    profitability = portfolio_manager.portfolio_profitability
+    return backtesting_job.BacktestingJobResult(
+        job_id=job.job_id,
+        seed=job.seed,
+        portfolio_history=_get_portfolio_history(job, portfolio_manager),
+        trades=[
+            (
+                trade.executed_time, trade.symbol, trade.side.value,
+                float(trade.executed_price), float(trade.executed_quantity), float(trade.total_cost)
+            )
+            for trade in exchange_manager.exchange_personal_data.trades_manager.get_trades()
+            if trade.has_been_executed()
+        ],
+        profitability=float(profitability.profitability),
+        profitability_percent=float(profitability.profitability_percent),
+        market_profitability_percent=float(profitability.market_profitability_percent),
+    )
+
+
+def _get_portfolio_history(job, portfolio_manager) -> list:
+    try:
+        return [
+            (
+                historical_value[enums.HistoricalPortfolioValue.TIME.value],
+                float(historical_value[enums.HistoricalPortfolioValue.VALUE.value])
+            )
+            for historical_value in portfolio_manager.get_portfolio_historical_values(
+                portfolio_manager.reference_market, job.portfolio_history_time_frame, None, None
+            )
+        ]
+    except errors.NotSupported:
+        return []
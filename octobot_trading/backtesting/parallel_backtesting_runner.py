@@ -0,0 +1,256 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import asyncio
+import collections
+import dataclasses
+import itertools
+import multiprocessing
+import multiprocessing.connection as connection
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+try:
+    import resource
+except ImportError:
+    # unavailable on windows: workers peak memory is not checked
+    resource = None
+
+import octobot_commons.logging as logging
+
+import octobot_trading.constants as constants
+import octobot_trading.backtesting.backtesting_job as backtesting_job
+import octobot_trading.backtesting.backtesting_job_runner as backtesting_job_runner
+
+
+class _Worker:
+    __slots__ = ("process", "connection", "running_job")
+
+    def __init__(self, process, worker_connection):
+        self.process = process
+        self.connection = worker_connection
+        self.running_job = None
+
+
+class ParallelBacktestingRunner:
+    """
+    Runs backtesting jobs on a pool of worker processes and streams their results as soon as they are available.
+    Jobs are distributed between workers queues according to their weight, idle workers then steal jobs from the
+    end of the most loaded queue to balance long and short jobs.
+    Each job runs in a new event loop with random and numpy random generators seeded from its seed.
+    Workers are replaced after max_jobs_per_worker jobs or when a job brought their peak memory to
+    worker_recycling_memory to contain leaks. Memory is only checked between jobs: it is not a limit. Jobs of crashed workers are reported as failed: each worker has its own pipe so that
+    a crashed worker can't block the others.
+    Warning: job_runner, jobs and their results are sent between processes: they have to be picklable
+    """
+
+    def __init__(self, jobs: list, workers_count: int = None,
+                 job_runner=backtesting_job_runner.run_backtesting_job, seed: int = 0,
+                 max_jobs_per_worker: int = constants.PARALLEL_BACKTESTING_MAX_JOBS_PER_WORKER,
+                 worker_recycling_memory: int = constants.PARALLEL_BACKTESTING_WORKER_RECYCLING_MEMORY):
+        self.logger = logging.get_logger(self.__class__.__name__)
+        self.jobs = jobs
+        self.workers_count = max(min(workers_count or os.cpu_count() or 1, len(jobs)), 1)
+        self.job_runner = job_runner
+        self.seed = seed
+        self.max_jobs_per_worker = max_jobs_per_worker
+        self.worker_recycling_memory = worker_recycling_memory
+        self.recycled_workers_count = 0
+        self._context = multiprocessing.get_context("spawn")
+        self._workers = []
+        self._pending_jobs_by_worker = []
+
+    async def run(self):
+        """
+        Runs every job
+        :return: an async generator of the jobs results, in completion order
+        """
+        remaining_jobs_count = len(self.jobs)
+        self._distribute_jobs(self._get_prepared_jobs())
+        self._workers = [None] * self.workers_count
+        try:
+            for worker_id in range(self.workers_count):
+                self._send_next_job(worker_id)
+            while remaining_jobs_count:
+                for result in await asyncio.to_thread(self._wait_for_results):
+                    remaining_jobs_count -= 1
+                    yield result
+        finally:
+            self._stop_workers()
+
+    def _get_prepared_jobs(self) -> list:
+        return [
+            dataclasses.replace(
+                job,
+                job_id=str(index) if job.job_id is None else job.job_id,
+                seed=self.seed + index if job.seed is None else job.seed,
+            )
+            for index, job in enumerate(self.jobs)
+        ]
+
+    def _distribute_jobs(self, jobs):
+        # heaviest jobs first, each to the least loaded worker
+        self._pending_jobs_by_worker = [collections.deque() for _ in range(self.workers_count)]
+        weights = [0] * self.workers_count
+        for job in sorted(jobs, key=lambda job: job.weight, reverse=True):
+            worker_id = weights.index(min(weights))
+            self._pending_jobs_by_worker[worker_id].append(job)
+            weights[worker_id] += job.weight
+
+    def _get_next_job(self, worker_id):
+        pending_jobs = self._pending_jobs_by_worker[worker_id]
+        if pending_jobs:
+            return pending_jobs.popleft()
+        # steal the lightest job of the most loaded worker
+        most_loaded_pending_jobs = max(
+            self._pending_jobs_by_worker,
+            key=lambda jobs: sum(job.weight for job in jobs)
+        )
+        if most_loaded_pending_jobs:
+            return most_loaded_pending_jobs.pop()
+        return None
+
+    def _send_next_job(self, worker_id):
+        job = self._get_next_job(worker_id)
+        if job is None:
+            # nothing left to do
+            self._stop_worker(worker_id)
+            return
+        worker = self._workers[worker_id]
+        if worker is None:
+            worker = self._workers[worker_id] = self._start_worker()
+        worker.running_job = job
+        worker.connection.send(job)
+
+    def _start_worker(self) -> _Worker:
+        runner_connection, worker_connection = self._context.Pipe()
+        process = self._context.Process(
+            target=_run_worker,
+            args=(worker_connection, self.job_runner, self.max_jobs_per_worker, self.worker_recycling_memory),
+            daemon=True
+        )
+        process.start()
+        # only used by the worker
+        worker_connection.close()
+        return _Worker(process, runner_connection)
+
+    def _wait_for_results(self) -> list:
+        worker_ids_by_waitable = {}
+        for worker_id, worker in enumerate(self._workers):
+            if worker is not None:
+                worker_ids_by_waitable[worker.connection] = worker_id
+                worker_ids_by_waitable[worker.process.sentinel] = worker_id
+        ready_worker_ids = {
+            worker_ids_by_waitable[waitable]
+            for waitable in connection.wait(
+                list(worker_ids_by_waitable), timeout=constants.PARALLEL_BACKTESTING_WORKERS_CHECK_INTERVAL
+            )
+        }
+        results = []
+        for worker_id in sorted(ready_worker_ids):
+            worker = self._workers[worker_id]
+            try:
+                if worker.connection.poll():
+                    results.append(self._handle_result(worker_id, *worker.connection.recv()))
+                    continue
+            except EOFError:
+                # exited while sending its result
+                pass
+            if not worker.process.is_alive():
+                results.append(self._handle_crashed_worker(worker_id))
+        return results
+
+    def _handle_result(self, worker_id, result, is_exiting):
+        self._workers[worker_id].running_job = None
+        if is_exiting:
+            self._stop_worker(worker_id)
+            self.recycled_workers_count += 1
+        self._send_next_job(worker_id)
+        return result
+
+    def _handle_crashed_worker(self, worker_id):
+        worker = self._workers[worker_id]
+        job = worker.running_job
+        error = f"Backtesting worker process exited with code {worker.process.exitcode}"
+        self.logger.error(f"{error} when running job {job.job_id}")
+        self._stop_worker(worker_id)
+        self._send_next_job(worker_id)
+        return backtesting_job.BacktestingJobResult(
+            job_id=job.job_id, seed=job.seed, worker_pid=worker.process.pid, error=error
+        )
+
+    def _stop_worker(self, worker_id):
+        worker = self._workers[worker_id]
+        if worker is None:
+            return
+        self._workers[worker_id] = None
+        try:
+            worker.connection.send(None)
+        except OSError:
+            # already exited
+            pass
+        worker.process.join(constants.PARALLEL_BACKTESTING_WORKERS_CHECK_INTERVAL)
+        if worker.process.is_alive():
+            worker.process.terminate()
+            worker.process.join()
+        worker.connection.close()
+
+    def _stop_workers(self):
+        for worker_id in range(len(self._workers)):
+            self._stop_worker(worker_id)
+        self._workers = []
+
+
+def _run_worker(worker_connection, job_runner, max_jobs, recycling_memory):
+    for jobs_count in itertools.count(1):
+        job = worker_connection.recv()
+        if job is None:
+            return
+        result = _run_job(job, job_runner)
+        is_exiting = bool(max_jobs) and jobs_count >= max_jobs \
+            or bool(recycling_memory) and _get_peak_memory() >= recycling_memory
+        worker_connection.send((result, is_exiting))
+        if is_exiting:
+            return
+
+
+def _run_job(job, job_runner) -> backtesting_job.BacktestingJobResult:
+    started_at = time.time()
+    random.seed(job.seed)
+    np.random.seed(job.seed % 2 ** 32)
+    try:
+        result = asyncio.run(job_runner(job))
+    except Exception as err:
+        logging.get_logger(ParallelBacktestingRunner.__name__).exception(
+            err, True, f"Error when running backtesting job {job.job_id}: {err}"
+        )
+        result = backtesting_job.BacktestingJobResult(
+            job_id=job.job_id, seed=job.seed, error=f"{err.__class__.__name__}: {err}"
+        )
+    result.duration = time.time() - started_at
+    result.worker_pid = os.getpid()
+    return result
+
+
+def _get_peak_memory() -> int:
+    if resource is None:
+        return 0
+    peak_memory = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on linux, bytes on macOS
+    return peak_memory if sys.platform == "darwin" else peak_memory * 1024
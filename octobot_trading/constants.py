@@ -64,6 +64,18 @@ TRADING_MODE_ACTIVITY_REASON = "reason"
 # Exchange
 DEFAULT_EXCHANGE_TIME_LAG = 10
 DEFAULT_BACKTESTING_TIME_LAG = 0
+# candles of each pair and time frame loaded at once ahead of the backtesting clock
+BACKTESTING_OHLCV_BLOCK_SIZE = int(os.getenv("BACKTESTING_OHLCV_BLOCK_SIZE", "5000"))
+# backtesting clock ticks of order book, recent trades, ticker and kline data loaded at once for each pair
+# (windows are decoded when loaded: keep them small enough for full depth order books)
+BACKTESTING_PREFETCH_WINDOW_TICKS = int(os.getenv("BACKTESTING_PREFETCH_WINDOW_TICKS", "60"))
+# parallel backtesting workers are replaced after this amount of jobs or once a job brought their peak memory
+# (in bytes) over this threshold to contain leaks. It is not a limit: a job can use more memory
+PARALLEL_BACKTESTING_MAX_JOBS_PER_WORKER = int(os.getenv("PARALLEL_BACKTESTING_MAX_JOBS_PER_WORKER", "20"))
+PARALLEL_BACKTESTING_WORKER_RECYCLING_MEMORY = int(
+    os.getenv("PARALLEL_BACKTESTING_WORKER_RECYCLING_MEMORY", str(4 * 1024 ** 3))
+)
+PARALLEL_BACKTESTING_WORKERS_CHECK_INTERVAL = 1
 INFINITE_MAX_HANDLED_PAIRS_WITH_TIMEFRAME = -1
 DEFAULT_CANDLE_HISTORY_SIZE = 200
 NO_DATA_LIMIT = -1
@@ -85,7 +97,10 @@ CCXT_ORDERS_CACHE_LIMIT = int(os.getenv("CCXT_ORDERS_CACHE_LIMIT", str(CCXT_DEFA
 CCXT_OHLCV_CACHE_LIMIT = int(os.getenv("CCXT_OHLCV_CACHE_LIMIT", str(CCXT_DEFAULT_CACHE_LIMIT)))
 CCXT_WATCH_ORDER_BOOK_LIMIT = int(os.getenv("CCXT_WATCH_ORDER_BOOK_LIMIT", str(CCXT_DEFAULT_CACHE_LIMIT)))
 THROTTLED_WS_UPDATES = float(os.getenv("THROTTLED_WS_UPDATES", "0.1"))  # avoid spamming CPU
+# max symbols of a multiplexed websocket subscription (watch_xyz_for_symbols), 0 for one subscription per symbol
+WS_SYMBOLS_BY_MULTIPLEXED_FEED = int(os.getenv("WS_SYMBOLS_BY_MULTIPLEXED_FEED", "0"))
 MAX_CANDLES_IN_RAM = int(os.getenv("MAX_CANDLES_IN_RAM", "3000"))    # max candles per CandlesManager
+DEFAULT_ORDER_BOOK_PRICE_TICK = float(os.getenv("DEFAULT_ORDER_BOOK_PRICE_TICK", "1e-10"))  # L2 books price precision
 STORAGE_ORIGIN_VALUE = "origin_value"
 DISPLAY_TIME_FRAME = commons_enums.TimeFrames.ONE_HOUR
 DEFAULT_SUBACCOUNT_ID = "default_subaccount_id"
@@ -95,6 +110,16 @@ DEFAULT_ACCOUNT_ID = "default_account_id"
 ENABLE_LIVE_CANDLES_STORAGE = os_util.parse_boolean_environment_var("ENABLE_LIVE_CANDLES_STORAGE", "False")
 ENABLE_HISTORICAL_ORDERS_UPDATES_STORAGE = os_util.parse_boolean_environment_var("ENABLE_HISTORICAL_ORDERS_UPDATES_STORAGE", "False")
 ENABLE_SIMULATED_ORDERS_STORAGE = os_util.parse_boolean_environment_var("ENABLE_SIMULATED_ORDERS_STORAGE", "False")
+# append updated orders to a log instead of rewriting every open order on each order update
+ENABLE_ORDERS_STORAGE_DELTA_LOG = os_util.parse_boolean_environment_var("ENABLE_ORDERS_STORAGE_DELTA_LOG", "False")
+ORDERS_STORAGE_LOG_COMPACTION_SIZE = int(os.getenv("ORDERS_STORAGE_LOG_COMPACTION_SIZE", "500"))
+# storages writes are buffered and written by batch by a background task, except in backtesting
+ENABLE_BATCHED_STORAGE_WRITES = os_util.parse_boolean_environment_var("ENABLE_BATCHED_STORAGE_WRITES", "True")
+STORAGE_WRITER_BATCH_INTERVAL = float(os.getenv("STORAGE_WRITER_BATCH_INTERVAL", "1"))
+STORAGE_WRITER_MAX_TABLE_BUFFER_SIZE = int(os.getenv("STORAGE_WRITER_MAX_TABLE_BUFFER_SIZE", "10000"))
+STORAGE_WRITER_BACKPRESSURE_POLICY = enums.StorageWriterBackpressurePolicy(
+    os.getenv("STORAGE_WRITER_BACKPRESSURE_POLICY", enums.StorageWriterBackpressurePolicy.WRITE_INLINE.value)
+)
 AUTH_UPDATE_DEBOUNCE_DURATION = float(os.getenv("AUTH_UPDATE_DEBOUNCE_DURATION", "10"))
 
 # Decimal default values (decimals are immutable, can be stored as constant)
@@ -200,7 +225,10 @@ BALANCE_CHANNEL = "Balance"
 BALANCE_PROFITABILITY_CHANNEL = "BalanceProfitability"
 POSITIONS_CHANNEL = "Positions"
 INDIVIDUAL_ORDER_SYNC_TIMEOUT = 1 * commons_constants.MINUTE_TO_SECONDS
-MAX_TRADES_COUNT = int(os.getenv("MAX_TRADES_COUNT", "10000"))    # larger values can use a large part of ram
+# archived trades use about 0.6KB each: 100000 trades use about 60MB, larger histories can be configured
+MAX_TRADES_COUNT = int(os.getenv("MAX_TRADES_COUNT", "100000"))
+# trades over this count are stored in compact columns, larger values can use a large part of ram
+MAX_LIVE_TRADES_COUNT = int(os.getenv("MAX_LIVE_TRADES_COUNT", "1000"))
 
 # History
 DEFAULT_SAVED_HISTORICAL_TIMEFRAMES = [commons_enums.TimeFrames.ONE_DAY]
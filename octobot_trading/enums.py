@@ -599,6 +599,15 @@ class StoredOrdersAttr(enum.Enum):
     UPDATE_WITH_TRIGGERING_ORDER_FEES = "utf"
 
 
+class StorageWriterBackpressurePolicy(enum.Enum):
+    WRITE_INLINE = "write_inline"   # the storage callback writes its table pending documents itself
+    DROP_OLDEST = "drop_oldest"     # the oldest pending document of the table is not written
+
+
+class ChannelConflationPolicy(enum.Enum):
+    KEEP_LATEST = "keep_latest"     # only the latest pending message of each (symbol, time_frame) is kept
+
+
 class OrderUpdateType(enum.Enum):
     NEW = "new"
     CLOSED = "closed"
@@ -15,6 +15,7 @@
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
 import asyncio
+import collections
 
 import octobot_commons.tree as commons_tree
 
@@ -26,6 +27,9 @@ import async_channel.producer as producers
 
 import octobot_commons.logging as logging
 
+import octobot_trading.enums as enums
+import octobot_trading.errors as errors
+
 
 class ExchangeChannelConsumer(consumers.Consumer):
     """
@@ -45,6 +49,69 @@ class ExchangeChannelSupervisedConsumer(consumers.SupervisedConsumer):
     """
 
 
+class ConflatedQueue(asyncio.Queue):
+    """
+    Consumer queue keeping only the latest pending message of each (symbol, time_frame) key: a message replaces
+    the pending message of its key, which keeps its position in the queue. Putting never waits: when the queue
+    is full, the oldest pending message is dropped.
+    When max_rate is set, at most max_rate messages per second are returned by get(), pending messages
+    are conflated in the meantime.
+    """
+    SYMBOL_KEY = "symbol"
+    TIME_FRAME_KEY = "time_frame"
+
+    def __init__(self, maxsize=0, max_rate=0):
+        super().__init__(maxsize=maxsize)
+        self.max_rate = max_rate
+        self.delivered_messages = 0
+        self.merged_messages = 0    # messages replaced by a newer one before being delivered
+        self.dropped_messages = 0   # messages removed due to a full queue
+        self._next_get_time = 0
+
+    def get_counters(self) -> dict:
+        return {
+            "delivered_messages": self.delivered_messages,
+            "merged_messages": self.merged_messages,
+            "dropped_messages": self.dropped_messages,
+            "pending_messages": self.qsize(),
+        }
+
+    async def put(self, item):
+        self.put_nowait(item)
+
+    def put_nowait(self, item):
+        key = (item.get(self.SYMBOL_KEY), item.get(self.TIME_FRAME_KEY))
+        if key in self._queue:
+            self._queue[key] = item
+            self.merged_messages += 1
+            return
+        if self.full():
+            self._queue.popitem(last=False)
+            self.dropped_messages += 1
+            self.task_done()
+        super().put_nowait(item)
+
+    async def get(self):
+        if self.max_rate:
+            loop = asyncio.get_running_loop()
+            if (delay := self._next_get_time - loop.time()) > 0:
+                await asyncio.sleep(delay)
+            item = await super().get()
+            self._next_get_time = loop.time() + 1 / self.max_rate
+            return item
+        return await super().get()
+
+    def _init(self, maxsize):
+        self._queue = collections.OrderedDict()
+
+    def _put(self, item):
+        self._queue[(item.get(self.SYMBOL_KEY), item.get(self.TIME_FRAME_KEY))] = item
+
+    def _get(self):
+        self.delivered_messages += 1
+        return self._queue.popitem(last=False)[1]
+
+
 class ExchangeChannelProducer(producers.Producer):
     """
     Producer adapted for ExchangeChannel
@@ -73,11 +140,17 @@ class ExchangeChannelProducer(producers.Producer):
 
 
 class ExchangeChannel(channels.Channel):
+    """
+    Consumers selected by filters are indexed by filter values: the index is reset when a consumer is added or
+    removed, which makes consumers resolution of each push a dict lookup.
+    """
     PRODUCER_CLASS = ExchangeChannelProducer
     CONSUMER_CLASS = ExchangeChannelConsumer
     CRYPTOCURRENCY_KEY = "cryptocurrency"
     SYMBOL_KEY = "symbol"
     DEFAULT_PRIORITY_LEVEL = channel_enums.ChannelConsumerPriorityLevels.HIGH.value
+    # when True, consumers can be created with a conflation_policy
+    ALLOW_CONFLATION = False
 
     def __init__(self, exchange_manager):
         super().__init__()
@@ -87,6 +160,10 @@ class ExchangeChannel(channels.Channel):
         self.filter_send_counter = 0
         self.should_send_filter = False
 
+        # consumers by filter values, built from get_consumer_from_filters calls
+        self._consumers_by_filters = {}
+        self._indexed_consumers_count = 0
+
     async def new_consumer(self,
                            callback: object = None,
                            consumer_instance: object = None,
@@ -94,10 +171,18 @@ class ExchangeChannel(channels.Channel):
                            priority_level: int = DEFAULT_PRIORITY_LEVEL,
                            symbol: str = channel_constants.CHANNEL_WILDCARD,
                            cryptocurrency: str = channel_constants.CHANNEL_WILDCARD,
+                           conflation_policy: enums.ChannelConflationPolicy = None,
+                           max_rate: float = 0,
                            **kwargs) -> ExchangeChannelConsumer:
+        """
+        :param conflation_policy: when set, the consumer queue is a ConflatedQueue
+        :param max_rate: maximum number of messages per second given to a conflated consumer, 0 for no limit
+        """
         consumer = consumer_instance if consumer_instance else self.CONSUMER_CLASS(callback,
                                                                                    size=size,
                                                                                    priority_level=priority_level)
+        if conflation_policy is not None or max_rate:
+            self._set_conflated_queue(consumer, conflation_policy, max_rate)
         await self._add_new_consumer_and_run(consumer,
                                              cryptocurrency=cryptocurrency,
                                              symbol=symbol,
@@ -113,6 +198,54 @@ class ExchangeChannel(channels.Channel):
             self.SYMBOL_KEY: symbol
         })
 
+    def get_conflation_counters(self) -> dict:
+        """
+        :return: the ConflatedQueue counters by conflated consumer
+        """
+        return {
+            consumer: consumer.queue.get_counters()
+            for consumer in self.get_consumers()
+            if isinstance(consumer.queue, ConflatedQueue)
+        }
+
+    def get_consumer_from_filters(self, consumer_filters) -> list:
+        """
+        :return: the consumers matching consumer_filters, the returned list should not be modified
+        """
+        if self._indexed_consumers_count != len(self.consumers):
+            # consumers list has been updated without add_new_consumer or remove_consumer
+            self._reset_consumers_index()
+        try:
+            return self._consumers_by_filters[tuple(consumer_filters.items())]
+        except KeyError:
+            filtered_consumers = self._consumers_by_filters[tuple(consumer_filters.items())] = \
+                super().get_consumer_from_filters(consumer_filters)
+            return filtered_consumers
+        except TypeError:
+            # unhashable filter value
+            return super().get_consumer_from_filters(consumer_filters)
+
+    def add_new_consumer(self, consumer, consumer_filters) -> None:
+        super().add_new_consumer(consumer, consumer_filters)
+        self._reset_consumers_index()
+
+    async def remove_consumer(self, consumer) -> None:
+        # consumers list is updated before the first await of remove_consumer
+        self._reset_consumers_index()
+        await super().remove_consumer(consumer)
+        self._reset_consumers_index()
+
+    def _set_conflated_queue(self, consumer, conflation_policy, max_rate):
+        if not self.ALLOW_CONFLATION:
+            raise errors.NotSupported(f"{self.get_name()} channel consumers can't be conflated")
+        if conflation_policy is not enums.ChannelConflationPolicy.KEEP_LATEST:
+            raise errors.NotSupported(f"Unsupported conflation policy: {conflation_policy}")
+        consumer.queue = ConflatedQueue(maxsize=consumer.queue.maxsize, max_rate=max_rate)
+
+    def _reset_consumers_index(self):
+        self._consumers_by_filters = {}
+        self._indexed_consumers_count = len(self.consumers)
+
     async def _add_new_consumer_and_run(self, consumer,
                                         cryptocurrency=channel_constants.CHANNEL_WILDCARD,
                                         symbol=channel_constants.CHANNEL_WILDCARD):
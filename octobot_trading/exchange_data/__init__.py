@@ -41,6 +41,7 @@ from octobot_trading.exchange_data.ohlcv import (
     get_symbol_volume_candles,
     get_symbol_time_candles,
     get_candle_as_list,
+    OHLCVBacktestingCursor,
     OHLCVUpdaterSimulator,
     OHLCVProducer,
     OHLCVChannel,
@@ -54,6 +55,7 @@ from octobot_trading.exchange_data.order_book import (
     OrderBookTickerProducer,
     OrderBookTickerChannel,
     OrderBookManager,
+    PriceLevels,
     OrderBookUpdaterSimulator,
 )
 from octobot_trading.exchange_data import prices
@@ -160,6 +162,7 @@ __all__ = [
     "get_symbol_volume_candles",
     "get_symbol_time_candles",
     "get_candle_as_list",
+    "OHLCVBacktestingCursor",
     "OHLCVUpdaterSimulator",
     "OHLCVProducer",
     "OHLCVChannel",
@@ -170,6 +173,7 @@ __all__ = [
     "OrderBookTickerProducer",
     "OrderBookTickerChannel",
     "OrderBookManager",
+    "PriceLevels",
     "OrderBookUpdaterSimulator",
     "MarkPriceUpdaterSimulator",
     "MarkPriceProducer",
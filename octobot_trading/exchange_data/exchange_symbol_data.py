@@ -128,11 +128,19 @@ class ExchangeSymbolData:
             )
         )
 
-    def handle_order_book_update(self, asks, bids):
+    def handle_order_book_update(self, asks, bids, compute_deltas=False):
+        """
+        :return: the changed asks and bids levels when compute_deltas is True, None otherwise
+        """
         trigger_init_event = not self.order_book_manager.order_book_initialized
-        self.order_book_manager.handle_new_books(asks, bids)
+        deltas = None
+        if compute_deltas:
+            deltas = self.order_book_manager.update_books(asks, bids)
+        else:
+            self.order_book_manager.handle_new_books(asks, bids)
         if trigger_init_event:
             self._set_initialized_event(commons_enums.InitializationEventExchangeTopics.ORDER_BOOK.value)
+        return deltas
 
     def handle_order_book_ticker_update(self, ask_quantity, ask_price, bid_quantity, bid_price):
         self.order_book_manager.order_book_ticker_update(ask_quantity, ask_price, bid_quantity, bid_price)
@@ -57,3 +57,4 @@ class KlineProducer(exchanges_channel.ExchangeChannelProducer):
 class KlineChannel(exchanges_channel.TimeFrameExchangeChannel):
     PRODUCER_CLASS = KlineProducer
     CONSUMER_CLASS = exchanges_channel.ExchangeChannelConsumer
+    ALLOW_CONFLATION = True
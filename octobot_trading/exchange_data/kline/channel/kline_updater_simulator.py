@@ -13,6 +13,7 @@
 #
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
+import octobot_backtesting.enums as backtesting_enums
 import octobot_commons.errors as errors
 
 import octobot_trading.exchange_data.kline.channel.kline_updater as kline_updater
@@ -24,6 +25,8 @@ class KlineUpdaterSimulator(kline_updater.KlineUpdater):
         super().__init__(channel)
         self.exchange_data_importer = importer
         self.exchange_name = self.channel.exchange_manager.exchange_name
+        # klines are read by windows ahead of the backtesting clock
+        self.klines_prefetcher = util.create_data_prefetcher(self, backtesting_enums.ExchangeDataTables.KLINE)
 
         self.last_timestamp_pushed = 0
         self.time_consumer = None
@@ -35,15 +38,10 @@ class KlineUpdaterSimulator(kline_updater.KlineUpdater):
         try:
             for time_frame in self.channel.exchange_manager.exchange_config.available_time_frames:
                 for pair in self.channel.exchange_manager.exchange_config.traded_symbol_pairs:
-                    kline_data = await self.exchange_data_importer.get_kline_from_timestamps(
-                        exchange_name=self.exchange_name,
-                        symbol=pair,
-                        time_frame=time_frame,
-                        inferior_timestamp=timestamp,
-                        limit=1)
-                    if kline_data and kline_data[0][0] > self.last_timestamp_pushed:
-                        self.last_timestamp_pushed = kline_data[0][0]
-                        await self.push(time_frame, pair, kline_data[0][-1])
+                    kline_data = await self.klines_prefetcher.get_next_data(pair, timestamp, time_frame=time_frame)
+                    if kline_data is not None and kline_data[0] > self.last_timestamp_pushed:
+                        self.last_timestamp_pushed = kline_data[0]
+                        await self.push(time_frame, pair, kline_data[-1])
         except errors.DatabaseNotFoundError as e:
             self.logger.warning(f"Not enough data : {e}")
             await self.pause()
@@ -34,6 +34,7 @@ from octobot_trading.exchange_data.ohlcv.candles_adapter import (
     get_candle_as_list,
 )
 from octobot_trading.exchange_data.ohlcv.channel import (
+    OHLCVBacktestingCursor,
     OHLCVUpdaterSimulator,
     OHLCVProducer,
     OHLCVChannel,
@@ -52,6 +53,7 @@ __all__ = [
     "get_symbol_volume_candles",
     "get_symbol_time_candles",
     "get_candle_as_list",
+    "OHLCVBacktestingCursor",
     "OHLCVUpdaterSimulator",
     "OHLCVProducer",
     "OHLCVChannel",
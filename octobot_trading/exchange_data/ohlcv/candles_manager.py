@@ -15,7 +15,6 @@
 #  License along with this library.
 import numpy as np
 
-import octobot_commons.data_util as data_util
 import octobot_commons.enums as enums
 import octobot_commons.logging as logging
 
@@ -42,12 +41,13 @@ class CandlesManager(util.Initializable):
         self.time_candles_index = 0
         self.volume_candles_index = 0
 
-        self.close_candles = None
-        self.open_candles = None
-        self.high_candles = None
-        self.low_candles = None
-        self.time_candles = None
-        self.volume_candles = None
+        # candles are stored in a single ring buffer: one row per candle, one column per enums.PriceIndexes value.
+        # Column-major order keeps each price series contiguous so that windows can be returned as views.
+        self._candles = None
+        # physical index of the oldest candle when the buffer is full
+        self._head = 0
+        # candle open time to storage slot
+        self._time_slots = {}
 
         self.reached_max = False
         self._reset_candles()
@@ -66,14 +66,40 @@ class CandlesManager(util.Initializable):
         self.time_candles_index = 0
         self.volume_candles_index = 0
 
-        self.close_candles = np.full(self.max_candles_count, fill_value=np.nan, dtype=np.float64)
-        self.open_candles = np.full(self.max_candles_count, fill_value=np.nan, dtype=np.float64)
-        self.high_candles = np.full(self.max_candles_count, fill_value=np.nan, dtype=np.float64)
-        self.low_candles = np.full(self.max_candles_count, fill_value=np.nan, dtype=np.float64)
-        self.time_candles = np.full(self.max_candles_count, fill_value=np.nan, dtype=np.float64)
-        self.volume_candles = np.full(self.max_candles_count, fill_value=np.nan, dtype=np.float64)
+        self._head = 0
+        self._time_slots = {}
+        self._candles = np.full((self.max_candles_count, len(enums.PriceIndexes)),
+                                fill_value=np.nan, dtype=np.float64, order="F")
+
+    # raw storage columns: ordered by storage slot, not by time once the buffer is full
+    @property
+    def close_candles(self):
+        return self._candles[:, enums.PriceIndexes.IND_PRICE_CLOSE.value]
+
+    @property
+    def open_candles(self):
+        return self._candles[:, enums.PriceIndexes.IND_PRICE_OPEN.value]
+
+    @property
+    def high_candles(self):
+        return self._candles[:, enums.PriceIndexes.IND_PRICE_HIGH.value]
+
+    @property
+    def low_candles(self):
+        return self._candles[:, enums.PriceIndexes.IND_PRICE_LOW.value]
+
+    @property
+    def time_candles(self):
+        return self._candles[:, enums.PriceIndexes.IND_PRICE_TIME.value]
+
+    @property
+    def volume_candles(self):
+        return self._candles[:, enums.PriceIndexes.IND_PRICE_VOL.value]
 
     # getters
+    # Note: returned arrays are read-only views on the candles storage when the requested window is contiguous
+    # in the ring buffer and copies otherwise. Views reflect later updates of the in-construction candle and,
+    # once the buffer is full, can be overwritten by new candles: copy them if they have to be kept.
     def get_symbol_candles_count(self):
         return self.time_candles_index
 
@@ -106,22 +132,7 @@ class CandlesManager(util.Initializable):
         }
 
     def get_candles(self, limit=-1):
-        candles_size = self.close_candles_index if limit == -1 else limit
-        candles = [[]] * candles_size
-        iter_range = range(self.close_candles_index) if limit == -1 \
-            else range(self.close_candles_index-limit, self.close_candles_index)
-        candles_index = 0
-        for index in iter_range:
-            candle = [0] * len(enums.PriceIndexes)
-            candle[enums.PriceIndexes.IND_PRICE_CLOSE.value] = self.close_candles[index]
-            candle[enums.PriceIndexes.IND_PRICE_OPEN.value] = self.open_candles[index]
-            candle[enums.PriceIndexes.IND_PRICE_HIGH.value] = self.high_candles[index]
-            candle[enums.PriceIndexes.IND_PRICE_LOW.value] = self.low_candles[index]
-            candle[enums.PriceIndexes.IND_PRICE_VOL.value] = self.volume_candles[index]
-            candle[enums.PriceIndexes.IND_PRICE_TIME.value] = self.time_candles[index]
-            candles[candles_index] = candle
-            candles_index += 1
-        return candles
+        return self._extract_limited_data(self._candles, limit, max_limit=self.close_candles_index).tolist()
 
     def replace_all_candles(self, all_candles_data):
         self._reset_candles()
@@ -129,18 +140,12 @@ class CandlesManager(util.Initializable):
         self.candles_initialized = True
 
     def upsert_candle(self, updated_candle):
-        updated_candle_time = updated_candle[enums.PriceIndexes.IND_PRICE_TIME.value]
-        for index, candle_time in enumerate(self.time_candles):
-            if candle_time == updated_candle_time:
-                self.close_candles[index] = updated_candle[enums.PriceIndexes.IND_PRICE_CLOSE.value]
-                self.open_candles[index] = updated_candle[enums.PriceIndexes.IND_PRICE_OPEN.value]
-                self.high_candles[index] = updated_candle[enums.PriceIndexes.IND_PRICE_HIGH.value]
-                self.low_candles[index] = updated_candle[enums.PriceIndexes.IND_PRICE_LOW.value]
-                self.volume_candles[index] = updated_candle[enums.PriceIndexes.IND_PRICE_VOL.value]
-                return
-
-        # candle not in db, add it
-        self.add_new_candle(updated_candle)
+        slot = self._get_candle_slot(updated_candle[enums.PriceIndexes.IND_PRICE_TIME.value])
+        if slot is None:
+            # candle not in db, add it
+            self.add_new_candle(updated_candle)
+        else:
+            self._set_candle_values(slot, updated_candle)
 
     def add_old_and_new_candles(self, candles_data):
         """
@@ -150,8 +155,7 @@ class CandlesManager(util.Initializable):
         """
         # check old candles
         for old_candle in candles_data[:-1]:
-            if old_candle[enums.PriceIndexes.IND_PRICE_TIME.value] not in self.time_candles:
-                self.add_new_candle(old_candle)
+            self.add_new_candle(old_candle)
 
         try:
             self.add_new_candle(candles_data[-1])
@@ -165,13 +169,11 @@ class CandlesManager(util.Initializable):
         """
         if self._should_add_new_candle(new_candle_data[enums.PriceIndexes.IND_PRICE_TIME.value]):
             try:
-                self._check_max_candles()
-                self.close_candles[self.close_candles_index] = new_candle_data[enums.PriceIndexes.IND_PRICE_CLOSE.value]
-                self.open_candles[self.open_candles_index] = new_candle_data[enums.PriceIndexes.IND_PRICE_OPEN.value]
-                self.high_candles[self.high_candles_index] = new_candle_data[enums.PriceIndexes.IND_PRICE_HIGH.value]
-                self.low_candles[self.low_candles_index] = new_candle_data[enums.PriceIndexes.IND_PRICE_LOW.value]
-                self.time_candles[self.time_candles_index] = float(new_candle_data[enums.PriceIndexes.IND_PRICE_TIME.value])
-                self.volume_candles[self.volume_candles_index] = new_candle_data[enums.PriceIndexes.IND_PRICE_VOL.value]
+                slot = self._get_next_candle_slot()
+                candle_time = float(new_candle_data[enums.PriceIndexes.IND_PRICE_TIME.value])
+                self._set_candle_values(slot, new_candle_data)
+                self._candles[slot, enums.PriceIndexes.IND_PRICE_TIME.value] = candle_time
+                self._time_slots[candle_time] = slot
                 self._inc_candle_index()
             except IndexError as e:
                 self.logger.error(f"Fail to add new candle {new_candle_data} : {e}")
@@ -184,20 +186,32 @@ class CandlesManager(util.Initializable):
         else:
             self.add_new_candle(new_candles_data)
 
-    def _change_current_candle(self):
-        self.close_candles = data_util.shift_value_array(self.close_candles, -1, np.nan, np.float64)
-        self.open_candles = data_util.shift_value_array(self.open_candles, -1, np.nan, np.float64)
-        self.high_candles = data_util.shift_value_array(self.high_candles, -1, np.nan, np.float64)
-        self.low_candles = data_util.shift_value_array(self.low_candles, -1, np.nan, np.float64)
-        self.volume_candles = data_util.shift_value_array(self.volume_candles, -1, np.nan, np.float64)
-        self.time_candles = data_util.shift_value_array(self.time_candles, -1, np.nan, np.float64)
+    def _set_candle_values(self, slot, candle_data):
+        self._candles[slot, enums.PriceIndexes.IND_PRICE_CLOSE.value] = \
+            candle_data[enums.PriceIndexes.IND_PRICE_CLOSE.value]
+        self._candles[slot, enums.PriceIndexes.IND_PRICE_OPEN.value] = \
+            candle_data[enums.PriceIndexes.IND_PRICE_OPEN.value]
+        self._candles[slot, enums.PriceIndexes.IND_PRICE_HIGH.value] = \
+            candle_data[enums.PriceIndexes.IND_PRICE_HIGH.value]
+        self._candles[slot, enums.PriceIndexes.IND_PRICE_LOW.value] = \
+            candle_data[enums.PriceIndexes.IND_PRICE_LOW.value]
+        self._candles[slot, enums.PriceIndexes.IND_PRICE_VOL.value] = \
+            candle_data[enums.PriceIndexes.IND_PRICE_VOL.value]
+
+    def _get_candle_slot(self, candle_time):
+        return self._time_slots.get(candle_time)
 
     def _should_add_new_candle(self, new_open_time):
-        return new_open_time not in self.time_candles
+        return new_open_time not in self._time_slots
 
-    def _check_max_candles(self):
+    def _get_next_candle_slot(self):
         if self.reached_max:
-            self._change_current_candle()
+            # buffer is full: overwrite the oldest candle, the next one becomes the oldest
+            slot = self._head
+            self._head = (self._head + 1) % self.max_candles_count
+            self._time_slots.pop(self._candles[slot, enums.PriceIndexes.IND_PRICE_TIME.value], None)
+            return slot
+        return self.close_candles_index
 
     def _inc_candle_index(self):
         if self.close_candles_index < self.max_candles_count - 1:
@@ -211,13 +225,13 @@ class CandlesManager(util.Initializable):
             self.reached_max = True
 
     def _extract_limited_data(self, data, limit=-1, max_limit=-1):
-        max_handled_limit: int = self.max_candles_count if self.reached_max else max_limit
-        if limit == -1:
-            if max_limit == -1:
-                return np.array(data, dtype=np.float64)
-            return np.array(data[:max_handled_limit], dtype=np.float64)
-
-        if max_limit == -1:
-            return np.array(data[-min(limit, len(data)):], dtype=np.float64)
-        else:
-            return np.array(data[max(0, max_handled_limit - limit): max_handled_limit], dtype=np.float64)
+        stored_count: int = self.max_candles_count if self.reached_max or max_limit == -1 else max_limit
+        count: int = stored_count if limit == -1 else min(limit, stored_count)
+        start: int = (self._head + stored_count - count) % self.max_candles_count
+        end: int = start + count
+        if end <= self.max_candles_count:
+            window = data[start:end]
+            window.flags.writeable = False
+            return window
+        # window wraps around the end of the ring buffer
+        return np.concatenate((data[start:], data[:end - self.max_candles_count]))
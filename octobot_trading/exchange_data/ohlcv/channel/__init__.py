@@ -24,6 +24,10 @@ from octobot_trading.exchange_data.ohlcv.channel.ohlcv_updater import (
     OHLCVUpdater,
 )
 
+from octobot_trading.exchange_data.ohlcv.channel import ohlcv_backtesting_cursor
+from octobot_trading.exchange_data.ohlcv.channel.ohlcv_backtesting_cursor import (
+    OHLCVBacktestingCursor,
+)
 from octobot_trading.exchange_data.ohlcv.channel import ohlcv_updater_simulator
 from octobot_trading.exchange_data.ohlcv.channel.ohlcv_updater_simulator import (
     OHLCVUpdaterSimulator,
@@ -31,6 +35,7 @@ from octobot_trading.exchange_data.ohlcv.channel.ohlcv_updater_simulator import
 
 
 __all__ = [
+    "OHLCVBacktestingCursor",
     "OHLCVUpdaterSimulator",
     "OHLCVProducer",
     "OHLCVChannel",
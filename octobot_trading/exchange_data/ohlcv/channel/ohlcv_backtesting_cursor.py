@@ -0,0 +1,153 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import bisect
+
+import octobot_backtesting.importers as importers
+
+import octobot_commons.constants as commons_constants
+import octobot_commons.enums as commons_enums
+
+import octobot_trading.constants as constants
+
+# backtesting data files OHLCV table columns: timestamp, exchange_name, cryptocurrency, symbol, time_frame, candle
+_OHLCV_SYMBOL_INDEX = 3
+_OHLCV_TIME_FRAME_INDEX = 4
+
+
+class _CandlesBlock:
+    __slots__ = ("times", "candles", "index")
+
+    def __init__(self):
+        self.times = []
+        self.candles = []
+        self.index = 0
+
+    def select(self, inferior_timestamp, superior_timestamp):
+        start_index = bisect.bisect_left(self.times, inferior_timestamp, self.index)
+        end_index = bisect.bisect_right(self.times, superior_timestamp, start_index)
+        # chronological selection: previous candles won't be selected anymore
+        self.index = start_index
+        return self.candles[start_index:end_index]
+
+    def extend(self, candles):
+        # drop already consumed candles
+        del self.times[:self.index]
+        del self.candles[:self.index]
+        self.index = 0
+        self.times.extend(candle[commons_enums.PriceIndexes.IND_PRICE_TIME.value] for candle in candles)
+        self.candles.extend(candles)
+
+
+class OHLCVBacktestingCursor:
+    """
+    Streams backtesting candles: candles of every pair and time frame are read together from the importer
+    database by time windows of block_size candles of the shortest time frame, ahead of the backtesting clock.
+    Candles are then selected from memory.
+    Warning: as the backtesting clock, selections are chronological: candles from before the last selected
+    inferior timestamp can't be selected anymore
+    """
+
+    def __init__(self, importer, exchange_name, pairs, time_frames, block_size=constants.BACKTESTING_OHLCV_BLOCK_SIZE):
+        self.importer = importer
+        self.exchange_name = exchange_name
+        self.block_size = block_size
+        self.loaded_windows_count = 0
+        self._loaded_until = None
+        self._blocks = {}
+        self._blocks_by_symbol_and_time_frame_value = {}
+        for pair in pairs:
+            for time_frame in time_frames:
+                self._add_block(pair, time_frame)
+
+    async def get_candles(self, pair, time_frame, inferior_timestamp, superior_timestamp) -> list:
+        """
+        :param pair: the candles pair
+        :param time_frame: the candles time frame
+        :param inferior_timestamp: the minimum candle time to select (included)
+        :param superior_timestamp: the maximum candle time to select (included)
+        :return: the selected candles
+        """
+        try:
+            block = self._blocks[(pair, time_frame)]
+        except KeyError:
+            block = self._add_block(pair, time_frame)
+            if self._loaded_until is not None:
+                # catch up with already loaded windows
+                block.extend(await self._get_window_candles(
+                    inferior_timestamp, self._loaded_until, symbol=pair, time_frame=time_frame
+                ))
+        if self._loaded_until is None or superior_timestamp > self._loaded_until:
+            await self._load_window(inferior_timestamp, superior_timestamp)
+        return block.select(inferior_timestamp, superior_timestamp)
+
+    def _add_block(self, pair, time_frame):
+        block = self._blocks[(pair, time_frame)] = \
+            self._blocks_by_symbol_and_time_frame_value[(pair, time_frame.value)] = _CandlesBlock()
+        return block
+
+    async def _load_window(self, inferior_timestamp, superior_timestamp):
+        from_timestamp = inferior_timestamp if self._loaded_until is None else self._loaded_until
+        shortest_time_frame_minutes = min(
+            commons_enums.TimeFramesMinutes[time_frame] for _, time_frame in self._blocks
+        )
+        to_timestamp = max(
+            superior_timestamp,
+            from_timestamp + self.block_size * shortest_time_frame_minutes * commons_constants.MINUTE_TO_SECONDS
+        )
+        candles_by_block = {}
+        for ohlcv in await self._get_window_ohlcv(from_timestamp, to_timestamp):
+            try:
+                block = self._blocks_by_symbol_and_time_frame_value[
+                    (ohlcv[_OHLCV_SYMBOL_INDEX], ohlcv[_OHLCV_TIME_FRAME_INDEX])
+                ]
+            except KeyError:
+                # not selected pair or time frame
+                continue
+            candle = ohlcv[-1]
+            if self._loaded_until is None or \
+                    candle[commons_enums.PriceIndexes.IND_PRICE_TIME.value] > self._loaded_until:
+                try:
+                    candles_by_block[block].append(candle)
+                except KeyError:
+                    candles_by_block[block] = [candle]
+        for block, candles in candles_by_block.items():
+            block.extend(candles)
+        self._loaded_until = to_timestamp
+        self.loaded_windows_count += 1
+
+    async def _get_window_candles(self, from_timestamp, to_timestamp, symbol, time_frame):
+        return [
+            ohlcv[-1]
+            for ohlcv in await self._get_window_ohlcv(from_timestamp, to_timestamp, symbol, time_frame)
+        ]
+
+    async def _get_window_ohlcv(self, from_timestamp, to_timestamp, symbol=None, time_frame=None):
+        timestamps, operations = importers.get_operations_from_timestamps(to_timestamp, from_timestamp)
+        ohlcv_data = await self.importer.get_ohlcv(
+            exchange_name=self.exchange_name,
+            symbol=symbol,
+            time_frame=time_frame,
+            timestamps=timestamps,
+            operations=operations
+        )
+        # selected data are sorted from the most recent
+        ohlcv_data.reverse()
+        return ohlcv_data
+
+    def clear(self):
+        self._loaded_until = None
+        self._blocks = {}
+        self._blocks_by_symbol_and_time_frame_value = {}
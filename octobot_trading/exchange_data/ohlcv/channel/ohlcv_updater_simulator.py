@@ -20,6 +20,7 @@ import octobot_commons.enums as enums
 import octobot_commons.errors as errors
 
 import octobot_trading.exchange_data.ohlcv.channel.ohlcv_updater as ohlcv_updater
+import octobot_trading.exchange_data.ohlcv.channel.ohlcv_backtesting_cursor as ohlcv_backtesting_cursor
 import octobot_trading.util as util
 
 
@@ -41,6 +42,10 @@ class OHLCVUpdaterSimulator(ohlcv_updater.OHLCVUpdater):
         self.require_last_init_candles_pairs_push = False
         self.traded_pairs = self._get_traded_pairs()
         self.traded_time_frame = self._get_time_frames()
+        # candles are read by blocks ahead of the backtesting clock
+        self.candles_cursor = ohlcv_backtesting_cursor.OHLCVBacktestingCursor(
+            importer, self.exchange_name, self.traded_pairs, self.traded_time_frame
+        )
 
     async def start(self):
         if not self.is_initialized:
@@ -56,23 +61,22 @@ class OHLCVUpdaterSimulator(ohlcv_updater.OHLCVUpdater):
                     # (selection is <= and >=)
                     # Use timestamp + self.future_candle_sec_length to include the future candle on the future candles
                     # time frame that will be sorted in exchange simulator for later uses.
-                    ohlcv_data: list = await self.exchange_data_importer.get_ohlcv_from_timestamps(
-                        exchange_name=self.exchange_name,
-                        symbol=pair,
-                        time_frame=time_frame,
-                        inferior_timestamp=self.last_timestamp_pushed + 1,
-                        superior_timestamp=timestamp + (self.future_candle_sec_length
-                                                        if self.future_candle_time_frame is time_frame else 0)
+                    candles: list = await self.candles_cursor.get_candles(
+                        pair,
+                        time_frame,
+                        self.last_timestamp_pushed + 1,
+                        timestamp + (self.future_candle_sec_length
+                                     if self.future_candle_time_frame is time_frame else 0)
                     )
-                    if ohlcv_data:
-                        pushed_data = await self._handle_ohlcv_data(ohlcv_data, time_frame, pair, timestamp)
+                    if candles:
+                        pushed_data = await self._handle_candles(candles, time_frame, pair, timestamp)
                     elif self.require_last_init_candles_pairs_push:
                         # triggered on first iteration to initialize large candles that might be pushed much later
                         # otherwise but are required to complete TA evaluation
                         if time_frame.value in self.last_candles_by_pair_by_time_frame[pair]:
                             await self.push(time_frame,
                                             pair,
-                                            [self.last_candles_by_pair_by_time_frame[pair][time_frame.value][-1]],
+                                            [self.last_candles_by_pair_by_time_frame[pair][time_frame.value]],
                                             partial=True)
                             pushed_data = True
             if (
@@ -93,13 +97,13 @@ class OHLCVUpdaterSimulator(ohlcv_updater.OHLCVUpdater):
             self.last_timestamp_pushed = timestamp
             self.require_last_init_candles_pairs_push = False
 
-    async def _handle_ohlcv_data(self, ohlcv_data, time_frame, pair, timestamp):
+    async def _handle_candles(self, candles, time_frame, pair, timestamp):
         has_future_candle = False
         if self.future_candle_time_frame is time_frame:
-            if ohlcv_data[-1][-1][enums.PriceIndexes.IND_PRICE_TIME.value] == timestamp:
+            if candles[-1][enums.PriceIndexes.IND_PRICE_TIME.value] == timestamp:
                 # register future candle
                 self.channel.exchange_manager.exchange.get_current_future_candles()[pair][time_frame.value] = \
-                    ohlcv_data[-1][-1]
+                    candles[-1]
                 # do not push future candle
                 has_future_candle = True
             else:
@@ -110,16 +114,15 @@ class OHLCVUpdaterSimulator(ohlcv_updater.OHLCVUpdater):
             # There should always be at least 2 candles in read data, otherwise this means that
             # the exchange was down for some time. Consider it unreachable
             if (
-                len(ohlcv_data) < 2 and
+                len(candles) < 2 and
                 not self.channel.exchange_manager.exchange.is_skipping_empty_candles_in_ohlcv_fetch()
             ):
                 self.channel.exchange_manager.exchange.is_unreachable = True
-        if not has_future_candle or len(ohlcv_data) > 1:
+        if not has_future_candle or len(candles) > 1:
             # push current candle(s)
-            candles = ohlcv_data[:-1] if has_future_candle else ohlcv_data
             await self.push(time_frame,
                             pair,
-                            [ohlcv[-1] for ohlcv in candles],
+                            candles[:-1] if has_future_candle else candles,
                             partial=True)
             return True
         return False
@@ -141,17 +144,13 @@ class OHLCVUpdaterSimulator(ohlcv_updater.OHLCVUpdater):
 
     async def _initialize_candles(self, time_frame, pair, should_retry):
         # fetch history
-        ohlcv_data = None
+        candles = None
         try:
             # only load candles starting from the star time of the backtesting
-            ohlcv_data: list = await self.exchange_data_importer.get_ohlcv_from_timestamps(
-                exchange_name=self.exchange_name,
-                symbol=pair,
-                time_frame=time_frame,
-                limit=self.OHLCV_OLD_LIMIT,
-                inferior_timestamp=self.initial_timestamp,
-                superior_timestamp=self.initial_timestamp)
-            candles_len = len(ohlcv_data)
+            candles: list = await self.candles_cursor.get_candles(
+                pair, time_frame, self.initial_timestamp, self.initial_timestamp
+            )
+            candles_len = len(candles)
             self.logger.info(f"Loaded pre-backtesting starting timestamp historical "
                              f"candles for: {pair} in {time_frame}: {candles_len} "
                              f"candle{'s' if candles_len > 1 else ''}")
@@ -159,15 +158,15 @@ class OHLCVUpdaterSimulator(ohlcv_updater.OHLCVUpdater):
             self.logger.exception(e, True, f"Error while fetching historical candles: {e}")
         if pair not in self.last_candles_by_pair_by_time_frame:
             self.last_candles_by_pair_by_time_frame[pair] = {}
-        if ohlcv_data:
+        if candles:
             # init historical candles
             await self.channel.exchange_manager.get_symbol_data(pair) \
                 .handle_candles_update(time_frame,
-                                       [ohlcv[-1] for ohlcv in ohlcv_data],
+                                       candles,
                                        replace_all=True,
                                        partial=False,
                                        upsert=False)
-            self.last_candles_by_pair_by_time_frame[pair][time_frame.value] = ohlcv_data[-1]
+            self.last_candles_by_pair_by_time_frame[pair][time_frame.value] = candles[-1]
             self.require_last_init_candles_pairs_push = True
         # self.initial_timestamp - 1 to re-select this candle and push it when init step will be over
         self.last_timestamp_pushed = self.initial_timestamp - 1
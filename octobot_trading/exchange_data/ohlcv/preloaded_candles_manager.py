@@ -45,31 +45,48 @@ class PreloadedCandlesManager(candles_manager.CandlesManager):
         return self.volume_candles
 
     def _set_all_candles(self, new_candles_data):
-        self.close_candles = self._get_candle_values_array(new_candles_data, enums.PriceIndexes.IND_PRICE_CLOSE.value)
-        self.open_candles = self._get_candle_values_array(new_candles_data, enums.PriceIndexes.IND_PRICE_OPEN.value)
-        self.high_candles = self._get_candle_values_array(new_candles_data, enums.PriceIndexes.IND_PRICE_HIGH.value)
-        self.low_candles = self._get_candle_values_array(new_candles_data, enums.PriceIndexes.IND_PRICE_LOW.value)
-        self.time_candles = self._get_candle_values_array(new_candles_data, enums.PriceIndexes.IND_PRICE_TIME.value)
-        self.volume_candles = self._get_candle_values_array(new_candles_data, enums.PriceIndexes.IND_PRICE_VOL.value)
-
-    def _get_candle_values_array(self, candles, key):
-        return np.array([candle[key] for candle in candles], dtype=np.float64)
+        """
+        :param new_candles_data: candles as rows ordered by time, each row following enums.PriceIndexes.
+        Can be a list of candles or a 2D numpy array (including a memory-mapped one, which is not copied
+        when already stored as float64 in column-major order)
+        """
+        if isinstance(new_candles_data, np.ndarray):
+            candles = new_candles_data
+        else:
+            candles = np.array(new_candles_data, dtype=np.float64)
+        if candles.ndim != 2:
+            # no candle
+            candles = candles.reshape((-1, len(enums.PriceIndexes)))
+        self._candles = np.asfortranarray(candles[:, :len(enums.PriceIndexes)], dtype=np.float64)
+        self._last_candle_slot = None
+
+    def _get_candle_slot(self, candle_time):
+        # preloaded candles are sorted by time
+        slot = int(np.searchsorted(self.time_candles, candle_time))
+        if slot < len(self.time_candles) and self.time_candles[slot] == candle_time:
+            return slot
+        return None
 
     def _get_candle_index(self, candle):
         # Uses the given candle to find the index on the associated candle in preloaded candles.
         # The goal of this method is to quickly identify where the limit between past and future candles
         # should be when handling preloaded candles.
-
+        candle_time = candle[enums.PriceIndexes.IND_PRICE_TIME.value]
+        time_candles = self.time_candles
+        slot = None
+        if self._last_candle_slot is not None:
+            # backtesting clock usually moves forward by one candle at a time
+            for candidate_slot in (self._last_candle_slot + 1, self._last_candle_slot):
+                if candidate_slot < len(time_candles) and time_candles[candidate_slot] == candle_time:
+                    slot = candidate_slot
+                    break
+        if slot is None:
+            slot = self._get_candle_slot(candle_time)
+        if slot is None:
+            return commons_constants.DEFAULT_IGNORED_VALUE
+        self._last_candle_slot = slot
         # return actual index + 1 as it is used as a select length
-        select_index = 0 if self.time_candles_index == 0 else self.time_candles_index - 1
-        for delta_index, time_value in enumerate(self.time_candles[select_index:]):
-            if time_value == candle[enums.PriceIndexes.IND_PRICE_TIME.value]:
-                return self.time_candles_index + delta_index
-        # candle in past candles
-        for index, time_value in enumerate(self.time_candles[:select_index]):
-            if time_value == candle[enums.PriceIndexes.IND_PRICE_TIME.value]:
-                return index
-        return commons_constants.DEFAULT_IGNORED_VALUE
+        return slot + 1
 
     def add_old_and_new_candles(self, candles_data):
         # candles are already loaded, just set indexes to the new candle
@@ -87,15 +104,12 @@ class PreloadedCandlesManager(candles_manager.CandlesManager):
         self.volume_candles_index = current_index
 
     def _extract_limited_data(self, data, limit=-1, max_limit=-1):
-        if limit == -1:
-            if max_limit == -1:
-                return data
-            return np.array(data[:max_limit], dtype=np.float64)
-
+        # preloaded candles never change: return read-only views
         if max_limit == -1:
-            return np.array(data[-min(limit, len(data)):], dtype=np.float64)
-        else:
-            return np.array(data[max(0, max_limit - limit): max_limit], dtype=np.float64)
+            max_limit = len(data)
+        window = data[:max_limit] if limit == -1 else data[max(0, max_limit - limit): max_limit]
+        window.flags.writeable = False
+        return window
 
     def add_new_candle(self, new_candle_data):
         self.logger.error("add_new_candle should not be called")
@@ -110,9 +124,5 @@ class PreloadedCandlesManager(candles_manager.CandlesManager):
         self.time_candles_index = 0
         self.volume_candles_index = 0
 
-        self.close_candles = np.ndarray((0,))
-        self.open_candles = np.ndarray((0,))
-        self.high_candles = np.ndarray((0,))
-        self.low_candles = np.ndarray((0,))
-        self.time_candles = np.ndarray((0,))
-        self.volume_candles = np.ndarray((0,))
+        self._candles = np.ndarray((0, len(enums.PriceIndexes)), order="F")
+        self._last_candle_slot = None
@@ -15,6 +15,7 @@
 #  License along with this library.
 
 from octobot_trading.exchange_data.order_book import order_book_manager
+from octobot_trading.exchange_data.order_book import price_levels
 from octobot_trading.exchange_data.order_book import channel
 
 from octobot_trading.exchange_data.order_book.channel import (
@@ -27,6 +28,9 @@ from octobot_trading.exchange_data.order_book.channel import (
 from octobot_trading.exchange_data.order_book.order_book_manager import (
     OrderBookManager,
 )
+from octobot_trading.exchange_data.order_book.price_levels import (
+    PriceLevels,
+)
 from octobot_trading.exchange_data.order_book.channel.order_book_updater_simulator import (
     OrderBookUpdaterSimulator,
 )
@@ -38,5 +42,6 @@ __all__ = [
     "OrderBookTickerProducer",
     "OrderBookTickerChannel",
     "OrderBookManager",
+    "PriceLevels",
     "OrderBookUpdaterSimulator",
 ]
@@ -18,6 +18,7 @@ import asyncio
 import async_channel.constants as constants
 
 import octobot_trading.exchange_channel as exchanges_channel
+import octobot_trading.errors as errors
 
 
 class OrderBookProducer(exchanges_channel.ExchangeChannelProducer):
@@ -28,20 +29,32 @@ class OrderBookProducer(exchanges_channel.ExchangeChannelProducer):
         try:
             if self.channel.get_filtered_consumers(symbol=constants.CHANNEL_WILDCARD) or \
                     self.channel.get_filtered_consumers(symbol=symbol):
+                deltas = None
                 if update_order_book:
-                    self.channel.exchange_manager.get_symbol_data(symbol).handle_order_book_update(asks, bids)
-                await self.send(cryptocurrency=self.channel.exchange_manager.exchange.
-                                get_pair_cryptocurrency(symbol),
+                    symbol_data = self.channel.exchange_manager.get_symbol_data(symbol)
+                    # only compute book changes when required
+                    deltas = symbol_data.handle_order_book_update(
+                        asks, bids, compute_deltas=bool(self.channel.get_filtered_consumers(symbol=symbol, delta=True))
+                    )
+                cryptocurrency = self.channel.exchange_manager.exchange.get_pair_cryptocurrency(symbol)
+                await self.send(cryptocurrency=cryptocurrency,
                                 symbol=symbol,
                                 asks=asks,
                                 bids=bids)
+                if deltas is not None:
+                    ask_deltas, bid_deltas = deltas
+                    await self.send_deltas(cryptocurrency=cryptocurrency,
+                                           symbol=symbol,
+                                           asks=ask_deltas,
+                                           bids=bid_deltas,
+                                           sequence=symbol_data.order_book_manager.sequence)
         except asyncio.CancelledError:
             self.logger.info("Update tasks cancelled.")
         except Exception as e:
             self.logger.exception(e, True, f"Exception when triggering update: {e}")
 
     async def send(self, cryptocurrency, symbol, asks, bids):
-        for consumer in self.channel.get_filtered_consumers(symbol=symbol):
+        for consumer in self.channel.get_filtered_consumers(symbol=symbol, delta=False):
             await consumer.queue.put({
                 "exchange": self.channel.exchange_manager.exchange_name,
                 "exchange_id": self.channel.exchange_manager.id,
@@ -51,10 +64,59 @@ class OrderBookProducer(exchanges_channel.ExchangeChannelProducer):
                 "bids": bids
             })
 
+    async def send_deltas(self, cryptocurrency, symbol, asks, bids, sequence):
+        """
+        Send order book changes to delta consumers
+        :param asks: the [price, size] list of added, changed and removed (with a size of 0) asks levels
+        :param bids: the [price, size] list of added, changed and removed (with a size of 0) bids levels
+        :param sequence: the order book update sequence number, consecutive updates have consecutive numbers
+        """
+        for consumer in self.channel.get_filtered_consumers(symbol=symbol, delta=True):
+            await consumer.queue.put({
+                "exchange": self.channel.exchange_manager.exchange_name,
+                "exchange_id": self.channel.exchange_manager.id,
+                "cryptocurrency": cryptocurrency,
+                "symbol": symbol,
+                "asks": asks,
+                "bids": bids,
+                "sequence": sequence
+            })
+
 
 class OrderBookChannel(exchanges_channel.ExchangeChannel):
+    """
+    Consumers created with delta=True receive the changed levels of each order book update and its sequence number
+    instead of the full order book. The full book remains available from the symbol data order_book_manager.
+    """
     PRODUCER_CLASS = OrderBookProducer
     CONSUMER_CLASS = exchanges_channel.ExchangeChannelConsumer
+    ALLOW_CONFLATION = True
+    DELTA_KEY = "delta"
+
+    def get_filtered_consumers(self,
+                               cryptocurrency=constants.CHANNEL_WILDCARD,
+                               symbol=constants.CHANNEL_WILDCARD,
+                               delta=constants.CHANNEL_WILDCARD):
+        return self.get_consumer_from_filters({
+            self.CRYPTOCURRENCY_KEY: cryptocurrency,
+            self.SYMBOL_KEY: symbol,
+            self.DELTA_KEY: delta
+        })
+
+    async def _add_new_consumer_and_run(self, consumer,
+                                        cryptocurrency=constants.CHANNEL_WILDCARD,
+                                        symbol=constants.CHANNEL_WILDCARD,
+                                        delta=False):
+        if delta and isinstance(consumer.queue, exchanges_channel.ConflatedQueue):
+            raise errors.NotSupported("Order book delta consumers can't be conflated: every delta is required")
+        self.add_new_consumer(consumer,
+                              {
+                                  self.CRYPTOCURRENCY_KEY: cryptocurrency,
+                                  self.SYMBOL_KEY: symbol,
+                                  self.DELTA_KEY: delta
+                              })
+        await self._run_consumer(consumer,
+                                 symbol=symbol)
 
 
 class OrderBookTickerProducer(exchanges_channel.ExchangeChannelProducer):
@@ -96,3 +158,4 @@ class OrderBookTickerProducer(exchanges_channel.ExchangeChannelProducer):
 class OrderBookTickerChannel(exchanges_channel.ExchangeChannel):
     PRODUCER_CLASS = OrderBookTickerProducer
     CONSUMER_CLASS = exchanges_channel.ExchangeChannelConsumer
+    ALLOW_CONFLATION = True
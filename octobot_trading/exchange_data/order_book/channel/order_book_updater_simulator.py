@@ -13,6 +13,7 @@
 #
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
+import octobot_backtesting.enums as backtesting_enums
 import octobot_commons.errors as errors
 
 import octobot_trading.exchange_data.order_book.channel.order_book_updater as order_book_updater
@@ -24,6 +25,8 @@ class OrderBookUpdaterSimulator(order_book_updater.OrderBookUpdater):
         super().__init__(channel)
         self.exchange_data_importer = importer
         self.exchange_name = self.channel.exchange_manager.exchange_name
+        # order books are read by windows ahead of the backtesting clock
+        self.order_books_prefetcher = util.create_data_prefetcher(self, backtesting_enums.ExchangeDataTables.ORDER_BOOK)
 
         self.last_timestamp_pushed = 0
         self.time_consumer = None
@@ -34,12 +37,8 @@ class OrderBookUpdaterSimulator(order_book_updater.OrderBookUpdater):
     async def handle_timestamp(self, timestamp, **kwargs):
         try:
             for pair in self.channel.exchange_manager.exchange_config.traded_symbol_pairs:
-                order_book_data = (await self.exchange_data_importer.get_order_book_from_timestamps(
-                    exchange_name=self.exchange_name,
-                    symbol=pair,
-                    inferior_timestamp=timestamp,
-                    limit=1))[0]
-                if order_book_data[0] > self.last_timestamp_pushed:
+                order_book_data = await self.order_books_prefetcher.get_next_data(pair, timestamp)
+                if order_book_data is not None and order_book_data[0] > self.last_timestamp_pushed:
                     self.last_timestamp_pushed = order_book_data[0]
                     await self.push(pair, order_book_data[-1], order_book_data[-2])
         except errors.DatabaseNotFoundError as e:
@@ -14,12 +14,16 @@
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
 import decimal
+import numpy as np
 import sortedcontainers
 
 import octobot_commons.logging as logging
 
+import octobot_trading.constants as constants
 import octobot_trading.enums as enums
+import octobot_trading.errors as errors
 import octobot_trading.util as util
+import octobot_trading.exchange_data.order_book.price_levels as price_levels
 from octobot_trading.enums import ExchangeConstantsOrderBookInfoColumns as ECOBIC
 
 ORDER_ID_NOT_FOUND = -1
@@ -27,13 +31,26 @@ INVALID_PARSED_VALUE = -1
 
 
 class OrderBookManager(util.Initializable):
-    def __init__(self):
+    def __init__(self, l3=False, price_tick=None):
+        """
+        :param l3: when True, keep each order of the book (L3 book) in asks and bids SortedDict price levels,
+        otherwise keep aggregated sizes per price level (L2 book) in asks and bids PriceLevels
+        :param price_tick: the L2 book price levels precision
+        """
         super().__init__()
         self.logger = logging.get_logger(self.__class__.__name__)
         self.order_book_initialized = False
-        self.asks = sortedcontainers.SortedDict()
-        self.bids = sortedcontainers.SortedDict()
+        self.l3 = l3
+        if self.l3:
+            self.asks = sortedcontainers.SortedDict()
+            self.bids = sortedcontainers.SortedDict()
+        else:
+            price_tick = price_tick or constants.DEFAULT_ORDER_BOOK_PRICE_TICK
+            self.asks = price_levels.PriceLevels(False, price_tick)
+            self.bids = price_levels.PriceLevels(True, price_tick)
         self.timestamp = 0
+        # incremented on each book update to let consumers of book changes detect missed updates
+        self.sequence = 0
         self.ask_quantity, self.ask_price, self.bid_quantity, self.bid_price = 0, 0, 0, 0
 
     async def initialize_impl(self):
@@ -60,13 +77,61 @@ class OrderBookManager(util.Initializable):
 
     def handle_new_books(self, asks, bids, timestamp=None):
         self.reset_order_book()
-        self.handle_book_adds(_convert_price_size_list_to_order(asks, enums.TradeOrderSide.SELL.value))
-        self.handle_book_adds(_convert_price_size_list_to_order(bids, enums.TradeOrderSide.BUY.value))
+        if self.l3:
+            self.handle_book_adds(_convert_price_size_list_to_order(asks, enums.TradeOrderSide.SELL.value))
+            self.handle_book_adds(_convert_price_size_list_to_order(bids, enums.TradeOrderSide.BUY.value))
+        else:
+            self.asks.set_levels(*_convert_price_size_list_to_arrays(asks))
+            self.bids.set_levels(*_convert_price_size_list_to_arrays(bids))
         if timestamp:
             self.timestamp = timestamp
+        self.sequence += 1
         self.order_book_initialized = True
 
+    def update_books(self, asks, bids, timestamp=None):
+        """
+        Replace L2 book levels by the given snapshot and compute changes from the previous snapshot
+        :param asks: the [price, size] list of asks
+        :param bids: the [price, size] list of bids
+        :param timestamp: the snapshot timestamp
+        :return: the [price, size] lists of changed asks and bids levels, removed levels have a size of 0
+        """
+        if self.l3:
+            self.logger.error("update_books is not supported on L3 order books")
+            self.handle_new_books(asks, bids, timestamp=timestamp)
+            return None
+        ask_deltas = _convert_arrays_to_price_size_list(*self.asks.update_levels(
+            *_convert_price_size_list_to_arrays(asks)
+        ))
+        bid_deltas = _convert_arrays_to_price_size_list(*self.bids.update_levels(
+            *_convert_price_size_list_to_arrays(bids)
+        ))
+        if timestamp:
+            self.timestamp = timestamp
+        self.sequence += 1
+        self.order_book_initialized = True
+        return ask_deltas, bid_deltas
+
+    def handle_book_deltas(self, asks, bids, timestamp=None):
+        """
+        Apply L2 book changes
+        :param asks: the [price, size] list of changed asks levels, a size of 0 removes the level
+        :param bids: the [price, size] list of changed bids levels, a size of 0 removes the level
+        :param timestamp: the changes timestamp
+        """
+        if self.l3:
+            self.logger.error("handle_book_deltas is not supported on L3 order books")
+            return
+        self.asks.apply_deltas(*_convert_price_size_list_to_arrays(asks))
+        self.bids.apply_deltas(*_convert_price_size_list_to_arrays(bids))
+        if timestamp:
+            self.timestamp = timestamp
+        self.sequence += 1
+
     def handle_book_adds(self, orders):
+        if not self.l3:
+            self.logger.error("handle_book_adds is only supported on L3 order books")
+            return
         for order in orders:
             try:
                 self._handle_book_add(order)
@@ -74,6 +139,9 @@ class OrderBookManager(util.Initializable):
                 self.logger.error(f"Error when adding order to order_book : {e}")
 
     def handle_book_deletes(self, orders):
+        if not self.l3:
+            self.logger.error("handle_book_deletes is only supported on L3 order books")
+            return
         for order in orders:
             try:
                 self._handle_book_delete(order)
@@ -81,6 +149,9 @@ class OrderBookManager(util.Initializable):
                 self.logger.error(f"Error when deleting order from order_book : {e}")
 
     def handle_book_updates(self, orders):
+        if not self.l3:
+            self.logger.error("handle_book_updates is only supported on L3 order books")
+            return
         for order in orders:
             try:
                 self._handle_book_update(order)
@@ -168,16 +239,99 @@ class OrderBookManager(util.Initializable):
         del self.bids[price]
 
     def get_ask(self):
-        return self.asks.peekitem(0)
+        """
+        :return: the (price, orders) best ask on L3 books, the (price, size) best ask on L2 books
+        """
+        if self.l3:
+            return self.asks.peekitem(0)
+        return self.asks.get_best()
 
     def get_bid(self):
-        return self.bids.peekitem(-1)
+        """
+        :return: the (price, orders) best bid on L3 books, the (price, size) best bid on L2 books
+        """
+        if self.l3:
+            return self.bids.peekitem(-1)
+        return self.bids.get_best()
 
     def get_asks(self, price):
-        return self.asks.get(price, None)
+        """
+        :return: the orders at this ask price on L3 books, the size at this ask price on L2 books
+        """
+        if self.l3:
+            return self.asks.get(price, None)
+        return self.asks.get_size(price)
 
     def get_bids(self, price):
-        return self.bids.get(price, None)
+        """
+        :return: the orders at this bid price on L3 books, the size at this bid price on L2 books
+        """
+        if self.l3:
+            return self.bids.get(price, None)
+        return self.bids.get_size(price)
+
+    def get_spread(self):
+        """
+        :return: the best ask price minus the best bid price or None when a side is empty
+        """
+        best_ask_price, best_bid_price = self._get_best_prices()
+        if best_ask_price is None or best_bid_price is None:
+            return None
+        return best_ask_price - best_bid_price
+
+    def get_mid_price(self):
+        """
+        :return: the average of the best ask and bid prices or None when a side is empty
+        """
+        best_ask_price, best_bid_price = self._get_best_prices()
+        if best_ask_price is None or best_bid_price is None:
+            return None
+        return (best_ask_price + best_bid_price) / 2
+
+    def _get_best_prices(self):
+        if self.l3:
+            return (
+                self.asks.peekitem(0)[0] if self.asks else None,
+                self.bids.peekitem(-1)[0] if self.bids else None
+            )
+        best_ask, best_bid = self.asks.get_best(), self.bids.get_best()
+        return (
+            None if best_ask is None else best_ask[0],
+            None if best_bid is None else best_bid[0]
+        )
+
+    # L2 book depth queries
+    def get_depth_to_price(self, side, price) -> float:
+        """
+        :param side: the book side: SELL for asks, BUY for bids
+        :param price: the price to stop at (included)
+        :return: the cumulated size of the given side from its best price to the given price
+        """
+        return self._get_price_levels(side).get_depth(price)
+
+    def get_vwap(self, side, quantity):
+        """
+        :param side: the book side: SELL for asks (buying quantity), BUY for bids (selling quantity)
+        :param quantity: the quantity to fill
+        :return: the average fill price of quantity or None when the book is not deep enough
+        """
+        return self._get_price_levels(side).get_vwap(quantity)
+
+    def get_imbalance(self, levels_count=None):
+        """
+        :param levels_count: the number of best levels to consider on each side, every level when None
+        :return: (bids volume - asks volume) / (bids volume + asks volume), from -1 (asks only) to 1 (bids only)
+        """
+        asks_volume = self._get_price_levels(enums.TradeOrderSide.SELL).get_volume(levels_count)
+        bids_volume = self._get_price_levels(enums.TradeOrderSide.BUY).get_volume(levels_count)
+        if asks_volume + bids_volume == 0:
+            return None
+        return (bids_volume - asks_volume) / (bids_volume + asks_volume)
+
+    def _get_price_levels(self, side) -> price_levels.PriceLevels:
+        if self.l3:
+            raise errors.NotSupported("Depth queries are only supported on L2 order books")
+        return self.bids if side is enums.TradeOrderSide.BUY else self.asks
 
 
 def _order_id_index(order_id, order_list):
@@ -194,6 +348,28 @@ def _order_id_index(order_id, order_list):
     return ORDER_ID_NOT_FOUND
 
 
+def _convert_price_size_list_to_arrays(price_size_list):
+    """
+    Convert a [price, size] list to prices and sizes arrays
+    :param price_size_list: the list of [price, size]
+    :return: the prices and sizes arrays
+    """
+    if len(price_size_list) == 0:
+        return np.empty(0, dtype=np.float64), np.empty(0, dtype=np.float64)
+    price_sizes = np.array(price_size_list, dtype=np.float64)
+    return price_sizes[:, 0], price_sizes[:, 1]
+
+
+def _convert_arrays_to_price_size_list(prices, sizes):
+    """
+    Convert prices and sizes arrays to a [price, size] list
+    :param prices: the prices array
+    :param sizes: the sizes array
+    :return: the list of [price, size]
+    """
+    return np.column_stack((prices, sizes)).tolist()
+
+
 def _convert_price_size_list_to_order(price_size_list, side):
     """
     Convert a [price, size] list to the book order format
@@ -0,0 +1,184 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import numpy as np
+
+
+class PriceLevels:
+    """
+    One side of a L2 order book: the aggregated size of each price level.
+    Levels are stored in numpy arrays sorted from the best price to the worst one and are
+    keyed by integer price ticks to avoid float comparison issues.
+    """
+
+    def __init__(self, is_bids: bool, price_tick: float):
+        self.is_bids: bool = is_bids
+        self.price_tick: float = price_tick
+        # bids are sorted by descending prices: negate their ticks to keep keys ascending on both sides
+        self._key_direction: int = -1 if is_bids else 1
+        self.keys: np.ndarray = np.empty(0, dtype=np.int64)
+        self.prices: np.ndarray = np.empty(0, dtype=np.float64)
+        self.sizes: np.ndarray = np.empty(0, dtype=np.float64)
+
+    def __len__(self):
+        return len(self.keys)
+
+    def clear(self):
+        self.keys = np.empty(0, dtype=np.int64)
+        self.prices = np.empty(0, dtype=np.float64)
+        self.sizes = np.empty(0, dtype=np.float64)
+
+    def to_keys(self, prices) -> np.ndarray:
+        return self._key_direction * np.rint(np.asarray(prices, dtype=np.float64) / self.price_tick).astype(np.int64)
+
+    def set_levels(self, prices, sizes):
+        """
+        Replace every level of this side
+        :param prices: the levels prices
+        :param sizes: the levels sizes, empty levels are ignored
+        """
+        self.keys, self.prices, self.sizes = self._get_sorted_levels(prices, sizes)
+
+    def update_levels(self, prices, sizes):
+        """
+        Replace every level of this side and compute the changes from the previous levels
+        :param prices: the levels prices
+        :param sizes: the levels sizes, empty levels are ignored
+        :return: the prices and sizes of added, changed and removed levels (with a size of 0),
+        from the best price to the worst one
+        """
+        keys, prices, sizes = self._get_sorted_levels(prices, sizes)
+        positions = np.searchsorted(self.keys, keys)
+        existing = positions < len(self.keys)
+        existing[existing] = self.keys[positions[existing]] == keys[existing]
+        changed = ~existing
+        changed[existing] = self.sizes[positions[existing]] != sizes[existing]
+        removed = np.ones(len(self.keys), dtype=bool)
+        removed[positions[existing]] = False
+        delta_keys = np.concatenate((keys[changed], self.keys[removed]))
+        order = np.argsort(delta_keys, kind="stable")
+        delta_prices = np.concatenate((prices[changed], self.prices[removed]))[order]
+        delta_sizes = np.concatenate((sizes[changed], np.zeros(np.count_nonzero(removed))))[order]
+        self.keys, self.prices, self.sizes = keys, prices, sizes
+        return delta_prices, delta_sizes
+
+    def set_level(self, price, size):
+        """
+        Update a single level in place, a size of 0 removes the level
+        """
+        key = int(self.to_keys(price))
+        index = int(np.searchsorted(self.keys, key))
+        if index < len(self.keys) and self.keys[index] == key:
+            if size > 0:
+                self.sizes[index] = size
+            else:
+                self.keys = np.delete(self.keys, index)
+                self.prices = np.delete(self.prices, index)
+                self.sizes = np.delete(self.sizes, index)
+        elif size > 0:
+            self.keys = np.insert(self.keys, index, key)
+            self.prices = np.insert(self.prices, index, price)
+            self.sizes = np.insert(self.sizes, index, size)
+
+    def apply_deltas(self, prices, sizes):
+        """
+        Update levels from a batch of changes, a size of 0 removes the level.
+        Existing levels are updated in place, added and removed levels are merged at once.
+        :param prices: the updated levels prices
+        :param sizes: the updated levels sizes
+        """
+        prices = np.asarray(prices, dtype=np.float64)
+        sizes = np.asarray(sizes, dtype=np.float64)
+        if len(prices) == 0:
+            return
+        # keep the last change of each level
+        keys, last_indexes = np.unique(self.to_keys(prices[::-1]), return_index=True)
+        prices, sizes = prices[::-1][last_indexes], sizes[::-1][last_indexes]
+        positions = np.searchsorted(self.keys, keys)
+        existing = positions < len(self.keys)
+        existing[existing] = self.keys[positions[existing]] == keys[existing]
+        self.sizes[positions[existing]] = sizes[existing]
+        added = ~existing & (sizes > 0)
+        if added.any():
+            self.keys = np.insert(self.keys, positions[added], keys[added])
+            self.prices = np.insert(self.prices, positions[added], prices[added])
+            self.sizes = np.insert(self.sizes, positions[added], sizes[added])
+        if (existing & (sizes <= 0)).any():
+            kept = self.sizes > 0
+            self.keys, self.prices, self.sizes = self.keys[kept], self.prices[kept], self.sizes[kept]
+
+    def get_best(self):
+        """
+        :return: the (price, size) of the best level or None when empty
+        """
+        if len(self.keys) == 0:
+            return None
+        return float(self.prices[0]), float(self.sizes[0])
+
+    def get_size(self, price):
+        """
+        :return: the size at the given price level or None when there is no level at this price
+        """
+        key = int(self.to_keys(price))
+        index = int(np.searchsorted(self.keys, key))
+        if index < len(self.keys) and self.keys[index] == key:
+            return float(self.sizes[index])
+        return None
+
+    def get_depth(self, price) -> float:
+        """
+        :return: the cumulated size of levels from the best price up to the given price (included)
+        """
+        return float(self.sizes[:int(np.searchsorted(self.keys, int(self.to_keys(price)), side="right"))].sum())
+
+    def get_volume(self, levels_count=None) -> float:
+        """
+        :return: the cumulated size of the levels_count best levels (of every level when None)
+        """
+        return float(self.sizes[:levels_count].sum())
+
+    def get_vwap(self, quantity):
+        """
+        :return: the average price of filling the given quantity against this side
+        or None when the book is not deep enough
+        """
+        if quantity <= 0:
+            return None
+        cumulated_sizes = np.cumsum(self.sizes)
+        if len(cumulated_sizes) == 0 or cumulated_sizes[-1] < quantity:
+            return None
+        last_level_index = int(np.searchsorted(cumulated_sizes, quantity))
+        filled_before_last_level = cumulated_sizes[last_level_index - 1] if last_level_index else 0
+        cost = np.dot(self.prices[:last_level_index], self.sizes[:last_level_index]) + \
+            (quantity - filled_before_last_level) * self.prices[last_level_index]
+        return float(cost / quantity)
+
+    def _get_sorted_levels(self, prices, sizes):
+        prices = np.asarray(prices, dtype=np.float64)
+        sizes = np.asarray(sizes, dtype=np.float64)
+        if len(prices) == 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64), np.empty(0, dtype=np.float64)
+        keys = self.to_keys(prices)
+        order = np.argsort(keys, kind="stable")
+        keys, prices, sizes = keys[order], prices[order], sizes[order]
+        # keep the last given size of duplicated levels
+        kept = np.append(keys[1:] != keys[:-1], True) & (sizes > 0)
+        return keys[kept], prices[kept], sizes[kept]
+
+    def get_levels(self, levels_count=None) -> list:
+        """
+        :return: the [price, size] of the levels_count best levels (of every level when None)
+        """
+        return np.column_stack((self.prices[:levels_count], self.sizes[:levels_count])).tolist()
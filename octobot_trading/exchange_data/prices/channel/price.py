@@ -57,3 +57,4 @@ class MarkPriceProducer(exchanges_channel.ExchangeChannelProducer):
 class MarkPriceChannel(exchanges_channel.ExchangeChannel):
     PRODUCER_CLASS = MarkPriceProducer
     CONSUMER_CLASS = exchanges_channel.ExchangeChannelConsumer
+    ALLOW_CONFLATION = True
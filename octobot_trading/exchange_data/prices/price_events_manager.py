@@ -15,6 +15,8 @@
 #  License along with this library.
 import asyncio
 import decimal
+import numpy as np
+import sortedcontainers
 
 import octobot_commons.logging as logging
 from octobot_trading.enums import ExchangeConstantsOrderColumns as ECOC
@@ -27,17 +29,34 @@ class PriceEventsManager:
     """
 
     """
-    The price event index from a price event tuple
+    The price event tuple indexes
     """
+    PRICE_INDEX = 0
+    TIMESTAMP_INDEX = 1
     PRICE_EVENT_INDEX = 2
-    PRICE_KEY = "price"
-    TIME_KEY = "time"
     MAX_LAST_RECENT_PRICES = 50
 
     def __init__(self):
         self.logger = logging.get_logger(self.__class__.__name__)
-        self.events = []
-        self._last_recent_prices = []
+        # events waiting for an upper price, sorted by ascending price: triggered events are always first
+        self._trigger_above_events = sortedcontainers.SortedKeyList(key=_get_event_price)
+        # events waiting for a lower price, sorted by descending price: triggered events are always first
+        self._trigger_below_events = sortedcontainers.SortedKeyList(key=_get_negative_event_price)
+        self._price_event_tuples = {}
+        # ring of the most recent prices and their timestamp
+        self._recent_prices = np.zeros(self.MAX_LAST_RECENT_PRICES, dtype=np.float64)
+        self._recent_timestamps = np.zeros(self.MAX_LAST_RECENT_PRICES, dtype=np.float64)
+        self._recent_prices_count = 0
+        self._recent_prices_head = 0
+        self._recent_min_price = None
+        self._recent_max_price = None
+
+    @property
+    def events(self):
+        """
+        :return: the waiting price event tuples
+        """
+        return list(self._trigger_above_events) + list(self._trigger_below_events)
 
     def stop(self):
         self.reset()
@@ -47,13 +66,14 @@ class PriceEventsManager:
         Reset price events
         """
         self.clear_recent_prices()
-        self.events.clear()
+        self._trigger_above_events.clear()
+        self._trigger_below_events.clear()
+        self._price_event_tuples.clear()
 
-    def get_min_and_max_prices(self) -> (float, float):
-        if len(self._last_recent_prices) < 2:
+    def get_min_and_max_prices(self) -> (decimal.Decimal, decimal.Decimal):
+        if self._recent_prices_count < 2:
             raise IndexError("Not enough data")
-        prices = sorted([element[self.PRICE_KEY] for element in self._last_recent_prices])
-        return prices[0], prices[-1]
+        return decimal.Decimal(str(self._recent_min_price)), decimal.Decimal(str(self._recent_max_price))
 
     def handle_recent_trades(self, recent_trades):
         """
@@ -62,15 +82,29 @@ class PriceEventsManager:
         """
         # reset recent prices on new recent trades
         self.clear_recent_prices()
-        for recent_trade in recent_trades:
-            price = decimal.Decimal(str(recent_trade[ECOC.PRICE.value]))
-            timestamp = recent_trade[ECOC.TIMESTAMP.value]
-            try:
-                self._add_recent_price(price, timestamp)
-                for event_to_set in self._check_events(price, timestamp):
-                    self._remove_and_set_event(event_to_set)
-            except KeyError:
-                self.logger.error("Error when checking price events with recent trades data")
+        if not recent_trades:
+            return
+        try:
+            prices = np.array([recent_trade[ECOC.PRICE.value] for recent_trade in recent_trades], dtype=np.float64)
+            timestamps = np.array([recent_trade[ECOC.TIMESTAMP.value] for recent_trade in recent_trades],
+                                  dtype=np.float64)
+        except KeyError:
+            self.logger.error("Error when checking price events with recent trades data")
+            return
+        self.handle_prices(prices, timestamps)
+
+    def handle_prices(self, prices, timestamps):
+        """
+        Handle a batch of prices with their timestamp.
+        Triggered events are set in the order of the price that first triggered them.
+        :param prices: the prices to check as a numpy array
+        :param timestamps: the timestamp of each price as a numpy array
+        """
+        if len(prices) == 0:
+            return
+        self._add_recent_prices(prices, timestamps)
+        for event_to_set in self._pop_events_triggered_by_prices(prices, timestamps):
+            event_to_set.set()
 
     def handle_price(self, price, timestamp):
         """
@@ -78,24 +112,46 @@ class PriceEventsManager:
         :param price: the price to check
         :param timestamp: the timestamp to check
         """
-        self._add_recent_price(price, timestamp)
-        for event_to_set in self._check_events(price, timestamp):
-            self._remove_and_set_event(event_to_set)
+        self._add_recent_price(float(price), timestamp)
+        for event_to_set in self._pop_triggered_events(price, timestamp):
+            event_to_set.set()
 
     def clear_recent_prices(self):
-        self._last_recent_prices = []
+        self._recent_prices_count = 0
+        self._recent_prices_head = 0
+        self._recent_min_price = None
+        self._recent_max_price = None
 
     def _add_recent_price(self, price, timestamp):
-        self._last_recent_prices.append({
-            self.PRICE_KEY: price,
-            self.TIME_KEY: timestamp
-        })
-        self._ensure_last_prices_length()
+        evicted_price = self._recent_prices[self._recent_prices_head] \
+            if self._recent_prices_count == self.MAX_LAST_RECENT_PRICES else None
+        self._recent_prices[self._recent_prices_head] = price
+        self._recent_timestamps[self._recent_prices_head] = timestamp
+        self._recent_prices_head = (self._recent_prices_head + 1) % self.MAX_LAST_RECENT_PRICES
+        self._recent_prices_count = min(self._recent_prices_count + 1, self.MAX_LAST_RECENT_PRICES)
+        if evicted_price is not None and evicted_price in (self._recent_min_price, self._recent_max_price):
+            self._update_recent_min_and_max_prices()
+        elif self._recent_min_price is None:
+            self._recent_min_price = self._recent_max_price = price
+        else:
+            self._recent_min_price = min(self._recent_min_price, price)
+            self._recent_max_price = max(self._recent_max_price, price)
 
-    def _ensure_last_prices_length(self):
-        if len(self._last_recent_prices) > self.MAX_LAST_RECENT_PRICES:
-            # only take the most recent prices
-            self._last_recent_prices = self._last_recent_prices[self.MAX_LAST_RECENT_PRICES // 2:]
+    def _add_recent_prices(self, prices, timestamps):
+        # only the most recent prices fit in the ring
+        prices = prices[-self.MAX_LAST_RECENT_PRICES:]
+        slots = (self._recent_prices_head + np.arange(len(prices))) % self.MAX_LAST_RECENT_PRICES
+        self._recent_prices[slots] = prices
+        self._recent_timestamps[slots] = timestamps[-self.MAX_LAST_RECENT_PRICES:]
+        self._recent_prices_head = (self._recent_prices_head + len(prices)) % self.MAX_LAST_RECENT_PRICES
+        self._recent_prices_count = min(self._recent_prices_count + len(prices), self.MAX_LAST_RECENT_PRICES)
+        self._update_recent_min_and_max_prices()
+
+    def _update_recent_min_and_max_prices(self):
+        # recent prices are always stored in the first _recent_prices_count slots
+        recent_prices = self._recent_prices[:self._recent_prices_count]
+        self._recent_min_price = float(recent_prices.min())
+        self._recent_max_price = float(recent_prices.max())
 
     def new_event(self, price, timestamp, trigger_above, allow_instant_fill=True):
         """
@@ -114,7 +170,8 @@ class PriceEventsManager:
             price_event_tuple[PriceEventsManager.PRICE_EVENT_INDEX].set()
         else:
             # this event will be set when conditions are met
-            self.events.append(price_event_tuple)
+            self._get_events_list(trigger_above).add(price_event_tuple)
+            self._price_event_tuples[price_event_tuple[PriceEventsManager.PRICE_EVENT_INDEX]] = price_event_tuple
         return price_event_tuple[PriceEventsManager.PRICE_EVENT_INDEX]
 
     def _is_triggered_by_last_recent_prices(self, price, timestamp, trigger_above):
@@ -125,14 +182,14 @@ class PriceEventsManager:
         :param trigger_above: True if waiting for an upper price
         :return: True if it would be triggered
         """
-        for recent_price in self._last_recent_prices:
-            trade_price = recent_price[self.PRICE_KEY]
-            if timestamp <= recent_price[self.TIME_KEY] and (
-                (trigger_above and price <= trade_price) or
-                (not trigger_above and price >= trade_price)
-            ):
-                return True
-        return False
+        if self._recent_prices_count == 0:
+            return False
+        reached_prices = self._recent_prices[:self._recent_prices_count][
+            self._recent_timestamps[:self._recent_prices_count] >= timestamp
+        ]
+        if len(reached_prices) == 0:
+            return False
+        return float(price) <= reached_prices.max() if trigger_above else float(price) >= reached_prices.min()
 
     def remove_event(self, event_to_remove):
         """
@@ -141,41 +198,125 @@ class PriceEventsManager:
         """
         return self._remove_event(event_to_remove)
 
-    def _remove_and_set_event(self, event_to_set):
-        """
-        Set the event and remove it from event list
-        :param event_to_set: the event to set
-        :return: the event index removed from event list
-        """
-        event_to_set.set()
-        return self._remove_event(event_to_set)
-
     def _remove_event(self, event_to_remove):
         """
-        Remove the event from events list
+        Remove the event from events lists
         :param event_to_remove: the event to remove
         """
-        for price_event_data in self.events:
-            if event_to_remove in price_event_data:
-                return self.events.remove(price_event_data)
+        try:
+            price_event_tuple = self._price_event_tuples.pop(event_to_remove)
+        except KeyError:
+            return
+        self._get_events_list(price_event_tuple[-1]).remove(price_event_tuple)
+
+    def _get_events_list(self, trigger_above):
+        return self._trigger_above_events if trigger_above else self._trigger_below_events
 
-    def _check_events(self, price, timestamp):
+    def _pop_triggered_events(self, price, timestamp):
         """
-        Check for each price, timestamp pair event if it should be triggered
+        Remove and return events triggered by the given price and timestamp
         :param price: the price used to check
         :param timestamp: the timestamp used to check
         :return: the event list that match
         """
+        triggered_events = []
+        for events_list, price_triggered_count in (
+            (self._trigger_above_events, self._trigger_above_events.bisect_key_right(price)),
+            (self._trigger_below_events, self._trigger_below_events.bisect_key_right(-price)),
+        ):
+            if price_triggered_count:
+                # price_triggered_count first events are triggered by price, keep the ones waiting for a later time
+                triggered_flags = [
+                    price_event_tuple[PriceEventsManager.TIMESTAMP_INDEX] <= timestamp
+                    for price_event_tuple in events_list[:price_triggered_count]
+                ]
+                triggered_events += self._pop_prefix_events(events_list, price_triggered_count, triggered_flags)
+        return triggered_events
+
+    def _pop_events_triggered_by_prices(self, prices, timestamps):
+        """
+        Remove and return events triggered by the given prices and timestamps
+        :param prices: the prices used to check as a numpy array
+        :param timestamps: the timestamps used to check as a numpy array
+        :return: the event list that match, sorted by first trigger price index
+        """
+        trigger_indexes = []
+        triggered_events = []
+        for events_list, trigger_above, price_triggered_count in (
+            (self._trigger_above_events, True,
+             self._trigger_above_events.bisect_key_right(decimal.Decimal(str(prices.max())))),
+            (self._trigger_below_events, False,
+             self._trigger_below_events.bisect_key_right(-decimal.Decimal(str(prices.min())))),
+        ):
+            if price_triggered_count:
+                first_trigger_indexes = _get_first_trigger_indexes(
+                    events_list[:price_triggered_count], prices, timestamps, trigger_above
+                )
+                triggered_flags = first_trigger_indexes < len(prices)
+                trigger_indexes.append(first_trigger_indexes[triggered_flags])
+                triggered_events += self._pop_prefix_events(events_list, price_triggered_count, triggered_flags)
+        if not triggered_events:
+            return triggered_events
         return [
-            event
-            for event_price, event_timestamp, event, trigger_above in self.events
-            if event_timestamp <= timestamp and
-            (
-                (trigger_above and event_price <= price) or
-                (not trigger_above and event_price >= price)
-            )
+            triggered_events[index]
+            for index in np.argsort(np.concatenate(trigger_indexes), kind="stable")
         ]
 
+    def _pop_prefix_events(self, events_list, prefix_length, triggered_flags):
+        """
+        Remove the triggered events from the first prefix_length events of events_list
+        :return: the removed events
+        """
+        triggered_events = []
+        waiting_price_event_tuples = []
+        for price_event_tuple, is_triggered in zip(events_list[:prefix_length], triggered_flags):
+            if is_triggered:
+                event = price_event_tuple[PriceEventsManager.PRICE_EVENT_INDEX]
+                triggered_events.append(event)
+                self._price_event_tuples.pop(event, None)
+            else:
+                waiting_price_event_tuples.append(price_event_tuple)
+        del events_list[:prefix_length]
+        events_list.update(waiting_price_event_tuples)
+        return triggered_events
+
+
+def _get_first_trigger_indexes(price_event_tuples, prices, timestamps, trigger_above):
+    """
+    Compute the index of the first price triggering each price event
+    :param price_event_tuples: the price events to check, all sharing the same trigger_above
+    :param prices: the prices used to check as a numpy array
+    :param timestamps: the timestamps used to check as a numpy array
+    :param trigger_above: True if events are waiting for an upper price
+    :return: the first trigger index of each event, len(prices) when not triggered
+    """
+    event_prices = np.array([float(price_event_tuple[PriceEventsManager.PRICE_INDEX])
+                             for price_event_tuple in price_event_tuples], dtype=np.float64)
+    event_timestamps = np.array([price_event_tuple[PriceEventsManager.TIMESTAMP_INDEX]
+                                 for price_event_tuple in price_event_tuples], dtype=np.float64)
+    # when every price is late enough, the first trigger is the first time the running max (or min) reaches the
+    # event price
+    if trigger_above:
+        first_trigger_indexes = np.searchsorted(np.maximum.accumulate(prices), event_prices, side="left")
+    else:
+        first_trigger_indexes = np.searchsorted(-np.minimum.accumulate(prices), -event_prices, side="left")
+    late_events = event_timestamps > timestamps.min()
+    if late_events.any():
+        # events waiting for a later time than some prices: check each price time
+        late_prices = event_prices[late_events][:, None]
+        reached = timestamps[None, :] >= event_timestamps[late_events][:, None]
+        reached &= prices[None, :] >= late_prices if trigger_above else prices[None, :] <= late_prices
+        first_trigger_indexes[late_events] = np.where(reached.any(axis=1), reached.argmax(axis=1), len(prices))
+    return first_trigger_indexes
+
+
+def _get_event_price(price_event_tuple):
+    return price_event_tuple[PriceEventsManager.PRICE_INDEX]
+
+
+def _get_negative_event_price(price_event_tuple):
+    return -price_event_tuple[PriceEventsManager.PRICE_INDEX]
+
 
 def _new_price_event(price, timestamp, trigger_above):
     """
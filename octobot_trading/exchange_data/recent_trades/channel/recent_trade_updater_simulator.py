@@ -33,6 +33,10 @@ class RecentTradeUpdaterSimulator(recent_trade_updater.RecentTradeUpdater):
         super().__init__(channel)
         self.exchange_data_importer = importer
         self.exchange_name = self.channel.exchange_manager.exchange_name
+        # recent trades are read by windows ahead of the backtesting clock
+        self.recent_trades_prefetcher = util.create_data_prefetcher(
+            self, backtesting_enums.ExchangeDataTables.RECENT_TRADES
+        )
 
         self.last_timestamp_pushed = 0
         self.last_timestamp_pushed_by_symbol = {}
@@ -46,12 +50,8 @@ class RecentTradeUpdaterSimulator(recent_trade_updater.RecentTradeUpdater):
     async def handle_timestamp(self, timestamp, **kwargs):
         try:
             for pair in self.channel.exchange_manager.exchange_config.traded_symbol_pairs:
-                recent_trades_data = (await self.exchange_data_importer.get_recent_trades_from_timestamps(
-                    exchange_name=self.exchange_name,
-                    symbol=pair,
-                    inferior_timestamp=timestamp,
-                    limit=1))[0]
-                if recent_trades_data[0] > self.last_timestamp_pushed:
+                recent_trades_data = await self.recent_trades_prefetcher.get_next_data(pair, timestamp)
+                if recent_trades_data is not None and recent_trades_data[0] > self.last_timestamp_pushed:
                     self.last_timestamp_pushed = recent_trades_data[0]
                     await self.push(pair, recent_trades_data[-1])
         except errors.DatabaseNotFoundError as e:
@@ -129,6 +129,7 @@ class TickerProducer(exchanges_channel.ExchangeChannelProducer):
 class TickerChannel(exchanges_channel.ExchangeChannel):
     PRODUCER_CLASS = TickerProducer
     CONSUMER_CLASS = exchanges_channel.ExchangeChannelConsumer
+    ALLOW_CONFLATION = True
 
 
 class MiniTickerProducer(exchanges_channel.ExchangeChannelProducer):
@@ -32,6 +32,8 @@ class TickerUpdaterSimulator(ticker_updater.TickerUpdater):
         super().__init__(channel)
         self.exchange_data_importer = importer
         self.exchange_name = self.channel.exchange_manager.exchange_name
+        # tickers are read by windows ahead of the backtesting clock
+        self.tickers_prefetcher = util.create_data_prefetcher(self, backtesting_enums.ExchangeDataTables.TICKER)
 
         self.last_timestamp_pushed = 0
         self.last_timestamp_pushed_by_symbol = {}
@@ -48,12 +50,8 @@ class TickerUpdaterSimulator(ticker_updater.TickerUpdater):
     async def handle_timestamp(self, timestamp, **kwargs):
         try:
             for pair in self.channel.exchange_manager.exchange_config.traded_symbol_pairs:
-                ticker_data = (await self.exchange_data_importer.get_ticker_from_timestamps(
-                    exchange_name=self.exchange_name,
-                    symbol=pair,
-                    inferior_timestamp=timestamp,
-                    limit=1))[0]
-                if ticker_data[0] > self.last_timestamp_pushed:
+                ticker_data = await self.tickers_prefetcher.get_next_data(pair, timestamp)
+                if ticker_data is not None and ticker_data[0] > self.last_timestamp_pushed:
                     self.last_timestamp_pushed = ticker_data[0]
                     await self.push(pair, ticker_data[-1])
         except errors.DatabaseNotFoundError as e:
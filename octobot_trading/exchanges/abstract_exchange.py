@@ -190,7 +190,7 @@ class AbstractExchange(tentacles_management.AbstractTentacle):
         :param symbol: the symbol
         :param price_example: a price example to be used in MarketStatusFixer
         :param with_fixer: when True, return a new instance of MarketStatusFixer
-        :return: market status dict
+        :return: market status dict, read-only: copy.deepcopy it before making changes
         """
         raise NotImplementedError("get_market_status is not implemented")
 
@@ -188,7 +188,7 @@ class AbstractWebsocketExchange:
         try:
             return self.books[symbol]
         except KeyError:
-            self.books[symbol] = exchange_data.OrderBookManager()
+            self.books[symbol] = exchange_data.OrderBookManager(l3=True)
             return self.books[symbol]
 
     def get_pair_from_exchange(self, pair):
@@ -157,22 +157,25 @@ class AbstractAdapter:
         raise NotImplementedError("parse_order is not implemented")
 
     def fix_ohlcv(self, raw, **kwargs):
+        # raw can be an exchange library internal buffer: fix new candles
         # add generic logic if necessary
-        return raw
+        return [list(ohlcv) for ohlcv in raw]
 
     def parse_ohlcv(self, fixed, **kwargs):
         raise NotImplementedError("parse_ohlcv is not implemented")
 
     def fix_kline(self, raw, **kwargs):
+        # raw can be an exchange library internal buffer: fix new klines
         # add generic logic if necessary
-        return raw
+        return [list(kline) for kline in raw]
 
     def parse_kline(self, fixed, **kwargs):
         raise NotImplementedError("parse_kline is not implemented")
 
     def fix_ticker(self, raw, **kwargs):
+        # raw can be an exchange library internal buffer: fix a new ticker
         # add generic logic if necessary
-        return raw
+        return dict(raw)
 
     def parse_ticker(self, fixed, **kwargs):
         raise NotImplementedError("parse_ticker is not implemented")
@@ -188,15 +191,17 @@ class AbstractAdapter:
         raise NotImplementedError("parse_balance is not implemented")
 
     def fix_order_book(self, raw, **kwargs):
+        # raw can be an exchange library internal buffer: fix a new order book, levels are not copied
         # add generic logic if necessary
-        return raw
+        return dict(raw)
 
     def parse_order_book(self, fixed, **kwargs):
         raise NotImplementedError("parse_order_book is not implemented")
 
     def fix_public_recent_trades(self, raw, **kwargs):
+        # raw can be an exchange library internal buffer: fix new trades
         # add generic logic if necessary
-        return raw
+        return [dict(recent_trade) for recent_trade in raw]
 
     def parse_public_recent_trades(self, fixed, **kwargs):
         raise NotImplementedError("parse_public_recent_trades is not implemented")
@@ -17,6 +17,7 @@
 import asyncio
 import copy
 import decimal
+import math
 import time
 
 import ccxt
@@ -45,6 +46,8 @@ class CCXTWebsocketConnector(abstract_websocket_exchange.AbstractWebsocketExchan
     NO_MESSAGE_DISCONNECTED_TIMEOUT = 4 * commons_constants.MINUTE_TO_SECONDS
     RECREATE_CLIENT_ON_DISCONNECT = False   # when True, a new ccxt websocket client will replace the previous
     # one when the exchange is disconnected
+    DEEP_COPY_UPDATES = False   # when True, callbacks are given a copy of ccxt update data. Set to True when
+    # callbacks edit their update data in place: it is also used in ccxt internal buffers
 
     IGNORED_FEED_PAIRS = {
         # When ticker or future index is available : no need to calculate mark price from recent trades
@@ -98,6 +101,9 @@ class CCXTWebsocketConnector(abstract_websocket_exchange.AbstractWebsocketExchan
     EXCHANGE_CONSTRUCTOR_KWARGS = {}
     SHORT_RECONNECT_DELAY = 0.5
     LONG_RECONNECT_DELAY = 5
+    # When > 0, symbols of feeds supported by the client watch_xyz_for_symbols methods are grouped by
+    # SYMBOLS_BY_MULTIPLEXED_FEED into a single subscription (and task) dispatching updates to each symbol
+    SYMBOLS_BY_MULTIPLEXED_FEED = trading_constants.WS_SYMBOLS_BY_MULTIPLEXED_FEED
 
     def __init__(self, config, exchange_manager, adapter_class=None, additional_config=None, websocket_name=None):
         super().__init__(config, exchange_manager)
@@ -444,9 +450,32 @@ class CCXTWebsocketConnector(abstract_websocket_exchange.AbstractWebsocketExchan
             Feeds.CANCEL_ORDER: self._get_generator("watchCancelOrder"),
         }
 
+    def _get_multiplexed_feed_generator_by_feed(self):
+        return {
+            # Unauthenticated
+            Feeds.TRADES: self._get_multiplexed_generator("watchTradesForSymbols"),
+            Feeds.TICKER: self._get_multiplexed_generator("watchTickers"),
+            Feeds.CANDLE: self._get_multiplexed_generator("watchOHLCVForSymbols"),
+            Feeds.KLINE: self._get_multiplexed_generator("watchOHLCVForSymbols"),
+            Feeds.L1_BOOK: self._get_multiplexed_generator("watchOrderBookForSymbols"),
+            Feeds.L2_BOOK: self._get_multiplexed_generator("watchOrderBookForSymbols"),
+            Feeds.L3_BOOK: self._get_multiplexed_generator("watchOrderBookForSymbols"),
+        }
+
     def _get_generator(self, method_name):
         return getattr(self.client, method_name) if hasattr(self.client, method_name) else Feeds.UNSUPPORTED
 
+    def _get_multiplexed_generator(self, method_name):
+        # multi symbols methods are defined in every ccxt client: rely on the has dict
+        if self.client is not None and self.client.has.get(method_name):
+            return self._get_generator(method_name)
+        return Feeds.UNSUPPORTED
+
+    def _get_feed_watch_func(self, feed, multiplexed):
+        if multiplexed:
+            return self._get_multiplexed_feed_generator_by_feed().get(feed, Feeds.UNSUPPORTED)
+        return self._get_feed_generator_by_feed()[feed]
+
     def _get_callback_by_feed(self):
         return {
             # Unauthenticated
@@ -516,7 +545,15 @@ class CCXTWebsocketConnector(abstract_websocket_exchange.AbstractWebsocketExchan
             kwargs["limit"] = limit
         if params is not None:
             kwargs["params"] = params
-        if symbols is not None:
+        multiplexed_generator = self._get_feed_watch_func(feed, True) \
+            if self.SYMBOLS_BY_MULTIPLEXED_FEED > 0 else Feeds.UNSUPPORTED
+        if symbols is not None and multiplexed_generator is not Feeds.UNSUPPORTED:
+            # one task per group of symbols
+            added_subscriptions = self._create_multiplexed_tasks_if_necessary(
+                feed, feed_callback, feed_generator, multiplexed_generator, symbols, **kwargs
+            )
+            has_added_feed = bool(added_subscriptions)
+        elif symbols is not None:
             for symbol in symbols:
                 kwargs["symbol"] = symbol
                 # one task per symbol: ccxt_pro is not handling multi symbol generators
@@ -540,7 +577,11 @@ class CCXTWebsocketConnector(abstract_websocket_exchange.AbstractWebsocketExchan
             self.logger.error(f"Aborting {feed.value} feed connection with {g_kwargs}: "
                               f"missing required initialization data")
             return
+        multiplexed = "symbols" in g_kwargs
         enable_throttling = feed in self.THROTTLED_CHANNELS and self.throttled_ws_updates != 0.0
+        # multiplexed updates are received one symbol at a time: keep the same updates rate by symbol
+        throttled_ws_updates = self.throttled_ws_updates / len(g_kwargs["symbols"]) \
+            if multiplexed else self.throttled_ws_updates
         ws_des = f"{watch_func.__name__} {g_kwargs}"
         subsequent_disconnections = 0
         already_got_feed_stopping_error = False
@@ -549,7 +590,10 @@ class CCXTWebsocketConnector(abstract_websocket_exchange.AbstractWebsocketExchan
         spamming_logs_debug_interval = 1000
         while not self.should_stop:
             try:
-                update_data = await watch_func(*g_args, **g_kwargs)
+                update_data = await (
+                    self._watch_multiplexed_feed(feed, watch_func, **g_kwargs) if multiplexed
+                    else watch_func(*g_args, **g_kwargs)
+                )
 
                 self._last_message_time = time.time()
                 if subsequent_disconnections > 0:
@@ -557,13 +601,18 @@ class CCXTWebsocketConnector(abstract_websocket_exchange.AbstractWebsocketExchan
                 subsequent_disconnections = 0
                 already_got_closed_by_user_error = False
                 if update_data:
-                    # Use a copy of the update data as it will be edited by adapters.
-                    # We should avoid editing the original object since it is also used in ccxt internally buffers
-                    await callback(copy.deepcopy(update_data), **g_kwargs)
+                    # update data is also used in ccxt internal buffers: callbacks and adapters create
+                    # new structures instead of editing it
+                    if multiplexed:
+                        await self._dispatch_multiplexed_update(feed, callback, update_data, **g_kwargs)
+                    else:
+                        await callback(
+                            copy.deepcopy(update_data) if self.DEEP_COPY_UPDATES else update_data, **g_kwargs
+                        )
                 if enable_throttling:
                     # ccxt keeps updating the internal structures while waiting
                     # https://docs.ccxt.com/en/latest/ccxt.pro.manual.html?rtd_search=fetchLedger#incremental-data-structures
-                    await asyncio.sleep(self.throttled_ws_updates)
+                    await asyncio.sleep(throttled_ws_updates)
             except ccxt.NetworkError as err:
                 # short reconnect on ping pong timeout or 1st reconnect
                 is_ping_pong_error = isinstance(err, ccxt.RequestTimeout)
@@ -588,7 +637,7 @@ class CCXTWebsocketConnector(abstract_websocket_exchange.AbstractWebsocketExchan
                 await asyncio.sleep(reconnect_delay)
                 self.logger.debug(f"Reconnecting to {ws_des}")
                 # self.client might have changed
-                watch_func = self._get_feed_generator_by_feed()[feed]
+                watch_func = self._get_feed_watch_func(feed, multiplexed)
                 subsequent_disconnections += 1  # wait for a longer time before the next reconnect
             except ccxt.BadRequest as err:
                 message = f"Impossible to start {ws_des} feed due to exchange refusing the connection request: {err}."
@@ -603,7 +652,7 @@ class CCXTWebsocketConnector(abstract_websocket_exchange.AbstractWebsocketExchan
                 already_got_feed_stopping_error = True
                 await asyncio.sleep(self.LONG_RECONNECT_DELAY)  # avoid spamming
                 # self.client might have changed
-                watch_func = self._get_feed_generator_by_feed()[feed]
+                watch_func = self._get_feed_watch_func(feed, multiplexed)
             except ccxt.NotSupported as err:
                 self.logger.exception(
                     err,
@@ -644,7 +693,7 @@ class CCXTWebsocketConnector(abstract_websocket_exchange.AbstractWebsocketExchan
                 await asyncio.sleep(self.LONG_RECONNECT_DELAY)  # avoid spamming
                 subsequent_disconnections += 1  # wait for a longer time before the next reconnect
                 # self.client might have changed
-                watch_func = self._get_feed_generator_by_feed()[feed]
+                watch_func = self._get_feed_watch_func(feed, multiplexed)
 
     def _create_task_if_necessary(self, feed, feed_callback, feed_generator, **kwargs):
         identifier = self._get_feed_identifier(feed_generator, kwargs)
@@ -656,9 +705,84 @@ class CCXTWebsocketConnector(abstract_websocket_exchange.AbstractWebsocketExchan
             return True
         return False
 
+    def _create_multiplexed_tasks_if_necessary(
+        self, feed, feed_callback, feed_generator, multiplexed_generator, symbols, **kwargs
+    ) -> list:
+        # symbols are registered with their single symbol feed identifier to avoid duplicated subscriptions
+        identifiers = {
+            symbol: self._get_feed_identifier(feed_generator, {**kwargs, "symbol": symbol})
+            for symbol in symbols
+        }
+        new_symbols = [
+            symbol
+            for symbol, identifier in identifiers.items()
+            if identifier not in self.feed_tasks
+        ]
+        for index in range(0, len(new_symbols), self.SYMBOLS_BY_MULTIPLEXED_FEED):
+            grouped_symbols = new_symbols[index:index + self.SYMBOLS_BY_MULTIPLEXED_FEED]
+            self.logger.debug(
+                f"Subscribing to {feed.value} with {kwargs} for {len(grouped_symbols)} symbols "
+                f"({len(self.feed_tasks)} total feeds)"
+            )
+            task = asyncio.create_task(
+                self._feed_task(feed, feed_callback, multiplexed_generator, symbols=grouped_symbols, **kwargs)
+            )
+            for symbol in grouped_symbols:
+                self.feed_tasks[identifiers[symbol]] = task
+        return new_symbols
+
+    async def _watch_multiplexed_feed(self, feed, watch_func, symbols=None, timeframe=None, **kwargs):
+        if feed in self.TIME_FRAME_RELATED_FEEDS:
+            return await watch_func([[symbol, timeframe] for symbol in symbols], **kwargs)
+        return await watch_func(symbols, **kwargs)
+
+    async def _dispatch_multiplexed_update(self, feed, callback, update_data, symbols=None, timeframe=None, **kwargs):
+        """
+        Calls callback for each symbol of a watch_xyz_for_symbols update
+        :param feed: the feed of the update
+        :param callback: the feed callback
+        :param update_data: the ccxt multi symbols update
+        :param symbols: the feed symbols
+        :param timeframe: the feed timeframe
+        :param kwargs: the feed kwargs
+        """
+        symbol_key = trading_enums.ExchangeConstantsOrderColumns.SYMBOL.value
+        if feed in self.TIME_FRAME_RELATED_FEEDS:
+            # {symbol: {timeframe: ohlcv}}
+            updates = [
+                (symbol, update_time_frame, candles)
+                for symbol, candles_by_time_frame in update_data.items()
+                for update_time_frame, candles in candles_by_time_frame.items()
+            ]
+        elif feed is Feeds.TICKER:
+            # {symbol: ticker}
+            updates = [(symbol, timeframe, ticker) for symbol, ticker in update_data.items()]
+        elif feed is Feeds.TRADES:
+            # trades of any symbol
+            trades_by_symbol = {}
+            for trade in update_data:
+                trades_by_symbol.setdefault(trade[symbol_key], []).append(trade)
+            updates = [(symbol, timeframe, trades) for symbol, trades in trades_by_symbol.items()]
+        else:
+            # order book of the updated symbol
+            updates = [(update_data[symbol_key], timeframe, update_data)]
+        for symbol, update_time_frame, symbol_update in updates:
+            if symbol_update and symbol in symbols:
+                await callback(
+                    copy.deepcopy(symbol_update) if self.DEEP_COPY_UPDATES else symbol_update,
+                    symbol=symbol, timeframe=update_time_frame, **kwargs
+                )
+
     async def _wait_for_initialization(self, feed, *g_args, **g_kwargs):
-        if not self.is_feed_requiring_init(feed) or g_kwargs["symbol"] not in self.filtered_pairs:
-            # no need to wait for pairs not in self.filtered_pairs
+        if not self.is_feed_requiring_init(feed):
+            return True
+        # no need to wait for pairs not in self.filtered_pairs
+        symbols = [
+            symbol
+            for symbol in g_kwargs.get("symbols", [g_kwargs.get("symbol")])
+            if symbol in self.filtered_pairs
+        ]
+        if not symbols:
             return True
         is_initialized_func = None
         if feed is Feeds.CANDLE:
@@ -668,9 +792,12 @@ class CCXTWebsocketConnector(abstract_websocket_exchange.AbstractWebsocketExchan
                     self.logger.error(f"No exchange manager when starting websocket connector.")
                     return False
                 try:
-                    return self.exchange_manager.exchange_symbols_data.get_exchange_symbol_data(
-                        g_kwargs["symbol"], allow_creation=False
-                    ).symbol_candles[commons_enums.TimeFrames(g_kwargs["timeframe"])].candles_initialized
+                    return all(
+                        self.exchange_manager.exchange_symbols_data.get_exchange_symbol_data(
+                            symbol, allow_creation=False
+                        ).symbol_candles[commons_enums.TimeFrames(g_kwargs["timeframe"])].candles_initialized
+                        for symbol in symbols
+                    )
                 except KeyError:
                     return False
 
@@ -782,29 +909,18 @@ class CCXTWebsocketConnector(abstract_websocket_exchange.AbstractWebsocketExchan
     def get_feeds_count(cls, pairs, time_frames) -> int:
         total_count = 0
         if pairs:
-            # rounding: account for 1 feed per symbol
-            total_count = len(pairs)
+            # rounding: account for 1 feed per symbol or per group of multiplexed symbols
+            total_count = cls._get_symbols_feeds_count(pairs)
             if cls.get_exchange_feed(trading_enums.WebsocketFeeds.CANDLE):
-                # rounding: account for 1 per timeframe per symbol
-                total_count += len(pairs) * len(time_frames)
+                # rounding: account for 1 per timeframe per symbol or per group of multiplexed symbols
+                total_count += cls._get_symbols_feeds_count(pairs) * len(time_frames)
         return total_count
 
-    def _convert_book_prices_to_orders(self, book_prices_and_volumes, book_side):
-        """
-        Convert a book_prices format : {PRICE_1: SIZE_1, PRICE_2: SIZE_2...}
-        to OctoBot's order book format
-        :param book_prices: an order book dictionary (order_book.SortedDict)
-        :param book_side: a TradeOrderSide value
-        :return: the list of order book data converted
-        """
-        return [
-            {
-                ECOBIC.PRICE.value: float(book_price_and_volume[0]),
-                ECOBIC.SIZE.value: float(book_price_and_volume[1]),
-                ECOBIC.SIDE.value: book_side,
-            }
-            for book_price_and_volume in book_prices_and_volumes
-        ]
+    @classmethod
+    def _get_symbols_feeds_count(cls, pairs) -> int:
+        if cls.SYMBOLS_BY_MULTIPLEXED_FEED > 0:
+            return math.ceil(len(pairs) / cls.SYMBOLS_BY_MULTIPLEXED_FEED)
+        return len(pairs)
 
     """
     Callbacks
@@ -840,22 +956,12 @@ class CCXTWebsocketConnector(abstract_websocket_exchange.AbstractWebsocketExchan
         :param symbol: the feed symbol
         :param kwargs: the feed kwargs
         """
-        book_instance = self.get_book_instance(symbol)
-
-        book_instance.handle_book_adds(
-            self._convert_book_prices_to_orders(
-                order_book[ECOBIC.ASKS.value],
-                trading_enums.TradeOrderSide.SELL.value) +
-            self._convert_book_prices_to_orders(
-                order_book[ECOBIC.BIDS.value],
-                trading_enums.TradeOrderSide.BUY.value)
-        )
-
+        # ccxt books are L2 [price, size] lists: the symbol order book computes changes if necessary.
+        # ccxt updates its levels in place: push copies
         await self.push_to_channel(trading_constants.ORDER_BOOK_CHANNEL,
                                    symbol,
-                                   book_instance.asks,
-                                   book_instance.bids,
-                                   update_order_book=False)
+                                   [list(level) for level in order_book[ECOBIC.ASKS.value]],
+                                   [list(level) for level in order_book[ECOBIC.BIDS.value]])
 
     async def candle(self, candles: list, symbol=None, timeframe=None, **kwargs):
         """
@@ -865,7 +971,7 @@ class CCXTWebsocketConnector(abstract_websocket_exchange.AbstractWebsocketExchan
         :param kwargs: the feed kwargs
         """
         time_frame = commons_enums.TimeFrames(timeframe)
-        kline = self.adapter.adapt_kline([copy.deepcopy(candles[-1])])[0]
+        kline = self.adapter.adapt_kline([candles[-1]])[0]
         adapted = self.adapter.adapt_ohlcv(candles, time_frame=time_frame)
         last_candle = adapted[-1]
         if symbol not in self.watched_pairs:
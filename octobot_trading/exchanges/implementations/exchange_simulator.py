@@ -119,6 +119,7 @@ class ExchangeSimulator(rest_exchange.RestExchange):
     def get_market_status(self, symbol, price_example=None, with_fixer=True):
         """
         Override of the RESTExchange get_fixed_market_status to handle different get_market_status return values
+        Returned market statuses are shared and read-only: copy.deepcopy them before making changes
         """
         if self._should_fix_market_status():
             return self.get_fixed_market_status(
@@ -128,17 +129,35 @@ class ExchangeSimulator(rest_exchange.RestExchange):
                 remove_price_limits=self._should_remove_market_status_limits(),
                 adapt_for_contract_size=self._should_adapt_market_status_for_contract_size()
             )
-        market_status, _ = self.connector.get_market_status(
-            symbol, price_example=price_example, with_fixer=with_fixer
+        return self._get_cached_market_status(
+            symbol, price_example, (with_fixer, ), self._get_origin_market_status(symbol)[0],
+            lambda: self.connector.get_market_status(symbol, price_example=price_example, with_fixer=with_fixer)[0]
         )
-        return market_status
 
     def get_fixed_market_status(self, symbol, price_example=None, with_fixer=True, remove_price_limits=False,
                                 adapt_for_contract_size=False):
         """
         Override of the RESTExchange get_fixed_market_status to call adapt_market_status only on fetch market statuses
         (should not be call on default market status)
+        Returned market statuses are shared and read-only: copy.deepcopy them before making changes
         """
+        origin_market_status, is_real = self._get_origin_market_status(symbol)
+        contract_size = self.get_contract_size(symbol) \
+            if is_real and adapt_for_contract_size and self.exchange_manager.is_future else None
+        return self._get_cached_market_status(
+            symbol, price_example, (with_fixer, remove_price_limits, contract_size), origin_market_status,
+            lambda: self._create_simulated_fixed_market_status(
+                symbol, price_example, with_fixer, remove_price_limits, contract_size
+            )
+        )
+
+    def _get_origin_market_status(self, symbol):
+        market_status, is_real = self.connector.get_market_status(symbol, with_fixer=False)
+        # default market statuses are always the same but are a new dict each time
+        return (market_status if is_real else None), is_real
+
+    def _create_simulated_fixed_market_status(self, symbol, price_example, with_fixer, remove_price_limits,
+                                              contract_size):
         market_status, is_real = self.connector.get_market_status(symbol, with_fixer=False)
         market_status = copy.deepcopy(market_status)
         if is_real:
@@ -147,8 +166,8 @@ class ExchangeSimulator(rest_exchange.RestExchange):
                 market_status,
                 remove_price_limits=remove_price_limits
             )
-            if adapt_for_contract_size and self.exchange_manager.is_future:
-                self._adapt_market_status_for_contract_size(market_status, self.get_contract_size(symbol))
+            if contract_size is not None:
+                self._adapt_market_status_for_contract_size(market_status, contract_size)
         if with_fixer:
             return exchange_util.ExchangeMarketStatusFixer(market_status, price_example).market_status
         return market_status
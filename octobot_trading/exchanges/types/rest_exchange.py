@@ -32,6 +32,7 @@ from octobot_commons import number_util
 import octobot_trading.enums as enums
 import octobot_trading.constants as constants
 import octobot_trading.errors as errors
+import octobot_trading.util as util
 import octobot_trading.exchanges.util as exchanges_util
 import octobot_trading.exchanges.connectors.ccxt.ccxt_connector as ccxt_connector
 from octobot_trading.enums import ExchangeConstantsOrderColumns as ecoc
@@ -144,6 +145,9 @@ class RestExchange(abstract_exchange.AbstractExchange):
             self._apply_fetched_details(config, exchange_manager)
         self.connector = self._create_connector(config, exchange_manager, connector_class)
         self.pair_contracts = {}
+        # read-only market statuses by symbol and market status options, with the connector market status
+        # they are created from
+        self._market_statuses_cache = {}
 
     def _create_connector(self, config, exchange_manager, connector_class):
         return (connector_class or self.DEFAULT_CONNECTOR_CLASS)(
@@ -376,6 +380,7 @@ class RestExchange(abstract_exchange.AbstractExchange):
                 f"This might be due to an update on {self.name} market rules. Fetching updated rules."
             )
             await self.connector.load_symbol_markets(reload=True, market_filter=self.exchange_manager.market_filter)
+            self.clear_market_statuses_cache()
             # retry order creation with updated markets (ccxt will use the updated market values)
             return await self._create_specific_order(order_type, symbol, quantity, price=price,
                                                      stop_price=stop_price, side=side,
@@ -501,7 +506,9 @@ class RestExchange(abstract_exchange.AbstractExchange):
 
     def get_market_status(self, symbol, price_example=None, with_fixer=True):
         """
-        Override using get_fixed_market_status in exchange tentacle if the default market status is not as expected
+        Override using get_fixed_market_status in exchange tentacle if the default market status is not as expected.
+        Returned market statuses are cached, shared and read-only (lists are tuples): callers and overrides have to
+        copy.deepcopy them before making changes.
         """
         if self._should_fix_market_status():
             return self.get_fixed_market_status(
@@ -511,7 +518,10 @@ class RestExchange(abstract_exchange.AbstractExchange):
                 remove_price_limits=self._should_remove_market_status_limits(),
                 adapt_for_contract_size=self._should_adapt_market_status_for_contract_size()
             )
-        return self.connector.get_market_status(symbol, price_example=price_example, with_fixer=with_fixer)
+        return self._get_cached_market_status(
+            symbol, price_example, (with_fixer, ), self.connector.get_market_status(symbol, with_fixer=False),
+            lambda: self.connector.get_market_status(symbol, price_example=price_example, with_fixer=with_fixer)
+        )
 
     def get_fixed_market_status(self, symbol, price_example=None, with_fixer=True, remove_price_limits=False,
                                 adapt_for_contract_size=False):
@@ -520,20 +530,67 @@ class RestExchange(abstract_exchange.AbstractExchange):
         calling _fix_market_status.
         Changes PRECISION_AMOUNT and PRECISION_PRICE from decimals to integers
         (use number of digits instead of price example) by default.
-        Override _fix_market_status to change other elements
+        Override _fix_market_status to change other elements.
+        Returned market statuses are cached by symbol, options and contract size, shared and read-only
+        (lists are tuples): callers and overrides have to copy.deepcopy them before making changes.
         """
+        connector_market_status = self.connector.get_market_status(symbol, with_fixer=False)
+        adapt_for_contract_size = adapt_for_contract_size and self.exchange_manager.is_future
+        contract_size = self.get_contract_size(symbol) if adapt_for_contract_size else None
+        return self._get_cached_market_status(
+            symbol, price_example, (with_fixer, remove_price_limits, contract_size), connector_market_status,
+            lambda: self._create_fixed_market_status(
+                connector_market_status, price_example, with_fixer, remove_price_limits, contract_size
+            )
+        )
+
+    def _create_fixed_market_status(self, connector_market_status, price_example, with_fixer, remove_price_limits,
+                                    contract_size):
         market_status = self.connector.adapter.adapt_market_status(
-            copy.deepcopy(
-                self.connector.get_market_status(symbol, with_fixer=False)
-            ),
+            copy.deepcopy(connector_market_status),
             remove_price_limits=remove_price_limits
         )
-        if adapt_for_contract_size and self.exchange_manager.is_future:
-            self._adapt_market_status_for_contract_size(market_status, self.get_contract_size(symbol))
+        if contract_size is not None:
+            self._adapt_market_status_for_contract_size(market_status, contract_size)
         if with_fixer:
             return exchanges_util.ExchangeMarketStatusFixer(market_status, price_example).market_status
         return market_status
 
+    def _get_cached_market_status(self, symbol, price_example, options, origin_market_status, create_market_status):
+        """
+        :param symbol: the market status symbol
+        :param price_example: the price example given to the market status fixer,
+        market statuses created from a price example are not cached
+        :param options: the options used to create the market status
+        :param origin_market_status: the connector market status the market status is created from,
+        cached market statuses are outdated when markets are reloaded and this market status is replaced
+        :param create_market_status: creates the market status
+        :return: the read-only market status
+        """
+        if price_example is not None:
+            return util.to_read_only(create_market_status())
+        cache_key = (symbol, options)
+        try:
+            cached_origin_market_status, market_status = self._market_statuses_cache[cache_key]
+            if cached_origin_market_status is origin_market_status:
+                return market_status
+        except KeyError:
+            pass
+        market_status = util.to_read_only(create_market_status())
+        self._market_statuses_cache[cache_key] = (origin_market_status, market_status)
+        return market_status
+
+    def clear_market_statuses_cache(self):
+        self._market_statuses_cache = {}
+
+    def get_symbol_trading_rules(self, symbol, with_fixer=True):
+        """
+        :param symbol: the symbol to get trading rules of
+        :param with_fixer: when True, rules are compiled from the fixed market status
+        :return: the symbol trading rules compiled from the cached market status of this symbol
+        """
+        return orders.get_symbol_trading_rules(self.get_market_status(symbol, with_fixer=with_fixer))
+
     def _apply_contract_size(self, value, contract_size):
         if value is None:
             return value
@@ -13,10 +13,12 @@
 #
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
+import copy
 import decimal
 import math
 
 import octobot_commons.logging as logging
+import octobot_trading.util as util
 from octobot_trading.enums import ExchangeConstantsMarketStatusColumns as Ecmsc
 from octobot_trading.enums import ExchangeConstantsMarketStatusInfoColumns as Ecmsic
 
@@ -128,7 +130,9 @@ class ExchangeMarketStatusFixer:
 
     def __init__(self, market_status, price_example=None):
         self.logger = logging.get_logger(self.__class__.__name__)
-        self.market_status = market_status
+        # market status is fixed in place: fix a copy of read-only market statuses
+        self.market_status = copy.deepcopy(market_status) \
+            if isinstance(market_status, util.ReadOnlyDict) else market_status
         self.price_example = price_example
 
         if Ecmsc.INFO.value in self.market_status:
@@ -84,6 +84,8 @@ from octobot_trading.personal_data.orders import (
     decimal_check_and_adapt_order_details_if_necessary,
     add_dusts_to_quantity_if_necessary,
     decimal_add_dusts_to_quantity_if_necessary,
+    SymbolTradingRules,
+    get_symbol_trading_rules,
     create_order_from_raw,
     create_order_instance_from_raw,
     create_order_from_type,
@@ -92,6 +94,7 @@ from octobot_trading.personal_data.orders import (
     create_order_from_order_storage_details,
     OrdersProducer,
     OrdersChannel,
+    IndexedOrders,
     OrdersManager,
     OrdersUpdaterSimulator,
     CloseOrderState,
@@ -149,6 +152,7 @@ from octobot_trading.personal_data.portfolios import (
     get_coefficient_of_determination,
     get_asset_price_from_converter_or_tickers,
     HistoricalAssetValue,
+    HistoricalPortfolioValues,
     HistoricalPortfolioValueManager,
 )
 from octobot_trading.personal_data import positions
@@ -179,6 +183,7 @@ from octobot_trading.personal_data.positions import (
 from octobot_trading.personal_data import trades
 from octobot_trading.personal_data.trades import (
     TradesManager,
+    TradesStore,
     TradesProducer,
     TradesChannel,
     create_trade_instance_from_raw,
@@ -308,6 +313,8 @@ __all__ = [
     "decimal_check_and_adapt_order_details_if_necessary",
     "add_dusts_to_quantity_if_necessary",
     "decimal_add_dusts_to_quantity_if_necessary",
+    "SymbolTradingRules",
+    "get_symbol_trading_rules",
     "create_order_from_raw",
     "create_order_instance_from_raw",
     "create_order_from_type",
@@ -316,6 +323,7 @@ __all__ = [
     "create_order_from_order_storage_details",
     "OrdersProducer",
     "OrdersChannel",
+    "IndexedOrders",
     "OrdersManager",
     "OrdersUpdaterSimulator",
     "CloseOrderState",
@@ -371,6 +379,7 @@ __all__ = [
     "get_draw_down",
     "create_historical_asset_value_from_dict_like_object",
     "HistoricalAssetValue",
+    "HistoricalPortfolioValues",
     "HistoricalPortfolioValueManager",
     "PositionsUpdaterSimulator",
     "Position",
@@ -393,6 +402,7 @@ __all__ = [
     "parse_position_margin_type",
     "parse_position_mode",
     "TradesManager",
+    "TradesStore",
     "TradesProducer",
     "TradesChannel",
     "create_trade_instance_from_raw",
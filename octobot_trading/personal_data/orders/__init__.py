@@ -68,6 +68,10 @@ from octobot_trading.personal_data.orders.channel import (
     OrdersUpdater,
     OrdersUpdaterSimulator,
 )
+from octobot_trading.personal_data.orders import indexed_orders
+from octobot_trading.personal_data.orders.indexed_orders import (
+    IndexedOrders,
+)
 from octobot_trading.personal_data.orders import orders_manager
 from octobot_trading.personal_data.orders.orders_manager import (
     OrdersManager,
@@ -136,6 +140,11 @@ from octobot_trading.personal_data.orders.decimal_order_adapter import (
     decimal_check_and_adapt_order_details_if_necessary,
     decimal_add_dusts_to_quantity_if_necessary,
 )
+from octobot_trading.personal_data.orders import symbol_trading_rules
+from octobot_trading.personal_data.orders.symbol_trading_rules import (
+    SymbolTradingRules,
+    get_symbol_trading_rules,
+)
 from octobot_trading.personal_data.orders import order_factory
 from octobot_trading.personal_data.orders.order_factory import (
     create_order_from_raw,
@@ -206,6 +215,8 @@ __all__ = [
     "decimal_check_and_adapt_order_details_if_necessary",
     "add_dusts_to_quantity_if_necessary",
     "decimal_add_dusts_to_quantity_if_necessary",
+    "SymbolTradingRules",
+    "get_symbol_trading_rules",
     "create_order_from_raw",
     "create_order_instance_from_raw",
     "create_order_from_type",
@@ -214,6 +225,7 @@ __all__ = [
     "create_order_from_order_storage_details",
     "OrdersProducer",
     "OrdersChannel",
+    "IndexedOrders",
     "OrdersManager",
     "OrdersUpdaterSimulator",
     "CloseOrderState",
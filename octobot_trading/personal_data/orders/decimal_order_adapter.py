@@ -23,6 +23,7 @@ import octobot_trading.errors as errors
 import octobot_trading.enums as enums
 import octobot_trading.exchanges as exchanges
 import octobot_trading.personal_data as personal_data
+import octobot_trading.personal_data.orders.symbol_trading_rules as symbol_trading_rules
 from octobot_trading.enums import ExchangeConstantsMarketStatusColumns as Ecmsc
 
 DECIMAL_SCIENTIFIC_NOTATION_EXP = "E-"
@@ -98,34 +99,13 @@ def decimal_trunc_with_n_decimal_digits(value, digits, truncate=True):  # TODO m
 
 
 def decimal_adapt_order_quantity_because_quantity(limiting_value, max_value, quantity_to_adapt, price, symbol_market):
-    orders = []
-    nb_full_orders = limiting_value // max_value
-    rest_order_quantity = limiting_value % max_value
-    after_rest_quantity_to_adapt = quantity_to_adapt
-
-    if rest_order_quantity > constants.ZERO:
-        after_rest_quantity_to_adapt -= rest_order_quantity
-        valid_last_order_quantity = decimal_adapt_quantity(symbol_market, rest_order_quantity)
-        orders.append((valid_last_order_quantity, price))
-
-    other_orders_quantity = (after_rest_quantity_to_adapt + max_value) / (nb_full_orders + constants.ONE)
-    valid_other_orders_quantity = decimal_adapt_quantity(symbol_market, other_orders_quantity)
-    orders += [(valid_other_orders_quantity, price)] * int(nb_full_orders)
-    return orders
+    return symbol_trading_rules.get_symbol_trading_rules(symbol_market).split_by_quantity(
+        limiting_value, max_value, quantity_to_adapt, price
+    )
 
 
 def decimal_adapt_order_quantity_because_price(limiting_value, max_value, price, symbol_market):
-    orders = []
-    nb_full_orders = limiting_value // max_value
-    rest_order_cost = limiting_value % max_value
-    if rest_order_cost > constants.ZERO:
-        valid_last_order_quantity = decimal_adapt_quantity(symbol_market, rest_order_cost / price)
-        orders.append((valid_last_order_quantity, price))
-
-    other_orders_quantity = max_value / price
-    valid_other_orders_quantity = decimal_adapt_quantity(symbol_market, other_orders_quantity)
-    orders += [(valid_other_orders_quantity, price)] * int(nb_full_orders)
-    return orders
+    return symbol_trading_rules.get_symbol_trading_rules(symbol_market).split_by_cost(limiting_value, max_value, price)
 
 
 def decimal_adapt_order_quantity_because_fees(
@@ -163,34 +143,16 @@ def decimal_split_orders(total_order_price, max_cost, valid_quantity, max_quanti
     :param symbol_market:
     :return:
     """
-    if max_cost is None and max_quantity is None:
-        raise RuntimeError("Impossible to split orders with max_cost and max_quantity undefined.")
-    nb_orders_according_to_cost = None
-    nb_orders_according_to_quantity = None
-    if max_cost:
-        nb_orders_according_to_cost = total_order_price / max_cost
-
-    if max_quantity:
-        nb_orders_according_to_quantity = valid_quantity / max_quantity
-
-    if nb_orders_according_to_cost is None:
-        # can only split using quantity
-        return decimal_adapt_order_quantity_because_quantity(valid_quantity, max_quantity,
-                                                             quantity, price, symbol_market)
-    elif nb_orders_according_to_quantity is None:
-        # can only split using price
-        return decimal_adapt_order_quantity_because_price(total_order_price, max_cost, price, symbol_market)
-    else:
-        if nb_orders_according_to_cost > nb_orders_according_to_quantity:
-            return decimal_adapt_order_quantity_because_price(total_order_price, max_cost, price, symbol_market)
-        return decimal_adapt_order_quantity_because_quantity(valid_quantity, max_quantity,
-                                                             quantity, price, symbol_market)
+    return symbol_trading_rules.get_symbol_trading_rules(symbol_market).split_orders(
+        total_order_price, max_cost, valid_quantity, max_quantity, price, quantity
+    )
 
 
 def decimal_check_and_adapt_order_details_if_necessary(quantity, price, symbol_market, fixed_symbol_data=False,
                                                        truncate=True):
     """
-    Checks if order attributes are valid and try to fix it if not
+    Checks if order attributes are valid and try to fix it if not.
+    Use a SymbolTradingRules to adapt many orders of the same symbol.
     :param quantity:
     :param price:
     :param symbol_market:
@@ -198,86 +160,9 @@ def decimal_check_and_adapt_order_details_if_necessary(quantity, price, symbol_m
     :param truncate:
     :return:
     """
-    if quantity.is_nan() or price.is_nan() or price == constants.ZERO:
-        return []
-
-    symbol_market_limits = symbol_market[Ecmsc.LIMITS.value]
-
-    limit_amount = symbol_market_limits[Ecmsc.LIMITS_AMOUNT.value]
-    limit_cost = symbol_market_limits[Ecmsc.LIMITS_COST.value]
-    limit_price = symbol_market_limits[Ecmsc.LIMITS_PRICE.value]
-
-    # adapt digits if necessary
-    valid_quantity = decimal_adapt_quantity(symbol_market, quantity, truncate)
-    valid_price = decimal_adapt_price(symbol_market, price, truncate)
-
-    # case 1: try with data directly from exchange
-    if personal_data.is_valid(limit_amount, Ecmsc.LIMITS_AMOUNT_MIN.value, zero_valid=True):
-        min_quantity = decimal.Decimal(str(limit_amount.get(Ecmsc.LIMITS_AMOUNT_MIN.value, math.nan)))
-        max_quantity = None
-        # not all symbol data have a max quantity
-        if personal_data.is_valid(limit_amount, Ecmsc.LIMITS_AMOUNT_MAX.value, zero_valid=False):
-            max_quantity = decimal.Decimal(str(limit_amount.get(Ecmsc.LIMITS_AMOUNT_MAX.value, math.nan)))
-
-        total_order_price = valid_quantity * valid_price
-
-        if valid_quantity < min_quantity:
-            # invalid order
-            return []
-
-        # case 1.1: use only quantity and cost
-        if personal_data.is_valid(limit_cost, Ecmsc.LIMITS_COST_MIN.value, zero_valid=True):
-            min_cost = decimal.Decimal(str(limit_cost.get(Ecmsc.LIMITS_COST_MIN.value, math.nan)))
-            max_cost = None
-            # not all symbol data have a max cost
-            if personal_data.is_valid(limit_cost, Ecmsc.LIMITS_COST_MAX.value, zero_valid=False):
-                max_cost = decimal.Decimal(str(limit_cost.get(Ecmsc.LIMITS_COST_MAX.value, math.nan)))
-
-            # check total_order_price not < min_cost
-            if not personal_data.check_cost(float(total_order_price), min_cost):
-                return []
-
-            # check total_order_price not > max_cost and valid_quantity not > max_quantity
-            elif (max_cost is not None and total_order_price > max_cost) or \
-                    (max_quantity is not None and valid_quantity > max_quantity):
-                # split quantity into smaller orders
-                return decimal_split_orders(total_order_price, max_cost, valid_quantity,
-                                            max_quantity, valid_price, quantity, symbol_market)
-
-            else:
-                # valid order that can be handled by the exchange
-                return [(valid_quantity, valid_price)]
-
-        # case 1.2: use only quantity and price (if available)
-        else:
-            if personal_data.is_valid(limit_price, Ecmsc.LIMITS_PRICE_MIN.value, zero_valid=True):
-                min_price = decimal.Decimal(str(limit_price.get(Ecmsc.LIMITS_PRICE_MIN.value, math.nan)))
-                max_price = None
-                # not all symbol data have a max price
-                if personal_data.is_valid(limit_price, Ecmsc.LIMITS_PRICE_MAX.value, zero_valid=False):
-                    max_price = decimal.Decimal(str(limit_price.get(Ecmsc.LIMITS_PRICE_MAX.value, math.nan)))
-
-                if (max_price is not None and (valid_price > max_price)) or valid_price < min_price:
-                    # invalid order
-                    return []
-
-            # check total_order_price not > max_cost and valid_quantity not > max_quantity
-            if max_quantity is not None and valid_quantity > max_quantity:
-                # split quantity into smaller orders
-                return decimal_adapt_order_quantity_because_quantity(valid_quantity, max_quantity,
-                                                                     quantity, valid_price, symbol_market)
-            else:
-                # valid order that can be handled wy the exchange
-                return [(valid_quantity, valid_price)]
-
-    if not fixed_symbol_data:
-        # case 2: try fixing data from exchanges
-        fixed_data = exchanges.ExchangeMarketStatusFixer(symbol_market, float(price)).market_status
-        return decimal_check_and_adapt_order_details_if_necessary(quantity, price, fixed_data,
-                                                                  fixed_symbol_data=True, truncate=truncate)
-    else:
-        # impossible to check if order is valid: try anyway, the exchange will tell
-        return [(valid_quantity, valid_price)]
+    return symbol_trading_rules.get_symbol_trading_rules(
+        symbol_market, fixed_symbol_data=fixed_symbol_data
+    ).split_into_valid_orders(quantity, price, truncate=truncate)
 
 
 def decimal_add_dusts_to_quantity_if_necessary(quantity, price, symbol_market, current_symbol_holding):
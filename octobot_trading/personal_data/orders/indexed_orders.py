@@ -0,0 +1,181 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import collections
+import itertools
+
+
+class IndexedOrders(collections.OrderedDict):
+    """
+    Orders by key (usually their order_id), also indexed by symbol, status, exchange order id, order group name and tag.
+    Indexes are updated when orders are added or removed and when an indexed attribute of an order changes:
+    added orders notify their changes through update_order_indexes().
+    Indexed orders are returned in insertion order.
+    """
+    SYMBOL = "symbol"
+    STATUS = "status"
+    EXCHANGE_ORDER_ID = "exchange_order_id"
+    ORDER_GROUP = "order_group"
+    TAG = "tag"
+    INDEXED_ATTRIBUTES = (SYMBOL, STATUS, EXCHANGE_ORDER_ID, ORDER_GROUP, TAG)
+
+    def __init__(self, orders=None):
+        self._indexes = {attribute: {} for attribute in self.INDEXED_ATTRIBUTES}
+        # (attribute, value) of index buckets that are not in insertion order anymore
+        self._unsorted_buckets = set()
+        self._indexed_values = {}
+        self._sequences = {}
+        self._sequence = itertools.count()
+        self._keys_by_order = {}
+        super().__init__()
+        if orders:
+            self.update(orders)
+
+    def __setitem__(self, key, order):
+        is_new_key = key not in self
+        if is_new_key:
+            self._sequences[key] = next(self._sequence)
+        else:
+            self._unindex_order(key, self[key])
+        super().__setitem__(key, order)
+        self._index_order(key, order, is_new_key)
+
+    def __delitem__(self, key):
+        self._unindex_order(key, self[key])
+        self._sequences.pop(key, None)
+        super().__delitem__(key)
+
+    def pop(self, key, *default):
+        if key not in self:
+            if default:
+                return default[0]
+            raise KeyError(key)
+        order = super().pop(key)
+        self._unindex_order(key, order)
+        self._sequences.pop(key, None)
+        return order
+
+    def popitem(self, last=True):
+        key, order = super().popitem(last=last)
+        self._unindex_order(key, order)
+        self._sequences.pop(key, None)
+        return key, order
+
+    def clear(self):
+        for key, order in list(self.items()):
+            self._unindex_order(key, order)
+        self._unsorted_buckets.clear()
+        self._sequences.clear()
+        super().clear()
+
+    def get_indexed_orders(self, attribute, value) -> list:
+        """
+        :param attribute: the indexed attribute
+        :param value: the attribute value
+        :return: the orders which attribute is value, in insertion order
+        """
+        return list(self._get_bucket(attribute, value).values())
+
+    def get_orders_candidates(self, **indexed_values):
+        """
+        :param indexed_values: the required value of indexed attributes
+        :return: the smallest collection of orders (in insertion order) containing every order
+        matching every given value. Orders still have to be filtered on the other given values
+        """
+        if not indexed_values:
+            return self.values()
+        attribute, value = min(
+            indexed_values.items(),
+            key=lambda indexed_value: len(self._indexes[indexed_value[0]].get(indexed_value[1], ()))
+        )
+        if len(self._indexes[attribute].get(value, ())) * 2 > len(self):
+            # filtering every order is cheaper than sorting a large bucket
+            return self.values()
+        return self._get_bucket(attribute, value).values()
+
+    def update_order_indexes(self, order):
+        """
+        Should be called when an indexed attribute of an order changes
+        :param order: the updated order
+        """
+        key = self._keys_by_order.get(id(order))
+        if key is None:
+            return
+        previous_values = self._indexed_values[key]
+        values = _get_indexed_values(order)
+        if values == previous_values:
+            return
+        for attribute, previous_value, value in zip(self.INDEXED_ATTRIBUTES, previous_values, values):
+            if value != previous_value:
+                self._remove_from_bucket(attribute, previous_value, key)
+                self._add_to_bucket(attribute, value, key, order, False)
+        self._indexed_values[key] = values
+
+    def _index_order(self, key, order, is_new_key):
+        values = _get_indexed_values(order)
+        for attribute, value in zip(self.INDEXED_ATTRIBUTES, values):
+            self._add_to_bucket(attribute, value, key, order, is_new_key)
+        self._indexed_values[key] = values
+        self._keys_by_order[id(order)] = key
+        order.orders_index = self
+
+    def _unindex_order(self, key, order):
+        values = self._indexed_values.pop(key, None)
+        if values is None:
+            return
+        for attribute, value in zip(self.INDEXED_ATTRIBUTES, values):
+            self._remove_from_bucket(attribute, value, key)
+        if self._keys_by_order.get(id(order)) == key:
+            self._keys_by_order.pop(id(order))
+            if getattr(order, "orders_index", None) is self:
+                order.orders_index = None
+
+    def _add_to_bucket(self, attribute, value, key, order, is_new_key):
+        bucket = self._indexes[attribute].setdefault(value, {})
+        if bucket and not is_new_key:
+            # an older order is appended after newer ones
+            self._unsorted_buckets.add((attribute, value))
+        bucket[key] = order
+
+    def _remove_from_bucket(self, attribute, value, key):
+        index = self._indexes[attribute]
+        bucket = index.get(value)
+        if bucket is None:
+            return
+        bucket.pop(key, None)
+        if not bucket:
+            index.pop(value)
+            self._unsorted_buckets.discard((attribute, value))
+
+    def _get_bucket(self, attribute, value) -> dict:
+        bucket = self._indexes[attribute].get(value)
+        if bucket is None:
+            return {}
+        if (attribute, value) in self._unsorted_buckets:
+            bucket = self._indexes[attribute][value] = dict(
+                sorted(bucket.items(), key=lambda item: self._sequences[item[0]])
+            )
+            self._unsorted_buckets.discard((attribute, value))
+        return bucket
+
+
+def _get_indexed_values(order) -> tuple:
+    return (
+        order.symbol,
+        order.status,
+        order.exchange_order_id,
+        None if order.order_group is None else order.order_group.name,
+        order.tag,
+    )
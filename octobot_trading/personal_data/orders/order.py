@@ -41,6 +41,8 @@ class Order(util.Initializable):
 
     def __init__(self, trader, side=None):
         super().__init__()
+        # IndexedOrders to notify on indexed attributes changes, set when added to an OrdersManager
+        self.orders_index = None
         self.trader: octobot_trading.exchanges.traders.trader.Trader = trader
         self.exchange_manager = trader.exchange_manager
         self.lock = asyncio.Lock()
@@ -124,6 +126,55 @@ class Order(util.Initializable):
         # kwargs given to trader.create_order() when this order should be created later on
         self.trader_creation_kwargs = {}
 
+    @property
+    def symbol(self):
+        return self._symbol
+
+    @symbol.setter
+    def symbol(self, symbol):
+        self._symbol = symbol
+        self._update_orders_index()
+
+    @property
+    def status(self):
+        return self._status
+
+    @status.setter
+    def status(self, status):
+        self._status = status
+        self._update_orders_index()
+
+    @property
+    def exchange_order_id(self):
+        return self._exchange_order_id
+
+    @exchange_order_id.setter
+    def exchange_order_id(self, exchange_order_id):
+        self._exchange_order_id = exchange_order_id
+        self._update_orders_index()
+
+    @property
+    def tag(self):
+        return self._tag
+
+    @tag.setter
+    def tag(self, tag):
+        self._tag = tag
+        self._update_orders_index()
+
+    @property
+    def order_group(self):
+        return self._order_group
+
+    @order_group.setter
+    def order_group(self, order_group):
+        self._order_group = order_group
+        self._update_orders_index()
+
+    def _update_orders_index(self):
+        if self.orders_index is not None:
+            self.orders_index.update_order_indexes(self)
+
     @classmethod
     def get_name(cls):
         return cls.__name__
@@ -13,7 +13,6 @@
 #
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
-import collections
 import uuid
 import typing
 import contextlib
@@ -28,6 +27,7 @@ import octobot_trading.personal_data.orders.order as order_class
 import octobot_trading.personal_data.orders.order_factory as order_factory
 import octobot_trading.personal_data.orders.order_util as order_util
 import octobot_trading.personal_data.orders.order_group as order_group_import
+import octobot_trading.personal_data.orders.indexed_orders as indexed_orders
 
 
 class OrdersManager(util.Initializable):
@@ -39,13 +39,22 @@ class OrdersManager(util.Initializable):
         self.trader = trader
         self.orders_initialized = False
         self.enable_order_auto_synchronization = True
-        self.orders: collections.OrderedDict[str, order_class.Order] = collections.OrderedDict()
+        self._orders: indexed_orders.IndexedOrders[str, order_class.Order] = indexed_orders.IndexedOrders()
         self.order_groups: dict[str, order_group_import.OrderGroup] = {}
         # orders that are expected from exchange but have not yet been fetched: will be removed when fetched
         self.pending_creation_orders: list[order_class.Order] = []
         # if this the orders manager completed the initial exchange orders sync phase (only on real trader)
         self.are_exchange_orders_initialized = self.trader.simulate
 
+    @property
+    def orders(self) -> indexed_orders.IndexedOrders:
+        return self._orders
+
+    @orders.setter
+    def orders(self, orders):
+        self._orders = orders if isinstance(orders, indexed_orders.IndexedOrders) \
+            else indexed_orders.IndexedOrders(orders)
+
     async def initialize_impl(self):
         self._reset_orders()
 
@@ -83,18 +92,17 @@ class OrdersManager(util.Initializable):
 
     def get_order(self, order_id, exchange_order_id=None):
         if order_id is None:
-            for order in self.orders.values():
+            for order in self.orders.get_orders_candidates(exchange_order_id=exchange_order_id):
                 if order.exchange_order_id == exchange_order_id:
                     return order
             raise KeyError(exchange_order_id)
         return self.orders[order_id]
 
     def get_order_from_group(self, group_name):
-        return [
-            order
-            for order in self.orders.values()
-            if order.order_group is not None and order.order_group.name == group_name
-        ]
+        if group_name is None:
+            # orders without group are not part of a None named group
+            return []
+        return self.orders.get_indexed_orders(indexed_orders.IndexedOrders.ORDER_GROUP, group_name)
 
     def get_or_create_group(self, group_type, group_name):
         """
@@ -207,7 +215,7 @@ class OrdersManager(util.Initializable):
                 return True
             except KeyError:
                 return False
-        return order_id in set(self.orders.keys())
+        return order_id in self.orders
 
     def remove_order_instance(self, order):
         if self.has_order(order.order_id):
@@ -239,7 +247,7 @@ class OrdersManager(util.Initializable):
     # private methods
     def _reset_orders(self):
         self.orders_initialized = False
-        self.orders = collections.OrderedDict()
+        self.orders.clear()
         for group in self.order_groups.values():
             group.clear()
         self.order_groups = {}
@@ -251,9 +259,16 @@ class OrdersManager(util.Initializable):
     def _select_orders(
         self, state=None, symbol=None, since=constants.NO_DATA_LIMIT, 
         until=constants.NO_DATA_LIMIT, limit=constants.NO_DATA_LIMIT, tag=None):
+        indexed_values = {}
+        if state is not None:
+            indexed_values[indexed_orders.IndexedOrders.STATUS] = state
+        if symbol:
+            indexed_values[indexed_orders.IndexedOrders.SYMBOL] = symbol
+        if tag is not None:
+            indexed_values[indexed_orders.IndexedOrders.TAG] = tag
         orders = [
             order
-            for order in self.orders.values()
+            for order in self.orders.get_orders_candidates(**indexed_values)
             if (
                     (state is None or order.status == state) and
                     (symbol is None or (symbol and order.symbol == symbol)) and
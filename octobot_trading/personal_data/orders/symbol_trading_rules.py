@@ -0,0 +1,256 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import decimal
+
+import octobot_trading.constants as constants
+import octobot_trading.util as util
+import octobot_trading.exchanges.util.exchange_market_status_fixer as exchange_market_status_fixer
+from octobot_trading.enums import ExchangeConstantsMarketStatusColumns as Ecmsc
+
+
+class SymbolTradingRules:
+    """
+    Order price and quantity rules of a symbol, compiled once from its market status.
+    Applies the same rules as decimal_order_adapter.decimal_check_and_adapt_order_details_if_necessary without
+    reading the market status and converting its limits for each order.
+    """
+
+    def __init__(self, symbol_market, fixed_symbol_data=False):
+        """
+        :param symbol_market: the symbol market status
+        :param fixed_symbol_data: True when symbol_market has already been fixed by the ExchangeMarketStatusFixer
+        """
+        self.symbol_market = symbol_market
+        self.fixed_symbol_data = fixed_symbol_data
+
+        precision = symbol_market[Ecmsc.PRECISION.value]
+        self.price_digits = precision.get(Ecmsc.PRECISION_PRICE.value, constants.CURRENCY_DEFAULT_MAX_PRICE_DIGITS)
+        self.amount_digits = precision.get(Ecmsc.PRECISION_AMOUNT.value, 0)
+        self.tick_size = _get_quantum(self.price_digits)
+        self.quantum = _get_quantum(self.amount_digits)
+
+        # limits are None when missing or invalid
+        limits = symbol_market.get(Ecmsc.LIMITS.value, {})
+        limit_amount = limits.get(Ecmsc.LIMITS_AMOUNT.value, {})
+        limit_cost = limits.get(Ecmsc.LIMITS_COST.value, {})
+        limit_price = limits.get(Ecmsc.LIMITS_PRICE.value, {})
+        self.min_quantity = _get_limit(limit_amount, Ecmsc.LIMITS_AMOUNT_MIN.value, True)
+        self.max_quantity = _get_limit(limit_amount, Ecmsc.LIMITS_AMOUNT_MAX.value, False)
+        self.min_cost = _get_limit(limit_cost, Ecmsc.LIMITS_COST_MIN.value, True)
+        self.max_cost = _get_limit(limit_cost, Ecmsc.LIMITS_COST_MAX.value, False)
+        self.min_price = _get_limit(limit_price, Ecmsc.LIMITS_PRICE_MIN.value, True)
+        self.max_price = _get_limit(limit_price, Ecmsc.LIMITS_PRICE_MAX.value, False)
+
+    def round_price(self, price, truncate=True):
+        """
+        :param price: the price to round
+        :param truncate: when False, price is rounded up
+        :return: the price with at most price_digits decimal digits
+        """
+        return _trunc_with_quantum(price, self.price_digits, self.tick_size, truncate)
+
+    def round_quantity(self, quantity, truncate=True):
+        """
+        :param quantity: the quantity to round
+        :param truncate: when False, quantity is rounded up
+        :return: the quantity with at most amount_digits decimal digits
+        """
+        return _trunc_with_quantum(quantity, self.amount_digits, self.quantum, truncate)
+
+    def split_into_valid_orders(self, quantity, price, truncate=True) -> list:
+        """
+        Checks if order attributes are valid and try to fix it if not: rounds quantity and price,
+        splits too large orders and ignores too small orders
+        :param quantity: the order quantity
+        :param price: the order price
+        :param truncate: when False, quantity and price are rounded up
+        :return: the (quantity, price) list of valid orders
+        """
+        if quantity.is_nan() or price.is_nan() or price == constants.ZERO:
+            return []
+
+        # adapt digits if necessary
+        valid_quantity = self.round_quantity(quantity, truncate)
+        valid_price = self.round_price(price, truncate)
+
+        # case 1: try with data directly from exchange
+        if self.min_quantity is not None:
+            if valid_quantity < self.min_quantity:
+                # invalid order
+                return []
+            total_order_price = valid_quantity * valid_price
+
+            # case 1.1: use only quantity and cost
+            if self.min_cost is not None:
+                # check total_order_price not < min_cost
+                if float(total_order_price) < self.min_cost:
+                    return []
+                # check total_order_price not > max_cost and valid_quantity not > max_quantity
+                if (self.max_cost is not None and total_order_price > self.max_cost) or \
+                        (self.max_quantity is not None and valid_quantity > self.max_quantity):
+                    # split quantity into smaller orders
+                    return self.split_orders(
+                        total_order_price, self.max_cost, valid_quantity, self.max_quantity, valid_price, quantity
+                    )
+                # valid order that can be handled by the exchange
+                return [(valid_quantity, valid_price)]
+
+            # case 1.2: use only quantity and price (if available)
+            if self.min_price is not None and (
+                valid_price < self.min_price or (self.max_price is not None and valid_price > self.max_price)
+            ):
+                # invalid order
+                return []
+            if self.max_quantity is not None and valid_quantity > self.max_quantity:
+                # split quantity into smaller orders
+                return self.split_by_quantity(valid_quantity, self.max_quantity, quantity, valid_price)
+            # valid order that can be handled by the exchange
+            return [(valid_quantity, valid_price)]
+
+        if not self.fixed_symbol_data:
+            # case 2: try fixing data from exchanges
+            fixed_data = exchange_market_status_fixer.ExchangeMarketStatusFixer(
+                self.symbol_market, float(price)
+            ).market_status
+            return SymbolTradingRules(fixed_data, fixed_symbol_data=True).split_into_valid_orders(
+                quantity, price, truncate=truncate
+            )
+        # impossible to check if order is valid: try anyway, the exchange will tell
+        return [(valid_quantity, valid_price)]
+
+    def adapt_orders(self, orders, truncate=True) -> list:
+        """
+        :param orders: the (quantity, price) of the orders to adapt
+        :param truncate: when False, quantities and prices are rounded up
+        :return: the list of valid (quantity, price) orders of each given order
+        """
+        return [
+            self.split_into_valid_orders(quantity, price, truncate=truncate)
+            for quantity, price in orders
+        ]
+
+    def split_orders(self, total_order_price, max_cost, valid_quantity, max_quantity, price, quantity) -> list:
+        """
+        Splits too big orders into multiple ones according to the most restrictive of max_cost and max_quantity
+        :param total_order_price: the order cost
+        :param max_cost: the maximum cost of an order
+        :param valid_quantity: the rounded order quantity
+        :param max_quantity: the maximum quantity of an order
+        :param price: the order price
+        :param quantity: the order quantity
+        :return: the (quantity, price) list of split orders
+        """
+        if not max_cost and not max_quantity:
+            raise RuntimeError("Impossible to split orders with max_cost and max_quantity undefined.")
+        if not max_cost:
+            # can only split using quantity
+            return self.split_by_quantity(valid_quantity, max_quantity, quantity, price)
+        if not max_quantity or total_order_price / max_cost > valid_quantity / max_quantity:
+            return self.split_by_cost(total_order_price, max_cost, price)
+        return self.split_by_quantity(valid_quantity, max_quantity, quantity, price)
+
+    def split_by_quantity(self, valid_quantity, max_quantity, quantity, price) -> list:
+        """
+        :param valid_quantity: the rounded order quantity
+        :param max_quantity: the maximum quantity of an order
+        :param quantity: the order quantity
+        :param price: the order price
+        :return: the (quantity, price) list of orders of at most max_quantity
+        """
+        orders = []
+        nb_full_orders = valid_quantity // max_quantity
+        rest_order_quantity = valid_quantity % max_quantity
+        after_rest_quantity_to_adapt = quantity
+        if rest_order_quantity > constants.ZERO:
+            after_rest_quantity_to_adapt -= rest_order_quantity
+            orders.append((self.round_quantity(rest_order_quantity), price))
+        other_orders_quantity = (after_rest_quantity_to_adapt + max_quantity) / (nb_full_orders + constants.ONE)
+        orders += [(self.round_quantity(other_orders_quantity), price)] * int(nb_full_orders)
+        return orders
+
+    def split_by_cost(self, total_order_price, max_cost, price) -> list:
+        """
+        :param total_order_price: the order cost
+        :param max_cost: the maximum cost of an order
+        :param price: the order price
+        :return: the (quantity, price) list of orders of at most max_cost
+        """
+        orders = []
+        nb_full_orders = total_order_price // max_cost
+        rest_order_cost = total_order_price % max_cost
+        if rest_order_cost > constants.ZERO:
+            orders.append((self.round_quantity(rest_order_cost / price), price))
+        orders += [(self.round_quantity(max_cost / price), price)] * int(nb_full_orders)
+        return orders
+
+
+_SYMBOL_TRADING_RULES_CACHE = {}
+_MAX_CACHED_SYMBOL_TRADING_RULES = 1024
+
+
+def get_symbol_trading_rules(symbol_market, fixed_symbol_data=False) -> SymbolTradingRules:
+    """
+    :param symbol_market: the symbol market status
+    :param fixed_symbol_data: True when symbol_market has already been fixed by the ExchangeMarketStatusFixer
+    :return: the trading rules of symbol_market, compiled once for each read-only (cached) market status
+    """
+    if not isinstance(symbol_market, util.ReadOnlyDict):
+        # symbol_market can change: rules can't be reused
+        return SymbolTradingRules(symbol_market, fixed_symbol_data=fixed_symbol_data)
+    # cached rules keep a reference to their market status: its id can't be reused while cached
+    cache_key = (id(symbol_market), fixed_symbol_data)
+    try:
+        trading_rules = _SYMBOL_TRADING_RULES_CACHE[cache_key]
+        if trading_rules.symbol_market is symbol_market:
+            return trading_rules
+    except KeyError:
+        pass
+    if len(_SYMBOL_TRADING_RULES_CACHE) >= _MAX_CACHED_SYMBOL_TRADING_RULES:
+        # outdated market statuses (from reloaded markets or price examples) are released
+        _SYMBOL_TRADING_RULES_CACHE.clear()
+    trading_rules = _SYMBOL_TRADING_RULES_CACHE[cache_key] = SymbolTradingRules(
+        symbol_market, fixed_symbol_data=fixed_symbol_data
+    )
+    return trading_rules
+
+
+def _get_quantum(digits):
+    if int(digits) > 0:
+        return constants.ONE.scaleb(-int(digits))
+    return None
+
+
+def _get_limit(limit, key, zero_valid):
+    value = limit.get(key)
+    if key in limit and exchange_market_status_fixer.is_ms_valid(value, zero_valid=zero_valid):
+        return decimal.Decimal(str(value))
+    return None
+
+
+def _trunc_with_quantum(value, digits, quantum, truncate):
+    try:
+        exponent = value.as_tuple().exponent
+        if not isinstance(exponent, int) or exponent >= -digits:
+            # nothing to truncate (or not a finite number)
+            return value
+        if quantum is None:
+            if digits > constants.ZERO:
+                # tick size precisions (ex: 0.01) can't be used as decimal digits: value is kept as is
+                return value
+            return value // constants.ONE
+        return value.quantize(quantum, rounding=decimal.ROUND_DOWN if truncate else decimal.ROUND_UP)
+    except (ValueError, decimal.InvalidOperation):
+        return value
@@ -85,6 +85,7 @@ from octobot_trading.personal_data.portfolios.portfolio_util import (
 from octobot_trading.personal_data.portfolios.history import (
     create_historical_asset_value_from_dict_like_object,
     HistoricalAssetValue,
+    HistoricalPortfolioValues,
     HistoricalPortfolioValueManager,
 )
 
@@ -121,5 +122,6 @@ __all__ = [
     "create_historical_asset_value_from_dict_like_object",
     "get_draw_down",
     "HistoricalAssetValue",
+    "HistoricalPortfolioValues",
     "HistoricalPortfolioValueManager",
 ]
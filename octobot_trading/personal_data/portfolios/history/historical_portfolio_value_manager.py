@@ -13,10 +13,11 @@
 #
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
+import decimal
 import time
 
-import sortedcontainers
 import copy
+import numpy as np
 
 import octobot_commons.logging as logging
 import octobot_commons.constants as commons_constants
@@ -28,12 +29,13 @@ import octobot_trading.errors as errors
 import octobot_trading.constants as constants
 import octobot_trading.personal_data.portfolios.portfolio_util as portfolio_util
 import octobot_trading.personal_data.portfolios.history.historical_asset_value as historical_asset_value
-import octobot_trading.personal_data.portfolios.history.historical_asset_value_factory as historical_asset_value_factory
+import octobot_trading.personal_data.portfolios.history.historical_portfolio_values as historical_portfolio_values
 
 
 class HistoricalPortfolioValueManager(util.Initializable):
     """
-    HistoricalPortfolioValueManager stores and make the portfolio value through time as HistoricalAssetValue
+    HistoricalPortfolioValueManager stores and make the portfolio value through time in HistoricalPortfolioValues
+    columns, saved time frames relevance is maintained on insert
     """
     TABLE_NAME = "historical_portfolio_value"
     DATA_SOURCE_KEY = "data_source"
@@ -77,7 +79,10 @@ class HistoricalPortfolioValueManager(util.Initializable):
         self.ending_portfolio = None
 
         self.max_history_size = self.__class__.MAX_HISTORY_SIZE
-        self.historical_portfolio_value = sortedcontainers.SortedDict()
+        self.historical_portfolio_value = self._create_historical_portfolio_values()
+        # historical values changes since the last pop_history_changes() call
+        self._changed_timestamps = set()
+        self._removed_timestamps = set()
 
     async def initialize_impl(self):
         """
@@ -92,7 +97,8 @@ class HistoricalPortfolioValueManager(util.Initializable):
         self.last_update_time = self.starting_time
         self.starting_portfolio = None
         self.ending_portfolio = None
-        self.historical_portfolio_value = sortedcontainers.SortedDict()
+        self.historical_portfolio_value = self._create_historical_portfolio_values()
+        self._clear_history_changes()
         # reset uploaded portfolio history
         await self.save_historical_portfolio_value(reset=True)
 
@@ -155,34 +161,70 @@ class HistoricalPortfolioValueManager(util.Initializable):
         :param from_timestamp: selected time window start time
         :param to_timestamp: selected time window end time
         """
-        to_timestamp = to_timestamp or self.portfolio_manager.exchange_manager.exchange.get_exchange_current_time()
-        time_frame_seconds = commons_enums.TimeFramesMinutes[time_frame] * commons_constants.MINUTE_TO_SECONDS
-        sorted_available_timestamps = list(self.historical_portfolio_value)
-        relevant_historical_values = [
-            value
-            for timestamp, value in self.historical_portfolio_value.items()
-            if self._is_historical_timestamp_relevant(
-                timestamp, time_frame_seconds, from_timestamp, to_timestamp, sorted_available_timestamps
-            )
-        ]
+        timestamps, values = self.get_historical_values_arrays(currency, time_frame, from_timestamp, to_timestamp)
         historical_values = {}
-        for historical_value in relevant_historical_values:
-            try:
-                historical_values[historical_value.get_timestamp()] = \
-                    self._get_value_in_currency(historical_value, currency)
-            except errors.MissingPriceDataError as e:
-                # do not add missing historical values
-                self.logger.debug(f"Missing price data when computing historical portfolio value: {e}")
+        for timestamp, value in zip(timestamps.tolist(), values.tolist()):
+            timestamp = historical_portfolio_values.to_timestamp(timestamp)
+            if value != value:
+                # NaN: no value in currency
+                try:
+                    value = float(self._convert_historical_value(self.get_historical_value(timestamp), currency))
+                except errors.MissingPriceDataError as e:
+                    # do not add missing historical values
+                    self.logger.debug(f"Missing price data when computing historical portfolio value: {e}")
+                    continue
+            historical_values[timestamp] = value
         return historical_values
 
-    def get_historical_value(self, timestamp):
+    def get_historical_values_arrays(self, currency, time_frame, from_timestamp=0, to_timestamp=None) -> tuple:
+        """
+        Returns the timestamps and portfolio historical values arrays. Values are NaN when the portfolio value
+        in currency is not available at their timestamp. Does not include the current portfolio value
+        :param currency: the currency of values
+        :param time_frame: intervals between values
+        :param from_timestamp: selected time window start time
+        :param to_timestamp: selected time window end time
+        """
+        to_timestamp = to_timestamp or self.portfolio_manager.exchange_manager.exchange.get_exchange_current_time()
+        time_frame_seconds = commons_enums.TimeFramesMinutes[time_frame] * commons_constants.MINUTE_TO_SECONDS
+        timestamps = self.historical_portfolio_value.timestamps
+        start_index = np.searchsorted(timestamps, from_timestamp or 0, side="left")
+        end_index = np.searchsorted(timestamps, to_timestamp or time.time(), side="right")
+        indexes = start_index + np.flatnonzero(
+            self.historical_portfolio_value.get_time_frame_relevance(time_frame_seconds)[start_index:end_index]
+        )
+        return timestamps[indexes], self.historical_portfolio_value.get_column(currency)[indexes]
+
+    def get_historical_value(self, timestamp) -> historical_asset_value.HistoricalAssetValue:
+        """
+        :return: a copy of the value at timestamp, updating it does not update the stored value
+        """
         return self.historical_portfolio_value[timestamp]
 
+    def pop_history_changes(self) -> tuple:
+        """
+        Returns and forgets the historical values changes since the previous call
+        :return: the dict of added or updated historical values and the removed timestamps, sorted by timestamp
+        """
+        changed_values = [
+            self.historical_portfolio_value.get_dict(timestamp)
+            for timestamp in sorted(self._changed_timestamps)
+        ]
+        removed_timestamps = sorted(self._removed_timestamps)
+        self._clear_history_changes()
+        return changed_values, removed_timestamps
+
+    def _clear_history_changes(self):
+        self._changed_timestamps = set()
+        self._removed_timestamps = set()
+
     async def _upsert_value(self, timestamps, value_by_currency, save_changes):
         changed = False
         for timestamp in timestamps:
             try:
-                changed = self.get_historical_value(timestamp).update(value_by_currency) or changed
+                if self.historical_portfolio_value.update_value(timestamp, value_by_currency):
+                    self._changed_timestamps.add(timestamp)
+                    changed = True
             except KeyError:
                 self._add_historical_portfolio_value(timestamp, value_by_currency)
                 changed = True
@@ -197,9 +239,12 @@ class HistoricalPortfolioValueManager(util.Initializable):
                 f"has been reached"
             )
             # remove the oldest element
-            self.historical_portfolio_value.popitem(0)
-        self.historical_portfolio_value[timestamp] = \
-            historical_asset_value.HistoricalAssetValue(timestamp, value_by_currency)
+            removed_timestamp = self.historical_portfolio_value.pop_oldest()
+            self._changed_timestamps.discard(removed_timestamp)
+            self._removed_timestamps.add(removed_timestamp)
+        self.historical_portfolio_value.set_value(timestamp, value_by_currency)
+        self._changed_timestamps.add(timestamp)
+        self._removed_timestamps.discard(timestamp)
 
     def _update_portfolios(self):
         if self.portfolio_manager.portfolio is None or self.portfolio_manager.portfolio.portfolio is None:
@@ -235,15 +280,24 @@ class HistoricalPortfolioValueManager(util.Initializable):
             self.logger.exception(err, True, f"Error when ready portfolio history: {err}")
 
     def _load_historical_values(self, dict_values):
-        self.historical_portfolio_value = sortedcontainers.SortedDict({
+        value_by_currency_by_timestamp = {
             element[historical_asset_value.HistoricalAssetValue.TIMESTAMP_KEY]:
-                historical_asset_value_factory.create_historical_asset_value_from_dict_like_object(
-                    historical_asset_value.HistoricalAssetValue, element
-                )
+                element[historical_asset_value.HistoricalAssetValue.VALUES_KEY]
             for element in dict_values
-        })
+        }
+        self.historical_portfolio_value = self._create_historical_portfolio_values()
+        # oldest values might not have been removed from database yet
+        for timestamp in sorted(value_by_currency_by_timestamp)[-self.max_history_size:]:
+            self.historical_portfolio_value.set_value(timestamp, value_by_currency_by_timestamp[timestamp])
+        self._clear_history_changes()
         self._load_historical_starting_portfolio_values()
 
+    def _create_historical_portfolio_values(self):
+        return historical_portfolio_values.HistoricalPortfolioValues(
+            commons_enums.TimeFramesMinutes[commons_enums.TimeFrames(time_frame)] * commons_constants.MINUTE_TO_SECONDS
+            for time_frame in self.saved_time_frames
+        )
+
     def _load_metadata(self, metadata_list):
         if metadata_list:
             # metadata are always stored as the 1st element of the table
@@ -253,40 +307,10 @@ class HistoricalPortfolioValueManager(util.Initializable):
             self.historical_ending_portfolio = metadata.get(self.ENDING_PORTFOLIO, None)
 
     def _load_historical_starting_portfolio_values(self):
-        self.historical_starting_portfolio_values = {}
-        for value in self.historical_portfolio_value.values():
-            for currency in value.get_currencies():
-                if currency not in self.historical_starting_portfolio_values:
-                    self.historical_starting_portfolio_values[currency] = value.get(currency)
-
-    def _is_historical_timestamp_relevant(
-        self, timestamp, time_frame_seconds, from_timestamp, to_timestamp, sorted_available_timestamps: list
-    ):
-        from_timestamp = from_timestamp or 0
-        to_timestamp = to_timestamp or time.time()
-        return self._is_timestamp_relevant(timestamp, time_frame_seconds, sorted_available_timestamps) and \
-           from_timestamp <= timestamp <= to_timestamp
-
-    @staticmethod
-    def _is_timestamp_relevant(timestamp, time_frame_seconds, sorted_available_timestamps: list):
-        if timestamp % time_frame_seconds == 0:
-            # timestamp is expected at this time
-            return True
-        else:
-            # timestamp is relevant only if there is no other available timestamp within the given timeframe range
-            current_timestamp_index = sorted_available_timestamps.index(timestamp)
-            allowed_delta = time_frame_seconds / 2
-            previous_timestamp = (
-                sorted_available_timestamps[current_timestamp_index - 1]
-                if current_timestamp_index > 0
-                else 0
-            )
-            next_timestamp = (
-                sorted_available_timestamps[current_timestamp_index + 1]
-                if current_timestamp_index < len(sorted_available_timestamps) - 1
-                else (timestamp + allowed_delta)
-            )
-            return previous_timestamp + allowed_delta <= timestamp <= next_timestamp - allowed_delta
+        self.historical_starting_portfolio_values = {
+            currency: decimal.Decimal(f"{value}")
+            for currency, value in self.historical_portfolio_value.get_first_values().items()
+        }
 
     @staticmethod
     def convert_to_historical_timestamp(timestamp, time_frame):
@@ -318,18 +342,14 @@ class HistoricalPortfolioValueManager(util.Initializable):
             return True
         try:
             for currency, value in value_by_currency.items():
-                if self.get_historical_value(time_frame_allowed_window_start).is_significant_change(currency, value):
+                if self.historical_portfolio_value.is_significant_change(
+                    time_frame_allowed_window_start, currency, value
+                ):
                     return True
         except KeyError:
             return True
         return False
 
-    def _get_value_in_currency(self, historical_value, currency):
-        try:
-            return historical_value.get(currency)
-        except KeyError:
-            return self._convert_historical_value(historical_value, currency)
-
     def _convert_historical_value(self, historical_value, target_currency):
         # TODO try to get a more accurate historical value into target_currency currency using price history
         # last chance: try to get any usable value from portfolio value holder (not accurate since used the intermediary
@@ -357,7 +377,7 @@ class HistoricalPortfolioValueManager(util.Initializable):
         raise errors.MissingPriceDataError(f"no price data to evaluate {historical_value} on {target_currency}")
 
     def get_dict_historical_values(self):
-        return [historical_asset.to_dict() for historical_asset in self.historical_portfolio_value.values()]
+        return self.historical_portfolio_value.to_dicts()
 
     def get_metadata(self):
         return {
@@ -0,0 +1,299 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import collections
+import decimal
+
+import numpy as np
+
+import octobot_trading.personal_data.portfolios.history.historical_asset_value as historical_asset_value
+
+
+_INITIAL_CAPACITY = 64
+
+
+class HistoricalPortfolioValues(collections.abc.Mapping):
+    """
+    Historical portfolio values by timestamp, stored in columns: a sorted timestamps array and a float64 values array
+    per currency (NaN when the currency has no value at this timestamp). Each row takes 8 bytes per tracked currency.
+    For each time frame, the relevance of each timestamp (see get_time_frame_relevance) is maintained on insert.
+    Values are materialized as new HistoricalAssetValue instances when accessed by timestamp:
+    updating those instances does not update the stored values.
+    """
+
+    def __init__(self, time_frames_seconds=()):
+        """
+        :param time_frames_seconds: the time frames (in seconds) which relevance should be maintained from the start
+        """
+        self._start = 0
+        self._end = 0
+        self._timestamps = np.empty(_INITIAL_CAPACITY, dtype=np.float64)
+        self._columns = {}
+        self._relevance_by_time_frame = {
+            time_frame_seconds: np.zeros(_INITIAL_CAPACITY, dtype=bool)
+            for time_frame_seconds in time_frames_seconds
+        }
+
+    def __getitem__(self, timestamp) -> historical_asset_value.HistoricalAssetValue:
+        index = self._get_index(timestamp)
+        return historical_asset_value.HistoricalAssetValue(
+            to_timestamp(self._timestamps[index].item()),
+            {
+                currency: decimal.Decimal(f"{value}")
+                for currency, value in self._get_row_values(index).items()
+            }
+        )
+
+    def __contains__(self, timestamp):
+        try:
+            self._get_index(timestamp)
+            return True
+        except KeyError:
+            return False
+
+    def __iter__(self):
+        return iter(self.get_timestamps_list())
+
+    def __len__(self):
+        return self._end - self._start
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        """
+        :return: the sorted timestamps array, should not be modified
+        """
+        return self._timestamps[self._start:self._end]
+
+    def get_timestamps_list(self) -> list:
+        return [to_timestamp(timestamp) for timestamp in self.timestamps.tolist()]
+
+    def get_currencies(self):
+        return self._columns.keys()
+
+    def get_column(self, currency) -> np.ndarray:
+        """
+        :return: the values array of the given currency, aligned on timestamps, should not be modified
+        """
+        try:
+            return self._columns[currency][self._start:self._end]
+        except KeyError:
+            return np.full(len(self), np.nan)
+
+    def get_value(self, timestamp, currency) -> float:
+        """
+        :return: the value of currency at timestamp, raises KeyError when missing
+        """
+        try:
+            value = self._columns[currency][self._get_index(timestamp)]
+        except KeyError as err:
+            raise KeyError(currency) from err
+        if np.isnan(value):
+            raise KeyError(currency)
+        return value.item()
+
+    def get_dict(self, timestamp) -> dict:
+        index = self._get_index(timestamp)
+        return {
+            historical_asset_value.HistoricalAssetValue.TIMESTAMP_KEY: to_timestamp(self._timestamps[index].item()),
+            historical_asset_value.HistoricalAssetValue.VALUES_KEY: self._get_row_values(index),
+        }
+
+    def to_dicts(self) -> list:
+        """
+        :return: every value as HistoricalAssetValue.to_dict() dicts, sorted by timestamp
+        """
+        columns = {
+            currency: self.get_column(currency).tolist()
+            for currency in self._columns
+        }
+        return [
+            {
+                historical_asset_value.HistoricalAssetValue.TIMESTAMP_KEY: to_timestamp(timestamp),
+                historical_asset_value.HistoricalAssetValue.VALUES_KEY: {
+                    currency: values[index]
+                    for currency, values in columns.items()
+                    if values[index] == values[index]  # skip NaN
+                },
+            }
+            for index, timestamp in enumerate(self.timestamps.tolist())
+        ]
+
+    def get_first_values(self) -> dict:
+        """
+        :return: the oldest value of each currency
+        """
+        first_values = {}
+        for currency in self._columns:
+            column = self.get_column(currency)
+            indexes = np.flatnonzero(~np.isnan(column))
+            if len(indexes):
+                first_values[currency] = (indexes[0], column[indexes[0]].item())
+        return {
+            currency: value
+            for currency, (_, value) in sorted(first_values.items(), key=lambda item: item[1][0])
+        }
+
+    def set_value(self, timestamp, value_by_currency):
+        """
+        Adds a value at timestamp, replacing any existing value at this timestamp
+        """
+        try:
+            index = self._get_index(timestamp)
+            for column in self._columns.values():
+                column[index] = np.nan
+        except KeyError:
+            index = self._insert_row(timestamp)
+        self._write_values(index, value_by_currency)
+
+    def update_value(self, timestamp, value_by_currency) -> bool:
+        """
+        Updates existing values and adds new ones at timestamp, raises KeyError when there is no value at timestamp
+        :return: True if value_by_currency is different from the value at this timestamp
+        """
+        index = self._get_index(timestamp)
+        if self._get_row_values(index) == {currency: float(value) for currency, value in value_by_currency.items()}:
+            return False
+        self._write_values(index, value_by_currency)
+        return True
+
+    def pop_oldest(self):
+        """
+        Removes the oldest value
+        :return: the removed value timestamp
+        """
+        if not len(self):
+            raise KeyError("pop_oldest(): no value")
+        timestamp = to_timestamp(self._timestamps[self._start].item())
+        self._start += 1
+        if self._start == self._end:
+            self._start = self._end = 0
+        else:
+            self._update_relevance(self._start, self._start + 1)
+        return timestamp
+
+    def is_significant_change(self, timestamp, currency, value) -> bool:
+        """
+        :return: True if value changes from at least HistoricalAssetValue.SIGNIFICANT_VALUE_CHANGE_THRESHOLD from the
+        value of currency at timestamp. Raises KeyError when there is no such value
+        """
+        stored_value = self.get_value(timestamp, currency)
+        if not stored_value:
+            return bool(value)
+        return abs(stored_value - float(value)) / stored_value >= \
+            historical_asset_value.HistoricalAssetValue.SIGNIFICANT_VALUE_CHANGE_THRESHOLD
+
+    def get_time_frame_relevance(self, time_frame_seconds) -> np.ndarray:
+        """
+        A timestamp is relevant for a time frame when it is a multiple of this time frame or when there is no other
+        timestamp within half of this time frame around it
+        :return: the relevance of each timestamp, should not be modified
+        """
+        if time_frame_seconds not in self._relevance_by_time_frame:
+            self._relevance_by_time_frame[time_frame_seconds] = np.zeros(len(self._timestamps), dtype=bool)
+            self._update_relevance(self._start, self._end, time_frames_seconds=(time_frame_seconds, ))
+        return self._relevance_by_time_frame[time_frame_seconds][self._start:self._end]
+
+    def _get_index(self, timestamp) -> int:
+        index = self._start + int(np.searchsorted(self.timestamps, timestamp))
+        if index < self._end and self._timestamps[index] == timestamp:
+            return index
+        raise KeyError(timestamp)
+
+    def _get_row_values(self, index) -> dict:
+        return {
+            currency: column[index].item()
+            for currency, column in self._columns.items()
+            if not np.isnan(column[index])
+        }
+
+    def _write_values(self, index, value_by_currency):
+        for currency, value in value_by_currency.items():
+            if currency not in self._columns:
+                self._columns[currency] = np.full(len(self._timestamps), np.nan)
+            self._columns[currency][index] = float(value)
+
+    def _insert_row(self, timestamp) -> int:
+        if self._end == len(self._timestamps):
+            self._reserve_row()
+        index = self._start + int(np.searchsorted(self.timestamps, timestamp))
+        if index < self._end:
+            # shift newer rows
+            for array in self._get_arrays():
+                array[index + 1:self._end + 1] = array[index:self._end]
+        self._timestamps[index] = timestamp
+        for column in self._columns.values():
+            column[index] = np.nan
+        self._end += 1
+        # relevance depends on the previous and next timestamps
+        self._update_relevance(index - 1, index + 2)
+        return index
+
+    def _reserve_row(self):
+        size = len(self)
+        if size * 2 <= len(self._timestamps):
+            # move rows to the beginning of arrays
+            for array in self._get_arrays():
+                array[:size] = array[self._start:self._end]
+        else:
+            capacity = len(self._timestamps) * 2
+            self._timestamps = _resized(self._timestamps, self._start, self._end, capacity, np.nan)
+            self._columns = {
+                currency: _resized(column, self._start, self._end, capacity, np.nan)
+                for currency, column in self._columns.items()
+            }
+            self._relevance_by_time_frame = {
+                time_frame_seconds: _resized(relevance, self._start, self._end, capacity, False)
+                for time_frame_seconds, relevance in self._relevance_by_time_frame.items()
+            }
+        self._start, self._end = 0, size
+
+    def _get_arrays(self):
+        yield self._timestamps
+        yield from self._columns.values()
+        yield from self._relevance_by_time_frame.values()
+
+    def _update_relevance(self, from_index, to_index, time_frames_seconds=None):
+        from_index = max(from_index, self._start)
+        to_index = min(to_index, self._end)
+        if from_index >= to_index:
+            return
+        timestamps = self._timestamps[from_index:to_index]
+        previous_timestamps = np.empty(len(timestamps))
+        previous_timestamps[1:] = timestamps[:-1]
+        previous_timestamps[0] = self._timestamps[from_index - 1] if from_index > self._start else 0
+        next_timestamps = np.empty(len(timestamps))
+        next_timestamps[:-1] = timestamps[1:]
+        for time_frame_seconds in time_frames_seconds or self._relevance_by_time_frame:
+            allowed_delta = time_frame_seconds / 2
+            next_timestamps[-1] = self._timestamps[to_index] if to_index < self._end \
+                else timestamps[-1] + allowed_delta
+            self._relevance_by_time_frame[time_frame_seconds][from_index:to_index] = (
+                (np.mod(timestamps, time_frame_seconds) == 0)
+                | (
+                    (previous_timestamps + allowed_delta <= timestamps)
+                    & (timestamps <= next_timestamps - allowed_delta)
+                )
+            )
+
+
+def _resized(array, start, end, capacity, fill_value):
+    resized = np.full(capacity, fill_value, dtype=array.dtype)
+    resized[:end - start] = array[start:end]
+    return resized
+
+
+def to_timestamp(timestamp: float):
+    # timestamps are usually integers
+    return int(timestamp) if timestamp.is_integer() else timestamp
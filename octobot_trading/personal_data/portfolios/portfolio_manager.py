@@ -186,7 +186,8 @@ class PortfolioManager(util.Initializable):
             self.exchange_manager.exchange.get_exchange_current_time(), time_frame
         )
         if self.portfolio_value_holder is not None:
-            historical_values[current_historical_time] = self.portfolio_value_holder.portfolio_current_value
+            # historical values are floats
+            historical_values[current_historical_time] = float(self.portfolio_value_holder.portfolio_current_value)
         return [
             {
                 enums.HistoricalPortfolioValue.TIME.value: key,
@@ -46,6 +46,12 @@ class PortfolioValueHolder:
         self.origin_crypto_currencies_values = {}
         self.current_crypto_currencies_values = {}
 
+        # current portfolio valuation: holdings value by currency and their (currency value, quantity)
+        self._holdings_values = {}
+        self._holdings_states = {}
+        self._holdings_total_value = constants.ZERO
+        self._valuation_reference_market = None
+
     def reset_portfolio_values(self):
         self.portfolio_origin_value = constants.ZERO
         self.portfolio_current_value = constants.ZERO
@@ -54,6 +60,7 @@ class PortfolioValueHolder:
 
         self.origin_crypto_currencies_values = {}
         self.current_crypto_currencies_values = {}
+        self._reset_holdings_values()
 
     def update_origin_crypto_currencies_values(self, symbol, mark_price):
         """
@@ -65,15 +72,14 @@ class PortfolioValueHolder:
         currency, market = symbol_util.parse_symbol(symbol).base_and_quote()
         # update origin values if this price has relevant data regarding
         # the origin portfolio (using both quote and base)
-        origin_crypto_currencies_with_values = set(self.origin_crypto_currencies_values.keys())
         origin_currencies_should_be_updated = (
             (
-                currency not in origin_crypto_currencies_with_values
+                currency not in self.origin_crypto_currencies_values
                 and currency != self.portfolio_manager.reference_market
             )
             or
             (
-                market not in origin_crypto_currencies_with_values
+                market not in self.origin_crypto_currencies_values
                 and market != self.portfolio_manager.reference_market
             )
         )
@@ -109,13 +115,15 @@ class PortfolioValueHolder:
 
     def get_current_holdings_values(self):
         """
-        Get holdings ratio for each currency
-        :return: the holdings ratio dictionary
+        Get holdings value for each currency
+        :return: the holdings value dictionary
         """
         holdings = self.get_current_crypto_currencies_values()
+        # only values currencies which value or quantity changed since the last valuation
+        self._update_current_holdings_values(self.portfolio_manager.portfolio.portfolio)
         return {
-            currency: self._get_currency_value(self.portfolio_manager.portfolio.portfolio, currency, holdings)
-            for currency in holdings.keys()
+            currency: self._holdings_values.get(currency, constants.ZERO)
+            for currency in holdings
         }
 
     def get_assets_holdings_value(self, assets, target_unit, init_price_fetchers=False):
@@ -171,7 +179,9 @@ class PortfolioValueHolder:
                     assets_in_open_orders += order.total_cost
             currency_holdings += assets_in_open_orders
         # compute ratio
-        current_holdings_value = self.value_converter.evaluate_value(currency, currency_holdings)
+        current_holdings_value = self._get_valued_holdings_value(currency, currency_holdings)
+        if current_holdings_value is None:
+            current_holdings_value = self.value_converter.evaluate_value(currency, currency_holdings)
         return current_holdings_value / total_holdings_value
 
     def handle_profitability_recalculation(self, force_recompute_origin_portfolio):
@@ -253,10 +263,96 @@ class PortfolioValueHolder:
 
     def _update_portfolio_and_currencies_current_value(self):
         """
-        Update the portfolio current value with the current portfolio instance
+        Update the portfolio current value with the current portfolio instance.
+        Only currencies which value might have changed since the last update are evaluated
+        """
+        portfolio = self.portfolio_manager.portfolio.portfolio
+        self.current_crypto_currencies_values.update(
+            self._evaluate_config_crypto_currencies_and_portfolio_values(
+                portfolio, up_to_date_currencies=self._get_up_to_date_currencies()
+            )
+        )
+        if len(self.current_crypto_currencies_values) > len(self.origin_crypto_currencies_values):
+            # add any missing value to origin_crypto_currencies_values (can happen with indirect valuations)
+            self._fill_currencies_values(self.origin_crypto_currencies_values)
+        self.portfolio_current_value = self._update_current_holdings_values(portfolio)
+
+    def _get_up_to_date_currencies(self) -> set:
+        """
+        :return: the currencies which value didn't change since the last current portfolio valuation
+        """
+        reference_market = self.portfolio_manager.reference_market
+        updated_currencies = self.value_converter.pop_updated_currencies(reference_market)
+        if updated_currencies is None or reference_market != self._valuation_reference_market:
+            self._valuation_reference_market = reference_market
+            return set()
+        # currencies without value are always evaluated
+        return {
+            currency
+            for currency, value in self.current_crypto_currencies_values.items()
+            if value and currency not in updated_currencies
+        }
+
+    def _update_current_holdings_values(self, portfolio):
         """
-        self.portfolio_current_value = self._update_portfolio_current_value(
-            self.portfolio_manager.portfolio.portfolio)
+        Update the holdings value of currencies which value or quantity changed
+        :param portfolio: the current portfolio
+        :return: the current portfolio value
+        """
+        for currency in [
+            currency
+            for currency in self._holdings_states
+            if currency not in self.current_crypto_currencies_values
+        ]:
+            self._holdings_states.pop(currency)
+            self._holdings_total_value -= self._holdings_values.pop(currency)
+        not_valued_holdings_value = constants.ZERO
+        missing_currencies = self.value_converter.missing_currency_data_in_exchange
+        for currency, asset in portfolio.items():
+            currency_value = self.current_crypto_currencies_values.get(currency)
+            if currency_value is None:
+                if asset.total != constants.ZERO and currency not in missing_currencies:
+                    not_valued_holdings_value += self._get_currency_value(portfolio, currency)
+            else:
+                self._update_holdings_value(currency, currency_value, asset.total)
+        for currency, currency_value in self.current_crypto_currencies_values.items():
+            if currency not in portfolio:
+                self._update_holdings_value(currency, currency_value, constants.ZERO)
+        return self._holdings_total_value + not_valued_holdings_value - sum(
+            self._holdings_values.get(currency, constants.ZERO)
+            for currency in missing_currencies
+        )
+
+    def _update_holdings_value(self, currency, currency_value, quantity):
+        state = (currency_value, quantity)
+        if self._holdings_states.get(currency) == state:
+            return
+        self._holdings_states[currency] = state
+        value = constants.ZERO if quantity == constants.ZERO else currency_value * quantity
+        self._holdings_total_value += value - self._holdings_values.get(currency, constants.ZERO)
+        self._holdings_values[currency] = value
+
+    def _get_valued_holdings_value(self, currency, quantity):
+        """
+        :return: the value of quantity from the last current portfolio valuation,
+        None if this currency value might have changed since
+        """
+        try:
+            currency_value, valued_quantity = self._holdings_states[currency]
+        except KeyError:
+            return None
+        if self._valuation_reference_market != self.portfolio_manager.reference_market \
+           or not self.value_converter.are_prices_up_to_date():
+            return None
+        if quantity == valued_quantity:
+            return self._holdings_values[currency]
+        return currency_value * quantity
+
+    def _reset_holdings_values(self):
+        self._holdings_values = {}
+        self._holdings_states = {}
+        self._holdings_total_value = constants.ZERO
+        self._valuation_reference_market = None
 
     def _recompute_origin_portfolio_initial_value(self):
         """
@@ -280,15 +376,17 @@ class PortfolioValueHolder:
 
     def _evaluate_config_crypto_currencies_and_portfolio_values(self,
                                                                 portfolio,
-                                                                ignore_missing_currency_data=False):
+                                                                ignore_missing_currency_data=False,
+                                                                up_to_date_currencies=None):
         """
         Evaluate both config and portfolio currencies values
         :param portfolio: the current portfolio
         :param ignore_missing_currency_data: when True, ignore missing currencies values in calculation
+        :param up_to_date_currencies: currencies to skip as their value is already known
         :return: the result of config and portfolio currencies values calculation
         """
         evaluated_pair_values = {}
-        evaluated_currencies = set()
+        evaluated_currencies = set(up_to_date_currencies) if up_to_date_currencies else set()
         missing_tickers = set()
 
         self._evaluate_config_currencies_values(evaluated_pair_values, evaluated_currencies, missing_tickers)
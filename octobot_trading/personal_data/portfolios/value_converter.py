@@ -15,6 +15,9 @@
 #  License along with this library.
 import asyncio
 import decimal
+import functools
+import itertools
+import typing
 
 import octobot_commons.logging as logging
 import octobot_commons.symbols as symbol_util
@@ -49,12 +52,59 @@ class ValueConverter:
         # internal price conversion elements
         self._price_bridge_by_symbol = {}
         self._missing_price_bridges = set()
+        # currencies graph of last_prices_by_trading_pair: pair symbols by neighbour currency by currency
+        self._currency_graph = {}
+        # last_prices_by_trading_pair as of the last graph sync: also detects prices set without update_last_price
+        self._synced_prices = {}
+        # (currency, target) of saved price bridges by bridge pair
+        self._price_bridges_by_pair = {}
+        # pairs which price changed since the last pop_updated_currencies call
+        self._updated_pairs = set()
+        self._has_new_pairs = True
 
     def update_last_price(self, symbol, price):
+        if symbol not in self._synced_prices:
+            self._sync_currency_graph()
         if symbol not in self.last_prices_by_trading_pair:
-            self.reset_missing_price_bridges()
+            self._add_to_currency_graph(symbol)
             self.logger.debug(f"Initialized last price for {symbol}")
+        elif self._synced_prices[symbol] != price:
+            self._updated_pairs.add(frozenset(_get_base_and_quote(symbol)))
         self.last_prices_by_trading_pair[symbol] = price
+        self._synced_prices[symbol] = price
+
+    def pop_updated_currencies(self, target) -> typing.Optional[set]:
+        """
+        :param target: the currency values are evaluated into
+        :return: the currencies which value in target might have changed since the last call,
+        None when any currency value might have changed
+        """
+        self._sync_currency_graph()
+        if self._has_new_pairs:
+            updated_currencies = None
+        else:
+            updated_currencies = set()
+            for pair in self._updated_pairs:
+                updated_currencies.update(pair)
+                updated_currencies.update(
+                    currency
+                    for currency, bridge_target in self._price_bridges_by_pair.get(pair, ())
+                    if bridge_target == target
+                )
+            # target value is always one
+            updated_currencies.discard(target)
+        self._has_new_pairs = False
+        self._updated_pairs = set()
+        return updated_currencies
+
+    def are_prices_up_to_date(self) -> bool:
+        """
+        :return: True when no price changed since the last pop_updated_currencies call
+        """
+        return not (
+            self._has_new_pairs or self._updated_pairs
+            or self._synced_prices != self.last_prices_by_trading_pair
+        )
 
     def evaluate_value(self, currency, quantity, raise_error=True, target_currency=None, init_price_fetchers=True):
         """
@@ -78,13 +128,14 @@ class ValueConverter:
     def get_usd_like_value(self, currency, quantity, raise_error=True, init_price_fetchers=True):
         if symbol_util.is_usd_like_coin(currency):
             return quantity
-        if symbol := self.get_usd_like_symbol_from_symbols(currency, self.last_prices_by_trading_pair):
-            base, quote = symbol_util.parse_symbol(symbol).base_and_quote()
-            usd_like_currency = base if symbol_util.is_usd_like_coin(base) else quote
-            return self.evaluate_value(
-                currency, quantity, raise_error=raise_error,
-                target_currency=usd_like_currency, init_price_fetchers=init_price_fetchers
-            )
+        self._sync_currency_graph()
+        neighbours = self._currency_graph.get(currency, {})
+        for usd_like_currency in commons_constants.USD_LIKE_COINS:
+            if usd_like_currency in neighbours:
+                return self.evaluate_value(
+                    currency, quantity, raise_error=raise_error,
+                    target_currency=usd_like_currency, init_price_fetchers=init_price_fetchers
+                )
         raise errors.MissingPriceDataError(
             f"Can't convert {currency} to any of {commons_constants.USD_LIKE_COINS} using last_prices_by_trading_pair: "
             f"{list(self.last_prices_by_trading_pair)}"
@@ -100,17 +151,22 @@ class ValueConverter:
     @staticmethod
     def get_usd_like_symbols_from_symbols(currency: str, symbols) -> list:
         # look for symbols using USD_LIKE_COINS priorities
-        usd_like_symbols = []
-        for usd_like_coin in commons_constants.USD_LIKE_COINS:
-            for symbol in symbols:
-                base_and_quote = symbol_util.parse_symbol(symbol).base_and_quote()
-                if currency in base_and_quote and usd_like_coin in base_and_quote:
-                    usd_like_symbols.append(symbol)
-        return usd_like_symbols
+        symbols_by_usd_like_coin = {}
+        for symbol in symbols:
+            base_and_quote = _get_base_and_quote(symbol)
+            if currency in base_and_quote:
+                for coin in base_and_quote:
+                    if coin in _USD_LIKE_COINS_PRIORITIES:
+                        symbols_by_usd_like_coin.setdefault(coin, []).append(symbol)
+        return [
+            symbol
+            for usd_like_coin in sorted(symbols_by_usd_like_coin, key=_USD_LIKE_COINS_PRIORITIES.get)
+            for symbol in symbols_by_usd_like_coin[usd_like_coin]
+        ]
 
     @staticmethod
     def can_convert_symbol_to_usd_like(symbol: str) -> bool:
-        base, quote = symbol_util.parse_symbol(symbol).base_and_quote()
+        base, quote = _get_base_and_quote(symbol)
         for usd_like_coins in commons_constants.USD_LIKE_COINS:
             if usd_like_coins == base or usd_like_coins == quote:
                 return True
@@ -256,12 +312,13 @@ class ValueConverter:
     ) -> decimal.Decimal:
         # settlement_asset needs to be handled to add support for futures
 
-        # try with two pairs
+        # try with two or more pairs
         # for example:
         # currency: ETH - ref market: USDT
         # ETH/USDT is not available. ETH/BTC and BTC/USDT are available though.
         # first convert ETH -> BTC and then BTC -> USDT
         #               | bridge part 1     | bridge part 2
+        # bridges are the shortest paths of the currency graph made of priced pairs, base_bridge pairs excluded
 
         try:
             return self.convert_currency_value_from_saved_price_bridges(currency, target, quantity)
@@ -269,119 +326,179 @@ class ValueConverter:
             if self.is_missing_price_bridge(currency, target):
                 return None
             # try to find a bridge
-        if len(base_bridge) > self.MAX_PRICE_BRIDGE_DEPTH:
-            self._save_missing_price_bridge(currency, target)
+        if currency == target:
             return None
-        part_1_base = currency
-        part_2_quote = target
-        # look into available symbols to find pair bridges
-        for bridge_part_1_symbol in self._get_priced_pairs():
-            parsed_bridge_part_1_symbol = symbol_util.parse_symbol(bridge_part_1_symbol)
-            if (parsed_bridge_part_1_symbol.base, parsed_bridge_part_1_symbol.quote) in base_bridge\
-               or (parsed_bridge_part_1_symbol.quote, parsed_bridge_part_1_symbol.base) in base_bridge:
-                # avoid looping in symbols
-                continue
-            # part 1: check if bridge_part_1_symbol can be used as part 1 of the bridge
-            is_inverse_part_1 = False
-            if part_1_base == parsed_bridge_part_1_symbol.quote:
-                is_inverse_part_1 = True
-            elif part_1_base != parsed_bridge_part_1_symbol.base:
-                continue
-            part_1_quote = parsed_bridge_part_1_symbol.quote
-            if is_inverse_part_1:
-                part_1_quote = parsed_bridge_part_1_symbol.base
-                part_1_base = parsed_bridge_part_1_symbol.quote
-            try:
-                bridge_part_1_value = self.convert_currency_value_using_last_prices(
-                    quantity, part_1_base, part_1_quote
-                )
-                # check that bridge_part_1_value is really set
-                if not bridge_part_1_value:
-                    continue
-            except errors.MissingPriceDataError:
-                # first pair might not be initialized or is not available at all
-                # make sure it's not just initializing
-                self._ensure_no_pending_symbol_price(part_1_base, part_1_quote)
-                # try with other pairs
-                continue
-            # part 2: bridge part 1 is found and valued, try to get a compatible second part
-            # case 1: 2 parts bridge
-            try:
-                bridge_part_2_value = self.convert_currency_value_using_last_prices(
-                    constants.ONE,
-                    part_1_quote,
-                    part_2_quote,
-                )
-                if bridge_part_2_value:
-                    self._remove_from_missing_currency_data(currency)
-                    local_bridge = [(part_1_base, part_1_quote), (part_1_quote, part_2_quote)]
-                    self._save_price_bridge(currency, target, local_bridge)
-                    return bridge_part_1_value * bridge_part_2_value
-            except errors.MissingPriceDataError:
-                # conversion pairs might not be initialized or is not available at all
-                self._ensure_no_pending_symbol_price(part_1_quote, part_2_quote)
-                # otherwise continue with other pairs
-            bridge = base_bridge + [(part_1_base, part_1_quote)]
-            # case 2: X parts bridge
-            nested_value = self.try_convert_currency_value_using_multiple_pairs(
-                part_1_quote, target, constants.ONE, bridge
-            )
-            if nested_value:
-                try:
-                    extended_bridge = [(part_1_base, part_1_quote)] \
-                        + self.get_saved_price_conversion_bridge(part_1_quote, target)
-                    self._save_price_bridge(currency, target, extended_bridge)
-                except KeyError:
-                    # should not happen, however if it does, do not crash
-                    pass
-                return bridge_part_1_value * nested_value
+        self._sync_currency_graph()
+        excluded_pairs = {frozenset(pair) for pair in base_bridge}
+        if currency in self._save_price_bridges_to(target, excluded_pairs):
+            self._remove_from_missing_currency_data(currency)
+            return self.convert_currency_value_from_saved_price_bridges(currency, target, quantity)
+        # make sure the bridge is not just waiting for its prices to be initialized
+        if currency in self._get_bridges_parents(target, excluded_pairs, self._get_pending_pairs_graph()):
+            raise errors.PendingPriceDataError
         # no bridge found
         self._save_missing_price_bridge(currency, target)
         return None
 
-    def _get_priced_pairs(self):
-        for pair in self.last_prices_by_trading_pair:
-            # first look into pairs with price
-            yield pair
-        for pair in self.portfolio_manager.exchange_manager.exchange_config.traded_symbol_pairs:
-            # then into pairs from config
-            if pair not in self.last_prices_by_trading_pair:
-                yield pair
-        if self.initializing_symbol_prices:
-            for pair in self.initializing_symbol_prices_pairs:
-                # finally into initializing pairs
-                yield pair
+    def evaluate_values(self, quantity_by_currency, target_currency=None, raise_error=True, init_price_fetchers=True):
+        """
+        Evaluate the value of each currency quantity in the reference (attribute) currency.
+        Price bridges to target_currency of every currency are computed at once when the first one is required.
+        :param quantity_by_currency: the currency quantities to evaluate
+        :param raise_error: will catch exception if False
+        :param target_currency: asset to evaluate currencies into, defaults to self.portfolio_manager.reference_market
+        :param init_price_fetchers: will ask for missing ticker if price can't be converted if False
+        :return: the value of each currency
+        """
+        target_currency = target_currency or self.portfolio_manager.reference_market
+        return {
+            currency: self.evaluate_value(
+                currency, quantity, raise_error=raise_error,
+                target_currency=target_currency, init_price_fetchers=init_price_fetchers
+            )
+            for currency, quantity in quantity_by_currency.items()
+        }
 
-    def _ensure_no_pending_symbol_price(self, base, quote):
-        for symbol in (symbol_util.merge_currencies(base, quote), symbol_util.merge_currencies(quote, base)):
-            if symbol in self.portfolio_manager.exchange_manager.exchange_config.traded_symbol_pairs \
-                    or symbol in self.initializing_symbol_prices_pairs:
-                raise errors.PendingPriceDataError
+    def _save_price_bridges_to(self, target, excluded_pairs) -> dict:
+        """
+        Saves the price bridges to target of every currency that can be converted into target
+        :return: the bridges parents of each currency
+        """
+        parents = self._get_bridges_parents(target, excluded_pairs, None)
+        bridges = {}
+        for currency in parents:
+            # parents are sorted by distance to target: the next currency bridge is already known
+            next_currency = parents[currency]
+            if next_currency is None:
+                continue
+            bridge = bridges[currency] = [(currency, next_currency)] + bridges.get(next_currency, [])
+            if len(bridge) > 1:
+                self._save_price_bridge(currency, target, bridge)
+        return parents
+
+    def _get_bridges_parents(self, target, excluded_pairs, pending_pairs_graph) -> dict:
+        """
+        Breadth first search of the currencies that can be converted into target
+        :param pending_pairs_graph: when set, pairs waiting for their price are also used
+        :return: the next currency towards target by currency, sorted by distance to target
+        """
+        parents = {target: None}
+        to_visit = [target]
+        # a bridge is made of a first pair, up to MAX_PRICE_BRIDGE_DEPTH intermediary pairs and a last pair
+        for _ in range(self.MAX_PRICE_BRIDGE_DEPTH + 2):
+            next_to_visit = []
+            for currency in to_visit:
+                neighbours = self._get_priced_neighbours(currency)
+                if pending_pairs_graph:
+                    neighbours = itertools.chain(neighbours, pending_pairs_graph.get(currency, ()))
+                for neighbour in neighbours:
+                    if neighbour not in parents and frozenset((currency, neighbour)) not in excluded_pairs:
+                        parents[neighbour] = currency
+                        next_to_visit.append(neighbour)
+            if not next_to_visit:
+                break
+            to_visit = next_to_visit
+        return parents
+
+    def _get_connected_currencies(self, currency) -> set:
+        connected_currencies = {currency}
+        to_visit = [currency]
+        while to_visit:
+            for neighbour in self._currency_graph.get(to_visit.pop(), ()):
+                if neighbour not in connected_currencies:
+                    connected_currencies.add(neighbour)
+                    to_visit.append(neighbour)
+        return connected_currencies
+
+    def _get_priced_neighbours(self, currency):
+        for neighbour, symbols in self._currency_graph.get(currency, {}).items():
+            # zero prices can't be used to convert values
+            if any(self.last_prices_by_trading_pair.get(symbol) for symbol in symbols):
+                yield neighbour
+
+    def _get_pending_pairs_graph(self) -> dict:
+        pending_pairs_graph = {}
+        pending_pairs = self.portfolio_manager.exchange_manager.exchange_config.traded_symbol_pairs
+        if self.initializing_symbol_prices:
+            pending_pairs = itertools.chain(pending_pairs, self.initializing_symbol_prices_pairs)
+        for symbol in pending_pairs:
+            if symbol in self.last_prices_by_trading_pair:
+                continue
+            base, quote = _get_base_and_quote(symbol)
+            if base and quote:
+                pending_pairs_graph.setdefault(base, set()).add(quote)
+                pending_pairs_graph.setdefault(quote, set()).add(base)
+        return pending_pairs_graph
+
+    def _sync_currency_graph(self):
+        # last_prices_by_trading_pair might have been updated without update_last_price
+        if self._synced_prices == self.last_prices_by_trading_pair:
+            return
+        if not self._synced_prices.keys() <= self.last_prices_by_trading_pair.keys():
+            # removed pairs: rebuild the graph
+            self._currency_graph = {}
+            self._synced_prices = {}
+            self._has_new_pairs = True
+        for symbol, price in self.last_prices_by_trading_pair.items():
+            if symbol not in self._synced_prices:
+                self._add_to_currency_graph(symbol)
+            elif self._synced_prices[symbol] != price:
+                self._updated_pairs.add(frozenset(_get_base_and_quote(symbol)))
+        self._synced_prices = dict(self.last_prices_by_trading_pair)
+
+    def _add_to_currency_graph(self, symbol):
+        base, quote = _get_base_and_quote(symbol)
+        if not (base and quote):
+            return
+        # pairs can have many symbols (ex: BTC/USDT and BTC/USDT:USDT)
+        symbols = self._currency_graph.setdefault(base, {}).setdefault(quote, [])
+        if symbol in symbols:
+            return
+        symbols.append(symbol)
+        self._currency_graph.setdefault(quote, {})[base] = symbols
+        self._has_new_pairs = True
+        if self._missing_price_bridges:
+            # only bridges from or to currencies connected to this new pair might now be available
+            connected_currencies = self._get_connected_currencies(base)
+            self._missing_price_bridges = {
+                (currency, target)
+                for currency, target in self._missing_price_bridges
+                if currency not in connected_currencies and target not in connected_currencies
+            }
 
     def get_saved_price_conversion_bridge(self, currency, target) -> list:
         return self._price_bridge_by_symbol[symbol_util.merge_currencies(currency, target)]
 
     def _save_price_bridge(self, currency, target, bridge):
         self._price_bridge_by_symbol[symbol_util.merge_currencies(currency, target)] = bridge
+        for pair in bridge:
+            self._price_bridges_by_pair.setdefault(frozenset(pair), set()).add((currency, target))
 
     def convert_currency_value_from_saved_price_bridges(self, currency, target, quantity) -> decimal.Decimal:
         try:
             bridge = self._price_bridge_by_symbol[symbol_util.merge_currencies(currency, target)]
             converted_value = quantity
             for base, quote in bridge:
-                converted_value = self.convert_currency_value_using_last_prices(converted_value, base, quote)
+                converted_value = self._convert_currency_value_using_currency_graph(converted_value, base, quote)
             return converted_value
         except KeyError as err:
             raise errors.MissingPriceDataError from err
 
+    def _convert_currency_value_using_currency_graph(self, quantity, currency, target) -> decimal.Decimal:
+        # use the first priced symbol of the pair
+        for symbol in self._currency_graph.get(currency, {}).get(target, ()):
+            if price := self.last_prices_by_trading_pair.get(symbol):
+                return quantity * price if _get_base_and_quote(symbol)[0] == currency else quantity / price
+        return self.convert_currency_value_using_last_prices(quantity, currency, target)
+
     def reset_missing_price_bridges(self):
         self._missing_price_bridges = set()
 
     def _save_missing_price_bridge(self, base, quote):
-        self._missing_price_bridges.add(symbol_util.merge_currencies(base, quote))
+        self._missing_price_bridges.add((base, quote))
 
     def is_missing_price_bridge(self, base, quote):
-        return symbol_util.merge_currencies(base, quote) in self._missing_price_bridges
+        return (base, quote) in self._missing_price_bridges
 
     def _remove_from_missing_currency_data(self, currency):
         if currency in self.missing_currency_data_in_exchange:
@@ -404,3 +521,11 @@ class ValueConverter:
 
     def clear(self):
         self.portfolio_manager = None
+
+
+_USD_LIKE_COINS_PRIORITIES = {coin: priority for priority, coin in enumerate(commons_constants.USD_LIKE_COINS)}
+
+
+@functools.lru_cache(maxsize=4096)
+def _get_base_and_quote(symbol) -> tuple:
+    return symbol_util.parse_symbol(symbol).base_and_quote()
@@ -18,10 +18,14 @@ from octobot_trading.personal_data.trades import trades_manager
 from octobot_trading.personal_data.trades import trade_factory
 from octobot_trading.personal_data.trades import channel
 from octobot_trading.personal_data.trades import trade
+from octobot_trading.personal_data.trades import trades_store
 
 from octobot_trading.personal_data.trades.trades_manager import (
     TradesManager,
 )
+from octobot_trading.personal_data.trades.trades_store import (
+    TradesStore,
+)
 from octobot_trading.personal_data.trades.trade_factory import (
     create_trade_instance_from_raw,
     create_closed_order_instance_from_raw_trade,
@@ -46,6 +50,7 @@ from octobot_trading.personal_data.trades.trades_util import (
 
 __all__ = [
     "TradesManager",
+    "TradesStore",
     "TradesProducer",
     "TradesChannel",
     "create_trade_instance_from_raw",
@@ -26,6 +26,8 @@ class Trade:
     CLOSING_TRADE_ORDER_STATUS = {enums.OrderStatus.CANCELED, enums.OrderStatus.FILLED, enums.OrderStatus.CLOSED}
 
     def __init__(self, trader):
+        # TradesStore to notify on indexed attributes changes, set when added to a TradesStore
+        self.trades_index = None
         self.trader = trader
         self.exchange_manager = trader.exchange_manager
 
@@ -66,6 +68,28 @@ class Trade:
         # raw exchange trade type, used to create trade dict
         self.exchange_trade_type = None
 
+    @property
+    def origin_order_id(self):
+        return self._origin_order_id
+
+    @origin_order_id.setter
+    def origin_order_id(self, origin_order_id):
+        self._origin_order_id = origin_order_id
+        self._update_trades_index()
+
+    @property
+    def exchange_order_id(self):
+        return self._exchange_order_id
+
+    @exchange_order_id.setter
+    def exchange_order_id(self, exchange_order_id):
+        self._exchange_order_id = exchange_order_id
+        self._update_trades_index()
+
+    def _update_trades_index(self):
+        if self.trades_index is not None:
+            self.trades_index.update_trade_indexes(self)
+
     def update_from_order(self, order, creation_time=0, canceled_time=0, executed_time=0, exchange_trade_id=None):
         self.currency = order.currency
         self.market = order.market
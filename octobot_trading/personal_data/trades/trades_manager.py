@@ -24,19 +24,22 @@ import octobot_trading.constants as constants
 import octobot_trading.enums as enums
 import octobot_trading.personal_data as personal_data
 import octobot_trading.personal_data.trades.trade_pnl as trade_pnl
+import octobot_trading.personal_data.trades.trades_store as trades_store
 import octobot_trading.util as util
 
 
 class TradesManager(util.Initializable):
-    # memory usage for 100000 trades: approx 180 Mo
     MAX_TRADES_COUNT = constants.MAX_TRADES_COUNT
+    # most recent trades are kept as Trade instances (memory usage for 100000 trades: approx 180 Mo),
+    # older ones are archived in compact columns
+    MAX_LIVE_TRADES_COUNT = constants.MAX_LIVE_TRADES_COUNT
 
     def __init__(self, trader):
         super().__init__()
         self.logger = logging.get_logger(self.__class__.__name__)
         self.trader = trader
         self.trades_initialized = False
-        self.trades: collections.OrderedDict[str, personal_data.Trade] = collections.OrderedDict()
+        self.trades: trades_store.TradesStore = trades_store.TradesStore(self.trader, self.MAX_LIVE_TRADES_COUNT)
 
     async def initialize_impl(self):
         await self.reload_history(False)
@@ -86,8 +89,8 @@ class TradesManager(util.Initializable):
         return False
 
     def get_total_paid_fees(self):
-        total_fees = {}
-        for trade in self.trades.values():
+        total_fees = self.trades.get_archived_paid_fees()
+        for trade in self.trades.get_live_trades():
             if trade.fee is not None:
                 fee_cost = trade.fee[enums.FeePropertyColumns.COST.value]
                 fee_currency = trade.fee[enums.FeePropertyColumns.CURRENCY.value]
@@ -109,7 +112,42 @@ class TradesManager(util.Initializable):
         return pnls[0] if pnls else None
 
     def get_completed_trades_pnl(self, trades_history=None, selected_trades=None) -> list[trade_pnl.TradePnl]:
-        trades = trades_history or self.get_trades()
+        if trades_history:
+            return self._get_trades_history_pnl(trades_history, selected_trades)
+        # use indexes: cost depends on the number of selected (or completed) trades, not on the history size
+        if selected_trades:
+            exits_by_entry_id = {}
+            for trade in selected_trades:
+                if trade.status is not enums.OrderStatus.CANCELED and trade.associated_entry_ids:
+                    for entry_id in trade.associated_entry_ids:
+                        exits_by_entry_id.setdefault(entry_id, []).append(trade)
+        else:
+            exit_ids_by_entry_id = {
+                entry_id: exit_ids
+                for entry_id, exit_ids in self.trades.get_exit_trade_ids_by_entry_id().items()
+                if self.trades.get_last_trade_id(entry_id) is not None
+            }
+            # materialize archived trades at once
+            exit_trades = iter(self.trades.get_trades_from_ids(
+                [exit_id for exit_ids in exit_ids_by_entry_id.values() for exit_id in exit_ids]
+            ))
+            exits_by_entry_id = {
+                entry_id: [next(exit_trades) for _ in exit_ids]
+                for entry_id, exit_ids in exit_ids_by_entry_id.items()
+            }
+        entry_trade_ids = {
+            entry_id: entry_trade_id
+            for entry_id in exits_by_entry_id
+            if (entry_trade_id := self.trades.get_last_trade_id(entry_id)) is not None
+        }
+        return [
+            trade_pnl.TradePnl([entry_trade], exits_by_entry_id[entry_id])
+            for entry_id, entry_trade in zip(
+                entry_trade_ids, self.trades.get_trades_from_ids(list(entry_trade_ids.values()))
+            )
+        ]
+
+    def _get_trades_history_pnl(self, trades, selected_trades) -> list[trade_pnl.TradePnl]:
         trades_by_order_id = {
             trade.origin_order_id: trade
             for trade in trades
@@ -140,14 +178,7 @@ class TradesManager(util.Initializable):
         return None
 
     def get_trades(self, origin_order_id=None, exchange_order_id=None):
-        return [
-            trade
-            for trade in self.trades.values()
-            if (
-                (not origin_order_id or trade.origin_order_id == origin_order_id)
-                and (not exchange_order_id or trade.exchange_order_id == exchange_order_id)
-            )
-        ]
+        return self.trades.get_indexed_trades(origin_order_id=origin_order_id, exchange_order_id=exchange_order_id)
 
     # private
     def _check_trades_size(self):
@@ -156,7 +187,7 @@ class TradesManager(util.Initializable):
 
     def _reset_trades(self):
         self.trades_initialized = False
-        self.trades = collections.OrderedDict()
+        self.trades = trades_store.TradesStore(self.trader, self.MAX_LIVE_TRADES_COUNT)
 
     async def _load_trades_history(self, reset):
         if self.trader.exchange_manager.is_backtesting:
@@ -192,9 +223,11 @@ class TradesManager(util.Initializable):
             self.logger.exception(err, True, f"Error when loading local trade history {err}")
 
     def _get_trades_count_by_symbols(self, trades=None):
+        if not trades:
+            return self.trades.get_count_by_symbol()
         return collections.Counter(
             trade.symbol
-            for trade in (trades or self.trades.values())
+            for trade in trades
         )
 
     def _remove_oldest_trades(self, nb_to_remove):
@@ -202,12 +235,10 @@ class TradesManager(util.Initializable):
             f"Clearing the {nb_to_remove} oldest historical {self.trader.exchange_manager.exchange_name} "
             f"trades as the maximum count of trades ({self.MAX_TRADES_COUNT}) has been reached"
         )
-        popped = []
-        for _ in range(nb_to_remove):
-            popped.append(self.trades.popitem(last=False)[1])
+        removed_counts = self.trades.remove_oldest_trades(nb_to_remove)
         self.logger.info(
-            f"Cleared the {len(popped)} {self.trader.exchange_manager.exchange_name} oldest historical trades: "
-            f"{dict(self._get_trades_count_by_symbols(trades=popped))}"
+            f"Cleared the {sum(removed_counts.values())} {self.trader.exchange_manager.exchange_name} oldest "
+            f"historical trades: {dict(removed_counts)}"
         )
 
 
@@ -222,6 +253,6 @@ class TradesManager(util.Initializable):
         )
 
     def clear(self):
-        for trade in self.trades.values():
+        for trade in self.trades.get_live_trades():
             trade.clear()
         self._reset_trades()
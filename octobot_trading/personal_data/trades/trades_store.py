@@ -0,0 +1,683 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import collections
+import decimal
+import itertools
+
+import numpy as np
+
+import octobot_trading.enums as enums
+import octobot_trading.personal_data.trades.trade as trade_import
+
+
+_DECIMAL_ATTRIBUTES = (
+    "origin_price", "origin_quantity", "executed_quantity", "executed_price", "trade_profitability", "total_cost",
+)
+_TIME_ATTRIBUTES = ("creation_time", "canceled_time", "executed_time")
+_BOOLEAN_ATTRIBUTES = ("simulated", "is_closing_order", "is_from_this_octobot", "reduce_only", "broker_applied")
+_CATEGORY_ATTRIBUTES = (
+    "status", "symbol", "currency", "market", "taker_or_maker", "trade_type", "exchange_trade_type", "side",
+    "quantity_currency", "tag",
+)
+_OBJECT_ATTRIBUTES = ("trade_id", "origin_order_id", "exchange_order_id", "exchange_trade_id", "associated_entry_ids")
+# fee columns
+_FEE_COST = "fee_cost"
+_FEE_ORIGINAL_COST = "fee_original_cost"
+_FEE_LAYOUT = "fee_layout"
+_FEE_COST_KEY = enums.FeePropertyColumns.COST.value
+_FEE_CURRENCY_KEY = enums.FeePropertyColumns.CURRENCY.value
+_FEE_ORIGINAL_COST_KEY = enums.FeePropertyColumns.EXCHANGE_ORIGINAL_COST.value
+_FEE_DECIMAL_KEYS = {_FEE_COST_KEY: _FEE_COST, _FEE_ORIGINAL_COST_KEY: _FEE_ORIGINAL_COST}
+_TRADE_DICT_KEYS = {"origin_order_id": "_origin_order_id", "exchange_order_id": "_exchange_order_id"}
+# placeholder of a fee value stored in a decimal column
+_DECIMAL_FEE_VALUE = object()
+_NO_CODE = -1
+# 2**53: larger integers can't be stored as float64 without precision loss
+_MAX_FLOAT_INTEGER = 9007199254740992
+_MIN_COMPACTED_ROWS = 1024
+_INITIAL_CAPACITY = 64
+
+
+class TradesStore(collections.abc.MutableMapping):
+    """
+    Trades by trade id, in insertion order, stored in two tiers:
+    - the most recent trades are kept as Trade instances that can be updated
+    - older trades are archived in compact columns: interned symbols, sides, types and statuses and numpy arrays
+    of prices, quantities, fees and times. Archived trades are materialized as new Trade instances when accessed:
+    updating those instances does not update the store.
+    Decimal values are archived as float64 when they can be restored without loss, their exact value is kept
+    otherwise.
+    Trades are indexed by origin order id and exchange order id: live trades notify their changes through
+    update_trade_indexes(). Exit trade ids of archived trades are indexed by entry order id.
+    Index buckets holding a single trade id are stored as this trade id to save memory.
+    """
+
+    def __init__(self, trader, max_live_trades):
+        """
+        :param trader: the trader of the stored trades
+        :param max_live_trades: the number of most recent trades to keep as Trade instances
+        """
+        self.trader = trader
+        self.max_live_trades = max_live_trades
+        self._live_trades = collections.OrderedDict()
+
+        # archived trades
+        self._rows_by_trade_id = {}
+        # trade id of each row, None for removed rows
+        self._row_trade_ids = []
+        # oldest row that might not be removed
+        self._first_row = 0
+        self._capacity = 0
+        self._columns = {}
+        # values that can't be stored in their column, by column and row
+        self._exact_values = {}
+        self._integer_times = {}
+        self._categories = {attribute: _Categories() for attribute in _CATEGORY_ATTRIBUTES + (_FEE_LAYOUT, )}
+        self._objects = {attribute: [] for attribute in _OBJECT_ATTRIBUTES}
+        self._archived_fees = {}
+        self._reset_columns()
+
+        # indexes
+        # insertion sequence and indexed values of live trades, archived trades are sorted by row
+        self._sequences = {}
+        self._sequence = itertools.count()
+        self._indexed_values = {}
+        self._trade_ids_by_origin_order_id = {}
+        self._trade_ids_by_exchange_order_id = {}
+        self._trade_ids_by_trade = {}
+        self._archived_exit_ids_by_entry_id = {}
+
+    def __getitem__(self, trade_id):
+        try:
+            return self._live_trades[trade_id]
+        except KeyError:
+            return self._create_trade(self._rows_by_trade_id[trade_id])
+
+    def __setitem__(self, trade_id, trade):
+        if trade_id in self._rows_by_trade_id:
+            # keep trade position
+            row = self._rows_by_trade_id[trade_id]
+            self._unindex_trade(trade_id, self._get_archived_indexed_values(row))
+            self._remove_row(row)
+            self._write_row(row, trade_id, trade)
+            self._index_trade(trade_id, _get_indexed_values(trade))
+            return
+        if trade_id in self._live_trades:
+            self._unindex_trade(trade_id, self._indexed_values[trade_id])
+            self._detach_trade(self._live_trades[trade_id])
+        else:
+            self._sequences[trade_id] = next(self._sequence)
+        self._live_trades[trade_id] = trade
+        self._indexed_values[trade_id] = _get_indexed_values(trade)
+        self._index_trade(trade_id, self._indexed_values[trade_id])
+        self._attach_trade(trade_id, trade)
+        if len(self._live_trades) > self.max_live_trades:
+            archived_trade_id, archived_trade = self._live_trades.popitem(last=False)
+            self._detach_trade(archived_trade)
+            # archived trades stay indexed
+            self._sequences.pop(archived_trade_id)
+            self._indexed_values.pop(archived_trade_id)
+            self._archive(archived_trade_id, archived_trade)
+
+    def __delitem__(self, trade_id):
+        if trade_id in self._live_trades:
+            self._detach_trade(self._live_trades.pop(trade_id))
+            self._unindex_trade(trade_id, self._indexed_values.pop(trade_id))
+            self._sequences.pop(trade_id)
+        else:
+            row = self._rows_by_trade_id.pop(trade_id)
+            self._unindex_trade(trade_id, self._get_archived_indexed_values(row))
+            self._remove_row(row)
+            self._row_trade_ids[row] = None
+            self._compact_if_necessary()
+
+    def __contains__(self, trade_id):
+        return trade_id in self._live_trades or trade_id in self._rows_by_trade_id
+
+    def __iter__(self):
+        yield from (trade_id for trade_id in self._row_trade_ids[self._first_row:] if trade_id is not None)
+        yield from self._live_trades
+
+    def __len__(self):
+        return len(self._rows_by_trade_id) + len(self._live_trades)
+
+    def popitem(self, last=True):
+        """
+        :param last: when False, the oldest trade is removed, the most recent one otherwise
+        :return: the removed (trade_id, trade) item
+        """
+        if (last and self._live_trades) or not self._rows_by_trade_id:
+            if not self._live_trades:
+                raise KeyError("popitem(): trades store is empty")
+            trade_id = next(reversed(self._live_trades)) if last else next(iter(self._live_trades))
+        else:
+            rows = range(len(self._row_trade_ids) - 1, self._first_row - 1, -1) if last \
+                else range(self._first_row, len(self._row_trade_ids))
+            # iterate on rows to avoid copying every trade id on each call
+            trade_id = next(
+                self._row_trade_ids[row] for row in rows if self._row_trade_ids[row] is not None
+            )
+        trade = self[trade_id]
+        del self[trade_id]
+        return trade_id, trade
+
+    def remove_oldest_trades(self, count) -> collections.Counter:
+        """
+        Removes the oldest trades without materializing archived trades
+        :param count: the number of trades to remove
+        :return: the number of removed trades of each symbol
+        """
+        removed_counts = collections.Counter()
+        symbols = self._categories["symbol"]
+        while count > 0 and self._rows_by_trade_id:
+            trade_id = self._row_trade_ids[self._first_row]
+            if trade_id is None:
+                self._first_row += 1
+                continue
+            code = self._columns["symbol"][self._first_row]
+            removed_counts[None if code == _NO_CODE else symbols.values[code]] += 1
+            # also moves the first row
+            del self[trade_id]
+            count -= 1
+        while count > 0 and self._live_trades:
+            removed_counts[self.popitem(last=False)[1].symbol] += 1
+            count -= 1
+        return removed_counts
+
+    def clear(self):
+        for trade in self._live_trades.values():
+            self._detach_trade(trade)
+        self._live_trades.clear()
+        self._rows_by_trade_id.clear()
+        self._row_trade_ids.clear()
+        self._first_row = 0
+        for values in self._objects.values():
+            values.clear()
+        self._archived_fees.clear()
+        self._reset_columns()
+        self._sequences.clear()
+        self._trade_ids_by_origin_order_id.clear()
+        self._trade_ids_by_exchange_order_id.clear()
+        self._indexed_values.clear()
+        self._trade_ids_by_trade.clear()
+        self._archived_exit_ids_by_entry_id.clear()
+
+    def get_indexed_trades(self, origin_order_id=None, exchange_order_id=None) -> list:
+        """
+        :param origin_order_id: the origin order id of the trades to get, ignored when empty
+        :param exchange_order_id: the exchange order id of the trades to get, ignored when empty
+        :return: the trades matching every given id, in insertion order
+        """
+        if not origin_order_id and not exchange_order_id:
+            return list(self.values())
+        trade_ids, *other_buckets_trade_ids = [
+            _get_bucket_trade_ids(index, value)
+            for index, value in (
+                (self._trade_ids_by_origin_order_id, origin_order_id),
+                (self._trade_ids_by_exchange_order_id, exchange_order_id),
+            )
+            if value
+        ]
+        for bucket_trade_ids in other_buckets_trade_ids:
+            trade_ids = [trade_id for trade_id in trade_ids if trade_id in bucket_trade_ids]
+        return self.get_trades_from_ids(self._sorted(trade_ids))
+
+    def get_trades_from_ids(self, trade_ids) -> list:
+        """
+        :param trade_ids: ids of stored trades
+        :return: the trades of the given ids, archived trades are materialized at once
+        """
+        archived_rows = [
+            self._rows_by_trade_id[trade_id]
+            for trade_id in trade_ids
+            if trade_id not in self._live_trades
+        ]
+        archived_trades = iter(self._create_trades(archived_rows) if archived_rows else ())
+        return [
+            self._live_trades[trade_id] if trade_id in self._live_trades else next(archived_trades)
+            for trade_id in trade_ids
+        ]
+
+    def values(self):
+        return _TradesValuesView(self)
+
+    def get_last_trade_id(self, origin_order_id):
+        """
+        :param origin_order_id: an origin order id
+        :return: the id of the most recent trade of this origin order id, None when there is no such trade
+        """
+        trade_ids = _get_bucket_trade_ids(self._trade_ids_by_origin_order_id, origin_order_id)
+        if not trade_ids:
+            return None
+        return self._sorted(trade_ids)[-1]
+
+    def get_exit_trade_ids_by_entry_id(self) -> dict:
+        """
+        :return: the ids of the non-cancelled trades associated to each entry order id, entry order ids are
+        sorted by first associated trade
+        """
+        exit_ids_by_entry_id = {
+            entry_id: list(exit_ids) if type(exit_ids) is list else [exit_ids]
+            for entry_id, exit_ids in self._archived_exit_ids_by_entry_id.items()
+        }
+        # live trades can be updated: their entries are not indexed
+        for trade_id, trade in self._live_trades.items():
+            if trade.status is not enums.OrderStatus.CANCELED and trade.associated_entry_ids:
+                for entry_id in trade.associated_entry_ids:
+                    exit_ids_by_entry_id.setdefault(entry_id, []).append(trade_id)
+        return dict(sorted(
+            exit_ids_by_entry_id.items(), key=lambda item: min(self._get_position(trade_id) for trade_id in item[1])
+        ))
+
+    def update_trade_indexes(self, trade):
+        """
+        Should be called when an indexed attribute of a trade changes
+        :param trade: the updated trade
+        """
+        trade_id = self._trade_ids_by_trade.get(id(trade))
+        if trade_id is None:
+            return
+        values = _get_indexed_values(trade)
+        if self._indexed_values[trade_id] != values:
+            self._unindex_trade(trade_id, self._indexed_values[trade_id])
+            self._indexed_values[trade_id] = values
+            self._index_trade(trade_id, values)
+
+    def get_live_trades(self) -> list:
+        """
+        :return: the trades that are not archived yet (the most recent ones) as Trade instances
+        """
+        return list(self._live_trades.values())
+
+    def get_archived_trades_count(self) -> int:
+        """
+        :return: the number of trades stored in columns
+        """
+        return len(self._rows_by_trade_id)
+
+    def get_archived_paid_fees(self) -> dict:
+        """
+        :return: the total fees paid by archived trades, by currency
+        """
+        return {
+            currency: fees
+            for currency, fees in self._archived_fees.items()
+        }
+
+    def get_count_by_symbol(self) -> collections.Counter:
+        """
+        :return: the number of trades of each symbol
+        """
+        counts = collections.Counter(trade.symbol for trade in self._live_trades.values())
+        symbols = self._categories["symbol"]
+        codes = self._get_archived_column("symbol")
+        for code, count in enumerate(np.bincount(codes[codes != _NO_CODE], minlength=len(symbols.values))):
+            if count:
+                counts[symbols.values[code]] += int(count)
+        return counts
+
+    def get_archived_column(self, attribute) -> np.ndarray:
+        """
+        :param attribute: a Trade decimal or time attribute name
+        :return: the float64 values of this attribute for every archived trade, in insertion order, NaN when
+        unavailable. Used for vectorized reductions: values are approximated.
+        """
+        if attribute not in _DECIMAL_ATTRIBUTES and attribute not in _TIME_ATTRIBUTES:
+            raise KeyError(f"{attribute} is not a numeric archived attribute")
+        return self._get_archived_column(attribute)
+
+    def _index_trade(self, trade_id, values):
+        for index, value in zip((self._trade_ids_by_origin_order_id, self._trade_ids_by_exchange_order_id), values):
+            _add_to_bucket(index, value, trade_id)
+
+    def _unindex_trade(self, trade_id, values):
+        for index, value in zip((self._trade_ids_by_origin_order_id, self._trade_ids_by_exchange_order_id), values):
+            _remove_from_bucket(index, value, trade_id)
+
+    def _get_archived_indexed_values(self, row):
+        return self._objects["origin_order_id"][row], self._objects["exchange_order_id"][row]
+
+    def _attach_trade(self, trade_id, trade):
+        self._trade_ids_by_trade[id(trade)] = trade_id
+        trade.trades_index = self
+
+    def _detach_trade(self, trade):
+        self._trade_ids_by_trade.pop(id(trade), None)
+        if getattr(trade, "trades_index", None) is self:
+            trade.trades_index = None
+
+    def _get_position(self, trade_id):
+        # archived trades are older than live ones
+        if trade_id in self._sequences:
+            return 1, self._sequences[trade_id]
+        return 0, self._rows_by_trade_id[trade_id]
+
+    def _sorted(self, trade_ids):
+        if len(trade_ids) < 2:
+            return list(trade_ids)
+        return sorted(trade_ids, key=self._get_position)
+
+    def _get_archived_exit_entry_ids(self, row):
+        if self._get_category("status", row) is enums.OrderStatus.CANCELED:
+            return ()
+        return self._objects["associated_entry_ids"][row] or ()
+
+    def _get_archived_column(self, column):
+        rows = self._get_archived_rows()
+        return self._columns[column][rows]
+
+    def _get_archived_rows(self):
+        rows = np.fromiter(
+            (trade_id is not None for trade_id in self._row_trade_ids[self._first_row:]),
+            dtype=bool, count=len(self._row_trade_ids) - self._first_row
+        )
+        return np.flatnonzero(rows) + self._first_row
+
+    def _archive(self, trade_id, trade):
+        row = len(self._row_trade_ids)
+        if row >= self._capacity:
+            self._resize(max(_INITIAL_CAPACITY, self._capacity * 2))
+        self._row_trade_ids.append(trade_id)
+        for values in self._objects.values():
+            values.append(None)
+        self._rows_by_trade_id[trade_id] = row
+        self._write_row(row, trade_id, trade)
+
+    def _write_row(self, row, trade_id, trade):
+        for attribute in _DECIMAL_ATTRIBUTES:
+            self._set_decimal(attribute, row, getattr(trade, attribute))
+        for attribute in _TIME_ATTRIBUTES:
+            self._set_time(attribute, row, getattr(trade, attribute))
+        for attribute in _BOOLEAN_ATTRIBUTES:
+            value = getattr(trade, attribute)
+            if value is True or value is False:
+                self._columns[attribute][row] = value
+            else:
+                self._exact_values[attribute][row] = value
+        for attribute in _CATEGORY_ATTRIBUTES:
+            self._set_category(attribute, row, getattr(trade, attribute))
+        for attribute in _OBJECT_ATTRIBUTES:
+            self._objects[attribute][row] = getattr(trade, attribute)
+        self._set_fee(row, trade.fee)
+        for entry_id in self._get_archived_exit_entry_ids(row):
+            _add_to_bucket(self._archived_exit_ids_by_entry_id, entry_id, trade_id)
+
+    def _remove_row(self, row):
+        trade_id = self._row_trade_ids[row]
+        for entry_id in self._get_archived_exit_entry_ids(row):
+            _remove_from_bucket(self._archived_exit_ids_by_entry_id, entry_id, trade_id)
+        fee = self._get_fee(row)
+        if fee:
+            self._add_archived_fee(fee, -1)
+        for values in self._exact_values.values():
+            values.pop(row, None)
+        for attribute in _OBJECT_ATTRIBUTES:
+            self._objects[attribute][row] = None
+        for attribute in _CATEGORY_ATTRIBUTES + (_FEE_LAYOUT, ):
+            self._columns[attribute][row] = _NO_CODE
+
+    def _create_trade(self, row):
+        return self._create_trades([row])[0]
+
+    def _create_trades(self, rows) -> list:
+        # reads every column once for all the given rows
+        rows = np.asarray(rows, dtype=np.int64)
+        attributes_values = {}
+        for attribute in _DECIMAL_ATTRIBUTES + (_FEE_COST, _FEE_ORIGINAL_COST):
+            attributes_values[attribute] = self._get_decimals(attribute, rows)
+        for attribute in _TIME_ATTRIBUTES:
+            integer_times = self._integer_times[attribute][rows].tolist()
+            attributes_values[attribute] = self._get_exact_values(attribute, rows, [
+                int(value) if is_integer else value
+                for value, is_integer in zip(self._columns[attribute][rows].tolist(), integer_times)
+            ])
+        for attribute in _BOOLEAN_ATTRIBUTES:
+            attributes_values[attribute] = self._get_exact_values(
+                attribute, rows, self._columns[attribute][rows].tolist()
+            )
+        for attribute in _CATEGORY_ATTRIBUTES + (_FEE_LAYOUT, ):
+            category_values = self._categories[attribute].values
+            attributes_values[attribute] = self._get_exact_values(
+                attribute, rows, [category_values[code] for code in self._columns[attribute][rows].tolist()]
+            )
+        for attribute in _OBJECT_ATTRIBUTES:
+            objects = self._objects[attribute]
+            attributes_values[attribute] = [objects[row] for row in rows.tolist()]
+        fees = [
+            _get_fee(layout, cost, original_cost)
+            for layout, cost, original_cost in zip(
+                attributes_values.pop(_FEE_LAYOUT),
+                attributes_values.pop(_FEE_COST),
+                attributes_values.pop(_FEE_ORIGINAL_COST),
+            )
+        ]
+        # fill instances dicts directly: indexed order ids properties are backed by private attributes
+        names = [_TRADE_DICT_KEYS.get(attribute, attribute) for attribute in attributes_values] + ["fee"]
+        default_values = {"trades_index": None, "trader": self.trader, "exchange_manager": self.trader.exchange_manager}
+        trades = []
+        for values in zip(*attributes_values.values(), fees):
+            trade = trade_import.Trade.__new__(trade_import.Trade)
+            trade.__dict__.update(default_values)
+            trade.__dict__.update(zip(names, values))
+            trades.append(trade)
+        return trades
+
+    def _get_decimals(self, column, rows) -> list:
+        return self._get_exact_values(column, rows, [
+            decimal.Decimal(repr(value)) for value in self._columns[column][rows].tolist()
+        ])
+
+    def _get_exact_values(self, column, rows, values) -> list:
+        exact_values = self._exact_values[column]
+        if exact_values:
+            for index, row in enumerate(rows.tolist()):
+                if row in exact_values:
+                    values[index] = exact_values[row]
+        return values
+
+    def _set_decimal(self, column, row, value):
+        if type(value) is decimal.Decimal and value.is_finite():
+            float_value = float(value)
+            self._columns[column][row] = float_value
+            if decimal.Decimal(repr(float_value)) != value:
+                # keep exact value
+                self._exact_values[column][row] = value
+            return
+        try:
+            self._columns[column][row] = np.nan if value is None else float(value)
+        except (TypeError, ValueError):
+            self._columns[column][row] = np.nan
+        self._exact_values[column][row] = value
+
+    def _get_decimal(self, column, row):
+        exact_values = self._exact_values[column]
+        if row in exact_values:
+            return exact_values[row]
+        return decimal.Decimal(repr(float(self._columns[column][row])))
+
+    def _set_time(self, column, row, value):
+        value_type = type(value)
+        if value_type is float or (value_type is int and -_MAX_FLOAT_INTEGER <= value <= _MAX_FLOAT_INTEGER):
+            self._columns[column][row] = value
+            self._integer_times[column][row] = value_type is int
+            return
+        try:
+            self._columns[column][row] = np.nan if value is None else float(value)
+        except (TypeError, ValueError):
+            self._columns[column][row] = np.nan
+        self._exact_values[column][row] = value
+
+    def _set_category(self, column, row, value):
+        try:
+            self._columns[column][row] = self._categories[column].get_code(value)
+        except TypeError:
+            # not hashable
+            self._columns[column][row] = _NO_CODE
+            self._exact_values[column][row] = value
+
+    def _get_category(self, column, row):
+        exact_values = self._exact_values[column]
+        if row in exact_values:
+            return exact_values[row]
+        return self._categories[column].values[self._columns[column][row]]
+
+    def _set_fee(self, row, fee):
+        if not isinstance(fee, dict):
+            self._set_category(_FEE_LAYOUT, row, fee)
+            return
+        # fee costs are stored in columns, other fee values are interned with the fee keys
+        layout = []
+        for key, value in fee.items():
+            if key in _FEE_DECIMAL_KEYS:
+                self._set_decimal(_FEE_DECIMAL_KEYS[key], row, value)
+                value = _DECIMAL_FEE_VALUE
+            layout.append((key, value))
+        self._set_category(_FEE_LAYOUT, row, tuple(layout))
+        self._add_archived_fee(fee, 1)
+
+    def _get_fee(self, row):
+        return _get_fee(
+            self._get_category(_FEE_LAYOUT, row),
+            self._get_decimal(_FEE_COST, row),
+            self._get_decimal(_FEE_ORIGINAL_COST, row)
+        )
+
+    def _add_archived_fee(self, fee, sign):
+        currency = fee.get(_FEE_CURRENCY_KEY)
+        cost = fee.get(_FEE_COST_KEY)
+        if cost is None:
+            return
+        if currency in self._archived_fees:
+            self._archived_fees[currency] += cost * sign
+        else:
+            self._archived_fees[currency] = cost * sign
+
+    def _compact_if_necessary(self):
+        # removing the oldest trades is the most frequent removal
+        while self._first_row < len(self._row_trade_ids) and self._row_trade_ids[self._first_row] is None:
+            self._first_row += 1
+        removed_rows_count = len(self._row_trade_ids) - len(self._rows_by_trade_id)
+        if removed_rows_count < _MIN_COMPACTED_ROWS or removed_rows_count * 2 < len(self._row_trade_ids):
+            return
+        rows = self._get_archived_rows()
+        new_rows = {int(row): new_row for new_row, row in enumerate(rows)}
+        for column, values in self._columns.items():
+            self._columns[column] = _get_resized(values[rows], max(_INITIAL_CAPACITY, len(rows) * 2))
+        for column, values in self._integer_times.items():
+            self._integer_times[column] = _get_resized(values[rows], max(_INITIAL_CAPACITY, len(rows) * 2))
+        self._capacity = max(_INITIAL_CAPACITY, len(rows) * 2)
+        for column, exact_values in self._exact_values.items():
+            self._exact_values[column] = {new_rows[row]: value for row, value in exact_values.items()}
+        for attribute, values in self._objects.items():
+            self._objects[attribute] = [values[row] for row in rows]
+        self._row_trade_ids = [self._row_trade_ids[row] for row in rows]
+        self._rows_by_trade_id = {trade_id: row for row, trade_id in enumerate(self._row_trade_ids)}
+        self._first_row = 0
+
+    def _resize(self, capacity):
+        for column, values in self._columns.items():
+            self._columns[column] = _get_resized(values, capacity)
+        for column, values in self._integer_times.items():
+            self._integer_times[column] = _get_resized(values, capacity)
+        self._capacity = capacity
+
+    def _reset_columns(self):
+        self._capacity = 0
+        self._columns = {
+            **{column: np.empty(0, dtype=np.float64)
+               for column in _DECIMAL_ATTRIBUTES + _TIME_ATTRIBUTES + (_FEE_COST, _FEE_ORIGINAL_COST)},
+            **{column: np.empty(0, dtype=bool) for column in _BOOLEAN_ATTRIBUTES},
+            **{column: np.empty(0, dtype=np.int32) for column in _CATEGORY_ATTRIBUTES + (_FEE_LAYOUT, )},
+        }
+        self._integer_times = {column: np.empty(0, dtype=bool) for column in _TIME_ATTRIBUTES}
+        self._exact_values = {column: {} for column in self._columns}
+
+
+class _Categories:
+    """
+    Interned values of a column
+    """
+
+    def __init__(self):
+        self.values = []
+        self._codes = {}
+
+    def get_code(self, value) -> int:
+        # values of different types can be equal (1 == True == Decimal(1)): use the type in keys
+        key = (type(value), value)
+        try:
+            return self._codes[key]
+        except KeyError:
+            code = self._codes[key] = len(self.values)
+            self.values.append(value)
+            return code
+
+
+class _TradesValuesView(collections.abc.ValuesView):
+    # materializes archived trades by batch
+    _BATCH_SIZE = 1000
+
+    def __iter__(self):
+        trade_ids = list(self._mapping)
+        for start in range(0, len(trade_ids), self._BATCH_SIZE):
+            yield from self._mapping.get_trades_from_ids(trade_ids[start:start + self._BATCH_SIZE])
+
+
+def _add_to_bucket(index, value, trade_id):
+    bucket = index.get(value)
+    if bucket is None:
+        index[value] = trade_id
+    elif type(bucket) is list:
+        bucket.append(trade_id)
+    else:
+        index[value] = [bucket, trade_id]
+
+
+def _remove_from_bucket(index, value, trade_id):
+    bucket = index.get(value)
+    if type(bucket) is list:
+        bucket.remove(trade_id)
+        if len(bucket) == 1:
+            index[value] = bucket[0]
+    elif bucket == trade_id:
+        index.pop(value)
+
+
+def _get_bucket_trade_ids(index, value):
+    bucket = index.get(value)
+    if bucket is None:
+        return ()
+    return bucket if type(bucket) is list else (bucket, )
+
+
+def _get_fee(layout, cost, original_cost):
+    if not isinstance(layout, tuple):
+        return layout
+    decimal_values = {_FEE_COST_KEY: cost, _FEE_ORIGINAL_COST_KEY: original_cost}
+    return {
+        key: decimal_values[key] if value is _DECIMAL_FEE_VALUE else value
+        for key, value in layout
+    }
+
+
+def _get_indexed_values(trade) -> tuple:
+    return trade.origin_order_id, trade.exchange_order_id
+
+
+def _get_resized(values, capacity):
+    resized = np.empty(capacity, dtype=values.dtype)
+    resized[:len(values)] = values[:capacity]
+    return resized
@@ -15,6 +15,12 @@
 #  License along with this library
 
 
+from octobot_trading.storage import storage_writer
+from octobot_trading.storage.storage_writer import (
+    StorageWriter,
+    StorageWriterMetrics,
+)
+
 from octobot_trading.storage import abstract_storage
 from octobot_trading.storage.abstract_storage import (
     AbstractStorage,
@@ -59,6 +65,8 @@ from octobot_trading.storage.util import (
 )
 
 __all__ = [
+    "StorageWriter",
+    "StorageWriterMetrics",
     "AbstractStorage",
     "TradesStorage",
     "OrdersStorage",
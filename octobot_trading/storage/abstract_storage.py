@@ -26,6 +26,7 @@ import octobot_commons.logging as logging
 import octobot_trading.exchange_channel as exchanges_channel
 import octobot_trading.constants as trading_constants
 import octobot_trading.exchanges as exchanges
+import octobot_trading.storage.storage_writer as storage_writer
 
 
 class AbstractStorage:
@@ -89,6 +90,8 @@ class AbstractStorage:
     async def stop(self, clear=True):
         if self.consumer is not None:
             await self.consumer.stop()
+        if self.exchange_manager is not None and self._use_storage_writer():
+            await storage_writer.StorageWriter.instance().flush()
         for task in (self._update_task, self._flush_task):
             if task is not None and not task.done():
                 task.cancel()
@@ -119,6 +122,7 @@ class AbstractStorage:
 
     async def get_history(self):
         # override if necessary
+        await self._write_pending_documents(self._get_db())
         return [
             copy.copy(document[trading_constants.STORAGE_ORIGIN_VALUE])
             for document in await self._get_db().all(self.HISTORY_TABLE)
@@ -163,7 +167,43 @@ class AbstractStorage:
         await self.clear_database_history(self._get_db(), flush=flush)
 
     async def flush(self):
-        await self._get_db().flush()
+        database = self._get_db()
+        await self._write_pending_documents(database)
+        await database.flush()
+
+    def _use_storage_writer(self):
+        # write now in backtesting
+        return trading_constants.ENABLE_BATCHED_STORAGE_WRITES and not self.exchange_manager.is_backtesting
+
+    async def _log(self, database, table_name: str, document: dict, cache=True, key=None, required=False):
+        """
+        Appends a document to the given table, through the storage writer when enabled
+        :param key: identifies the document: a pending document with the same key is replaced
+        :param required: when True, the document can't be dropped by the storage writer backpressure
+        """
+        if self._use_storage_writer():
+            await storage_writer.StorageWriter.instance().log(
+                database, table_name, document, cache=cache, key=key, required=required
+            )
+        else:
+            await database.log(table_name, document, cache=cache)
+
+    async def _replace_all(self, database, table_name: str, documents: list, cache=True):
+        if self._use_storage_writer():
+            await storage_writer.StorageWriter.instance().replace_all(database, table_name, documents, cache=cache)
+        else:
+            await database.replace_all(table_name, documents, cache=cache)
+
+    async def _delete_all(self, database, table_name: str):
+        if self._use_storage_writer():
+            await storage_writer.StorageWriter.instance().delete_all(database, table_name)
+        else:
+            await database.delete_all(table_name)
+
+    async def _write_pending_documents(self, database):
+        # to call before reading from database
+        if self._use_storage_writer():
+            await storage_writer.StorageWriter.instance().flush(database)
 
     @contextlib.contextmanager
     def _multi_exchange_auth_value_update(self, interval):
@@ -206,6 +246,7 @@ class AbstractStorage:
     async def clear_database_history(cls, database, flush=True):
         if cls.HISTORY_TABLE is None:
             raise NotImplementedError(f"{cls.__name__}.HISTORY_TABLE has to be set")
+        storage_writer.StorageWriter.instance().discard(database, cls.HISTORY_TABLE)
         await database.delete(cls.HISTORY_TABLE, None)
         if flush:
             await database.flush()
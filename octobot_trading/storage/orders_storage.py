@@ -26,6 +26,7 @@ import octobot_commons.authentication as authentication
 import octobot_trading.enums as enums
 import octobot_trading.constants as constants
 import octobot_trading.storage.abstract_storage as abstract_storage
+import octobot_trading.storage.storage_writer as storage_writer
 import octobot_trading.storage.util as storage_util
 import octobot_trading.exchanges as exchanges
 
@@ -34,7 +35,11 @@ class OrdersStorage(abstract_storage.AbstractStorage):
     LIVE_CHANNEL = channels_name.OctoBotTradingChannelsName.ORDERS_CHANNEL.value
     HISTORY_TABLE = commons_enums.DBTables.ORDERS.value
     HISTORICAL_OPEN_ORDERS_TABLE = commons_enums.DBTables.HISTORICAL_ORDERS_UPDATES.value
+    # updated orders appended since the last HISTORY_TABLE snapshot
+    HISTORY_LOG_TABLE = f"{HISTORY_TABLE}_log"
     ENABLE_HISTORICAL_ORDER_UPDATES_STORAGE = constants.ENABLE_HISTORICAL_ORDERS_UPDATES_STORAGE
+    ENABLE_DELTA_LOG = constants.ENABLE_ORDERS_STORAGE_DELTA_LOG
+    MIN_LOG_COMPACTION_SIZE = constants.ORDERS_STORAGE_LOG_COMPACTION_SIZE
     IS_MULTI_EXCHANGE_STORAGE = True   # set True when this storage is updating data from all other exchanges as well
 
     def __init__(self, exchange_manager, use_live_consumer_in_backtesting=None, is_historical=None):
@@ -43,6 +48,7 @@ class OrdersStorage(abstract_storage.AbstractStorage):
             use_live_consumer_in_backtesting=use_live_consumer_in_backtesting, is_historical=is_historical
         )
         self.startup_orders = {}
+        self._log_size = 0
 
     def should_store_data(self):
         return (
@@ -65,25 +71,53 @@ class OrdersStorage(abstract_storage.AbstractStorage):
         await self.trigger_debounced_update_auth_data(False)
         # only store the current snapshot of open orders when order updates are received
         if self.should_store_data():
-            await self._update_history()
+            if self.ENABLE_DELTA_LOG:
+                await self._log_order_update(order)
+            else:
+                await self._update_history()
             if self.ENABLE_HISTORICAL_ORDER_UPDATES_STORAGE:
                 await self._add_historical_open_orders(order, update_type)
             await self.trigger_debounced_flush()
 
     @abstract_storage.AbstractStorage.hard_reset_and_retry_if_necessary
     async def _update_history(self):
-        await self._get_db().replace_all(
-            self.HISTORY_TABLE,
+        await self._replace_history(
             [
                 _format_order(order, self.exchange_manager)
                 for order in self.exchange_manager.exchange_personal_data.orders_manager.get_open_orders()
-            ],
-            cache=False,
+            ]
         )
 
+    async def _replace_history(self, order_documents):
+        await self._replace_all(self._get_db(), self.HISTORY_TABLE, order_documents, cache=False)
+        if self._log_size:
+            # the snapshot includes every logged update
+            await self._delete_all(self._get_db(), self.HISTORY_LOG_TABLE)
+            self._log_size = 0
+
+    @abstract_storage.AbstractStorage.hard_reset_and_retry_if_necessary
+    async def _log_order_update(self, order_dict: dict):
+        """
+        Appends the stored details of the updated order (or its removal) to the orders log.
+        Compacts the log into a new open orders snapshot when it is larger than the open orders count.
+        """
+        # every log entry is required to rebuild open orders
+        await self._log(
+            self._get_db(), self.HISTORY_LOG_TABLE, _format_order_log_entry(order_dict, self.exchange_manager),
+            cache=False, required=True
+        )
+        self._log_size += 1
+        if self._log_size >= max(
+            self.MIN_LOG_COMPACTION_SIZE,
+            len(self.exchange_manager.exchange_personal_data.orders_manager.get_open_orders())
+        ):
+            # amortized: at most one open orders rewrite every open orders count updates
+            await self._update_history()
+
     async def _add_historical_open_orders(self, order_dict: dict, update_type: str):
         update_time = time.time()
-        await self._get_db().log(
+        await self._log(
+            self._get_db(),
             self.HISTORICAL_OPEN_ORDERS_TABLE,
             _format_order_update(self.exchange_manager, order_dict, update_type, update_time),
             cache=False,
@@ -108,7 +142,7 @@ class OrdersStorage(abstract_storage.AbstractStorage):
 
     async def _store_history(self):
         await self._update_history()
-        await self._get_db().flush()
+        await self.flush()
 
     def _get_db(self):
         return commons_databases.RunDatabasesProvider.instance().get_orders_db(
@@ -118,6 +152,7 @@ class OrdersStorage(abstract_storage.AbstractStorage):
         )
 
     async def get_historical_orders_updates(self):
+        await self._write_pending_documents(self._get_db())
         return copy.deepcopy(await self._get_db().all(self.HISTORICAL_OPEN_ORDERS_TABLE))
 
     async def get_startup_order_details(self, order_exchange__id):
@@ -125,9 +160,17 @@ class OrdersStorage(abstract_storage.AbstractStorage):
 
     async def _load_startup_orders(self):
         if self.should_store_data():
+            await self._write_pending_documents(self._get_db())
+            order_documents = copy.deepcopy(await self._get_db().all(self.HISTORY_TABLE))
+            orders_log = copy.deepcopy(await self._get_db().all(self.HISTORY_LOG_TABLE))
+            if orders_log:
+                # apply logged updates and compact them into a new snapshot
+                order_documents = _apply_orders_log(order_documents, orders_log)
+                self._log_size = len(orders_log)
+                await self._replace_history(copy.deepcopy(order_documents))
             self.startup_orders = {
                 _get_startup_order_key(order): from_order_document(order)
-                for order in copy.deepcopy(await self._get_db().all(self.HISTORY_TABLE))
+                for order in order_documents
                 if order    # skip empty order details (error when serializing)
             }
         else:
@@ -152,7 +195,10 @@ class OrdersStorage(abstract_storage.AbstractStorage):
     @classmethod
     async def clear_database_history(cls, database, flush=True):
         await super().clear_database_history(database, flush=False)
+        storage_writer.StorageWriter.instance().discard(database, cls.HISTORY_LOG_TABLE)
+        await database.delete(cls.HISTORY_LOG_TABLE, None)
         if cls.ENABLE_HISTORICAL_ORDER_UPDATES_STORAGE:
+            storage_writer.StorageWriter.instance().discard(database, cls.HISTORICAL_OPEN_ORDERS_TABLE)
             await database.delete(cls.HISTORICAL_OPEN_ORDERS_TABLE, None)
         if flush:
             await database.flush()
@@ -227,6 +273,46 @@ def _format_order_update(exchange_manager, order_dict, update_type, update_time)
     return order_update
 
 
+def _format_order_log_entry(order_dict, exchange_manager):
+    order_id = order_dict[enums.ExchangeConstantsOrderColumns.ID.value]
+    details = None
+    try:
+        order = exchange_manager.exchange_personal_data.orders_manager.get_order(order_id)
+        if order.status is enums.OrderStatus.OPEN:
+            # same content as in open orders snapshots
+            details = _format_order(order, exchange_manager) or None
+    except KeyError:
+        # order is not open anymore
+        pass
+    return {
+        enums.StoredOrdersAttr.ORDER_ID.value: order_id,
+        enums.StoredOrdersAttr.ORDER_EXCHANGE_ID.value:
+            order_dict.get(enums.ExchangeConstantsOrderColumns.EXCHANGE_ID.value) or order_id,
+        # no details: the order has been removed from open orders
+        enums.StoredOrdersAttr.ORDER_DETAILS.value: details,
+    }
+
+
+def _apply_orders_log(order_documents, orders_log):
+    """
+    :param order_documents: open orders snapshot documents
+    :param orders_log: log entries appended after this snapshot, in insertion order
+    :return: the open orders documents including logged updates
+    """
+    documents_by_order_id = {
+        order[constants.STORAGE_ORIGIN_VALUE][enums.ExchangeConstantsOrderColumns.ID.value]: order
+        for order in order_documents
+        if order    # skip empty order details (error when serializing)
+    }
+    for log_entry in orders_log:
+        order_id = log_entry[enums.StoredOrdersAttr.ORDER_ID.value]
+        if details := log_entry.get(enums.StoredOrdersAttr.ORDER_DETAILS.value):
+            documents_by_order_id[order_id] = details
+        else:
+            documents_by_order_id.pop(order_id, None)
+    return list(documents_by_order_id.values())
+
+
 def from_order_document(order_document):
     order_dict = dict(order_document)
     try:
@@ -32,6 +32,14 @@ class PortfolioStorage(abstract_storage.AbstractStorage):
     HISTORY_TABLE = commons_enums.RunDatabases.HISTORICAL_PORTFOLIO_VALUE.value
     IS_MULTI_EXCHANGE_STORAGE = True   # set True when this storage is updating data from all other exchanges as well
 
+    MAX_PENDING_REMOVED_TIMESTAMPS = 1000
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # database uuid of stored historical values by timestamp, None until the whole history is stored
+        self._stored_history_uuids = None
+        self._pending_removed_timestamps = []
+
     @abstract_storage.AbstractStorage.hard_reset_and_retry_if_necessary
     async def store_history(self, reset=False):
         if not self.enabled:
@@ -40,24 +48,78 @@ class PortfolioStorage(abstract_storage.AbstractStorage):
         hist_portfolio_values_manager = self.exchange_manager.exchange_personal_data.\
             portfolio_manager.historical_portfolio_value_manager
         metadata = hist_portfolio_values_manager.get_metadata()
+        await self._write_pending_documents(portfolio_db)
+        await portfolio_db.upsert(commons_enums.RunDatabases.METADATA.value, metadata, None, uuid=1)
+        try:
+            if reset or self._stored_history_uuids is None:
+                await self._store_whole_history(portfolio_db, hist_portfolio_values_manager)
+            else:
+                await self._store_history_changes(portfolio_db, hist_portfolio_values_manager)
+        except Exception:
+            # stored history is unknown: store the whole history next time
+            self._stored_history_uuids = None
+            raise
+        await self.trigger_debounced_flush()
+        await self.trigger_debounced_update_auth_data(reset)
+
+    async def _store_whole_history(self, portfolio_db, hist_portfolio_values_manager):
         # replace the whole table to ensure consistency
+        hist_portfolio_values_manager.pop_history_changes()
         history = hist_portfolio_values_manager.get_dict_historical_values()
-        existing_history = await portfolio_db.all(self.HISTORY_TABLE)
+        existing_history_by_timestamp = {
+            history_val[portfolio_history.HistoricalAssetValue.TIMESTAMP_KEY]: history_val
+            for history_val in await portfolio_db.all(self.HISTORY_TABLE)
+        }
         self._to_update_auth_data_ids_buffer.update(
             (
                 history_val[portfolio_history.HistoricalAssetValue.TIMESTAMP_KEY]
                 for history_val in history
-                if history_val not in existing_history
+                if existing_history_by_timestamp.get(
+                    history_val[portfolio_history.HistoricalAssetValue.TIMESTAMP_KEY]
+                ) != history_val
             )
         )
-        await portfolio_db.upsert(commons_enums.RunDatabases.METADATA.value, metadata, None, uuid=1)
-        await portfolio_db.replace_all(
-            self.HISTORY_TABLE,
-            history,
-            cache=False
-        )
-        await self.trigger_debounced_flush()
-        await self.trigger_debounced_update_auth_data(reset)
+        await portfolio_db.delete_all(self.HISTORY_TABLE)
+        self._stored_history_uuids = {}
+        self._pending_removed_timestamps = []
+        await self._insert_historical_values(portfolio_db, history)
+
+    async def _store_history_changes(self, portfolio_db, hist_portfolio_values_manager):
+        # only write added, updated and removed historical values
+        changed_values, removed_timestamps = hist_portfolio_values_manager.pop_history_changes()
+        new_values = []
+        for history_val in changed_values:
+            timestamp = history_val[portfolio_history.HistoricalAssetValue.TIMESTAMP_KEY]
+            self._to_update_auth_data_ids_buffer.add(timestamp)
+            if (uuid := self._stored_history_uuids.get(timestamp)) is None:
+                new_values.append(history_val)
+            else:
+                await portfolio_db.upsert(self.HISTORY_TABLE, history_val, None, uuid=uuid)
+        await self._insert_historical_values(portfolio_db, new_values)
+        for timestamp in removed_timestamps:
+            if self._stored_history_uuids.pop(timestamp, None) is not None:
+                self._pending_removed_timestamps.append(timestamp)
+        if len(self._pending_removed_timestamps) >= self.MAX_PENDING_REMOVED_TIMESTAMPS:
+            # removing from a query is going through the whole table: remove by batch
+            await portfolio_db.delete(
+                self.HISTORY_TABLE,
+                (await portfolio_db.search())[portfolio_history.HistoricalAssetValue.TIMESTAMP_KEY].one_of(
+                    self._pending_removed_timestamps
+                )
+            )
+            self._pending_removed_timestamps = []
+
+    async def _insert_historical_values(self, portfolio_db, history):
+        if history:
+            uuids = await portfolio_db.log_many(self.HISTORY_TABLE, history, cache=False)
+            self._stored_history_uuids.update(
+                (history_val[portfolio_history.HistoricalAssetValue.TIMESTAMP_KEY], uuid)
+                for history_val, uuid in zip(history, uuids)
+            )
+
+    async def clear_history(self, flush=True):
+        await super().clear_history(flush=flush)
+        self._stored_history_uuids = None
 
     async def _update_auth_data(self, reset):
         authenticator = authentication.Authenticator.instance()
@@ -0,0 +1,315 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library
+import asyncio
+import collections
+import dataclasses
+import itertools
+import time
+
+import octobot_commons.logging as logging
+import octobot_commons.singleton as singleton
+
+import octobot_trading.enums as enums
+import octobot_trading.constants as constants
+
+
+@dataclasses.dataclass
+class StorageWriterMetrics:
+    queue_depth: int = 0    # pending documents
+    max_queue_depth: int = 0
+    batches: int = 0
+    written_documents: int = 0
+    last_batch_size: int = 0
+    max_batch_size: int = 0
+    last_flush_latency: float = 0   # seconds to write the last batch
+    max_flush_latency: float = 0
+    coalesced_documents: int = 0    # documents replaced by a newer version before being written
+    dropped_documents: int = 0
+    inline_writes: int = 0  # writes from storages callbacks due to full buffers
+    errors: int = 0
+
+    def get_average_batch_size(self) -> float:
+        return self.written_documents / self.batches if self.batches else 0
+
+
+class StorageWriter(singleton.Singleton):
+    """
+    Buffers storages writes per database table and writes them by batch from a single background task
+    every batch_interval seconds, so that storages callbacks don't wait for database writes.
+    Pending writes are coalesced: a document logged with the key of a pending document replaces it and
+    a replace_all or delete_all of a table replaces its pending operations.
+    When a table buffer holds max_table_buffer_size documents, backpressure_policy is applied. Documents of
+    tables logged as required are never dropped: their table buffer is written inline instead.
+    Failed writes are logged and their unwritten operations are retried first on the next batch.
+    """
+
+    def __init__(self):
+        self.batch_interval = constants.STORAGE_WRITER_BATCH_INTERVAL
+        self.max_table_buffer_size = constants.STORAGE_WRITER_MAX_TABLE_BUFFER_SIZE
+        self.backpressure_policy = constants.STORAGE_WRITER_BACKPRESSURE_POLICY
+        self.metrics = StorageWriterMetrics()
+        self.logger = logging.get_logger(self.__class__.__name__)
+        self._buffers = {}
+        self._task = None
+        self._lock = None
+
+    async def log(self, database, table_name: str, document: dict, cache=True, key=None, required=False):
+        """
+        Appends a document to the given table
+        :param database: the database to write into
+        :param table_name: name of the table
+        :param document: document to write
+        :param cache: when True, enables the database local cache
+        :param key: when set, replaces the pending document of this table that has the same key
+        :param required: when True, pending documents of this table are written instead of being dropped
+        by the DROP_OLDEST backpressure policy
+        """
+        table_buffer = self._get_table_buffer(database, table_name)
+        table_buffer.required = table_buffer.required or required
+        if table_buffer.documents_count >= self.max_table_buffer_size:
+            await self._apply_backpressure(table_buffer)
+            table_buffer = self._get_table_buffer(database, table_name)
+            table_buffer.required = table_buffer.required or required
+        if table_buffer.log(document, cache, key):
+            self.metrics.coalesced_documents += 1
+        else:
+            self._update_queue_depth(1)
+        self._ensure_write_task()
+
+    async def replace_all(self, database, table_name: str, documents: list, cache=True):
+        """
+        Replaces the whole content of the given table, pending writes of this table are discarded
+        :param database: the database to write into
+        :param table_name: name of the table
+        :param documents: the new table content
+        :param cache: when True, documents are registered in the database local cache
+        """
+        table_buffer = self._get_table_buffer(database, table_name)
+        coalesced = table_buffer.documents_count
+        table_buffer.replace_all(documents, cache)
+        self.metrics.coalesced_documents += coalesced
+        self._update_queue_depth(table_buffer.documents_count - coalesced)
+        self._ensure_write_task()
+
+    async def delete_all(self, database, table_name: str):
+        """
+        Deletes the whole content of the given table, pending writes of this table are discarded
+        """
+        await self.replace_all(database, table_name, [], cache=False)
+
+    async def flush(self, database=None):
+        """
+        Writes pending documents now
+        :param database: when set, only writes the pending documents of this database
+        """
+        await self._write_buffers(database)
+
+    def discard(self, database, table_name: str):
+        """
+        Removes pending writes of the given table
+        """
+        if table_buffer := self._buffers.pop((id(database), table_name), None):
+            self._update_queue_depth(-table_buffer.documents_count)
+
+    def get_metrics(self) -> dict:
+        return {
+            **dataclasses.asdict(self.metrics),
+            "average_batch_size": self.metrics.get_average_batch_size(),
+        }
+
+    async def stop(self):
+        await self.flush()
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+        self._task = None
+
+    def _get_table_buffer(self, database, table_name):
+        try:
+            return self._buffers[(id(database), table_name)]
+        except KeyError:
+            table_buffer = self._buffers[(id(database), table_name)] = _TableBuffer(database, table_name)
+            return table_buffer
+
+    async def _apply_backpressure(self, table_buffer):
+        if (
+            self.backpressure_policy is enums.StorageWriterBackpressurePolicy.DROP_OLDEST
+            and not table_buffer.required
+        ):
+            if table_buffer.drop_oldest():
+                self.metrics.dropped_documents += 1
+                self._update_queue_depth(-1)
+                return
+        # StorageWriterBackpressurePolicy.WRITE_INLINE, required documents or only a pending replace_all to drop
+        self.metrics.inline_writes += 1
+        await self._write_buffers(table_buffer.database)
+
+    def _update_queue_depth(self, delta):
+        self.metrics.queue_depth += delta
+        self.metrics.max_queue_depth = max(self.metrics.max_queue_depth, self.metrics.queue_depth)
+
+    def _ensure_write_task(self):
+        if self._task is None or self._task.done() or self._task.get_loop() is not asyncio.get_running_loop():
+            self._task = asyncio.create_task(self._write_periodically())
+
+    async def _write_periodically(self):
+        while self._buffers:
+            await asyncio.sleep(self.batch_interval)
+            try:
+                await self._write_buffers(None)
+            except Exception as err:
+                self.logger.exception(err, True, f"Error when writing storages batch: {err}")
+
+    def _get_lock(self):
+        # locks can't be shared between event loops
+        if self._lock is None or getattr(self._lock, "_loop", None) not in (None, asyncio.get_running_loop()):
+            self._lock = asyncio.Lock()
+        return self._lock
+
+    async def _write_buffers(self, database):
+        async with self._get_lock():
+            table_buffers = [
+                self._buffers.pop(key)
+                for key in list(self._buffers)
+                if database is None or key[0] == id(database)
+            ]
+            if not table_buffers:
+                return
+            batch_size = sum(table_buffer.documents_count for table_buffer in table_buffers)
+            self._update_queue_depth(-batch_size)
+            t0 = time.perf_counter()
+            failed_table_buffers = [
+                table_buffer
+                for table_buffer in table_buffers
+                if not await self._write_table_buffer(table_buffer)
+            ]
+            latency = time.perf_counter() - t0
+            if failed_table_buffers:
+                batch_size -= sum(table_buffer.documents_count for table_buffer in failed_table_buffers)
+                self._restore_table_buffers(failed_table_buffers)
+            self.metrics.batches += 1
+            self.metrics.written_documents += batch_size
+            self.metrics.last_batch_size = batch_size
+            self.metrics.max_batch_size = max(self.metrics.max_batch_size, batch_size)
+            self.metrics.last_flush_latency = latency
+            self.metrics.max_flush_latency = max(self.metrics.max_flush_latency, latency)
+
+    async def _write_table_buffer(self, table_buffer) -> bool:
+        try:
+            try:
+                await table_buffer.write()
+            except Exception as err:
+                if not table_buffer.database.is_hard_reset_error(err):
+                    raise
+                self.logger.warning(f"Resetting database due to [{err}] error")
+                await table_buffer.database.hard_reset()
+                await table_buffer.write()
+            return True
+        except Exception as err:
+            self.metrics.errors += 1
+            self.logger.exception(
+                err, True, f"Error when writing {table_buffer.documents_count} documents "
+                           f"into {table_buffer.table_name}, retrying on next batch: {err}"
+            )
+            return False
+
+    def _restore_table_buffers(self, table_buffers):
+        # unwritten operations are pending again, before the ones logged during the write
+        restored_buffers = {}
+        for table_buffer in table_buffers:
+            key = (id(table_buffer.database), table_buffer.table_name)
+            self._update_queue_depth(table_buffer.documents_count)
+            if newer_table_buffer := self._buffers.pop(key, None):
+                coalesced = newer_table_buffer.prepend(table_buffer)
+                self.metrics.coalesced_documents += coalesced
+                self._update_queue_depth(-coalesced)
+                table_buffer = newer_table_buffer
+            restored_buffers[key] = table_buffer
+        self._buffers = {**restored_buffers, **self._buffers}
+        self._ensure_write_task()
+
+
+class _TableBuffer:
+    # pending operations of a table: an optional content replacement followed by logged documents
+    def __init__(self, database, table_name):
+        self.database = database
+        self.table_name = table_name
+        self.replacement = None
+        self.replacement_cache = False
+        # when True, documents can't be dropped
+        self.required = False
+        self.documents = collections.OrderedDict()
+
+    @property
+    def documents_count(self):
+        return len(self.documents) + (len(self.replacement) if self.replacement else 0)
+
+    def log(self, document, cache, key) -> bool:
+        """
+        :return: True when the document replaced a pending one
+        """
+        if key is None:
+            key = (_UNIQUE_KEY, next(_UNIQUE_KEYS_COUNTER))
+        coalesced = key in self.documents
+        self.documents[key] = (document, cache)
+        return coalesced
+
+    def replace_all(self, documents, cache):
+        self.replacement = list(documents)
+        self.replacement_cache = cache
+        self.documents.clear()
+
+    def prepend(self, older_table_buffer) -> int:
+        """
+        Adds the pending operations of older_table_buffer before these ones
+        :return: the number of older documents replaced by these ones
+        """
+        if self.replacement is not None:
+            return older_table_buffer.documents_count
+        documents = older_table_buffer.documents
+        coalesced = 0
+        for key, document in self.documents.items():
+            coalesced += key in documents
+            documents[key] = document
+        self.documents = documents
+        self.replacement = older_table_buffer.replacement
+        self.replacement_cache = older_table_buffer.replacement_cache
+        self.required = self.required or older_table_buffer.required
+        return coalesced
+
+    def drop_oldest(self) -> bool:
+        if not self.documents:
+            return False
+        self.documents.popitem(last=False)
+        return True
+
+    async def write(self):
+        # written operations are removed: a failed write can be retried with the remaining ones
+        if self.replacement is not None:
+            if self.replacement:
+                await self.database.replace_all(self.table_name, self.replacement, cache=self.replacement_cache)
+            else:
+                await self.database.delete_all(self.table_name)
+            self.replacement = None
+        for cache, documents in itertools.groupby(list(self.documents.items()), key=lambda item: item[1][1]):
+            documents = list(documents)
+            await self.database.log_many(self.table_name, [document for _, (document, _) in documents], cache=cache)
+            for key, _ in documents:
+                del self.documents[key]
+
+
+# keys of documents logged without key, unique across table buffers
+_UNIQUE_KEY = object()
+_UNIQUE_KEYS_COUNTER = itertools.count()
@@ -41,7 +41,8 @@ class TradesStorage(abstract_storage.AbstractStorage):
         old_trade: bool
     ):
         if trade[enums.ExchangeConstantsOrderColumns.STATUS.value] != enums.OrderStatus.CANCELED.value:
-            await self._get_db().log(
+            await self._log(
+                self._get_db(),
                 self.HISTORY_TABLE,
                 _format_trade(
                     trade,
@@ -50,7 +51,8 @@ class TradesStorage(abstract_storage.AbstractStorage):
                     self.plot_settings.x_multiplier,
                     self.plot_settings.kind,
                     self.plot_settings.mode
-                )
+                ),
+                key=trade[enums.ExchangeConstantsOrderColumns.ID.value],
             )
             await self.trigger_debounced_flush()
             self._to_update_auth_data_ids_buffer.add(trade[enums.ExchangeConstantsOrderColumns.ID.value])
@@ -61,12 +63,15 @@ class TradesStorage(abstract_storage.AbstractStorage):
         if self.exchange_manager.is_trader_simulated:
             return
         authenticator = authentication.Authenticator.instance()
+        trades = self.exchange_manager.exchange_personal_data.trades_manager.trades
         history = [
             self._get_trade_dict_with_usd_like_volume(trade)
-            for trade in self.exchange_manager.exchange_personal_data.trades_manager.trades.values()
+            # only materialize updated archived trades
+            for trade in trades.get_trades_from_ids(
+                [trade_id for trade_id in trades if trade_id in self._to_update_auth_data_ids_buffer]
+            )
             if trade.status is not enums.OrderStatus.CANCELED
             and trade.is_from_this_octobot
-            and trade.trade_id in self._to_update_auth_data_ids_buffer
         ]
         if (history or reset) and authenticator.is_initialized():
             # also update when history is empty to reset trade history
@@ -75,8 +80,8 @@ class TradesStorage(abstract_storage.AbstractStorage):
 
     @abstract_storage.AbstractStorage.hard_reset_and_retry_if_necessary
     async def _store_history(self):
-        database = self._get_db()
-        await database.replace_all(
+        await self._replace_all(
+            self._get_db(),
             self.HISTORY_TABLE,
             [
                 _format_trade(
@@ -92,7 +97,7 @@ class TradesStorage(abstract_storage.AbstractStorage):
             ],
             cache=False,
         )
-        await database.flush()
+        await self.flush()
 
     def _get_trade_dict_with_usd_like_volume(self, trade) -> dict:
         trade_dict = trade.to_dict()
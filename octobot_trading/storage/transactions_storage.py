@@ -31,7 +31,8 @@ class TransactionsStorage(abstract_storage.AbstractStorage):
             for transaction in self.exchange_manager.exchange_personal_data.transactions_manager.transactions.values()
         ]
         y_data = self.plot_settings.y_data or [0] * len(transactions)
-        await self._get_db().replace_all(
+        await self._replace_all(
+            self._get_db(),
             self.HISTORY_TABLE,
             [
                 _format_transaction(
@@ -26,11 +26,14 @@ from octobot_trading.util.initialization_util import (
 
 from octobot_trading.util import simulator_updater_utils
 from octobot_trading.util import config_util
+from octobot_trading.util import read_only_dict
+from octobot_trading.util import backtesting_data_prefetcher
 
 from octobot_trading.util.simulator_updater_utils import (
     stop_and_pause,
     pause_time_consumer,
     resume_time_consumer,
+    create_data_prefetcher,
     get_time_channel,
 )
 from octobot_trading.util.config_util import (
@@ -49,11 +52,19 @@ from octobot_trading.util.config_util import (
     get_traded_pairs_by_currency,
     get_current_bot_live_id,
 )
+from octobot_trading.util.read_only_dict import (
+    ReadOnlyDict,
+    to_read_only,
+)
+from octobot_trading.util.backtesting_data_prefetcher import (
+    BacktestingDataPrefetcher,
+)
 
 __all__ = [
     "stop_and_pause",
     "pause_time_consumer",
     "resume_time_consumer",
+    "create_data_prefetcher",
     "get_time_channel",
     "Initializable",
     "is_trader_enabled",
@@ -70,4 +81,7 @@ __all__ = [
     "get_reference_market",
     "get_traded_pairs_by_currency",
     "get_current_bot_live_id",
+    "ReadOnlyDict",
+    "to_read_only",
+    "BacktestingDataPrefetcher",
 ]
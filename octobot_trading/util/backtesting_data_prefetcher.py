@@ -0,0 +1,106 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import collections
+
+import octobot_backtesting.enums as backtesting_enums
+import octobot_backtesting.importers as importers
+
+import octobot_trading.constants as constants
+
+_TIMESTAMP_INDEX = 0
+
+
+class _DataBuffer:
+    __slots__ = ("rows", "loaded_until")
+
+    def __init__(self):
+        self.rows = collections.deque()
+        self.loaded_until = None
+
+    def drop_before(self, timestamp):
+        rows = self.rows
+        while rows and rows[0][_TIMESTAMP_INDEX] < timestamp:
+            rows.popleft()
+
+
+class BacktestingDataPrefetcher:
+    """
+    Serves the first data row at or after each backtesting clock timestamp. Rows of each symbol are read from
+    the exchange data importer by windows of window_ticks clock ticks in a single importer query and kept decoded
+    in a per symbol ring buffer until the end of the importer data.
+    Warning: as the backtesting clock, selections are chronological: rows from before the last given timestamp
+    can't be selected anymore
+    """
+
+    def __init__(self, importer, table, exchange_name, tick_seconds,
+                 window_ticks=constants.BACKTESTING_PREFETCH_WINDOW_TICKS):
+        self.importer = importer
+        self.table = table
+        self.exchange_name = exchange_name
+        self.window_seconds = tick_seconds * window_ticks
+        self.loaded_windows_count = 0
+        self._get_rows = {
+            backtesting_enums.ExchangeDataTables.ORDER_BOOK: importer.get_order_book,
+            backtesting_enums.ExchangeDataTables.RECENT_TRADES: importer.get_recent_trades,
+            backtesting_enums.ExchangeDataTables.TICKER: importer.get_ticker,
+            backtesting_enums.ExchangeDataTables.KLINE: importer.get_kline,
+        }[table]
+        self._last_timestamp = None
+        self._buffers = {}
+
+    async def get_next_data(self, symbol, timestamp, time_frame=None):
+        """
+        :param symbol: the data symbol
+        :param timestamp: the minimum data time to select (included)
+        :param time_frame: the data time frame, for time frame related data only
+        :return: the first imported data row from timestamp or None when there is no more data
+        """
+        if self._last_timestamp is None:
+            self._last_timestamp = (await self.importer.get_data_timestamp_interval())[1]
+        try:
+            buffer = self._buffers[(symbol, time_frame)]
+        except KeyError:
+            buffer = self._buffers[(symbol, time_frame)] = _DataBuffer()
+        buffer.drop_before(timestamp)
+        while not buffer.rows and timestamp <= self._last_timestamp \
+                and (buffer.loaded_until is None or buffer.loaded_until < self._last_timestamp):
+            await self._load_window(buffer, symbol, time_frame, timestamp)
+            buffer.drop_before(timestamp)
+        return buffer.rows[0] if buffer.rows else None
+
+    async def _load_window(self, buffer, symbol, time_frame, timestamp):
+        from_timestamp = timestamp if buffer.loaded_until is None else max(timestamp, buffer.loaded_until)
+        to_timestamp = from_timestamp + self.window_seconds
+        timestamps, operations = importers.get_operations_from_timestamps(to_timestamp, from_timestamp)
+        time_frame_kwargs = {} if time_frame is None else {"time_frame": time_frame}
+        rows = await self._get_rows(
+            exchange_name=self.exchange_name,
+            symbol=symbol,
+            timestamps=timestamps,
+            operations=operations,
+            **time_frame_kwargs
+        )
+        # selected rows are sorted from the most recent
+        rows.sort(key=lambda row: row[_TIMESTAMP_INDEX])
+        if buffer.loaded_until is not None:
+            rows = [row for row in rows if row[_TIMESTAMP_INDEX] > buffer.loaded_until]
+        buffer.rows.extend(rows)
+        buffer.loaded_until = to_timestamp
+        self.loaded_windows_count += 1
+
+    def clear(self):
+        self._last_timestamp = None
+        self._buffers = {}
@@ -0,0 +1,62 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import copy
+
+
+class ReadOnlyDict(dict):
+    """
+    A dict that can't be updated, used to share cached values.
+    Copies are regular (updatable) dicts.
+    """
+
+    def _raise_read_only(self, *_, **__):
+        raise TypeError(f"{self.__class__.__name__} can't be updated")
+
+    __setitem__ = _raise_read_only
+    __delitem__ = _raise_read_only
+    __ior__ = _raise_read_only
+    clear = _raise_read_only
+    pop = _raise_read_only
+    popitem = _raise_read_only
+    setdefault = _raise_read_only
+    update = _raise_read_only
+
+    def copy(self):
+        return dict(self)
+
+    def __copy__(self):
+        return dict(self)
+
+    def __deepcopy__(self, memo):
+        return {
+            copy.deepcopy(key, memo): copy.deepcopy(value, memo)
+            for key, value in self.items()
+        }
+
+    def __reduce__(self):
+        return self.__class__, (dict(self), )
+
+
+def to_read_only(value):
+    """
+    :param value: the value to convert
+    :return: a read-only deep copy of value: dicts are converted into ReadOnlyDict and lists into tuples
+    """
+    if isinstance(value, dict):
+        return ReadOnlyDict((key, to_read_only(element)) for key, element in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(to_read_only(element) for element in value)
+    return value
@@ -15,6 +15,10 @@
 #  License along with this library.
 import async_channel.channels as channels
 import octobot_backtesting.api as backtesting_api
+import octobot_commons.constants as commons_constants
+import octobot_commons.enums as commons_enums
+
+import octobot_trading.util.backtesting_data_prefetcher as backtesting_data_prefetcher
 
 
 async def stop_and_pause(producer) -> None:
@@ -49,6 +53,22 @@ async def resume_time_consumer(producer, producer_time_callback) -> None:
         producer.time_consumer = await get_time_channel(producer).new_consumer(producer_time_callback)
 
 
+def create_data_prefetcher(producer, table) -> backtesting_data_prefetcher.BacktestingDataPrefetcher:
+    """
+    Create a backtesting data prefetcher reading windows of the producer's shortest time frame ticks
+    :param producer: the simulator producer to create the prefetcher for
+    :param table: the backtesting data table to read
+    :return: the created prefetcher
+    """
+    shortest_time_frame = producer.channel.exchange_manager.exchange_config.get_shortest_time_frame()
+    return backtesting_data_prefetcher.BacktestingDataPrefetcher(
+        producer.exchange_data_importer,
+        table,
+        producer.exchange_name,
+        commons_enums.TimeFramesMinutes[shortest_time_frame] * commons_constants.MINUTE_TO_SECONDS
+    )
+
+
 def get_time_channel(producer):
     return channels.get_chan(
         backtesting_api.get_backtesting_time_channel_name(producer.channel.exchange_manager.exchange.backtesting)
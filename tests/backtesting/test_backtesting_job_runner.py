@@ -0,0 +1,138 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import json
+import time
+
+import pytest
+
+import octobot_backtesting.collectors as collectors
+import octobot_backtesting.enums as backtesting_enums
+import octobot_backtesting.importers as importers
+import octobot_commons.constants as commons_constants
+import octobot_commons.databases as databases
+import octobot_commons.enums as commons_enums
+import octobot_commons.tests.test_config as test_config
+import octobot_tentacles_manager.api as tentacles_manager_api
+import octobot_tentacles_manager.configuration as tentacles_configuration
+import octobot_tentacles_manager.constants as tentacles_manager_constants
+
+import octobot_trading.api as api
+import octobot_trading.backtesting as backtesting
+import octobot_trading.exchanges.connectors.ccxt.ccxt_client_util as ccxt_client_util
+import octobot_trading.exchanges.connectors.ccxt.ccxt_clients_cache as ccxt_clients_cache
+import octobot_trading.modes as modes
+from tests import event_loop
+
+# the backtesting channels manager refreshes evaluators channels
+pytest.importorskip("octobot_evaluators")
+
+pytestmark = pytest.mark.asyncio
+
+EXCHANGE_NAME = "binance"
+HOUR = 3600
+START = 1640995200
+CANDLES_COUNT = 200
+
+
+class GeneratedDataCollector(collectors.AbstractExchangeHistoryCollector):
+    IMPORTER = importers.ExchangeDataImporter
+
+
+class BacktestingJobTradingMode(modes.AbstractTradingMode):
+    pass
+
+
+async def _create_data_file(file_path):
+    database = databases.SQLiteDatabase(str(file_path))
+    await database.initialize()
+    try:
+        await database.insert(
+            backtesting_enums.DataTables.DESCRIPTION, timestamp=time.time(), version="1.1", exchange=EXCHANGE_NAME,
+            symbols=json.dumps(["BTC/USDT"]), time_frames=json.dumps([commons_enums.TimeFrames.ONE_HOUR.value]),
+            start_timestamp=START, end_timestamp=START + CANDLES_COUNT * HOUR
+        )
+        # BTC price is going from 100 to 299 USDT
+        candles = [[START + index * HOUR, 100 + index, 101 + index, 99 + index, 100 + index, 10]
+                   for index in range(CANDLES_COUNT)]
+        await database.insert_all(
+            backtesting_enums.ExchangeDataTables.OHLCV,
+            timestamp=[candle[commons_enums.PriceIndexes.IND_PRICE_TIME.value] for candle in candles],
+            exchange_name=EXCHANGE_NAME, cryptocurrency="BTC", symbol="BTC/USDT",
+            time_frame=commons_enums.TimeFrames.ONE_HOUR.value, candle=[json.dumps(candle) for candle in candles]
+        )
+    finally:
+        await database.stop()
+
+
+def _create_job(tmp_path, data_file, **kwargs):
+    config = test_config.load_test_config()
+    config[commons_constants.CONFIG_TIME_FRAME] = [commons_enums.TimeFrames.ONE_HOUR]
+    config[commons_constants.CONFIG_CRYPTO_CURRENCIES] = {
+        "Bitcoin": {commons_constants.CONFIG_CRYPTO_PAIRS: ["BTC/USDT"]}
+    }
+    config[commons_constants.CONFIG_TENTACLES_REQUIRED_CANDLES_COUNT] = commons_constants.DEFAULT_IGNORED_VALUE
+    tentacles_setup_config = tentacles_configuration.TentaclesSetupConfiguration(bot_installation_path=str(tmp_path))
+    tentacles_setup_config.tentacles_activation = {
+        tentacles_manager_constants.TENTACLES_TRADING_PATH: {BacktestingJobTradingMode.__name__: True}
+    }
+    return api.create_backtesting_job(
+        config, None, EXCHANGE_NAME, [str(data_file)], tentacles_setup_config=tentacles_setup_config, **kwargs
+    )
+
+
+async def _run_generated_data_backtesting_job(job):
+    # no market status and tentacles configuration files to read
+    ccxt_clients_cache.set_exchange_parsed_markets(
+        ccxt_clients_cache.get_client_key(ccxt_client_util.ccxt_exchange_class_factory(EXCHANGE_NAME)()), []
+    )
+    with tentacles_manager_api.local_tentacle_config_proxy(lambda *_: {}):
+        return await backtesting.run_backtesting_job(job)
+
+
+async def test_run_backtesting_job(tmp_path):
+    data_file = tmp_path / f"{GeneratedDataCollector.__name__}_1.data"
+    await _create_data_file(data_file)
+    job = _create_job(tmp_path, data_file, job_id="job", seed=1)
+    result = await _run_generated_data_backtesting_job(job)
+    assert api.is_successful_backtesting_job_result(result)
+    assert result.job_id == "job"
+    assert result.trades == []
+    # one value per day in BTC of the 10 BTC and 1000 USDT starting portfolio, the first candle is loaded as
+    # history: BTC is worth 101 USDT when the backtesting starts and 299 USDT when it ends
+    assert [timestamp for timestamp, _ in result.portfolio_history] == \
+        list(range(START, START + CANDLES_COUNT * HOUR, 24 * HOUR))
+    assert result.portfolio_history[0][1] == pytest.approx(10 + 1000 / 101)
+    assert result.portfolio_history[-1][1] == pytest.approx(10 + 1000 / 299)
+    assert result.profitability == pytest.approx(1000 / 299 - 1000 / 101)
+
+    # evaluators channels and run databases are released: the same job can run again
+    assert await _run_generated_data_backtesting_job(job) == result
+
+
+async def test_run_parallel_backtesting_jobs(tmp_path):
+    data_file = tmp_path / f"{GeneratedDataCollector.__name__}_1.data"
+    await _create_data_file(data_file)
+    jobs = [_create_job(tmp_path, data_file, job_id=job_id) for job_id in ("job_1", "job_2")]
+    results = {
+        result.job_id: result
+        async for result in api.run_parallel_backtesting_jobs(
+            jobs, workers_count=2, job_runner=_run_generated_data_backtesting_job
+        )
+    }
+    assert sorted(results) == ["job_1", "job_2"]
+    assert all(api.is_successful_backtesting_job_result(result) for result in results.values())
+    assert results["job_1"].profitability == results["job_2"].profitability == \
+        pytest.approx(1000 / 299 - 1000 / 101)
@@ -0,0 +1,129 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import asyncio
+import os
+import random
+
+import pytest
+
+import octobot_trading.api as api
+import octobot_trading.backtesting as backtesting
+from tests import event_loop
+
+pytestmark = pytest.mark.asyncio
+
+
+async def _random_job_runner(job):
+    await asyncio.sleep(0)
+    return backtesting.BacktestingJobResult(
+        job_id=job.job_id,
+        seed=job.seed,
+        trades=[(random.random(), "BTC/USDT", "buy", 1.0, 1.0, 1.0)],
+        profitability=random.random(),
+    )
+
+
+async def _memory_job_runner(job):
+    # allocate enough memory to go over the worker recycling memory
+    data = bytearray(10 * 1024 ** 2)
+    return await _random_job_runner(job)
+
+
+async def _failing_job_runner(job):
+    if job.job_id == "1":
+        raise RuntimeError("invalid job")
+    if job.job_id == "2":
+        # simulate a crash: the worker is exited without sending a result
+        os._exit(3)
+    return await _random_job_runner(job)
+
+
+def _create_jobs(count, **kwargs):
+    return [
+        api.create_backtesting_job({}, None, "binance", [], **kwargs)
+        for _ in range(count)
+    ]
+
+
+async def _run(jobs, **kwargs):
+    return {
+        result.job_id: result
+        async for result in api.run_parallel_backtesting_jobs(jobs, **kwargs)
+    }
+
+
+async def test_run_parallel_backtesting_jobs():
+    results = await _run(_create_jobs(6), workers_count=2, job_runner=_random_job_runner, seed=10)
+    assert sorted(results) == [str(index) for index in range(6)]
+    assert all(api.is_successful_backtesting_job_result(result) for result in results.values())
+    assert [results[str(index)].seed for index in range(6)] == list(range(10, 16))
+    assert len({result.worker_pid for result in results.values()}) <= 2
+    assert os.getpid() not in {result.worker_pid for result in results.values()}
+    assert api.get_backtesting_job_result_trades(results["0"])[0]["symbol"] == "BTC/USDT"
+    # jobs are seeded: same results whatever the worker running them
+    other_results = await _run(_create_jobs(6), workers_count=3, job_runner=_random_job_runner, seed=10)
+    assert [results[str(index)].profitability for index in range(6)] == \
+        [other_results[str(index)].profitability for index in range(6)]
+    # explicit job seed
+    random.seed(42)
+    expected_values = [random.random(), random.random()]
+    results = await _run(_create_jobs(1, seed=42, job_id="job"), job_runner=_random_job_runner)
+    assert [results["job"].trades[0][0], results["job"].profitability] == expected_values
+
+
+async def test_run_parallel_backtesting_jobs_recycled_workers():
+    runner = backtesting.ParallelBacktestingRunner(
+        _create_jobs(6), workers_count=1, job_runner=_random_job_runner, max_jobs_per_worker=2
+    )
+    results = [result async for result in runner.run()]
+    assert len(results) == 6
+    assert len({result.worker_pid for result in results}) == 3
+    assert runner.recycled_workers_count == 3
+
+    runner = backtesting.ParallelBacktestingRunner(
+        _create_jobs(3), workers_count=1, job_runner=_memory_job_runner, max_jobs_per_worker=0,
+        worker_recycling_memory=1
+    )
+    results = [result async for result in runner.run()]
+    assert len({result.worker_pid for result in results}) == 3
+    assert runner.recycled_workers_count == 3
+
+
+async def test_run_parallel_backtesting_jobs_errors():
+    results = await _run(_create_jobs(5), workers_count=2, job_runner=_failing_job_runner)
+    assert sorted(results) == [str(index) for index in range(5)]
+    assert results["1"].error == "RuntimeError: invalid job"
+    assert results["2"].error == "Backtesting worker process exited with code 3"
+    assert [api.is_successful_backtesting_job_result(results[str(index)]) for index in range(5)] == \
+        [True, False, False, True, True]
+
+
+async def test_jobs_distribution():
+    weights = [10, 1, 1, 1, 1, 5, 1]
+    runner = backtesting.ParallelBacktestingRunner(
+        [backtesting.BacktestingJob({}, None, "binance", [], job_id=str(index), weight=weight)
+         for index, weight in enumerate(weights)],
+        workers_count=2
+    )
+    runner._distribute_jobs(runner._get_prepared_jobs())
+    assert [[job.job_id for job in jobs] for jobs in runner._pending_jobs_by_worker] == \
+        [["0"], ["5", "1", "2", "3", "4", "6"]]
+    assert runner._get_next_job(0).job_id == "0"
+    # worker 0 is idle: steals from the end of worker 1 jobs
+    assert runner._get_next_job(0).job_id == "6"
+    assert runner._get_next_job(1).job_id == "5"
+    assert [runner._get_next_job(0).job_id for _ in range(4)] == ["4", "3", "2", "1"]
+    assert runner._get_next_job(1) is None
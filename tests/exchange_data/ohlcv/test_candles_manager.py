@@ -69,6 +69,43 @@ def test_replace_all_candles():
     assert candles_manager.close_candles[9] == new_candles[9][PriceIndexes.IND_PRICE_CLOSE.value]
 
 
+def test_upsert_candle():
+    candles_manager = CandlesManager()
+    candles = _gen_candles(3)
+    candles_manager.add_old_and_new_candles(candles[:2])
+    updated_candle = list(candles[1])
+    updated_candle[PriceIndexes.IND_PRICE_CLOSE.value] = 2
+    candles_manager.upsert_candle(updated_candle)
+    assert candles_manager.get_symbol_candles_count() == 2
+    assert list(candles_manager.get_symbol_close_candles()) == [candles[0][PriceIndexes.IND_PRICE_CLOSE.value], 2]
+
+    # unknown candle: added
+    candles_manager.upsert_candle(candles[2])
+    assert candles_manager.get_symbol_candles_count() == 3
+    assert candles_manager.get_symbol_close_candles()[-1] == candles[2][PriceIndexes.IND_PRICE_CLOSE.value]
+
+
+def test_candles_time_index_after_reaching_max_candles_count():
+    candles_manager = CandlesManager()
+    all_candles = _gen_candles(candles_manager.max_candles_count + 2)
+    candles_manager.add_old_and_new_candles(all_candles)
+    # overwritten candles are not in the index anymore
+    assert candles_manager._get_candle_slot(all_candles[0][PriceIndexes.IND_PRICE_TIME.value]) is None
+    assert candles_manager._get_candle_slot(all_candles[1][PriceIndexes.IND_PRICE_TIME.value]) is None
+    assert candles_manager._get_candle_slot(all_candles[-1][PriceIndexes.IND_PRICE_TIME.value]) == 1
+    assert len(candles_manager._time_slots) == candles_manager.max_candles_count
+
+    # already known candles are not added again
+    candles_manager.add_old_and_new_candles(all_candles[-10:])
+    assert candles_manager.get_symbol_time_candles(1)[-1] == all_candles[-1][PriceIndexes.IND_PRICE_TIME.value]
+    assert candles_manager._head == 2
+
+    updated_candle = list(all_candles[-2])
+    updated_candle[PriceIndexes.IND_PRICE_HIGH.value] = 3
+    candles_manager.upsert_candle(updated_candle)
+    assert list(candles_manager.get_symbol_high_candles(2)) == [3, all_candles[-1][PriceIndexes.IND_PRICE_HIGH.value]]
+
+
 def test_get_symbol_prices():
     candles_manager = CandlesManager()
     candle = _gen_candles(1)[0]
@@ -155,6 +192,42 @@ def test_reach_max_candles_count_with_custom_candles_count():
                other_candles[-1][PriceIndexes.IND_PRICE_CLOSE.value])
 
 
+def test_ring_buffer_windows():
+    candles_manager = CandlesManager(max_candles_count=CandlesManager.MAX_CANDLES_COUNT + 10)
+    max_candles_count = candles_manager.max_candles_count
+    all_candles = _gen_candles(max_candles_count + 5)
+    candles_manager.add_old_and_new_candles(all_candles[:max_candles_count])
+
+    # contiguous window: read-only view on the candles storage
+    close_candles = candles_manager.get_symbol_close_candles(10)
+    assert not close_candles.flags.writeable
+    assert np.shares_memory(close_candles, candles_manager.close_candles)
+    assert list(close_candles) == [candle[PriceIndexes.IND_PRICE_CLOSE.value]
+                                   for candle in all_candles[max_candles_count - 10:max_candles_count]]
+
+    # oldest candles are overwritten
+    candles_manager.add_old_and_new_candles(all_candles[max_candles_count:])
+    assert candles_manager.close_candles[0] == all_candles[max_candles_count][PriceIndexes.IND_PRICE_CLOSE.value]
+    # wrapping window: candles are still returned by time
+    time_candles = candles_manager.get_symbol_time_candles()
+    assert len(time_candles) == max_candles_count
+    assert list(time_candles) == [candle[PriceIndexes.IND_PRICE_TIME.value] for candle in all_candles[5:]]
+    assert list(candles_manager.get_symbol_time_candles(7)) == \
+           [candle[PriceIndexes.IND_PRICE_TIME.value] for candle in all_candles[-7:]]
+    # non-wrapping window after a wrap
+    recent_volumes = candles_manager.get_symbol_volume_candles(3)
+    assert not recent_volumes.flags.writeable
+    assert list(recent_volumes) == [candle[PriceIndexes.IND_PRICE_VOL.value] for candle in all_candles[-3:]]
+    assert candles_manager.get_candles(2) == [[float(value) for value in candle] for candle in all_candles[-2:]]
+
+    # upsert the last candle through its storage slot
+    updated_candle = list(all_candles[-1])
+    updated_candle[PriceIndexes.IND_PRICE_CLOSE.value] = 1
+    candles_manager.upsert_candle(updated_candle)
+    assert candles_manager.get_symbol_close_candles(1)[-1] == 1
+    assert len(candles_manager.get_symbol_close_candles()) == max_candles_count
+
+
 def _test_data(candles_data, expected_len, expected_last_val):
     assert len(candles_data) == expected_len
     if expected_len > 0:
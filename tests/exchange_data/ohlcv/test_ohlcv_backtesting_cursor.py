@@ -0,0 +1,116 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import json
+import mock
+import pytest
+import pytest_asyncio
+
+import octobot_backtesting.enums as backtesting_enums
+import octobot_backtesting.importers as importers
+import octobot_commons.enums as commons_enums
+
+import octobot_trading.exchange_data as exchange_data
+from tests import event_loop
+
+pytestmark = pytest.mark.asyncio
+
+EXCHANGE_NAME = "binance"
+MINUTE = 60
+HOUR = 60 * MINUTE
+SYMBOLS = ["BTC/USDT", "ETH/USDT"]
+TIME_FRAMES = [commons_enums.TimeFrames.ONE_MINUTE, commons_enums.TimeFrames.ONE_HOUR]
+
+
+def _candles(start, count, duration):
+    return [
+        [start + index * duration, 1 + index, 2 + index, 0.5 + index, 1.5 + index, 10 + index]
+        for index in range(count)
+    ]
+
+
+@pytest_asyncio.fixture
+async def importer(tmp_path):
+    file_path = tmp_path / "data.data"
+    file_path.touch()
+    importer = importers.ExchangeDataImporter({}, str(file_path))
+    importer.load_database()
+    await importer.database.initialize()
+    for symbol in SYMBOLS + ["XRP/USDT"]:
+        for time_frame in TIME_FRAMES:
+            candles = _candles(HOUR * 1000, 1000, commons_enums.TimeFramesMinutes[time_frame] * MINUTE)
+            await importer.database.insert_all(
+                backtesting_enums.ExchangeDataTables.OHLCV,
+                timestamp=[candle[commons_enums.PriceIndexes.IND_PRICE_TIME.value] for candle in candles],
+                exchange_name=EXCHANGE_NAME, cryptocurrency=symbol.split("/")[0], symbol=symbol,
+                time_frame=time_frame.value, candle=[json.dumps(candle) for candle in candles]
+            )
+    try:
+        yield importer
+    finally:
+        await importer.stop()
+
+
+async def test_get_candles(importer):
+    cursor = exchange_data.OHLCVBacktestingCursor(importer, EXCHANGE_NAME, SYMBOLS, TIME_FRAMES, block_size=50)
+    start = HOUR * 1000
+    assert await cursor.get_candles("BTC/USDT", commons_enums.TimeFrames.ONE_MINUTE, start, start) == \
+        _candles(start, 1, MINUTE)
+    assert cursor.loaded_windows_count == 1
+    # same selections as the importer chronological cache on a backtesting clock
+    last_timestamp = start - 1
+    with mock.patch.object(importer, "get_ohlcv", mock.AsyncMock(wraps=importer.get_ohlcv)) as get_ohlcv_mock:
+        for timestamp in range(start, start + 200 * MINUTE, MINUTE):
+            for symbol in SYMBOLS:
+                for time_frame, future_length in ((commons_enums.TimeFrames.ONE_MINUTE, MINUTE),
+                                                  (commons_enums.TimeFrames.ONE_HOUR, 0)):
+                    selected = await cursor.get_candles(
+                        symbol, time_frame, last_timestamp + 1, timestamp + future_length
+                    )
+                    # get_ohlcv_from_timestamps is using get_ohlcv to fill its cache
+                    expected = await importer.get_ohlcv_from_timestamps(
+                        exchange_name=EXCHANGE_NAME, symbol=symbol, time_frame=time_frame,
+                        inferior_timestamp=last_timestamp + 1, superior_timestamp=timestamp + future_length
+                    )
+                    assert selected == [ohlcv[-1] for ohlcv in expected]
+            last_timestamp = timestamp
+        # 1 query for every pair and time frame per 50 minutes (first window is already loaded)
+        # + 1 importer cache initialization per pair and time frame
+        assert get_ohlcv_mock.await_count == 3 + 4
+        assert cursor.loaded_windows_count == 4
+
+
+async def test_get_candles_after_data_end(importer):
+    cursor = exchange_data.OHLCVBacktestingCursor(importer, EXCHANGE_NAME, SYMBOLS, TIME_FRAMES, block_size=50)
+    start = HOUR * 1000
+    candles = await cursor.get_candles("BTC/USDT", commons_enums.TimeFrames.ONE_HOUR, start + 990 * HOUR,
+                                       start + 2000 * HOUR)
+    assert candles == _candles(start, 1000, HOUR)[990:]
+    assert await cursor.get_candles("BTC/USDT", commons_enums.TimeFrames.ONE_HOUR, start + 2000 * HOUR + 1,
+                                    start + 2001 * HOUR) == []
+    assert await cursor.get_candles("BTC/USDT", commons_enums.TimeFrames.FOUR_HOURS, start, start + HOUR) == []
+
+
+async def test_get_candles_of_not_registered_pair(importer):
+    cursor = exchange_data.OHLCVBacktestingCursor(importer, EXCHANGE_NAME, SYMBOLS, TIME_FRAMES, block_size=50)
+    start = HOUR * 1000
+    assert await cursor.get_candles("BTC/USDT", commons_enums.TimeFrames.ONE_MINUTE, start, start + MINUTE) == \
+        _candles(start, 2, MINUTE)
+    # already loaded window candles are also selected
+    assert await cursor.get_candles("XRP/USDT", commons_enums.TimeFrames.ONE_MINUTE, start, start + 60 * MINUTE) == \
+        _candles(start, 61, MINUTE)
+    assert cursor.loaded_windows_count == 2
+    assert await cursor.get_candles("XRP/USDT", commons_enums.TimeFrames.ONE_MINUTE, start + 61 * MINUTE,
+                                    start + 62 * MINUTE) == _candles(start, 63, MINUTE)[61:]
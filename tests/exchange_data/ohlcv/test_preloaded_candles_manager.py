@@ -0,0 +1,81 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import numpy as np
+
+import octobot_commons.constants as commons_constants
+from octobot_commons.enums import PriceIndexes
+from octobot_trading.exchange_data.ohlcv.preloaded_candles_manager import PreloadedCandlesManager
+from tests.exchange_data.ohlcv.test_candles_manager import _gen_candles
+
+
+def test_replace_all_candles_from_list():
+    candles_manager = PreloadedCandlesManager()
+    candles = _gen_candles(20)
+    candles_manager.replace_all_candles(candles)
+    assert candles_manager.get_preloaded_symbol_candles_count() == 20
+    assert list(candles_manager.get_preloaded_symbol_close_candles()) == \
+           [candle[PriceIndexes.IND_PRICE_CLOSE.value] for candle in candles]
+    assert list(candles_manager.get_preloaded_symbol_time_candles()) == \
+           [candle[PriceIndexes.IND_PRICE_TIME.value] for candle in candles]
+    assert candles_manager.get_preloaded_symbol_volume_candles().flags.c_contiguous
+
+    candles_manager.replace_all_candles([])
+    assert candles_manager.get_preloaded_symbol_candles_count() == 0
+
+
+def test_replace_all_candles_from_array():
+    candles_manager = PreloadedCandlesManager()
+    candles = np.asfortranarray(_gen_candles(20), dtype=np.float64)
+    candles_manager.replace_all_candles(candles)
+    # column-major float64 arrays are not copied
+    assert np.shares_memory(candles_manager.get_preloaded_symbol_open_candles(), candles)
+    assert list(candles_manager.get_preloaded_symbol_open_candles()) == \
+           list(candles[:, PriceIndexes.IND_PRICE_OPEN.value])
+
+    candles_manager.replace_all_candles(np.array(_gen_candles(5), dtype=np.float64))
+    assert candles_manager.get_preloaded_symbol_candles_count() == 5
+    assert candles_manager.get_preloaded_symbol_high_candles()[-1] == _gen_candles(5)[-1][PriceIndexes.IND_PRICE_HIGH.value]
+
+
+def test_add_old_and_new_candles():
+    candles_manager = PreloadedCandlesManager()
+    candles = _gen_candles(20)
+    candles_manager.replace_all_candles(candles)
+
+    candles_manager.add_old_and_new_candles(candles[:5])
+    assert candles_manager.get_symbol_candles_count() == 5
+    close_candles = candles_manager.get_symbol_close_candles()
+    assert list(close_candles) == [candle[PriceIndexes.IND_PRICE_CLOSE.value] for candle in candles[:5]]
+    assert not close_candles.flags.writeable
+
+    # next candle
+    candles_manager.add_old_and_new_candles(candles[5:6])
+    assert candles_manager.get_symbol_candles_count() == 6
+    assert list(candles_manager.get_symbol_close_candles(2)) == \
+           [candle[PriceIndexes.IND_PRICE_CLOSE.value] for candle in candles[4:6]]
+
+    # jump forward and backward
+    candles_manager.add_old_and_new_candles(candles[:15])
+    assert candles_manager.get_symbol_candles_count() == 15
+    assert candles_manager.get_symbol_time_candles(1)[-1] == candles[14][PriceIndexes.IND_PRICE_TIME.value]
+    candles_manager.add_old_and_new_candles(candles[:3])
+    assert candles_manager.get_symbol_candles_count() == 3
+    assert candles_manager._get_candle_index(candles[3]) == 4
+
+    # unknown candle
+    assert candles_manager._get_candle_index([1000, 1, 1, 1, 1, 1]) == commons_constants.DEFAULT_IGNORED_VALUE
+    candles_manager.add_old_and_new_candles([[1000, 1, 1, 1, 1, 1]])
+    assert candles_manager.get_symbol_candles_count() == 3
@@ -0,0 +1,70 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import pytest
+
+import octobot_commons.asyncio_tools as asyncio_tools
+
+import octobot_trading.constants as constants
+import octobot_trading.exchange_channel as exchanges_channel
+from tests.exchanges import simulated_exchange_manager
+from tests import event_loop
+
+pytestmark = pytest.mark.asyncio
+
+SYMBOL = "BTC/USDT"
+
+
+async def test_push_to_full_and_delta_consumers(simulated_exchange_manager):
+    channel = exchanges_channel.get_chan(constants.ORDER_BOOK_CHANNEL, simulated_exchange_manager.id)
+    full_updates = []
+    delta_updates = []
+
+    async def full_callback(**kwargs):
+        full_updates.append(kwargs)
+
+    async def delta_callback(**kwargs):
+        delta_updates.append(kwargs)
+
+    await channel.new_consumer(full_callback, symbol=SYMBOL)
+    await channel.new_consumer(delta_callback, symbol=SYMBOL, delta=True)
+    producer = channel.get_internal_producer()
+
+    await producer.push(SYMBOL, [[101, 1], [102, 2]], [[99, 1], [98, 2]])
+    await asyncio_tools.wait_asyncio_next_cycle()
+    assert len(full_updates) == 1
+    assert full_updates[0]["asks"] == [[101, 1], [102, 2]]
+    assert "sequence" not in full_updates[0]
+    assert delta_updates == [{
+        "exchange": simulated_exchange_manager.exchange_name,
+        "exchange_id": simulated_exchange_manager.id,
+        "cryptocurrency": "BTC",
+        "symbol": SYMBOL,
+        "asks": [[101, 1], [102, 2]],
+        "bids": [[99, 1], [98, 2]],
+        "sequence": 1,
+    }]
+
+    await producer.push(SYMBOL, [[101, 1], [102, 3]], [[98, 2], [97, 1]])
+    await asyncio_tools.wait_asyncio_next_cycle()
+    assert len(full_updates) == 2
+    assert full_updates[1]["bids"] == [[98, 2], [97, 1]]
+    assert len(delta_updates) == 2
+    assert delta_updates[1]["asks"] == [[102, 3]]
+    assert delta_updates[1]["bids"] == [[99, 0], [97, 1]]
+    assert delta_updates[1]["sequence"] == 2
+    order_book_manager = simulated_exchange_manager.get_symbol_data(SYMBOL).order_book_manager
+    assert order_book_manager.get_ask() == (101, 1)
+    assert order_book_manager.get_bid() == (98, 2)
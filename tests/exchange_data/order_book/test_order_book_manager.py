@@ -21,6 +21,7 @@ import pytest_asyncio
 from octobot_trading.exchange_data.order_book.order_book_manager import OrderBookManager
 from octobot_trading.enums import ExchangeConstantsOrderBookInfoColumns as ECOBIC
 from octobot_trading.enums import TradeOrderSide
+import octobot_trading.errors as errors
 from tests.test_utils.random_numbers import random_price_list, random_price, random_quantity, random_order_book_side
 from tests.test_utils.random_numbers import random_timestamp
 from tests import event_loop
@@ -30,6 +31,13 @@ pytestmark = pytest.mark.asyncio
 
 @pytest_asyncio.fixture()
 async def order_book_manager():
+    ob_manager = OrderBookManager(l3=True)
+    await ob_manager.initialize()
+    return ob_manager
+
+
+@pytest_asyncio.fixture()
+async def l2_order_book_manager():
     ob_manager = OrderBookManager()
     await ob_manager.initialize()
     return ob_manager
@@ -197,6 +205,97 @@ async def test_handle_book_updates(order_book_manager):
     assert get_order_at_id_in_order_list("6", order_book_manager.asks)[ECOBIC.SIZE.value] == order_6_2[ECOBIC.SIZE.value]
 
 
+async def test_l2_handle_new_books(l2_order_book_manager):
+    ts = random_timestamp()
+    l2_order_book_manager.handle_new_books(
+        [[101, 1], [103, 3], [102, 2]],
+        [[99, 1, 10], [97, 3, 10], [98, 2, 10]],
+        timestamp=ts
+    )
+    assert l2_order_book_manager.order_book_initialized
+    assert l2_order_book_manager.timestamp == ts
+    assert l2_order_book_manager.get_ask() == (101, 1)
+    assert l2_order_book_manager.get_bid() == (99, 1)
+    assert l2_order_book_manager.get_asks(102) == 2
+    assert l2_order_book_manager.get_bids(98) == 2
+    assert l2_order_book_manager.get_bids(100) is None
+    assert l2_order_book_manager.asks.get_levels() == [[101, 1], [102, 2], [103, 3]]
+    assert l2_order_book_manager.bids.get_levels() == [[99, 1], [98, 2], [97, 3]]
+
+    # new snapshot replaces previous levels
+    l2_order_book_manager.handle_new_books([[110, 1]], [])
+    assert l2_order_book_manager.asks.get_levels() == [[110, 1]]
+    assert l2_order_book_manager.get_bid() is None
+    assert l2_order_book_manager.get_spread() is None
+
+
+async def test_l2_handle_book_deltas(l2_order_book_manager):
+    l2_order_book_manager.handle_new_books([[101, 1], [102, 2], [103, 3]], [[99, 1], [98, 2], [97, 3]])
+    ts = random_timestamp()
+    l2_order_book_manager.handle_book_deltas(
+        # update, remove and add levels
+        [[102, 5], [101, 0], [104, 4], [100.5, 0.5]],
+        [[99, 0], [98.5, 1], [97, 1]],
+        timestamp=ts
+    )
+    assert l2_order_book_manager.timestamp == ts
+    assert l2_order_book_manager.asks.get_levels() == [[100.5, 0.5], [102, 5], [103, 3], [104, 4]]
+    assert l2_order_book_manager.bids.get_levels() == [[98.5, 1], [98, 2], [97, 1]]
+    # removing unknown levels is ignored
+    l2_order_book_manager.handle_book_deltas([[200, 0]], [])
+    assert len(l2_order_book_manager.asks) == 4
+
+    # L3 operations are not available
+    l2_order_book_manager.handle_book_adds([get_test_order(TradeOrderSide.BUY.value, "1")])
+    assert len(l2_order_book_manager.bids) == 3
+
+
+async def test_l2_update_books(l2_order_book_manager):
+    assert l2_order_book_manager.sequence == 0
+    assert l2_order_book_manager.update_books([[101, 1], [102, 2]], [[99, 1]]) == \
+           ([[101, 1], [102, 2]], [[99, 1]])
+    assert l2_order_book_manager.order_book_initialized
+    assert l2_order_book_manager.sequence == 1
+    ts = random_timestamp()
+    assert l2_order_book_manager.update_books([[101, 1], [103, 2]], [[99, 1]], timestamp=ts) == \
+           ([[102, 0], [103, 2]], [])
+    assert l2_order_book_manager.sequence == 2
+    assert l2_order_book_manager.timestamp == ts
+    assert l2_order_book_manager.asks.get_levels() == [[101, 1], [103, 2]]
+
+
+async def test_l2_depth_queries(l2_order_book_manager):
+    l2_order_book_manager.handle_new_books([[101, 1], [102, 2], [103, 3]], [[99, 4], [98, 2], [97, 3]])
+    assert l2_order_book_manager.get_spread() == 2
+    assert l2_order_book_manager.get_mid_price() == 100
+    assert l2_order_book_manager.get_depth_to_price(TradeOrderSide.SELL, 102) == 3
+    assert l2_order_book_manager.get_depth_to_price(TradeOrderSide.SELL, 100) == 0
+    assert l2_order_book_manager.get_depth_to_price(TradeOrderSide.BUY, 97.5) == 6
+    assert l2_order_book_manager.get_vwap(TradeOrderSide.SELL, 1) == 101
+    assert l2_order_book_manager.get_vwap(TradeOrderSide.SELL, 2) == 101.5
+    assert l2_order_book_manager.get_vwap(TradeOrderSide.SELL, 6) == (101 + 2 * 102 + 3 * 103) / 6
+    assert l2_order_book_manager.get_vwap(TradeOrderSide.SELL, 7) is None
+    assert l2_order_book_manager.get_vwap(TradeOrderSide.BUY, 5) == (4 * 99 + 98) / 5
+    assert l2_order_book_manager.get_imbalance() == (9 - 6) / 15
+    assert l2_order_book_manager.get_imbalance(1) == (4 - 1) / 5
+
+
+async def test_l3_depth_queries(order_book_manager):
+    assert order_book_manager.get_spread() is None
+    assert order_book_manager.get_mid_price() is None
+    order_book_manager.handle_new_books([[101, 1], [102, 2]], [[99, 4], [98, 2]])
+    assert order_book_manager.get_spread() == 2
+    assert order_book_manager.get_mid_price() == 100
+    with pytest.raises(errors.NotSupported):
+        order_book_manager.get_vwap(TradeOrderSide.SELL, 1)
+    with pytest.raises(errors.NotSupported):
+        order_book_manager.get_depth_to_price(TradeOrderSide.BUY, 98)
+    with pytest.raises(errors.NotSupported):
+        order_book_manager.get_imbalance()
+    order_book_manager.handle_book_deltas([[105, 1]], [])
+    assert order_book_manager.get_asks(105) is None
+
+
 def get_test_order(order_side, order_id, order_price=None, order_size=None):
     return {
         ECOBIC.SIDE.value: order_side,
@@ -0,0 +1,75 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+from octobot_trading.exchange_data.order_book.price_levels import PriceLevels
+
+
+def test_set_levels():
+    asks = PriceLevels(False, 0.01)
+    asks.set_levels([1.02, 1.01, 1.03, 1.01, 1.04], [2, 1, 3, 5, 0])
+    # last size of duplicated levels is kept, empty levels are ignored
+    assert asks.get_levels() == [[1.01, 5], [1.02, 2], [1.03, 3]]
+    assert asks.get_levels(2) == [[1.01, 5], [1.02, 2]]
+    asks.set_levels([], [])
+    assert len(asks) == 0
+    assert asks.get_best() is None
+    assert asks.get_vwap(1) is None
+
+    bids = PriceLevels(True, 0.01)
+    bids.set_levels([1.02, 1.01, 1.03], [2, 1, 3])
+    assert bids.get_levels() == [[1.03, 3], [1.02, 2], [1.01, 1]]
+
+
+def test_set_level():
+    bids = PriceLevels(True, 0.01)
+    bids.set_level(1.02, 2)
+    bids.set_level(1.04, 4)
+    bids.set_level(1.03, 3)
+    assert bids.get_levels() == [[1.04, 4], [1.03, 3], [1.02, 2]]
+    # price is rounded to the price tick
+    bids.set_level(1.0300000001, 1)
+    assert bids.get_levels() == [[1.04, 4], [1.03, 1], [1.02, 2]]
+    assert bids.get_size(1.03) == 1
+    bids.set_level(1.04, 0)
+    bids.set_level(1.05, 0)
+    assert bids.get_levels() == [[1.03, 1], [1.02, 2]]
+    assert bids.get_best() == (1.03, 1)
+
+
+def test_apply_deltas():
+    asks = PriceLevels(False, 0.5)
+    asks.set_levels([10, 11, 12], [1, 1, 1])
+    asks.apply_deltas([11, 9.5, 11, 13, 12, 14], [3, 1, 2, 1, 0, 0])
+    assert asks.get_levels() == [[9.5, 1], [10, 1], [11, 2], [13, 1]]
+    assert asks.get_depth(11) == 4
+    assert asks.get_depth(12.5) == 4
+    assert asks.get_volume() == 5
+    assert asks.get_vwap(2) == 9.75
+
+
+def test_update_levels():
+    bids = PriceLevels(True, 0.5)
+    delta_prices, delta_sizes = bids.update_levels([10, 11, 12], [1, 1, 1])
+    assert list(delta_prices) == [12, 11, 10]
+    assert list(delta_sizes) == [1, 1, 1]
+    delta_prices, delta_sizes = bids.update_levels([9.5, 11, 12, 10], [1, 2, 1, 0])
+    # 9.5 added, 11 changed, 10 removed
+    assert list(delta_prices) == [11, 10, 9.5]
+    assert list(delta_sizes) == [2, 0, 1]
+    assert bids.get_levels() == [[12, 1], [11, 2], [9.5, 1]]
+    delta_prices, delta_sizes = bids.update_levels([], [])
+    assert list(delta_prices) == [12, 11, 9.5]
+    assert list(delta_sizes) == [0, 0, 0]
+    assert len(bids) == 0
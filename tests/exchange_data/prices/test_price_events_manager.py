@@ -20,6 +20,7 @@ from asyncio import Event
 from mock import patch, Mock
 
 import octobot_trading.constants as trading_constants
+from octobot_trading.enums import ExchangeConstantsOrderColumns as ECOC
 
 from tests.exchange_data import price_events_manager
 from tests import event_loop
@@ -31,7 +32,7 @@ pytestmark = pytest.mark.asyncio
 
 async def test_reset(price_events_manager):
     if not os.getenv('CYTHON_IGNORE'):
-        price_events_manager.events.append(None)
+        price_events_manager.new_event(decimal_random_price(), random_timestamp(), True)
         assert price_events_manager.events
         price_events_manager.reset()
         assert not price_events_manager.events
@@ -171,3 +172,110 @@ async def test_remove_event(price_events_manager):
         price_events_manager.remove_event(event_2)
         assert event_2 not in price_events_manager.events
         assert len(price_events_manager.events) == 0
+
+
+async def test_handle_price_pops_triggered_events_only(price_events_manager):
+    above_events = [
+        price_events_manager.new_event(decimal.Decimal(str(price)), 10, True)
+        for price in (12, 10, 11, 13)
+    ]
+    below_events = [
+        price_events_manager.new_event(decimal.Decimal(str(price)), 10, False)
+        for price in (8, 7, 9, 6)
+    ]
+    # waiting for a later timestamp
+    late_above_event = price_events_manager.new_event(decimal.Decimal("10"), 20, True)
+    late_below_event = price_events_manager.new_event(decimal.Decimal("9"), 20, False)
+
+    price_events_manager.handle_price(decimal.Decimal("11"), 15)
+    assert [event.is_set() for event in above_events] == [False, True, True, False]
+    assert not late_above_event.is_set()
+    assert not any(event.is_set() for event in below_events)
+    if not os.getenv('CYTHON_IGNORE'):
+        assert len(price_events_manager.events) == 8
+
+    price_events_manager.handle_price(decimal.Decimal("7"), 15)
+    assert [event.is_set() for event in below_events] == [True, True, True, False]
+    assert not late_below_event.is_set()
+
+    price_events_manager.handle_price(decimal.Decimal("10"), 20)
+    assert late_above_event.is_set()
+    price_events_manager.handle_price(decimal.Decimal("9"), 20)
+    assert late_below_event.is_set()
+    if not os.getenv('CYTHON_IGNORE'):
+        assert len(price_events_manager.events) == 3
+
+    # remaining events can still be removed
+    price_events_manager.remove_event(above_events[0])
+    price_events_manager.remove_event(above_events[3])
+    price_events_manager.remove_event(below_events[3])
+    price_events_manager.handle_price(decimal.Decimal("20"), 30)
+    price_events_manager.handle_price(decimal.Decimal("1"), 30)
+    assert not above_events[0].is_set()
+    assert not above_events[3].is_set()
+    assert not below_events[3].is_set()
+    if not os.getenv('CYTHON_IGNORE'):
+        assert not price_events_manager.events
+
+
+async def test_handle_price_sets_events_with_same_price(price_events_manager):
+    events = [price_events_manager.new_event(decimal.Decimal("10"), 1, True) for _ in range(3)]
+    price_events_manager.remove_event(events[1])
+    price_events_manager.handle_price(decimal.Decimal("10"), 1)
+    assert [event.is_set() for event in events] == [True, False, True]
+
+
+async def test_handle_recent_trades_sets_events_by_first_trigger_time(price_events_manager):
+    set_events = []
+    events = {
+        name: price_events_manager.new_event(decimal.Decimal(price), timestamp, trigger_above)
+        for name, price, timestamp, trigger_above in (
+            ("sell_12", "12", 1, True),
+            ("sell_11", "11", 1, True),
+            ("late_sell_11", "11", 4, True),
+            ("sell_15", "15", 1, True),
+            ("buy_9", "9", 1, False),
+            ("late_buy_9", "9", 4, False),
+            ("buy_5", "5", 1, False),
+        )
+    }
+    for name, event in events.items():
+        event.set = lambda event_name=name: set_events.append(event_name)
+    price_events_manager.handle_recent_trades([
+        {ECOC.PRICE.value: price, ECOC.TIMESTAMP.value: timestamp}
+        for price, timestamp in ((10, 1), (12.5, 2), (8.5, 3), (11.2, 4), (8.9, 5))
+    ])
+    assert set_events == ["sell_11", "sell_12", "buy_9", "late_sell_11", "late_buy_9"]
+    if not os.getenv('CYTHON_IGNORE'):
+        assert len(price_events_manager.events) == 2
+    assert price_events_manager.get_min_and_max_prices() == (decimal.Decimal("8.5"), decimal.Decimal("12.5"))
+
+
+async def test_recent_prices_window(price_events_manager):
+    with pytest.raises(IndexError):
+        price_events_manager.get_min_and_max_prices()
+    price_events_manager.handle_price(decimal.Decimal("10"), 1)
+    with pytest.raises(IndexError):
+        price_events_manager.get_min_and_max_prices()
+    max_prices = price_events_manager.MAX_LAST_RECENT_PRICES
+    for index in range(max_prices):
+        price_events_manager.handle_price(decimal.Decimal(str(100 + index)), 2 + index)
+    # 10 is out of the recent prices window
+    assert price_events_manager.get_min_and_max_prices() == (
+        decimal.Decimal("100"), decimal.Decimal(str(100 + max_prices - 1))
+    )
+    assert not price_events_manager.new_event(decimal.Decimal("50"), 0, False).is_set()
+    assert price_events_manager.new_event(decimal.Decimal("100"), 0, False).is_set()
+    assert price_events_manager.new_event(decimal.Decimal("120"), 0, True).is_set()
+    assert price_events_manager.new_event(decimal.Decimal("110"), 2 + 10, False).is_set()
+    # 110 is too old
+    assert not price_events_manager.new_event(decimal.Decimal("110"), 2 + 11, False).is_set()
+
+    # recent trades reset recent prices
+    price_events_manager.handle_recent_trades([
+        {ECOC.PRICE.value: price, ECOC.TIMESTAMP.value: 1}
+        for price in range(max_prices * 2)
+    ])
+    assert price_events_manager.get_min_and_max_prices() == (
+        decimal.Decimal(str(max_prices)), decimal.Decimal(str(max_prices * 2 - 1))
+    )
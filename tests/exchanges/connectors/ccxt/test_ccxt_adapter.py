@@ -0,0 +1,81 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import copy
+import mock
+import pytest
+
+import octobot_commons.enums as commons_enums
+import octobot_trading.enums as enums
+import octobot_trading.exchanges.connectors.ccxt.ccxt_adapter as ccxt_adapter
+
+
+@pytest.fixture
+def adapter():
+    return ccxt_adapter.CCXTAdapter(mock.Mock(exchange_manager=mock.Mock(is_future=False)))
+
+
+def test_adapt_ticker_does_not_edit_raw(adapter):
+    raw = {
+        enums.ExchangeConstantsTickersColumns.SYMBOL.value: "BTC/USDT",
+        enums.ExchangeConstantsTickersColumns.TIMESTAMP.value: 1648462965123,
+        enums.ExchangeConstantsTickersColumns.CLOSE.value: 40000.5,
+        "info": {"c": "40000.5"},
+    }
+    origin = copy.deepcopy(raw)
+    adapted = adapter.adapt_ticker(raw)
+    assert adapted[enums.ExchangeConstantsTickersColumns.TIMESTAMP.value] == 1648462965
+    assert raw == origin
+
+
+def test_adapt_ohlcv_and_kline_do_not_edit_raw(adapter):
+    raw = [[1648462965123, "1", "2", "0.5", "1.5", "100"], [1648463025000, 1.5, 2, 1, 1.8, 50]]
+    origin = copy.deepcopy(raw)
+    assert adapter.adapt_ohlcv(raw, time_frame=commons_enums.TimeFrames.ONE_MINUTE.value) == [
+        [1648462920, 1, 2, 0.5, 1.5, 100], [1648462980, 1.5, 2, 1, 1.8, 50]
+    ]
+    assert raw == origin
+    assert adapter.adapt_kline(raw) == [
+        [1648462965, 1, 2, 0.5, 1.5, 100], [1648463025, 1.5, 2, 1, 1.8, 50]
+    ]
+    assert raw == origin
+
+
+def test_adapt_order_book_does_not_edit_raw(adapter):
+    raw = {
+        enums.ExchangeConstantsOrderBookInfoColumns.TIMESTAMP.value: 1648462965123,
+        enums.ExchangeConstantsOrderBookInfoColumns.ASKS.value: [[101, 1]],
+        enums.ExchangeConstantsOrderBookInfoColumns.BIDS.value: [[99, 2]],
+    }
+    origin = copy.deepcopy(raw)
+    adapted = adapter.adapt_order_book(raw)
+    assert adapted[enums.ExchangeConstantsOrderBookInfoColumns.TIMESTAMP.value] == 1648462965.123
+    assert adapted[enums.ExchangeConstantsOrderBookInfoColumns.ASKS.value] == [[101, 1]]
+    assert raw == origin
+
+
+def test_adapt_public_recent_trades_does_not_edit_raw(adapter):
+    raw = [{
+        enums.ExchangeConstantsOrderColumns.TIMESTAMP.value: 1648462965123,
+        enums.ExchangeConstantsOrderColumns.PRICE.value: 100,
+        enums.ExchangeConstantsOrderColumns.INFO.value: {"p": "100"},
+        enums.ExchangeConstantsOrderColumns.ID.value: "1",
+    }]
+    origin = copy.deepcopy(raw)
+    assert adapter.adapt_public_recent_trades(raw) == [{
+        enums.ExchangeConstantsOrderColumns.TIMESTAMP.value: 1648462965.123,
+        enums.ExchangeConstantsOrderColumns.PRICE.value: 100,
+    }]
+    assert raw == origin
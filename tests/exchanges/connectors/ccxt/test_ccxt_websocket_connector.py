@@ -0,0 +1,173 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import mock
+import pytest
+
+import octobot_commons.enums as commons_enums
+import octobot_commons.logging as logging
+import octobot_trading.enums as enums
+import octobot_trading.exchanges.connectors.ccxt.ccxt_websocket_connector as ccxt_websocket_connector
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+SYMBOLS = ["BTC/USDT", "ETH/USDT", "SOL/USDT", "ADA/USDT", "XRP/USDT"]
+
+
+class _Client:
+    def __init__(self, has):
+        self.has = has
+
+    async def watchTrades(self, symbol, **kwargs):
+        return []
+
+    async def watchTradesForSymbols(self, symbols, **kwargs):
+        return []
+
+    async def watchOHLCV(self, symbol, **kwargs):
+        return []
+
+    async def watchOHLCVForSymbols(self, symbols_and_time_frames, **kwargs):
+        return {}
+
+
+@pytest.fixture
+def connector():
+    # only the attributes used by subscriptions
+    connector = object.__new__(ccxt_websocket_connector.CCXTWebsocketConnector)
+    connector.logger = logging.get_logger("test_ccxt_websocket_connector")
+    connector.client = _Client({"watchTradesForSymbols": True, "watchOHLCVForSymbols": True})
+    connector.feed_tasks = {}
+    connector.min_timeframe = commons_enums.TimeFrames.ONE_MINUTE
+    connector._start_time_millis = 1648462965123
+    connector.recent_trades = mock.AsyncMock()
+    connector.candle = mock.AsyncMock()
+    return connector
+
+
+async def _subscribe(connector, feed, symbols, symbols_by_feed, time_frame=None):
+    with mock.patch.object(connector, "SYMBOLS_BY_MULTIPLEXED_FEED", symbols_by_feed), \
+            mock.patch.object(connector, "_feed_task", mock.Mock(return_value=None)) as _feed_task_mock, \
+            mock.patch("asyncio.create_task", mock.Mock(side_effect=lambda _: mock.Mock())):
+        connector._subscribe_feed(feed, symbols=symbols, time_frame=time_frame)
+        return _feed_task_mock
+
+
+async def test_subscribe_feed_multiplexed_symbols(connector):
+    _feed_task_mock = await _subscribe(connector, enums.WebsocketFeeds.TRADES, SYMBOLS[:3], 2)
+    assert [call.args[2] for call in _feed_task_mock.mock_calls] == [connector.client.watchTradesForSymbols] * 2
+    assert [call.kwargs["symbols"] for call in _feed_task_mock.mock_calls] == [SYMBOLS[:2], SYMBOLS[2:3]]
+    # feeds are registered by symbol
+    assert len(connector.feed_tasks) == 3
+    assert len(set(connector.feed_tasks.values())) == 2
+
+    # only new symbols are subscribed
+    _feed_task_mock = await _subscribe(connector, enums.WebsocketFeeds.TRADES, SYMBOLS, 2)
+    assert [call.kwargs["symbols"] for call in _feed_task_mock.mock_calls] == [SYMBOLS[3:]]
+    assert len(connector.feed_tasks) == 5
+    _feed_task_mock = await _subscribe(connector, enums.WebsocketFeeds.TRADES, SYMBOLS, 2)
+    _feed_task_mock.assert_not_called()
+
+
+async def test_subscribe_feed_without_multiplexed_symbols(connector):
+    # disabled
+    _feed_task_mock = await _subscribe(connector, enums.WebsocketFeeds.TRADES, SYMBOLS, 0)
+    assert [call.kwargs["symbol"] for call in _feed_task_mock.mock_calls] == SYMBOLS
+    assert [call.args[2] for call in _feed_task_mock.mock_calls] == [connector.client.watchTrades] * len(SYMBOLS)
+
+    # unsupported by client
+    connector.feed_tasks = {}
+    connector.client.has["watchTradesForSymbols"] = False
+    _feed_task_mock = await _subscribe(connector, enums.WebsocketFeeds.TRADES, SYMBOLS, 2)
+    assert [call.kwargs["symbol"] for call in _feed_task_mock.mock_calls] == SYMBOLS
+
+
+async def test_multiplexed_feed_watch_and_dispatch(connector):
+    connector.client.watchOHLCVForSymbols = mock.AsyncMock(return_value={
+        "BTC/USDT": {"1m": [[1, 2, 3, 4, 5, 6]]},
+        "ETH/USDT": {"1m": [[1, 2, 3, 4, 5, 7]]},
+    })
+    update = await connector._watch_multiplexed_feed(
+        enums.WebsocketFeeds.CANDLE, connector.client.watchOHLCVForSymbols,
+        symbols=SYMBOLS[:2], timeframe="1m", since=12
+    )
+    connector.client.watchOHLCVForSymbols.assert_awaited_once_with([["BTC/USDT", "1m"], ["ETH/USDT", "1m"]], since=12)
+    await connector._dispatch_multiplexed_update(
+        enums.WebsocketFeeds.CANDLE, connector.candle, update, symbols=SYMBOLS[:2], timeframe="1m", since=12
+    )
+    assert connector.candle.mock_calls == [
+        mock.call([[1, 2, 3, 4, 5, 6]], symbol="BTC/USDT", timeframe="1m", since=12),
+        mock.call([[1, 2, 3, 4, 5, 7]], symbol="ETH/USDT", timeframe="1m", since=12),
+    ]
+
+    btc_trade = {"symbol": "BTC/USDT", "id": "1"}
+    eth_trade = {"symbol": "ETH/USDT", "id": "2"}
+    sol_trade = {"symbol": "SOL/USDT", "id": "3"}
+    await connector._dispatch_multiplexed_update(
+        enums.WebsocketFeeds.TRADES, connector.recent_trades, [btc_trade, eth_trade, btc_trade, sol_trade],
+        symbols=SYMBOLS[:2]
+    )
+    # SOL/USDT is not in feed symbols
+    assert connector.recent_trades.mock_calls == [
+        mock.call([btc_trade, btc_trade], symbol="BTC/USDT", timeframe=None),
+        mock.call([eth_trade], symbol="ETH/USDT", timeframe=None),
+    ]
+
+    ticker_callback = mock.AsyncMock()
+    await connector._dispatch_multiplexed_update(
+        enums.WebsocketFeeds.TICKER, ticker_callback, {"ETH/USDT": {"close": 1}}, symbols=SYMBOLS[:2]
+    )
+    ticker_callback.assert_awaited_once_with({"close": 1}, symbol="ETH/USDT", timeframe=None)
+
+    book_callback = mock.AsyncMock()
+    book = {"symbol": "BTC/USDT", "asks": [[1, 1]], "bids": [[0.5, 1]]}
+    await connector._dispatch_multiplexed_update(
+        enums.WebsocketFeeds.L2_BOOK, book_callback, book, symbols=SYMBOLS[:2]
+    )
+    book_callback.assert_awaited_once_with(book, symbol="BTC/USDT", timeframe=None)
+
+
+async def test_get_feeds_count():
+    with mock.patch.object(ccxt_websocket_connector.CCXTWebsocketConnector, "EXCHANGE_FEEDS",
+                           {enums.WebsocketFeeds.CANDLE: True}):
+        time_frames = [commons_enums.TimeFrames.ONE_MINUTE, commons_enums.TimeFrames.ONE_HOUR]
+        assert ccxt_websocket_connector.CCXTWebsocketConnector.get_feeds_count(SYMBOLS, time_frames) == 5 + 5 * 2
+        with mock.patch.object(ccxt_websocket_connector.CCXTWebsocketConnector, "SYMBOLS_BY_MULTIPLEXED_FEED", 2):
+            assert ccxt_websocket_connector.CCXTWebsocketConnector.get_feeds_count(SYMBOLS, time_frames) == 3 + 3 * 2
+
+
+async def test_multiplexed_feed_task(connector):
+    trades = [{"symbol": "BTC/USDT", "id": "1"}, {"symbol": "ETH/USDT", "id": "2"}]
+
+    async def _watch_trades_for_symbols(symbols, **kwargs):
+        connector.should_stop = True
+        return trades
+
+    connector.client.watchTradesForSymbols = mock.AsyncMock(side_effect=_watch_trades_for_symbols)
+    connector.should_stop = False
+    connector.throttled_ws_updates = 0.1
+    with mock.patch("asyncio.sleep", mock.AsyncMock()) as sleep_mock:
+        await connector._feed_task(
+            enums.WebsocketFeeds.TRADES, connector.recent_trades, connector.client.watchTradesForSymbols,
+            symbols=SYMBOLS[:2], since=12
+        )
+        # same updates rate by symbol
+        sleep_mock.assert_awaited_once_with(0.05)
+    connector.client.watchTradesForSymbols.assert_awaited_once_with(SYMBOLS[:2], since=12)
+    assert connector.recent_trades.mock_calls == [
+        mock.call([trades[0]], symbol="BTC/USDT", timeframe=None, since=12),
+        mock.call([trades[1]], symbol="ETH/USDT", timeframe=None, since=12),
+    ]
@@ -19,7 +19,8 @@ import mock
 import pytest
 import octobot_trading.constants as constants
 import octobot_commons.constants as commons_constants
-from octobot_trading.enums import FeePropertyColumns, ExchangeConstantsMarketPropertyColumns, TraderOrderType
+from octobot_trading.enums import FeePropertyColumns, ExchangeConstantsMarketPropertyColumns, TraderOrderType, \
+    ExchangeConstantsMarketStatusColumns
 from octobot_trading.api.exchange import cancel_ccxt_throttle_task
 import octobot_trading.exchanges.util as exchange_util
 
@@ -158,3 +159,96 @@ async def test_init_exchange_tentacle(backtesting_trader):
             init_adapter
         )
         get_rest_exchange_class_mock.assert_called_once()
+
+
+async def test_get_market_status_cache(backtesting_trader):
+    _, exchange_manager, trader_inst = backtesting_trader
+    exchange = exchange_manager.exchange
+    market_status = exchange.get_market_status(DEFAULT_BACKTESTING_SYMBOL, with_fixer=False)
+    assert exchange.get_market_status(DEFAULT_BACKTESTING_SYMBOL, with_fixer=False) is market_status
+    assert exchange.get_market_status(DEFAULT_BACKTESTING_SYMBOL) is not market_status
+    # market statuses can't be corrupted
+    with pytest.raises(TypeError):
+        market_status[ExchangeConstantsMarketStatusColumns.LIMITS.value] = {}
+    with pytest.raises(TypeError):
+        market_status[ExchangeConstantsMarketStatusColumns.PRECISION.value].pop(
+            ExchangeConstantsMarketStatusColumns.PRECISION_PRICE.value
+        )
+    # fixing a cached market status creates a new one
+    fixed_market_status = exchange_util.ExchangeMarketStatusFixer(market_status, 100).market_status
+    fixed_market_status[ExchangeConstantsMarketStatusColumns.LIMITS.value] = {}
+    assert market_status[ExchangeConstantsMarketStatusColumns.LIMITS.value]
+    # price examples are specific to each call
+    assert exchange.get_market_status(DEFAULT_BACKTESTING_SYMBOL, price_example=100, with_fixer=False) \
+           is not exchange.get_market_status(DEFAULT_BACKTESTING_SYMBOL, price_example=100, with_fixer=False)
+
+
+async def test_get_fixed_market_status_cache(backtesting_trader):
+    _, exchange_manager, trader_inst = backtesting_trader
+    exchange = exchange_manager.exchange
+    precision = ExchangeConstantsMarketStatusColumns.PRECISION.value
+    precision_amount = ExchangeConstantsMarketStatusColumns.PRECISION_AMOUNT.value
+
+    def _get_market_statuses(amount_precision):
+        return {
+            DEFAULT_BACKTESTING_SYMBOL: {
+                precision: {precision_amount: amount_precision, ExchangeConstantsMarketStatusColumns.PRECISION_PRICE.value: 2},
+                ExchangeConstantsMarketStatusColumns.LIMITS.value: {
+                    ExchangeConstantsMarketStatusColumns.LIMITS_AMOUNT.value: {
+                        ExchangeConstantsMarketStatusColumns.LIMITS_AMOUNT_MIN.value: 1,
+                        ExchangeConstantsMarketStatusColumns.LIMITS_AMOUNT_MAX.value: None,
+                    },
+                },
+            }
+        }
+
+    exchange.connector._forced_market_statuses = _get_market_statuses(4)
+    with mock.patch.object(exchange.connector.adapter, "adapt_market_status",
+                           mock.Mock(side_effect=lambda market_status, **_: market_status)) as adapt_market_status_mock:
+        market_status = exchange.get_fixed_market_status(DEFAULT_BACKTESTING_SYMBOL, with_fixer=False)
+        assert market_status[precision][precision_amount] == 4
+        assert exchange.get_fixed_market_status(DEFAULT_BACKTESTING_SYMBOL, with_fixer=False) is market_status
+        adapt_market_status_mock.assert_called_once()
+        # other options
+        assert exchange.get_fixed_market_status(DEFAULT_BACKTESTING_SYMBOL, with_fixer=False,
+                                                remove_price_limits=True) is not market_status
+        assert adapt_market_status_mock.call_count == 2
+
+        # reloaded markets
+        exchange.connector._forced_market_statuses = _get_market_statuses(6)
+        reloaded_market_status = exchange.get_fixed_market_status(DEFAULT_BACKTESTING_SYMBOL, with_fixer=False)
+        assert reloaded_market_status[precision][precision_amount] == 6
+        assert exchange.get_fixed_market_status(DEFAULT_BACKTESTING_SYMBOL, with_fixer=False) \
+               is reloaded_market_status
+        exchange.clear_market_statuses_cache()
+        assert exchange.get_fixed_market_status(DEFAULT_BACKTESTING_SYMBOL, with_fixer=False) \
+               is not reloaded_market_status
+
+        # contract size change
+        exchange_manager.is_future = True
+        adapt_market_status_mock.reset_mock()
+        with mock.patch.object(exchange, "get_contract_size", mock.Mock(return_value=decimal.Decimal("0.1"))):
+            contract_market_status = exchange.get_fixed_market_status(
+                DEFAULT_BACKTESTING_SYMBOL, with_fixer=False, adapt_for_contract_size=True
+            )
+            assert exchange.get_fixed_market_status(
+                DEFAULT_BACKTESTING_SYMBOL, with_fixer=False, adapt_for_contract_size=True
+            ) is contract_market_status
+        with mock.patch.object(exchange, "get_contract_size", mock.Mock(return_value=decimal.Decimal("0.01"))):
+            assert exchange.get_fixed_market_status(
+                DEFAULT_BACKTESTING_SYMBOL, with_fixer=False, adapt_for_contract_size=True
+            )[precision][precision_amount] == 2
+        assert adapt_market_status_mock.call_count == 2
+
+
+async def test_get_symbol_trading_rules(backtesting_trader):
+    _, exchange_manager, trader_inst = backtesting_trader
+    exchange = exchange_manager.exchange
+    trading_rules = exchange.get_symbol_trading_rules(DEFAULT_BACKTESTING_SYMBOL)
+    assert trading_rules.symbol_market is exchange.get_market_status(DEFAULT_BACKTESTING_SYMBOL)
+    assert exchange.get_symbol_trading_rules(DEFAULT_BACKTESTING_SYMBOL) is trading_rules
+    assert exchange.get_symbol_trading_rules(DEFAULT_BACKTESTING_SYMBOL, with_fixer=False) is not trading_rules
+    exchange.clear_market_statuses_cache()
+    reloaded_trading_rules = exchange.get_symbol_trading_rules(DEFAULT_BACKTESTING_SYMBOL)
+    assert reloaded_trading_rules is not trading_rules
+    assert reloaded_trading_rules.symbol_market is exchange.get_market_status(DEFAULT_BACKTESTING_SYMBOL)
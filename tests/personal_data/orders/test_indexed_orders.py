@@ -0,0 +1,84 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import mock
+import pytest
+
+import octobot_trading.enums as enums
+import octobot_trading.personal_data as personal_data
+
+
+def _order(symbol, status=enums.OrderStatus.OPEN, exchange_order_id=None, group_name=None, tag=None):
+    return mock.Mock(symbol=symbol, status=status, exchange_order_id=exchange_order_id,
+                     order_group=mock.Mock() if group_name else None, tag=tag)
+
+
+def test_mapping_operations():
+    orders = personal_data.IndexedOrders()
+    orders["1"] = order_1 = _order("BTC/USDT", exchange_order_id="e1")
+    orders["2"] = order_2 = _order("ETH/USDT", exchange_order_id="e2")
+    orders["3"] = order_3 = _order("BTC/USDT", exchange_order_id="e3")
+    orders["4"] = order_4 = _order("BTC/USDT", exchange_order_id="e4")
+    assert order_1.orders_index is orders
+    assert orders.get_indexed_orders(personal_data.IndexedOrders.SYMBOL, "BTC/USDT") == [order_1, order_3, order_4]
+
+    del orders["1"]
+    assert order_1.orders_index is None
+    assert orders.pop("3") is order_3
+    assert orders.pop("3", None) is None
+    with pytest.raises(KeyError):
+        orders.pop("3")
+    assert orders.popitem(last=False) == ("2", order_2)
+    assert orders.get_indexed_orders(personal_data.IndexedOrders.SYMBOL, "BTC/USDT") == [order_4]
+    assert orders.get_indexed_orders(personal_data.IndexedOrders.EXCHANGE_ORDER_ID, "e2") == []
+
+    # replaced order
+    orders["4"] = order_5 = _order("ETH/USDT")
+    assert order_4.orders_index is None
+    assert orders.get_indexed_orders(personal_data.IndexedOrders.SYMBOL, "BTC/USDT") == []
+    assert orders.get_indexed_orders(personal_data.IndexedOrders.SYMBOL, "ETH/USDT") == [order_5]
+
+    orders.clear()
+    assert order_5.orders_index is None
+    assert orders.get_indexed_orders(personal_data.IndexedOrders.SYMBOL, "ETH/USDT") == []
+
+    orders = personal_data.IndexedOrders({"1": order_1, "2": order_2})
+    assert list(orders) == ["1", "2"]
+    assert orders.get_indexed_orders(personal_data.IndexedOrders.EXCHANGE_ORDER_ID, "e2") == [order_2]
+
+
+def test_update_order_indexes():
+    orders = personal_data.IndexedOrders()
+    created_orders = [_order("BTC/USDT", tag=f"tag_{index % 2}") for index in range(5)]
+    for index, order in enumerate(created_orders):
+        orders[str(index)] = order
+    created_orders[0].status = enums.OrderStatus.CLOSED
+    orders.update_order_indexes(created_orders[0])
+    assert orders.get_indexed_orders(personal_data.IndexedOrders.STATUS, enums.OrderStatus.CLOSED) == \
+           [created_orders[0]]
+    created_orders[0].status = enums.OrderStatus.OPEN
+    orders.update_order_indexes(created_orders[0])
+    # insertion order is kept
+    assert orders.get_indexed_orders(personal_data.IndexedOrders.STATUS, enums.OrderStatus.OPEN) == created_orders
+    # unknown orders are ignored
+    orders.update_order_indexes(_order("BTC/USDT"))
+
+    # smallest bucket
+    assert list(orders.get_orders_candidates(status=enums.OrderStatus.OPEN, tag="tag_1")) == \
+           [created_orders[1], created_orders[3]]
+    assert list(orders.get_orders_candidates(symbol="ETH/USDT", tag="tag_1")) == []
+    # every order is in the bucket
+    assert list(orders.get_orders_candidates(symbol="BTC/USDT")) == created_orders
+    assert list(orders.get_orders_candidates()) == created_orders
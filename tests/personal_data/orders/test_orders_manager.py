@@ -142,6 +142,26 @@ async def test_get_order(order_and_exchange_managers):
     assert order.order_id == "2"
 
 
+async def test_get_order_from_exchange_order_id(order_and_exchange_managers):
+    orders_manager, exchange_manager = order_and_exchange_managers
+    await reset_orders_manager(orders_manager)
+    order_2, order_3, order_4 = (orders_manager.get_order(order_id) for order_id in ("2", "3", "4"))
+    # the "y" exchange order id is shared by most orders
+    order_2.exchange_order_id = "x"
+    order_3.exchange_order_id = "y"
+    order_4.exchange_order_id = "y"
+    assert orders_manager.get_order(None, exchange_order_id="y") is order_3
+    assert orders_manager.get_order(None, exchange_order_id="x") is order_2
+    assert orders_manager.has_order(None, exchange_order_id="y")
+    assert not orders_manager.has_order(None, exchange_order_id="z")
+    assert not orders_manager.has_order(None, exchange_order_id=None)
+    with pytest.raises(KeyError):
+        orders_manager.get_order(None, exchange_order_id=None)
+    order_4.exchange_order_id = None
+    assert orders_manager.get_order(None, exchange_order_id=None) is order_4
+    assert orders_manager.has_order(None, exchange_order_id=None)
+
+
 async def test_get_all_orders(order_and_exchange_managers):
     orders_manager, exchange_manager = order_and_exchange_managers
     await reset_orders_manager(orders_manager)
@@ -341,3 +361,80 @@ async def test_get_open_orders(order_and_exchange_managers):
     # )
     # assert len(tagged_order) == 1
     # assert tagged_order[0].order_id == "4"
+
+
+async def test_indexes_follow_order_updates(order_and_exchange_managers):
+    orders_manager, exchange_manager = order_and_exchange_managers
+    await reset_orders_manager(orders_manager)
+    order_2 = orders_manager.get_order("2")
+    order_3 = orders_manager.get_order("3")
+    order_3.exchange_order_id = "exchange_3"
+    assert orders_manager.has_order("2")
+    assert not orders_manager.has_order("1")
+    assert orders_manager.get_order(None, exchange_order_id=order_3.exchange_order_id) is order_3
+    assert orders_manager.has_order(None, exchange_order_id=order_3.exchange_order_id)
+    assert not orders_manager.has_order(None, exchange_order_id="unknown")
+    assert [order.order_id for order in orders_manager.get_open_orders(DEFAULT_SYMBOL)] == ["2", "3", "4"]
+
+    # status change
+    order_2.status = enums.OrderStatus.PENDING_CANCEL
+    assert [order.order_id for order in orders_manager.get_open_orders(DEFAULT_SYMBOL)] == ["3", "4"]
+    assert orders_manager.get_pending_cancel_orders(DEFAULT_SYMBOL) == [order_2]
+    order_2.status = enums.OrderStatus.OPEN
+    # insertion order is kept
+    assert [order.order_id for order in orders_manager.get_open_orders(DEFAULT_SYMBOL)] == ["2", "3", "4"]
+    assert orders_manager.get_pending_cancel_orders() == []
+
+    # symbol, tag and exchange_order_id changes
+    order_3.symbol = "ETH/USDT"
+    assert [order.order_id for order in orders_manager.get_open_orders(DEFAULT_SYMBOL)] == ["2", "4"]
+    assert orders_manager.get_open_orders("ETH/USDT") == [order_3]
+    assert [order.order_id for order in orders_manager.get_open_orders()] == ["2", "3", "4"]
+    order_3.tag = "other tag"
+    assert orders_manager.get_open_orders(tag="other tag") == [order_3]
+    previous_exchange_order_id = order_3.exchange_order_id
+    order_3.exchange_order_id = "new exchange id"
+    assert not orders_manager.has_order(None, exchange_order_id=previous_exchange_order_id)
+    assert orders_manager.get_order(None, exchange_order_id="new exchange id") is order_3
+
+    # groups
+    group = orders_manager.create_group(personal_data.OneCancelsTheOtherOrderGroup, "group")
+    assert orders_manager.get_order_from_group("group") == []
+    order_3.add_to_order_group(group)
+    order_2.add_to_order_group(group)
+    assert orders_manager.get_order_from_group("group") == [order_2, order_3]
+    assert orders_manager.get_order_from_group(None) == []
+
+    # removal
+    orders_manager.remove_order_instance(order_3)
+    assert not orders_manager.has_order("3")
+    assert orders_manager.get_open_orders("ETH/USDT") == []
+    assert orders_manager.get_order_from_group("group") == [order_2]
+    with pytest.raises(KeyError):
+        orders_manager.get_order(None, exchange_order_id="new exchange id")
+    # removed orders changes are ignored
+    order_3.symbol = DEFAULT_SYMBOL
+    assert [order.order_id for order in orders_manager.get_open_orders(DEFAULT_SYMBOL)] == ["2", "4"]
+
+    # replaced orders are re-indexed at the end
+    order_2.order_id = "new_2"
+    orders_manager.replace_order("2", order_2)
+    assert [order.order_id for order in orders_manager.get_open_orders(DEFAULT_SYMBOL)] == ["4", "new_2"]
+
+    # directly set orders
+    orders_manager.orders = {order_3.order_id: order_3}
+    assert orders_manager.get_open_orders(DEFAULT_SYMBOL) == [order_3]
+    assert orders_manager.get_order(None, exchange_order_id="new exchange id") is order_3
+
+
+async def test_indexes_when_removing_oldest_orders(order_and_exchange_managers):
+    orders_manager, exchange_manager = order_and_exchange_managers
+    await reset_orders_manager(orders_manager)
+    orders_manager.MAX_ORDERS_COUNT = 2
+    try:
+        await _upsert_raw_orders([dict(RAW_ORDERS[1], id="5")], orders_manager)
+        # oldest orders are removed from indexes
+        assert [order.order_id for order in orders_manager.get_open_orders(DEFAULT_SYMBOL)] == ["3", "4", "5"]
+        assert not orders_manager.has_order("2")
+    finally:
+        orders_manager.MAX_ORDERS_COUNT = 0
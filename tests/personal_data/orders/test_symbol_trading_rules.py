@@ -0,0 +1,226 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import decimal
+import mock
+
+from octobot_trading.enums import ExchangeConstantsMarketStatusColumns as Ecmsc
+import octobot_trading.personal_data as personal_data
+import octobot_trading.exchanges.util.exchange_market_status_fixer as exchange_market_status_fixer
+import octobot_trading.util as util
+
+
+def _get_symbol_market(min_cost=1, max_cost=200, min_amount=0.5, max_amount=100, price_digits=4, amount_digits=3):
+    return {
+        Ecmsc.LIMITS.value: {
+            Ecmsc.LIMITS_AMOUNT.value: {
+                Ecmsc.LIMITS_AMOUNT_MIN.value: min_amount,
+                Ecmsc.LIMITS_AMOUNT_MAX.value: max_amount,
+            },
+            Ecmsc.LIMITS_COST.value: {
+                Ecmsc.LIMITS_COST_MIN.value: min_cost,
+                Ecmsc.LIMITS_COST_MAX.value: max_cost
+            },
+            Ecmsc.LIMITS_PRICE.value: {
+                Ecmsc.LIMITS_PRICE_MIN.value: 0.5,
+                Ecmsc.LIMITS_PRICE_MAX.value: 50
+            },
+        },
+        Ecmsc.PRECISION.value: {
+            Ecmsc.PRECISION_PRICE.value: price_digits,
+            Ecmsc.PRECISION_AMOUNT.value: amount_digits
+        }
+    }
+
+
+def test_compiled_rules():
+    rules = personal_data.SymbolTradingRules(_get_symbol_market(max_cost=None))
+    assert rules.tick_size == decimal.Decimal("0.0001")
+    assert rules.quantum == decimal.Decimal("0.001")
+    assert rules.min_quantity == decimal.Decimal("0.5")
+    assert rules.max_quantity == decimal.Decimal("100")
+    assert rules.min_cost == decimal.Decimal("1")
+    assert rules.max_cost is None
+    assert rules.min_price == decimal.Decimal("0.5")
+    assert rules.max_price == decimal.Decimal("50")
+
+    rules = personal_data.SymbolTradingRules(_get_symbol_market(amount_digits=0, max_amount=0))
+    assert rules.quantum is None
+    assert rules.max_quantity is None
+
+
+def test_round_price_and_quantity():
+    rules = personal_data.SymbolTradingRules(_get_symbol_market())
+    assert rules.round_price(decimal.Decimal("56.5128597145")) == decimal.Decimal("56.5128")
+    assert rules.round_price(decimal.Decimal("56.5128597145"), truncate=False) == decimal.Decimal("56.5129")
+    assert rules.round_price(decimal.Decimal("56.51")) == decimal.Decimal("56.51")
+    assert rules.round_price(decimal.Decimal("1E-7")) == decimal.Decimal("0")
+    assert rules.round_quantity(decimal.Decimal("1.23456")) == decimal.Decimal("1.234")
+    assert rules.round_quantity(decimal.Decimal("1.23456"), truncate=False) == decimal.Decimal("1.235")
+    assert rules.round_quantity(decimal.Decimal("NaN")).is_nan()
+    assert rules.round_quantity(decimal.Decimal("Infinity")) == decimal.Decimal("Infinity")
+
+    rules = personal_data.SymbolTradingRules(_get_symbol_market(amount_digits=0))
+    assert rules.round_quantity(decimal.Decimal("12.9")) == decimal.Decimal("12")
+    assert rules.round_quantity(decimal.Decimal("12")) == decimal.Decimal("12")
+
+    # tick size precisions are not truncated, as with decimal_trunc_with_n_decimal_digits
+    symbol_market = _get_symbol_market(min_cost=None, max_cost=None, price_digits=0.01, amount_digits=0.001)
+    rules = personal_data.SymbolTradingRules(symbol_market)
+    assert rules.tick_size is None
+    assert rules.quantum is None
+    for value in ("1.23456", "123.4567", "12"):
+        value = decimal.Decimal(value)
+        assert rules.round_price(value) == personal_data.decimal_adapt_price(symbol_market, value) == value
+        assert rules.round_quantity(value) == personal_data.decimal_adapt_quantity(symbol_market, value) == value
+    assert personal_data.decimal_check_and_adapt_order_details_if_necessary(
+        decimal.Decimal("1.23456"), decimal.Decimal("10.4567"), symbol_market
+    ) == [(decimal.Decimal("1.23456"), decimal.Decimal("10.4567"))]
+
+
+def test_split_into_valid_orders():
+    for symbol_market in (
+        _get_symbol_market(),
+        _get_symbol_market(max_cost=None),
+        _get_symbol_market(max_amount=None),
+        _get_symbol_market(min_cost=None, max_cost=None),
+        # tick size precisions
+        _get_symbol_market(price_digits=0.01, amount_digits=0.001),
+        _get_symbol_market(max_cost=None, price_digits=0.5, amount_digits=1e-8),
+    ):
+        rules = personal_data.SymbolTradingRules(symbol_market)
+        for quantity, price in (
+            ("0.5", "2"),
+            ("0.49", "2"),
+            ("0.4", "3"),
+            ("1.23456", "49.123456"),
+            ("99.9999", "1.5"),
+            ("150", "1"),
+            ("250", "10"),
+            ("1000.12345", "45"),
+            ("10", "60"),
+            ("10", "0.1"),
+            ("10", "0"),
+            ("NaN", "10"),
+        ):
+            quantity = decimal.Decimal(quantity)
+            price = decimal.Decimal(price)
+            assert rules.split_into_valid_orders(quantity, price) == \
+                   _legacy_check_and_adapt_order_details_if_necessary(quantity, price, symbol_market)
+
+
+def test_split_into_valid_orders_with_fixed_market_status():
+    symbol_market = _get_symbol_market(min_amount=None, min_cost=None)
+    rules = personal_data.SymbolTradingRules(symbol_market)
+    quantity = decimal.Decimal("1.23456")
+    price = decimal.Decimal("10.123456")
+    with mock.patch.object(exchange_market_status_fixer, "ExchangeMarketStatusFixer",
+                           mock.Mock(wraps=exchange_market_status_fixer.ExchangeMarketStatusFixer)) as fixer_mock:
+        assert rules.split_into_valid_orders(quantity, price) == [
+            (decimal.Decimal("1.234"), decimal.Decimal("10.1234"))
+        ]
+        fixer_mock.assert_called_once_with(symbol_market, float(price))
+    fixed_rules = personal_data.SymbolTradingRules(symbol_market, fixed_symbol_data=True)
+    with mock.patch.object(exchange_market_status_fixer, "ExchangeMarketStatusFixer", mock.Mock()) as fixer_mock:
+        assert fixed_rules.split_into_valid_orders(quantity, price) == [
+            (decimal.Decimal("1.234"), decimal.Decimal("10.1234"))
+        ]
+        fixer_mock.assert_not_called()
+
+
+def test_adapt_orders():
+    symbol_market = util.to_read_only(_get_symbol_market())
+    rules = personal_data.SymbolTradingRules(symbol_market)
+    orders = [
+        (decimal.Decimal("1.23456"), decimal.Decimal("10.123456")),
+        (decimal.Decimal("0.1"), decimal.Decimal("10")),
+        (decimal.Decimal("150"), decimal.Decimal("1")),
+    ]
+    assert rules.adapt_orders(orders) == [
+        [(decimal.Decimal("1.234"), decimal.Decimal("10.1234"))],
+        [],
+        [(decimal.Decimal("50"), decimal.Decimal("1")), (decimal.Decimal("100"), decimal.Decimal("1"))],
+    ]
+    assert rules.adapt_orders(orders) == [
+        personal_data.decimal_check_and_adapt_order_details_if_necessary(quantity, price, symbol_market)
+        for quantity, price in orders
+    ]
+    assert rules.adapt_orders([]) == []
+
+
+def _legacy_check_and_adapt_order_details_if_necessary(quantity, price, symbol_market):
+    # reference implementation using decimal_order_adapter split functions
+    if quantity.is_nan() or price.is_nan() or price == 0:
+        return []
+    min_quantity, max_quantity, min_cost, max_cost, min_price, max_price = [
+        None if value is None else decimal.Decimal(str(value))
+        for value in personal_data.get_min_max_amounts(symbol_market)
+    ]
+    valid_quantity = personal_data.decimal_adapt_quantity(symbol_market, quantity)
+    valid_price = personal_data.decimal_adapt_price(symbol_market, price)
+    if valid_quantity < min_quantity:
+        return []
+    total_order_price = valid_quantity * valid_price
+    if min_cost is not None:
+        if total_order_price < min_cost:
+            return []
+        if (max_cost is not None and total_order_price > max_cost) or \
+                (max_quantity is not None and valid_quantity > max_quantity):
+            if max_cost is not None and (max_quantity is None or
+                                         total_order_price / max_cost > valid_quantity / max_quantity):
+                return _legacy_split_by_cost(total_order_price, max_cost, valid_price, symbol_market)
+            return _legacy_split_by_quantity(valid_quantity, max_quantity, quantity, valid_price, symbol_market)
+        return [(valid_quantity, valid_price)]
+    if valid_price < min_price or valid_price > max_price:
+        return []
+    if max_quantity is not None and valid_quantity > max_quantity:
+        return _legacy_split_by_quantity(valid_quantity, max_quantity, quantity, valid_price, symbol_market)
+    return [(valid_quantity, valid_price)]
+
+
+def _legacy_split_by_quantity(valid_quantity, max_quantity, quantity, price, symbol_market):
+    orders = []
+    nb_full_orders = valid_quantity // max_quantity
+    rest_order_quantity = valid_quantity % max_quantity
+    if rest_order_quantity > 0:
+        quantity -= rest_order_quantity
+        orders.append((personal_data.decimal_adapt_quantity(symbol_market, rest_order_quantity), price))
+    other_orders_quantity = (quantity + max_quantity) / (nb_full_orders + 1)
+    return orders + [(personal_data.decimal_adapt_quantity(symbol_market, other_orders_quantity), price)] \
+        * int(nb_full_orders)
+
+
+def _legacy_split_by_cost(total_order_price, max_cost, price, symbol_market):
+    orders = []
+    nb_full_orders = total_order_price // max_cost
+    rest_order_cost = total_order_price % max_cost
+    if rest_order_cost > 0:
+        orders.append((personal_data.decimal_adapt_quantity(symbol_market, rest_order_cost / price), price))
+    return orders + [(personal_data.decimal_adapt_quantity(symbol_market, max_cost / price), price)] \
+        * int(nb_full_orders)
+
+
+def test_get_symbol_trading_rules():
+    # mutable market statuses are compiled each time
+    symbol_market = _get_symbol_market()
+    assert personal_data.get_symbol_trading_rules(symbol_market) is not \
+           personal_data.get_symbol_trading_rules(symbol_market)
+    # read-only market statuses are compiled once
+    read_only_symbol_market = util.to_read_only(symbol_market)
+    trading_rules = personal_data.get_symbol_trading_rules(read_only_symbol_market)
+    assert trading_rules.symbol_market is read_only_symbol_market
+    assert personal_data.get_symbol_trading_rules(read_only_symbol_market) is trading_rules
+    assert personal_data.get_symbol_trading_rules(read_only_symbol_market, fixed_symbol_data=True) is not trading_rules
+    assert personal_data.get_symbol_trading_rules(util.to_read_only(symbol_market)) is not trading_rules
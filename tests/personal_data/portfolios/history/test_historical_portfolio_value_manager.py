@@ -18,10 +18,12 @@ import mock
 import os
 import sortedcontainers
 import decimal
+import numpy as np
 
 import octobot_commons.enums as commons_enums
 import octobot_trading.personal_data as personal_data
 import octobot_trading.constants as constants
+import octobot_trading.enums as enums
 
 from tests.exchanges import backtesting_trader_with_historical_pf_value_manager, \
     backtesting_trader, backtesting_config, backtesting_exchange_manager, fake_backtesting
@@ -559,6 +561,65 @@ async def test_get_historical_values(historical_portfolio_value_manager):
         "BTC", commons_enums.TimeFrames.ONE_HOUR, from_timestamp=sunday_timestamp * 2, to_timestamp=today_timestamp) \
         == {}
 
+    # arrays: missing values are not converted
+    timestamps, values = historical_portfolio_value_manager.get_historical_values_arrays(
+        "BTC", commons_enums.TimeFrames.ONE_DAY, from_timestamp=saturday_timestamp
+    )
+    assert timestamps.tolist() == [saturday_timestamp, sunday_timestamp, today_timestamp, late_timestamp]
+    assert np.array_equal(values, [1.3, np.nan, 11, 77], equal_nan=True)
+
+    # with the current portfolio value
+    portfolio_manager = historical_portfolio_value_manager.portfolio_manager
+    portfolio_manager.portfolio_value_holder.portfolio_current_value = decimal.Decimal("12.5")
+    with mock.patch.object(portfolio_manager.exchange_manager.exchange, "get_exchange_current_time",
+                           mock.Mock(return_value=late_timestamp)):
+        portfolio_historical_values = portfolio_manager.get_portfolio_historical_values(
+            "BTC", commons_enums.TimeFrames.ONE_HOUR, saturday_timestamp, None
+        )
+    assert portfolio_historical_values[-1] == {
+        enums.HistoricalPortfolioValue.TIME.value: late_timestamp,
+        enums.HistoricalPortfolioValue.VALUE.value: 12.5,
+    }
+    assert all(
+        type(value[enums.HistoricalPortfolioValue.VALUE.value]) is float
+        for value in portfolio_historical_values
+    )
+
+
+async def test_pop_history_changes(historical_portfolio_value_manager):
+    day_1, day_2, day_3 = 1648425600, 1648512000, 1648598400
+    historical_portfolio_value_manager.max_history_size = 2
+    assert historical_portfolio_value_manager.pop_history_changes() == ([], [])
+    assert await historical_portfolio_value_manager.on_new_values(
+        {day_1: {"BTC": 1}, day_2: {"BTC": 2}}, save_changes=False
+    ) is True
+    assert historical_portfolio_value_manager.pop_history_changes() == (
+        [{"t": day_1, "v": {"BTC": 1}}, {"t": day_2, "v": {"BTC": 2}}], []
+    )
+    assert historical_portfolio_value_manager.pop_history_changes() == ([], [])
+
+    # updated value
+    assert await historical_portfolio_value_manager.on_new_values(
+        {day_2: {"BTC": 3}}, save_changes=False, force_update=True
+    ) is True
+    # unchanged value
+    assert await historical_portfolio_value_manager.on_new_values(
+        {day_1: {"BTC": 1}}, save_changes=False, force_update=True
+    ) is False
+    # new value: removes the oldest one
+    assert await historical_portfolio_value_manager.on_new_values({day_3: {"BTC": 4}}, save_changes=False) is True
+    assert historical_portfolio_value_manager.pop_history_changes() == (
+        [{"t": day_2, "v": {"BTC": 3}}, {"t": day_3, "v": {"BTC": 4}}], [day_1]
+    )
+
+    # reloaded history has no changes
+    historical_portfolio_value_manager._load_historical_values(
+        [{"t": day_1, "v": {"BTC": 1}}, {"t": day_2, "v": {"BTC": 3}}, {"t": day_3, "v": {"BTC": 4}}]
+    )
+    # too many values: oldest values are ignored
+    assert list(historical_portfolio_value_manager.historical_portfolio_value) == [day_2, day_3]
+    assert historical_portfolio_value_manager.pop_history_changes() == ([], [])
+
 
 def _check_historical_value(historical_value, timestamp, value_by_currency):
     assert isinstance(historical_value, personal_data.HistoricalAssetValue)
@@ -0,0 +1,153 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import decimal
+import random
+
+import numpy as np
+import pytest
+
+import octobot_trading.personal_data as personal_data
+
+HOUR = 3600
+DAY = 24 * HOUR
+
+
+def _is_timestamp_relevant(timestamp, time_frame_seconds, sorted_timestamps):
+    # reference implementation
+    if timestamp % time_frame_seconds == 0:
+        return True
+    index = sorted_timestamps.index(timestamp)
+    allowed_delta = time_frame_seconds / 2
+    previous_timestamp = sorted_timestamps[index - 1] if index > 0 else 0
+    next_timestamp = sorted_timestamps[index + 1] if index < len(sorted_timestamps) - 1 \
+        else timestamp + allowed_delta
+    return previous_timestamp + allowed_delta <= timestamp <= next_timestamp - allowed_delta
+
+
+def test_set_and_get_values():
+    values = personal_data.HistoricalPortfolioValues()
+    assert len(values) == 0
+    assert list(values) == []
+    values.set_value(DAY * 2, {"BTC": decimal.Decimal("1.5"), "USDT": 10})
+    values.set_value(DAY, {"BTC": decimal.Decimal("0.1")})
+    values.set_value(DAY + 1.5, {"ETH": 3})
+    assert len(values) == 3
+    assert list(values) == [DAY, DAY + 1.5, DAY * 2]
+    assert DAY in values
+    assert DAY + 2 not in values
+    with pytest.raises(KeyError):
+        values[DAY + 2]
+
+    historical_value = values[DAY * 2]
+    assert isinstance(historical_value, personal_data.HistoricalAssetValue)
+    assert historical_value.get_timestamp() == DAY * 2
+    assert historical_value.get("BTC") == decimal.Decimal("1.5")
+    assert historical_value.get("USDT") == decimal.Decimal("10")
+    with pytest.raises(KeyError):
+        historical_value.get("ETH")
+    # materialized values are copies
+    historical_value.update({"BTC": 2})
+    assert values.get_value(DAY * 2, "BTC") == 1.5
+
+    assert values.get_value(DAY + 1.5, "ETH") == 3
+    with pytest.raises(KeyError):
+        values.get_value(DAY, "ETH")
+    with pytest.raises(KeyError):
+        values.get_value(DAY, "XRP")
+    assert values.get_dict(DAY) == {
+        personal_data.HistoricalAssetValue.TIMESTAMP_KEY: DAY,
+        personal_data.HistoricalAssetValue.VALUES_KEY: {"BTC": 0.1},
+    }
+    assert values.to_dicts() == [
+        {"t": DAY, "v": {"BTC": 0.1}},
+        {"t": DAY + 1.5, "v": {"ETH": 3}},
+        {"t": DAY * 2, "v": {"BTC": 1.5, "USDT": 10}},
+    ]
+    assert list(values.get_currencies()) == ["BTC", "USDT", "ETH"]
+    assert np.array_equal(values.get_column("BTC"), [0.1, np.nan, 1.5], equal_nan=True)
+    assert np.isnan(values.get_column("XRP")).all()
+    assert values.get_first_values() == {"BTC": 0.1, "ETH": 3, "USDT": 10}
+
+    # replace value
+    values.set_value(DAY * 2, {"ETH": 1})
+    assert values.get_dict(DAY * 2)[personal_data.HistoricalAssetValue.VALUES_KEY] == {"ETH": 1}
+
+
+def test_update_value():
+    values = personal_data.HistoricalPortfolioValues()
+    with pytest.raises(KeyError):
+        values.update_value(DAY, {"BTC": 1})
+    values.set_value(DAY, {"BTC": 1, "USDT": 2})
+    assert values.update_value(DAY, {"BTC": decimal.Decimal(1), "USDT": 2}) is False
+    assert values.update_value(DAY, {"BTC": 1}) is True
+    assert values.update_value(DAY, {"BTC": 3, "ETH": 4}) is True
+    assert values.get_dict(DAY)[personal_data.HistoricalAssetValue.VALUES_KEY] == {"BTC": 3, "USDT": 2, "ETH": 4}
+
+
+def test_pop_oldest_and_growth():
+    values = personal_data.HistoricalPortfolioValues([HOUR])
+    with pytest.raises(KeyError):
+        values.pop_oldest()
+    for index in range(500):
+        values.set_value(index * HOUR, {"BTC": index})
+        if index >= 100:
+            # rolling window of 100 values
+            assert values.pop_oldest() == (index - 100) * HOUR
+    assert len(values) == 100
+    assert list(values) == [index * HOUR for index in range(400, 500)]
+    assert values.get_column("BTC").tolist() == list(range(400, 500))
+    assert values.get_time_frame_relevance(HOUR).all()
+    for _ in range(100):
+        values.pop_oldest()
+    assert len(values) == 0
+    values.set_value(1, {"BTC": 1})
+    assert list(values) == [1]
+
+
+def test_is_significant_change():
+    values = personal_data.HistoricalPortfolioValues()
+    values.set_value(DAY, {"BTC": 1, "USDT": 0})
+    assert values.is_significant_change(DAY, "BTC", 1) is False
+    assert values.is_significant_change(DAY, "BTC", decimal.Decimal("1.1")) is True
+    assert values.is_significant_change(DAY, "USDT", 0) is False
+    assert values.is_significant_change(DAY, "USDT", 1) is True
+    with pytest.raises(KeyError):
+        values.is_significant_change(DAY, "ETH", 1)
+    with pytest.raises(KeyError):
+        values.is_significant_change(DAY * 2, "BTC", 1)
+
+
+def test_get_time_frame_relevance():
+    rand = random.Random(0)
+    maintained_values = personal_data.HistoricalPortfolioValues([HOUR, DAY])
+    timestamps = set()
+    for _ in range(300):
+        timestamp = rand.randint(0, 30) * HOUR + rand.choice([0, 0, 1, 600, 1800, 2000])
+        timestamps.add(timestamp)
+        maintained_values.set_value(timestamp, {"BTC": 1})
+        if rand.random() < 0.1:
+            timestamps.remove(maintained_values.pop_oldest())
+        sorted_timestamps = sorted(timestamps)
+        for time_frame_seconds in (HOUR, DAY):
+            assert maintained_values.get_time_frame_relevance(time_frame_seconds).tolist() == [
+                _is_timestamp_relevant(timestamp, time_frame_seconds, sorted_timestamps)
+                for timestamp in sorted_timestamps
+            ]
+    # lazily computed time frame
+    assert maintained_values.get_time_frame_relevance(HOUR * 4).tolist() == [
+        _is_timestamp_relevant(timestamp, HOUR * 4, sorted(timestamps))
+        for timestamp in sorted(timestamps)
+    ]
@@ -366,3 +366,84 @@ async def test_get_holdings_ratio_with_include_assets_in_open_orders(backtesting
     assert portfolio_value_holder.get_holdings_ratio(
         "BTC", traded_symbols_only=True, include_assets_in_open_orders=True
     ) == decimal.Decimal('0.9166666666666666666666666667')
+
+
+async def test_incremental_portfolio_valuation(backtesting_trader):
+    config, exchange_manager, trader = backtesting_trader
+    portfolio_manager = exchange_manager.exchange_personal_data.portfolio_manager
+    portfolio_value_holder = portfolio_manager.portfolio_value_holder
+    value_converter = portfolio_value_holder.value_converter
+
+    exchange_manager.client_symbols.extend(["ETH/BTC", "DOT/ETH", "DOT/BTC", "XRP/BTC", "BTC/USDT", "DOT/USDT"])
+    portfolio_manager.portfolio.update_portfolio_from_balance({
+        'BTC': {'available': decimal.Decimal("1"), 'total': decimal.Decimal("1")},
+        'ETH': {'available': decimal.Decimal("10"), 'total': decimal.Decimal("10")},
+        'DOT': {'available': decimal.Decimal("100"), 'total': decimal.Decimal("100")},
+        'XRP': {'available': decimal.Decimal("1000"), 'total': decimal.Decimal("1000")},
+        'USDT': {'available': decimal.Decimal("1000"), 'total': decimal.Decimal("1000")}
+    }, True)
+    portfolio_manager.handle_mark_price_update("ETH/BTC", decimal.Decimal("0.1"))
+    portfolio_manager.handle_mark_price_update("DOT/ETH", decimal.Decimal("0.01"))
+    portfolio_manager.handle_mark_price_update("XRP/BTC", decimal.Decimal("0.0001"))
+    portfolio_manager.handle_mark_price_update("BTC/USDT", decimal.Decimal("1000"))
+    assert portfolio_value_holder.portfolio_current_value == decimal.Decimal("1") + decimal.Decimal("1") + \
+        decimal.Decimal("0.1") + decimal.Decimal("0.1") + decimal.Decimal("1")
+    assert portfolio_value_holder.get_current_holdings_values() == {
+        'BTC': decimal.Decimal("1"),
+        'ETH': decimal.Decimal("1"),
+        'DOT': decimal.Decimal("0.1"),
+        'XRP': decimal.Decimal("0.1"),
+        'USDT': decimal.Decimal("1"),
+    }
+
+    with mock.patch.object(value_converter, "evaluate_value", mock.Mock(wraps=value_converter.evaluate_value)) \
+         as evaluate_value_mock:
+        # only ETH and DOT (valued using ETH/BTC) are evaluated
+        portfolio_manager.handle_mark_price_update("ETH/BTC", decimal.Decimal("0.2"))
+        assert sorted(call.args[0] for call in evaluate_value_mock.mock_calls) == ["DOT", "ETH"]
+        assert portfolio_value_holder.portfolio_current_value == decimal.Decimal("1") + decimal.Decimal("2") + \
+            decimal.Decimal("0.2") + decimal.Decimal("0.1") + decimal.Decimal("1")
+        evaluate_value_mock.reset_mock()
+
+        # same price: nothing to evaluate
+        portfolio_manager.handle_mark_price_update("XRP/BTC", decimal.Decimal("0.0001"))
+        evaluate_value_mock.assert_not_called()
+
+        # holdings update: nothing to evaluate
+        portfolio_manager.portfolio.portfolio["XRP"].total = decimal.Decimal("2000")
+        portfolio_manager.handle_balance_updated()
+        evaluate_value_mock.assert_not_called()
+        assert portfolio_value_holder.get_current_holdings_values()["XRP"] == decimal.Decimal("0.2")
+        assert portfolio_value_holder.portfolio_current_value == decimal.Decimal("1") + decimal.Decimal("2") + \
+            decimal.Decimal("0.2") + decimal.Decimal("0.2") + decimal.Decimal("1")
+
+        # holdings ratio from valued holdings
+        assert portfolio_value_holder.get_holdings_ratio("ETH") == \
+            decimal.Decimal("2") / portfolio_value_holder.portfolio_current_value
+        evaluate_value_mock.assert_not_called()
+
+        # new pair: every currency is evaluated
+        portfolio_manager.handle_mark_price_update("DOT/USDT", decimal.Decimal("2"))
+        assert set(call.args[0] for call in evaluate_value_mock.mock_calls) == {"BTC", "DOT", "ETH", "USDT", "XRP"}
+
+    # a price update without valuation is not using valued holdings
+    value_converter.update_last_price("ETH/BTC", decimal.Decimal("0.3"))
+    assert portfolio_value_holder.get_holdings_ratio("ETH") == \
+        decimal.Decimal("3") / portfolio_value_holder.portfolio_current_value
+
+    # holdings values are up to date with holdings and can be modified
+    portfolio_manager.portfolio.portfolio["ETH"].total = decimal.Decimal("20")
+    holdings_values = portfolio_value_holder.get_current_holdings_values()
+    assert holdings_values["ETH"] == decimal.Decimal("4")
+    holdings_values["ETH"] = decimal.Decimal("100")
+    assert portfolio_value_holder.get_current_holdings_values()["ETH"] == decimal.Decimal("4")
+    portfolio_manager.portfolio.portfolio["ETH"].total = decimal.Decimal("10")
+
+    # prices set without update_last_price are not using valued holdings either
+    value_converter.last_prices_by_trading_pair["ETH/BTC"] = decimal.Decimal("0.4")
+    assert portfolio_value_holder.get_holdings_ratio("ETH") == \
+        decimal.Decimal("4") / portfolio_value_holder.portfolio_current_value
+    value_converter.last_prices_by_trading_pair["ETH/BTC"] = decimal.Decimal("0.3")
+
+    portfolio_value_holder.reset_portfolio_values()
+    assert portfolio_value_holder.get_current_holdings_values()["ETH"] == decimal.Decimal("3")
@@ -182,3 +182,127 @@ def test_can_convert_symbol_to_usd_like():
         f"{commons_constants.USD_LIKE_COINS[4]}/BTC"
     ) is True
     assert trading_personal_data.ValueConverter.can_convert_symbol_to_usd_like("BTC/ETH") is False
+
+
+def test_price_bridges_from_currency_graph(backtesting_trader):
+    config, exchange_manager, trader = backtesting_trader
+    portfolio_manager = exchange_manager.exchange_personal_data.portfolio_manager
+    value_converter = portfolio_manager.portfolio_value_holder.value_converter
+
+    value_converter.update_last_price("ADA/USDT", decimal.Decimal("2"))
+    value_converter.update_last_price("BTC/USDT", decimal.Decimal("100"))
+    value_converter.update_last_price("CRO/PLOP", decimal.Decimal("2"))
+    assert value_converter.try_convert_currency_value_using_multiple_pairs("CRO", "BTC", constants.ONE, []) is None
+    assert value_converter.try_convert_currency_value_using_multiple_pairs("ADA", "BTC", constants.ONE, []) \
+        == decimal.Decimal("0.02")
+    assert value_converter.is_missing_price_bridge("CRO", "BTC")
+
+    # price updates are not changing bridges
+    value_converter.update_last_price("BTC/USDT", decimal.Decimal("200"))
+    value_converter.update_last_price("ETH/DOT", decimal.Decimal("2"))
+    assert value_converter.is_missing_price_bridge("CRO", "BTC")
+    assert value_converter.try_convert_currency_value_using_multiple_pairs("ADA", "BTC", constants.ONE, []) \
+        == decimal.Decimal("0.01")
+
+    # a new pair connecting CRO makes its missing bridges available again
+    value_converter.update_last_price("PLOP/USDT", decimal.Decimal("4"))
+    assert not value_converter.is_missing_price_bridge("CRO", "BTC")
+    assert value_converter.try_convert_currency_value_using_multiple_pairs("CRO", "BTC", constants.ONE, []) \
+        == decimal.Decimal("0.04")
+    assert value_converter.get_saved_price_conversion_bridge("CRO", "BTC") == [
+        ("CRO", "PLOP"), ("PLOP", "USDT"), ("USDT", "BTC")
+    ]
+
+    # shortest bridge is used
+    value_converter.update_last_price("XRP/PLOP", decimal.Decimal("1"))
+    value_converter.update_last_price("XRP/BTC", decimal.Decimal("0.5"))
+    assert value_converter.try_convert_currency_value_using_multiple_pairs("XRP", "BTC", decimal.Decimal(2), [(
+        "XRP", "BTC"
+    )]) == decimal.Decimal("0.04")
+    assert value_converter.get_saved_price_conversion_bridge("XRP", "BTC") == [
+        ("XRP", "PLOP"), ("PLOP", "USDT"), ("USDT", "BTC")
+    ]
+
+    # pairs without price can't be used in bridges
+    value_converter.update_last_price("DOT/USDT", constants.ZERO)
+    assert value_converter.try_convert_currency_value_using_multiple_pairs("ETH", "BTC", constants.ONE, []) is None
+
+
+def test_evaluate_values(backtesting_trader):
+    config, exchange_manager, trader = backtesting_trader
+    portfolio_manager = exchange_manager.exchange_personal_data.portfolio_manager
+    value_converter = portfolio_manager.portfolio_value_holder.value_converter
+
+    value_converter.update_last_price("BTC/USDT", decimal.Decimal("100"))
+    value_converter.update_last_price("ETH/BTC", decimal.Decimal("0.1"))
+    value_converter.update_last_price("DOT/ETH", decimal.Decimal("0.5"))
+    assert value_converter.evaluate_values(
+        {"USDT": decimal.Decimal(3), "BTC": decimal.Decimal(2), "ETH": constants.ONE, "DOT": decimal.Decimal(4),
+         "CRO": constants.ONE},
+        target_currency="USDT"
+    ) == {
+        "USDT": decimal.Decimal(3),
+        "BTC": decimal.Decimal(200),
+        "ETH": decimal.Decimal(10),
+        "DOT": decimal.Decimal(20),
+        "CRO": constants.ZERO,
+    }
+    # bridges to USDT have been computed at once
+    assert value_converter.get_saved_price_conversion_bridge("DOT", "USDT") == [
+        ("DOT", "ETH"), ("ETH", "BTC"), ("BTC", "USDT")
+    ]
+
+
+def test_price_updates_without_update_last_price(backtesting_trader):
+    config, exchange_manager, trader = backtesting_trader
+    portfolio_manager = exchange_manager.exchange_personal_data.portfolio_manager
+    value_converter = portfolio_manager.portfolio_value_holder.value_converter
+
+    value_converter.update_last_price("BTC/USDT", decimal.Decimal("100"))
+    value_converter.update_last_price("ETH/BTC", decimal.Decimal("0.1"))
+    assert value_converter.pop_updated_currencies("USDT") is None
+    assert value_converter.are_prices_up_to_date()
+    value_converter.update_last_price("ETH/BTC", decimal.Decimal("0.2"))
+    assert not value_converter.are_prices_up_to_date()
+    assert value_converter.pop_updated_currencies("USDT") == {"ETH", "BTC"}
+
+    # price changes are detected
+    value_converter.last_prices_by_trading_pair["BTC/USDT"] = decimal.Decimal("200")
+    assert not value_converter.are_prices_up_to_date()
+    assert value_converter.pop_updated_currencies("USDT") == {"BTC"}
+    assert value_converter.are_prices_up_to_date()
+    # then set to the same value with update_last_price
+    value_converter.update_last_price("BTC/USDT", decimal.Decimal("200"))
+    assert value_converter.are_prices_up_to_date()
+
+    # new pairs are detected
+    value_converter.last_prices_by_trading_pair["DOT/USDT"] = decimal.Decimal("2")
+    assert not value_converter.are_prices_up_to_date()
+    value_converter.update_last_price("DOT/USDT", decimal.Decimal("3"))
+    assert value_converter.pop_updated_currencies("USDT") is None
+    assert value_converter.evaluate_value("DOT", constants.ONE, target_currency="BTC") == decimal.Decimal("0.015")
+
+
+def test_price_bridges_with_many_symbols_per_pair(backtesting_trader):
+    config, exchange_manager, trader = backtesting_trader
+    portfolio_manager = exchange_manager.exchange_personal_data.portfolio_manager
+    value_converter = portfolio_manager.portfolio_value_holder.value_converter
+
+    value_converter.update_last_price("BTC/USDT", constants.ZERO)
+    value_converter.update_last_price("BTC/USDT:USDT", decimal.Decimal("100"))
+    value_converter.update_last_price("ETH/BTC", decimal.Decimal("0.1"))
+    # BTC/USDT has no price: BTC/USDT:USDT is used
+    assert value_converter.try_convert_currency_value_using_multiple_pairs("ETH", "USDT", constants.ONE, []) \
+        == decimal.Decimal("10")
+    assert value_converter.try_convert_currency_value_using_multiple_pairs("USDT", "ETH", constants.ONE, []) \
+        == decimal.Decimal("0.1")
+    value_converter.update_last_price("BTC/USDT", decimal.Decimal("200"))
+    assert value_converter.try_convert_currency_value_using_multiple_pairs("ETH", "USDT", constants.ONE, []) \
+        == decimal.Decimal("20")
+
+
+def test_get_usd_like_symbols_from_symbols():
+    assert trading_personal_data.ValueConverter.get_usd_like_symbols_from_symbols(
+        "BTC", ["BTC/USDC", "ETH/USDT", "BTC/ETH", "BTC/USDT", "USDT/BTC"]
+    ) == ["BTC/USDT", "USDT/BTC", "BTC/USDC"]
+    assert trading_personal_data.ValueConverter.get_usd_like_symbol_from_symbols("BTC", ["BTC/ETH"]) is None
@@ -13,11 +13,13 @@
 #
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
+import decimal
+import mock
 import pytest
 
 from tests import event_loop
 from tests.exchanges import simulated_exchange_manager, simulated_trader
-from tests.personal_data.trades import create_trade
+from tests.personal_data.trades import create_trade, create_executed_trade
 
 import octobot_trading.personal_data as personal_data
 import octobot_trading.enums as enums
@@ -95,3 +97,56 @@ def test_get_completed_trades_pnl(trade_manager_and_trader):
     # does not depend on trades_manager trades
     trade_manager.trades.clear()
     assert len(trade_manager.get_completed_trades_pnl(trades)) == 3
+
+
+def test_archived_trades(trade_manager_and_trader):
+    trade_manager, trader = trade_manager_and_trader
+    with mock.patch.object(trade_manager, "MAX_TRADES_COUNT", 20), \
+            mock.patch.object(trade_manager, "MAX_LIVE_TRADES_COUNT", 5):
+        trade_manager._reset_trades()
+        for index in range(25):
+            trade = create_executed_trade(
+                trader, enums.TradeOrderSide.BUY, index, decimal.Decimal(1), decimal.Decimal(10),
+                "BTC/USDT" if index % 2 else "ETH/USDT",
+                {
+                    enums.FeePropertyColumns.COST.value: decimal.Decimal("0.1"),
+                    enums.FeePropertyColumns.CURRENCY.value: "USDT" if index % 2 else "ETH",
+                }
+            )
+            trade.trade_id = str(index)
+            trade.status = enums.OrderStatus.FILLED
+            trade_manager.upsert_trade_instance(trade)
+        # oldest trades are removed from archived ones
+        assert len(trade_manager.trades) == 19
+        assert trade_manager.trades.get_archived_trades_count() == 14
+        assert list(trade_manager.trades)[0] == "6"
+        assert trade_manager.get_trade("6").executed_time == 6
+        assert trade_manager.get_total_paid_fees() == {
+            "USDT": decimal.Decimal("0.9"), "ETH": decimal.Decimal("1.0")
+        }
+        assert trade_manager._get_trades_count_by_symbols() == {"BTC/USDT": 9, "ETH/USDT": 10}
+
+
+def test_archived_trades_pnl(trade_manager_and_trader):
+    trade_manager, trader = trade_manager_and_trader
+    with mock.patch.object(trade_manager, "MAX_LIVE_TRADES_COUNT", 5):
+        trade_manager._reset_trades()
+        for index in range(20):
+            trade = create_trade(trader, f"exchange_{index}", index % 2 == 1, str(index))
+            trade.trade_id = str(index)
+            if index % 2:
+                trade.associated_entry_ids = [str(index - 1)]
+            trade_manager.upsert_trade_instance(trade)
+        trade_manager.get_trade("19").associated_entry_ids.append("2")
+        assert trade_manager.trades.get_archived_trades_count() == 15
+        pnls = trade_manager.get_completed_trades_pnl()
+        expected_pnls = trade_manager.get_completed_trades_pnl(list(trade_manager.trades.values()))
+        assert len(pnls) == len(expected_pnls) == 10
+        for pnl, expected_pnl in zip(pnls, expected_pnls):
+            assert [trade.trade_id for trade in pnl.entries] == [trade.trade_id for trade in expected_pnl.entries]
+            assert [trade.trade_id for trade in pnl.closes] == [trade.trade_id for trade in expected_pnl.closes]
+        assert [trade.trade_id for trade in pnls[1].closes] == ["3", "19"]
+        assert trade_manager.get_completed_trade_pnl(None, "3").entries[0].trade_id == "2"
+        assert trade_manager.has_closing_trade_with_exchange_order_id("exchange_3") is True
+        assert trade_manager.has_closing_trade_with_exchange_order_id("exchange_2") is False
+        assert trade_manager.get_trade_from_order_id("4").trade_id == "4"
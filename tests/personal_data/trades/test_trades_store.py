@@ -0,0 +1,216 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import decimal
+import numpy as np
+import pytest
+
+from tests import event_loop
+from tests.exchanges import simulated_exchange_manager, simulated_trader
+from tests.personal_data.trades import create_executed_trade
+
+import octobot_trading.personal_data as personal_data
+import octobot_trading.enums as enums
+
+
+@pytest.fixture
+def trader(simulated_trader):
+    _, _, trader_instance = simulated_trader
+    return trader_instance
+
+
+def _create_trade(trader, index, symbol="BTC/USDT", fee_cost="0.1"):
+    trade = create_executed_trade(
+        trader, enums.TradeOrderSide.BUY if index % 2 else enums.TradeOrderSide.SELL, 1690000000 + index,
+        decimal.Decimal(f"{index}.125"), decimal.Decimal("25000.1"), symbol,
+        {
+            enums.FeePropertyColumns.COST.value: decimal.Decimal(fee_cost),
+            enums.FeePropertyColumns.CURRENCY.value: "USDT",
+            enums.FeePropertyColumns.IS_FROM_EXCHANGE.value: True,
+        }
+    )
+    trade.trade_id = trade.origin_order_id = f"id_{index}"
+    trade.status = enums.OrderStatus.FILLED
+    return trade
+
+
+def _get_trade_attributes(trade):
+    attributes = dict(trade.__dict__)
+    for attribute in ("trader", "exchange_manager"):
+        attributes.pop(attribute)
+    return attributes
+
+
+def test_archived_trades(trader):
+    store = personal_data.TradesStore(trader, 2)
+    trades = [_create_trade(trader, index) for index in range(5)]
+    # values that can't be stored as float64 or interned
+    trades[0].total_cost = decimal.Decimal("1.12345678901234567890")
+    trades[0].canceled_time = 1690000000.5
+    trades[0].tag = ["unhashable"]
+    trades[0].associated_entry_ids = ["id_1"]
+    trades[1].fee = None
+    trades[1].reduce_only = None
+    trades[1].executed_price = decimal.Decimal("NaN")
+    for trade in trades:
+        store[trade.trade_id] = trade
+    assert len(store) == 5
+    assert store.get_archived_trades_count() == 3
+    assert store.get_live_trades() == trades[3:]
+    assert list(store) == [trade.trade_id for trade in trades]
+    # live trades are the given instances
+    assert store["id_4"] is trades[4]
+    for trade in trades[:3]:
+        archived_trade = store[trade.trade_id]
+        assert archived_trade is not trade
+        assert archived_trade.trader is trader
+        attributes = _get_trade_attributes(archived_trade)
+        expected_attributes = _get_trade_attributes(trade)
+        assert set(attributes) == set(expected_attributes)
+        for attribute, value in expected_attributes.items():
+            if isinstance(value, decimal.Decimal) and value.is_nan():
+                assert attributes[attribute].is_nan()
+            else:
+                assert attributes[attribute] == value, attribute
+                assert type(attributes[attribute]) is type(value), attribute
+    assert store["id_0"].total_cost == decimal.Decimal("1.12345678901234567890")
+    assert store["id_0"].to_dict() == trades[0].to_dict()
+
+
+def test_remove_and_update_trades(trader):
+    store = personal_data.TradesStore(trader, 2)
+    for index in range(5):
+        store[f"id_{index}"] = _create_trade(trader, index)
+    updated_trade = _create_trade(trader, 10)
+    store["id_1"] = updated_trade
+    # updated trades keep their position
+    assert list(store) == [f"id_{index}" for index in range(5)]
+    assert store["id_1"].executed_quantity == updated_trade.executed_quantity
+    assert store.popitem(last=False)[0] == "id_0"
+    assert store.popitem()[0] == "id_4"
+    del store["id_2"]
+    assert "id_2" not in store
+    assert list(store) == ["id_1", "id_3"]
+    with pytest.raises(KeyError):
+        store["id_2"]
+    store.clear()
+    assert len(store) == 0
+    assert list(store) == []
+    with pytest.raises(KeyError):
+        store.popitem()
+    store["id_0"] = _create_trade(trader, 0)
+    assert list(store.values())[0].trade_id == "id_0"
+
+
+def test_remove_oldest_trades(trader):
+    store = personal_data.TradesStore(trader, 3)
+    for index in range(10):
+        store[f"id_{index}"] = _create_trade(trader, index, symbol="BTC/USDT" if index % 2 else "ETH/USDT")
+    del store["id_1"]
+    assert store.remove_oldest_trades(4) == {"ETH/USDT": 3, "BTC/USDT": 1}
+    assert list(store) == [f"id_{index}" for index in range(5, 10)]
+    assert store.get_archived_trades_count() == 2
+    # archived then live trades
+    assert store.remove_oldest_trades(3) == {"BTC/USDT": 2, "ETH/USDT": 1}
+    assert list(store) == ["id_8", "id_9"]
+    assert store.remove_oldest_trades(5) == {"ETH/USDT": 1, "BTC/USDT": 1}
+    assert len(store) == 0
+
+
+def test_compaction(trader):
+    store = personal_data.TradesStore(trader, 10)
+    for index in range(5000):
+        store[f"id_{index}"] = _create_trade(trader, index)
+    for _ in range(4000):
+        store.popitem(last=False)
+    assert len(store) == 1000
+    # removed rows are released
+    assert len(store._row_trade_ids) < 2000
+    assert list(store)[:2] == ["id_4000", "id_4001"]
+    assert store["id_4000"].executed_time == 1690004000
+    assert np.array_equal(store.get_archived_column("executed_time"), np.arange(1690004000, 1690004990))
+
+
+def test_aggregations(trader):
+    store = personal_data.TradesStore(trader, 3)
+    for index in range(10):
+        store[f"id_{index}"] = _create_trade(trader, index, "ETH/USDT" if index % 3 else "BTC/USDT", f"0.{index}")
+    assert store.get_count_by_symbol() == {"BTC/USDT": 4, "ETH/USDT": 6}
+    assert store.get_archived_paid_fees() == {"USDT": decimal.Decimal("2.1")}
+    del store["id_2"]
+    store.popitem(last=False)
+    assert store.get_count_by_symbol() == {"BTC/USDT": 3, "ETH/USDT": 5}
+    assert store.get_archived_paid_fees() == {"USDT": decimal.Decimal("1.9")}
+    assert list(store.get_archived_column("executed_quantity")) == [1.125, 3.125, 4.125, 5.125, 6.125]
+    with pytest.raises(KeyError):
+        store.get_archived_column("symbol")
+
+
+def test_order_ids_indexes(trader):
+    store = personal_data.TradesStore(trader, 2)
+    trades = [_create_trade(trader, index) for index in range(5)]
+    for index, trade in enumerate(trades):
+        trade.origin_order_id = f"order_{index // 2}"
+        trade.exchange_order_id = f"exchange_order_{index % 2}"
+        store[trade.trade_id] = trade
+    assert [trade.trade_id for trade in store.get_indexed_trades(origin_order_id="order_0")] == ["id_0", "id_1"]
+    assert [trade.trade_id for trade in store.get_indexed_trades(exchange_order_id="exchange_order_0")] == \
+           ["id_0", "id_2", "id_4"]
+    assert [trade.trade_id for trade in store.get_indexed_trades(origin_order_id="order_1",
+                                                                 exchange_order_id="exchange_order_1")] == ["id_3"]
+    assert store.get_indexed_trades(origin_order_id="unknown") == []
+    assert len(store.get_indexed_trades()) == 5
+    assert store.get_last_trade_id("order_1") == "id_3"
+    assert store.get_last_trade_id("unknown") is None
+
+    # live trades updates are indexed
+    trades[4].origin_order_id = "order_0"
+    assert [trade.trade_id for trade in store.get_indexed_trades(origin_order_id="order_0")] == \
+           ["id_0", "id_1", "id_4"]
+    assert store.get_last_trade_id("order_2") is None
+    # archived trades are snapshots
+    store["id_0"].origin_order_id = "order_3"
+    trades[0].origin_order_id = "order_3"
+    assert store.get_indexed_trades(origin_order_id="order_3") == []
+
+    del store["id_1"]
+    store.popitem()
+    assert [trade.trade_id for trade in store.get_indexed_trades(origin_order_id="order_0")] == ["id_0"]
+    store.clear()
+    assert store.get_indexed_trades(origin_order_id="order_0") == []
+    trades[3].origin_order_id = "order_0"
+    assert store.get_indexed_trades(origin_order_id="order_0") == []
+
+
+def test_exit_trade_ids_by_entry_id(trader):
+    store = personal_data.TradesStore(trader, 2)
+    trades = [_create_trade(trader, index) for index in range(6)]
+    trades[1].associated_entry_ids = ["id_0"]
+    trades[2].associated_entry_ids = ["id_1", "id_0"]
+    trades[3].associated_entry_ids = ["id_3"]
+    trades[3].status = enums.OrderStatus.CANCELED
+    trades[5].associated_entry_ids = ["id_4"]
+    for trade in trades[:5]:
+        store[trade.trade_id] = trade
+    assert store.get_exit_trade_ids_by_entry_id() == {"id_0": ["id_1", "id_2"], "id_1": ["id_2"]}
+    store[trades[5].trade_id] = trades[5]
+    # live trades can be updated
+    trades[5].associated_entry_ids.append("id_1")
+    assert store.get_exit_trade_ids_by_entry_id() == {
+        "id_0": ["id_1", "id_2"], "id_1": ["id_2", "id_5"], "id_4": ["id_5"]
+    }
+    store.popitem(last=False)
+    del store["id_2"]
+    assert store.get_exit_trade_ids_by_entry_id() == {"id_0": ["id_1"], "id_4": ["id_5"], "id_1": ["id_5"]}
@@ -0,0 +1,135 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import decimal
+import mock
+import pytest
+
+import octobot_commons.databases as commons_databases
+
+import octobot_trading.constants as constants
+import octobot_trading.enums as enums
+import octobot_trading.personal_data as personal_data
+import octobot_trading.storage as storage
+
+from tests.exchanges import backtesting_trader, backtesting_config, backtesting_exchange_manager, fake_backtesting
+from tests import event_loop
+
+pytestmark = pytest.mark.asyncio
+
+
+async def _create_open_order(trader, index, exchange_order_id=None):
+    order = personal_data.BuyLimitOrder(trader)
+    order.update(
+        order_type=enums.TraderOrderType.BUY_LIMIT,
+        symbol="BTC/USDT",
+        current_price=decimal.Decimal("70"),
+        quantity=decimal.Decimal("10"),
+        price=decimal.Decimal(str(60 + index)),
+        order_id=f"order_{index}",
+        exchange_order_id=exchange_order_id,
+    )
+    await trader.exchange_manager.exchange_personal_data.orders_manager.upsert_order_instance(order)
+    return order
+
+
+def _get_order_ids(order_documents):
+    return [
+        order_document[constants.STORAGE_ORIGIN_VALUE][enums.ExchangeConstantsOrderColumns.ID.value]
+        for order_document in order_documents
+    ]
+
+
+def _create_orders_storage(exchange_manager, database):
+    orders_storage = storage.OrdersStorage(exchange_manager)
+    orders_storage.should_store_data = mock.Mock(return_value=True)
+    orders_storage._get_db = mock.Mock(return_value=database)
+    return orders_storage
+
+
+async def test_delta_log_restore(backtesting_trader, tmp_path):
+    config, exchange_manager, trader = backtesting_trader
+    orders_manager = exchange_manager.exchange_personal_data.orders_manager
+    database = commons_databases.DBWriterReader(str(tmp_path / "orders.json"))
+    with mock.patch.object(storage.OrdersStorage, "ENABLE_DELTA_LOG", True), \
+            mock.patch.object(storage.OrdersStorage, "MIN_LOG_COMPACTION_SIZE", 10):
+        orders_storage = _create_orders_storage(exchange_manager, database)
+        order_1 = await _create_open_order(trader, 1, exchange_order_id="exchange_1")
+        order_2 = await _create_open_order(trader, 2)
+        await orders_storage.store_history()
+        assert _get_order_ids(await database.all(orders_storage.HISTORY_TABLE)) == ["order_1", "order_2"]
+
+        # updates are logged without rewriting the open orders snapshot
+        order_3 = await _create_open_order(trader, 3, exchange_order_id="exchange_3")
+        await orders_storage._log_order_update(order_3.to_dict())
+        orders_manager.remove_order_instance(order_1)
+        await orders_storage._log_order_update(order_1.to_dict())
+        # exchange order id received after the order creation
+        order_2.exchange_order_id = "exchange_2"
+        await orders_storage._log_order_update(order_2.to_dict())
+        assert _get_order_ids(await database.all(orders_storage.HISTORY_TABLE)) == ["order_1", "order_2"]
+        orders_log = await database.all(orders_storage.HISTORY_LOG_TABLE)
+        assert [log_entry[enums.StoredOrdersAttr.ORDER_ID.value] for log_entry in orders_log] == \
+            ["order_3", "order_1", "order_2"]
+        # removed orders are logged without details
+        assert orders_log[1][enums.StoredOrdersAttr.ORDER_EXCHANGE_ID.value] == "exchange_1"
+        assert orders_log[1][enums.StoredOrdersAttr.ORDER_DETAILS.value] is None
+        assert orders_storage._log_size == 3
+
+        # restart: startup orders are the snapshot with logged updates
+        restarted_orders_storage = _create_orders_storage(exchange_manager, database)
+        await restarted_orders_storage._load_startup_orders()
+        assert sorted(restarted_orders_storage.startup_orders) == ["exchange_2", "exchange_3"]
+        startup_order_2 = await restarted_orders_storage.get_startup_order_details("exchange_2")
+        assert startup_order_2[constants.STORAGE_ORIGIN_VALUE][enums.ExchangeConstantsOrderColumns.ID.value] == \
+            "order_2"
+        assert startup_order_2[constants.STORAGE_ORIGIN_VALUE][enums.ExchangeConstantsOrderColumns.PRICE.value] == \
+            decimal.Decimal("62")
+        assert await restarted_orders_storage.get_startup_order_details("exchange_1") is None
+        # logged updates are compacted into a new snapshot
+        assert sorted(_get_order_ids(await database.all(orders_storage.HISTORY_TABLE))) == ["order_2", "order_3"]
+        assert await database.all(orders_storage.HISTORY_LOG_TABLE) == []
+        assert restarted_orders_storage._log_size == 0
+    await database.close()
+
+
+async def test_delta_log_compaction(backtesting_trader, tmp_path):
+    config, exchange_manager, trader = backtesting_trader
+    database = commons_databases.DBWriterReader(str(tmp_path / "orders.json"))
+    with mock.patch.object(storage.OrdersStorage, "ENABLE_DELTA_LOG", True), \
+            mock.patch.object(storage.OrdersStorage, "MIN_LOG_COMPACTION_SIZE", 3):
+        orders_storage = _create_orders_storage(exchange_manager, database)
+        orders = [await _create_open_order(trader, index) for index in range(2)]
+        # compacted after MIN_LOG_COMPACTION_SIZE updates when there are less open orders
+        for _ in range(2):
+            await orders_storage._log_order_update(orders[0].to_dict())
+        assert len(await database.all(orders_storage.HISTORY_LOG_TABLE)) == 2
+        assert await database.all(orders_storage.HISTORY_TABLE) == []
+        await orders_storage._log_order_update(orders[0].to_dict())
+        assert await database.all(orders_storage.HISTORY_LOG_TABLE) == []
+        assert _get_order_ids(await database.all(orders_storage.HISTORY_TABLE)) == ["order_0", "order_1"]
+        assert orders_storage._log_size == 0
+
+        # compacted after open orders count updates otherwise
+        orders += [await _create_open_order(trader, index) for index in range(2, 5)]
+        for _ in range(4):
+            await orders_storage._log_order_update(orders[-1].to_dict())
+        assert len(await database.all(orders_storage.HISTORY_LOG_TABLE)) == 4
+        assert _get_order_ids(await database.all(orders_storage.HISTORY_TABLE)) == ["order_0", "order_1"]
+        await orders_storage._log_order_update(orders[-1].to_dict())
+        assert await database.all(orders_storage.HISTORY_LOG_TABLE) == []
+        assert _get_order_ids(await database.all(orders_storage.HISTORY_TABLE)) == \
+            [f"order_{index}" for index in range(5)]
+    await database.close()
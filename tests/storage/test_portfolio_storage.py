@@ -0,0 +1,82 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import mock
+import pytest
+
+import octobot_commons.databases as commons_databases
+import octobot_commons.display as commons_display
+
+import octobot_trading.storage as storage
+
+from tests.exchanges import backtesting_trader_with_historical_pf_value_manager, \
+    backtesting_trader, backtesting_config, backtesting_exchange_manager, fake_backtesting
+from tests import event_loop
+
+pytestmark = pytest.mark.asyncio
+
+DAY_1, DAY_2, DAY_3, DAY_4, DAY_5 = 1648425600, 1648512000, 1648598400, 1648684800, 1648771200
+
+
+async def test_store_history_changes(backtesting_trader_with_historical_pf_value_manager, tmp_path):
+    config, exchange_manager, trader = backtesting_trader_with_historical_pf_value_manager
+    historical_portfolio_value_manager = \
+        exchange_manager.exchange_personal_data.portfolio_manager.historical_portfolio_value_manager
+    historical_portfolio_value_manager.max_history_size = 3
+    database = commons_databases.DBWriterReader(str(tmp_path / "portfolio.json"))
+    portfolio_storage = storage.PortfolioStorage(exchange_manager, commons_display.PlotSettings())
+    portfolio_storage.MAX_PENDING_REMOVED_TIMESTAMPS = 2
+    with mock.patch.object(portfolio_storage, "_get_db", mock.Mock(return_value=database)), \
+         mock.patch.object(database, "replace_all", mock.AsyncMock()) as replace_all_mock:
+        # existing history is replaced on first store
+        await database.log_many(portfolio_storage.HISTORY_TABLE, [{"t": 1, "v": {"BTC": 0}}], cache=False)
+        await historical_portfolio_value_manager.on_new_values(
+            {DAY_1: {"BTC": 1}, DAY_2: {"BTC": 2}}, save_changes=False
+        )
+        await portfolio_storage.store_history()
+        assert await database.all(portfolio_storage.HISTORY_TABLE) == [
+            {"t": DAY_1, "v": {"BTC": 1}}, {"t": DAY_2, "v": {"BTC": 2}}
+        ]
+        assert portfolio_storage._to_update_auth_data_ids_buffer == {DAY_1, DAY_2}
+
+        # then only changes are stored
+        await historical_portfolio_value_manager.on_new_values(
+            {DAY_2: {"BTC": 3}, DAY_3: {"BTC": 4}}, save_changes=False, force_update=True
+        )
+        with mock.patch.object(database, "all", mock.AsyncMock()) as all_mock:
+            await portfolio_storage.store_history()
+            all_mock.assert_not_called()
+        assert await database.all(portfolio_storage.HISTORY_TABLE) == [
+            {"t": DAY_1, "v": {"BTC": 1}}, {"t": DAY_2, "v": {"BTC": 3}}, {"t": DAY_3, "v": {"BTC": 4}}
+        ]
+
+        # removed values are removed by batch
+        await historical_portfolio_value_manager.on_new_values({DAY_4: {"BTC": 5}}, save_changes=False)
+        await portfolio_storage.store_history()
+        assert len(await database.all(portfolio_storage.HISTORY_TABLE)) == 4
+        assert portfolio_storage._pending_removed_timestamps == [DAY_1]
+        await historical_portfolio_value_manager.on_new_values(
+            {DAY_4: {"BTC": 6}, DAY_5: {"BTC": 7}}, save_changes=False, force_update=True
+        )
+        await portfolio_storage.store_history()
+        assert portfolio_storage._pending_removed_timestamps == []
+        stored_history = [{"t": DAY_3, "v": {"BTC": 4}}, {"t": DAY_4, "v": {"BTC": 6}}, {"t": DAY_5, "v": {"BTC": 7}}]
+        assert await database.all(portfolio_storage.HISTORY_TABLE) == stored_history
+
+        # reset: the whole history is stored
+        await portfolio_storage.store_history(reset=True)
+        assert await database.all(portfolio_storage.HISTORY_TABLE) == stored_history
+        replace_all_mock.assert_not_called()
+    await database.close()
@@ -0,0 +1,218 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import asyncio
+import pytest
+import pytest_asyncio
+
+import octobot_trading.enums as enums
+import octobot_trading.storage as storage
+
+pytestmark = pytest.mark.asyncio
+
+
+class _Database:
+    def __init__(self):
+        self.tables = {}
+        self.calls = []
+
+    async def log_many(self, table_name, rows, cache=True):
+        self.calls.append(("log_many", table_name, len(rows)))
+        self.tables.setdefault(table_name, []).extend(rows)
+
+    async def replace_all(self, table_name, rows, cache=True):
+        self.calls.append(("replace_all", table_name, len(rows)))
+        self.tables[table_name] = list(rows)
+
+    async def delete_all(self, table_name):
+        self.calls.append(("delete_all", table_name, 0))
+        self.tables[table_name] = []
+
+    def is_hard_reset_error(self, error):
+        return False
+
+
+class _FailingDatabase(_Database):
+    def __init__(self, failing_table_name, hard_reset_error=False):
+        super().__init__()
+        self.failing_table_name = failing_table_name
+        self.hard_reset_error = hard_reset_error
+        self.hard_resets = 0
+        self.on_log_many = None
+
+    async def log_many(self, table_name, rows, cache=True):
+        if self.on_log_many is not None:
+            await self.on_log_many()
+        if table_name == self.failing_table_name:
+            raise RuntimeError("write error")
+        await super().log_many(table_name, rows, cache=cache)
+
+    def is_hard_reset_error(self, error):
+        return self.hard_reset_error
+
+    async def hard_reset(self):
+        self.hard_resets += 1
+
+
+@pytest_asyncio.fixture
+async def writer():
+    storage_writer = storage.StorageWriter()
+    storage_writer.batch_interval = 0.01
+    yield storage_writer
+    await storage_writer.stop()
+
+
+async def test_log_and_coalesce(writer):
+    database = _Database()
+    await writer.log(database, "trades", {"id": 1, "v": 1}, key=1)
+    await writer.log(database, "trades", {"id": 2, "v": 1}, key=2)
+    await writer.log(database, "trades", {"id": 1, "v": 2}, key=1)
+    await writer.log(database, "trades", {"id": None})
+    await writer.log(database, "trades", {"id": None})
+    assert database.calls == []
+    assert writer.get_metrics()["queue_depth"] == 4
+    assert writer.metrics.coalesced_documents == 1
+    await writer.flush(database)
+    assert database.calls == [("log_many", "trades", 4)]
+    assert database.tables["trades"] == [{"id": 1, "v": 2}, {"id": 2, "v": 1}, {"id": None}, {"id": None}]
+    metrics = writer.get_metrics()
+    assert metrics["queue_depth"] == 0
+    assert metrics["max_queue_depth"] == 4
+    assert metrics["batches"] == 1
+    assert metrics["written_documents"] == metrics["last_batch_size"] == metrics["average_batch_size"] == 4
+
+
+async def test_replace_all_supersedes_pending_writes(writer):
+    database = _Database()
+    await writer.log(database, "orders", {"id": 1})
+    await writer.replace_all(database, "orders", [{"id": 2}, {"id": 3}])
+    await writer.log(database, "orders", {"id": 4})
+    await writer.log(database, "orders_log", {"id": 5})
+    await writer.delete_all(database, "orders_log")
+    assert writer.metrics.coalesced_documents == 2
+    assert writer.metrics.queue_depth == 3
+    await writer.flush()
+    assert database.calls == [
+        ("replace_all", "orders", 2), ("log_many", "orders", 1), ("delete_all", "orders_log", 0)
+    ]
+    assert database.tables == {"orders": [{"id": 2}, {"id": 3}, {"id": 4}], "orders_log": []}
+
+
+async def test_background_writes(writer):
+    database = _Database()
+    other_database = _Database()
+    for index in range(10):
+        await writer.log(database, "trades", {"id": index})
+    await writer.log(other_database, "trades", {"id": 0})
+    await asyncio.sleep(0.05)
+    assert len(database.tables["trades"]) == 10
+    assert len(other_database.tables["trades"]) == 1
+    assert writer.metrics.batches == 1
+    assert writer.metrics.written_documents == 11
+    assert writer.metrics.queue_depth == 0
+    assert writer._task.done()
+    await writer.stop()
+
+
+async def test_discard(writer):
+    database = _Database()
+    await writer.log(database, "trades", {"id": 0})
+    writer.discard(database, "trades")
+    assert writer.metrics.queue_depth == 0
+    await writer.flush()
+    assert database.calls == []
+
+
+async def test_backpressure(writer):
+    database = _Database()
+    writer.max_table_buffer_size = 2
+    writer.backpressure_policy = enums.StorageWriterBackpressurePolicy.DROP_OLDEST
+    for index in range(4):
+        await writer.log(database, "trades", {"id": index})
+    assert writer.metrics.dropped_documents == 2
+    await writer.flush()
+    assert database.tables["trades"] == [{"id": 2}, {"id": 3}]
+
+    writer.backpressure_policy = enums.StorageWriterBackpressurePolicy.WRITE_INLINE
+    for index in range(4, 9):
+        await writer.log(database, "trades", {"id": index})
+    # writes 2 documents when logging the 3rd and 5th ones
+    assert writer.metrics.inline_writes == 2
+    assert len(database.tables["trades"]) == 6
+    await writer.flush()
+    assert [document["id"] for document in database.tables["trades"]] == list(range(2, 9))
+
+
+async def test_backpressure_required_documents(writer):
+    database = _Database()
+    writer.max_table_buffer_size = 2
+    writer.backpressure_policy = enums.StorageWriterBackpressurePolicy.DROP_OLDEST
+    for index in range(5):
+        await writer.log(database, "orders_log", {"id": index}, required=True)
+    # written inline instead of being dropped
+    assert writer.metrics.dropped_documents == 0
+    assert writer.metrics.inline_writes == 2
+    await writer.flush()
+    assert [document["id"] for document in database.tables["orders_log"]] == list(range(5))
+    # other tables documents can still be dropped
+    for index in range(3):
+        await writer.log(database, "trades", {"id": index})
+    assert writer.metrics.dropped_documents == 1
+
+
+async def test_failed_writes_are_retried(writer):
+    database = _FailingDatabase("orders_log")
+    await writer.replace_all(database, "orders_log", [{"id": 0}])
+    await writer.log(database, "orders_log", {"id": 1}, key=1, required=True)
+    await writer.log(database, "orders_log", {"id": 2}, key=2, required=True)
+    await writer.log(database, "trades", {"id": 0})
+    await writer.flush()
+    # other tables are written
+    assert database.tables == {"orders_log": [{"id": 0}], "trades": [{"id": 0}]}
+    assert writer.metrics.errors == 1
+    assert writer.metrics.written_documents == 2
+    assert writer.metrics.queue_depth == 2
+
+
+    async def _log_during_write():
+        database.on_log_many = None
+        await writer.log(database, "orders_log", {"id": 3}, key=3, required=True)
+        await writer.log(database, "orders_log", {"id": 1, "v": 2}, key=1, required=True)
+
+    # unwritten documents are written before the ones logged during the write
+    database.on_log_many = _log_during_write
+    await writer.flush()
+    assert writer.metrics.errors == 2
+    assert writer.metrics.queue_depth == 3
+    assert writer.metrics.coalesced_documents == 1
+    database.failing_table_name = None
+    await writer.flush()
+    assert database.tables["orders_log"] == [{"id": 0}, {"id": 1, "v": 2}, {"id": 2}, {"id": 3}]
+    assert writer.metrics.written_documents == 5
+    assert writer.metrics.queue_depth == 0
+
+
+async def test_failed_writes_after_hard_reset_are_retried(writer):
+    database = _FailingDatabase("orders_log", hard_reset_error=True)
+    await writer.log(database, "orders_log", {"id": 0})
+    await writer.log(database, "trades", {"id": 0})
+    await writer.flush()
+    assert database.hard_resets == 1
+    assert database.tables == {"trades": [{"id": 0}]}
+    database.failing_table_name = None
+    # retried by the background task
+    await asyncio.sleep(0.05)
+    assert database.tables == {"orders_log": [{"id": 0}], "trades": [{"id": 0}]}
+    assert writer.metrics.queue_depth == 0
@@ -0,0 +1,141 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import asyncio
+import pytest
+
+import octobot_commons.asyncio_tools as asyncio_tools
+import octobot_commons.enums as commons_enums
+
+import octobot_trading.constants as constants
+import octobot_trading.enums as enums
+import octobot_trading.errors as errors
+import octobot_trading.exchange_channel as exchanges_channel
+from tests.exchanges import simulated_exchange_manager
+from tests import event_loop
+
+pytestmark = pytest.mark.asyncio
+
+
+async def _callback(**kwargs):
+    pass
+
+
+async def test_get_filtered_consumers_index(simulated_exchange_manager):
+    channel = exchanges_channel.get_chan(constants.TICKER_CHANNEL, simulated_exchange_manager.id)
+    initial_consumers = channel.get_filtered_consumers(symbol="BTC/USDT")
+    btc_consumer = await channel.new_consumer(_callback, symbol="BTC/USDT", cryptocurrency="BTC")
+    wildcard_consumer = await channel.new_consumer(_callback)
+    btc_consumers = channel.get_filtered_consumers(symbol="BTC/USDT")
+    assert btc_consumers == initial_consumers + [btc_consumer, wildcard_consumer]
+    # indexed list
+    assert channel.get_filtered_consumers(symbol="BTC/USDT") is btc_consumers
+    assert btc_consumer not in channel.get_filtered_consumers(symbol="ETH/USDT")
+    assert wildcard_consumer in channel.get_filtered_consumers(symbol="ETH/USDT")
+    assert channel.get_filtered_consumers(cryptocurrency="BTC", symbol="BTC/USDT") == btc_consumers
+    assert btc_consumer in channel.get_filtered_consumers()
+
+    # index is reset on removal
+    await channel.remove_consumer(btc_consumer)
+    assert channel.get_filtered_consumers(symbol="BTC/USDT") == initial_consumers + [wildcard_consumer]
+    await channel.remove_consumer(wildcard_consumer)
+    assert channel.get_filtered_consumers(symbol="BTC/USDT") == initial_consumers
+
+
+async def test_time_frame_get_filtered_consumers_index(simulated_exchange_manager):
+    channel = exchanges_channel.get_chan(constants.KLINE_CHANNEL, simulated_exchange_manager.id)
+    initial_consumers = channel.get_filtered_consumers(symbol="BTC/USDT", time_frame=commons_enums.TimeFrames.ONE_HOUR)
+    one_hour_consumer = await channel.new_consumer(
+        _callback, symbol="BTC/USDT", time_frame=commons_enums.TimeFrames.ONE_HOUR
+    )
+    time_frames_consumer = await channel.new_consumer(
+        _callback, symbol="BTC/USDT",
+        time_frame=[commons_enums.TimeFrames.ONE_HOUR, commons_enums.TimeFrames.ONE_DAY]
+    )
+    assert channel.get_filtered_consumers(symbol="BTC/USDT", time_frame=commons_enums.TimeFrames.ONE_HOUR) == \
+        initial_consumers + [one_hour_consumer, time_frames_consumer]
+    assert time_frames_consumer in \
+        channel.get_filtered_consumers(symbol="BTC/USDT", time_frame=commons_enums.TimeFrames.ONE_DAY)
+    assert one_hour_consumer not in \
+        channel.get_filtered_consumers(symbol="BTC/USDT", time_frame=commons_enums.TimeFrames.ONE_DAY)
+    assert one_hour_consumer not in \
+        channel.get_filtered_consumers(symbol="ETH/USDT", time_frame=commons_enums.TimeFrames.ONE_HOUR)
+    await channel.remove_consumer(one_hour_consumer)
+    await channel.remove_consumer(time_frames_consumer)
+    assert channel.get_filtered_consumers(symbol="BTC/USDT", time_frame=commons_enums.TimeFrames.ONE_HOUR) == \
+        initial_consumers
+
+
+async def test_conflated_queue():
+    queue = exchanges_channel.ConflatedQueue(maxsize=2)
+    await queue.put({"symbol": "BTC/USDT", "time_frame": "1h", "value": 1})
+    await queue.put({"symbol": "BTC/USDT", "time_frame": "1d", "value": 2})
+    await queue.put({"symbol": "BTC/USDT", "time_frame": "1h", "value": 3})
+    assert queue.qsize() == 2
+    assert queue.get_counters() == {
+        "delivered_messages": 0, "merged_messages": 1, "dropped_messages": 0, "pending_messages": 2
+    }
+    # full queue: drop oldest
+    await queue.put({"symbol": "ETH/USDT", "value": 4})
+    assert queue.dropped_messages == 1
+    assert await queue.get() == {"symbol": "BTC/USDT", "time_frame": "1d", "value": 2}
+    assert await queue.get() == {"symbol": "ETH/USDT", "value": 4}
+    assert queue.empty()
+    assert queue.get_counters() == {
+        "delivered_messages": 2, "merged_messages": 1, "dropped_messages": 1, "pending_messages": 0
+    }
+    for _ in range(2):
+        queue.task_done()
+    await queue.join()
+
+
+async def test_conflated_queue_max_rate():
+    queue = exchanges_channel.ConflatedQueue(max_rate=20)
+    queue.put_nowait({"symbol": "BTC/USDT", "value": 1})
+    assert await queue.get() == {"symbol": "BTC/USDT", "value": 1}
+    queue.put_nowait({"symbol": "BTC/USDT", "value": 2})
+    get_task = asyncio.create_task(queue.get())
+    await asyncio_tools.wait_asyncio_next_cycle()
+    # throttled: latest value is returned
+    queue.put_nowait({"symbol": "BTC/USDT", "value": 3})
+    assert not get_task.done()
+    assert await asyncio.wait_for(get_task, 1) == {"symbol": "BTC/USDT", "value": 3}
+    assert queue.merged_messages == 1
+
+
+async def test_new_consumer_with_conflation(simulated_exchange_manager):
+    ticker_channel = exchanges_channel.get_chan(constants.TICKER_CHANNEL, simulated_exchange_manager.id)
+    consumer = await ticker_channel.new_consumer(
+        _callback, symbol="BTC/USDT", conflation_policy=enums.ChannelConflationPolicy.KEEP_LATEST
+    )
+    assert isinstance(consumer.queue, exchanges_channel.ConflatedQueue)
+    assert ticker_channel.get_conflation_counters() == {consumer: consumer.queue.get_counters()}
+    await ticker_channel.remove_consumer(consumer)
+
+    regular_consumer = await ticker_channel.new_consumer(_callback, symbol="BTC/USDT")
+    assert not isinstance(regular_consumer.queue, exchanges_channel.ConflatedQueue)
+    assert ticker_channel.get_conflation_counters() == {}
+    await ticker_channel.remove_consumer(regular_consumer)
+
+    trades_channel = exchanges_channel.get_chan(constants.RECENT_TRADES_CHANNEL, simulated_exchange_manager.id)
+    with pytest.raises(errors.NotSupported):
+        await trades_channel.new_consumer(
+            _callback, symbol="BTC/USDT", conflation_policy=enums.ChannelConflationPolicy.KEEP_LATEST
+        )
+    order_book_channel = exchanges_channel.get_chan(constants.ORDER_BOOK_CHANNEL, simulated_exchange_manager.id)
+    with pytest.raises(errors.NotSupported):
+        await order_book_channel.new_consumer(
+            _callback, symbol="BTC/USDT", delta=True, conflation_policy=enums.ChannelConflationPolicy.KEEP_LATEST
+        )
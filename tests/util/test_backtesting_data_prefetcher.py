@@ -0,0 +1,135 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import json
+import mock
+import pytest
+import pytest_asyncio
+
+import octobot_backtesting.enums as backtesting_enums
+import octobot_backtesting.importers as importers
+import octobot_commons.enums as commons_enums
+
+import octobot_trading.util as util
+from tests import event_loop
+
+pytestmark = pytest.mark.asyncio
+
+EXCHANGE_NAME = "binance"
+MINUTE = 60
+START = 1000 * MINUTE
+# one order book every 2 minutes with a missing order book at 20 minutes and an additional one at 30.5 minutes
+ORDER_BOOK_TIMES = sorted(
+    [START + index * 2 * MINUTE for index in range(50) if index != 10] + [START + 30 * MINUTE + 30]
+)
+
+
+def _order_book(index, timestamp):
+    return [[timestamp + index, 1]], [[timestamp - index, 2]]
+
+
+@pytest_asyncio.fixture
+async def importer(tmp_path):
+    file_path = tmp_path / "data.data"
+    file_path.touch()
+    importer = importers.ExchangeDataImporter({}, str(file_path))
+    importer.load_database()
+    await importer.database.initialize()
+    for symbol in ("BTC/USDT", "ETH/USDT"):
+        order_books = [_order_book(index, timestamp) for index, timestamp in enumerate(ORDER_BOOK_TIMES)]
+        await importer.database.insert_all(
+            backtesting_enums.ExchangeDataTables.ORDER_BOOK,
+            timestamp=ORDER_BOOK_TIMES,
+            exchange_name=EXCHANGE_NAME, cryptocurrency=symbol.split("/")[0], symbol=symbol,
+            asks=[json.dumps(asks) for asks, _ in order_books], bids=[json.dumps(bids) for _, bids in order_books]
+        )
+    klines = [[START + index * MINUTE, 1, 2, 0.5, 1.5, index] for index in range(10)]
+    for time_frame in (commons_enums.TimeFrames.ONE_MINUTE, commons_enums.TimeFrames.ONE_HOUR):
+        await importer.database.insert_all(
+            backtesting_enums.ExchangeDataTables.KLINE,
+            timestamp=[kline[0] for kline in klines],
+            exchange_name=EXCHANGE_NAME, cryptocurrency="BTC", symbol="BTC/USDT", time_frame=time_frame.value,
+            candle=[json.dumps(kline if time_frame is commons_enums.TimeFrames.ONE_MINUTE else kline[:-1] + [-1])
+                    for kline in klines]
+        )
+    importer.available_data_types = [backtesting_enums.ExchangeDataTables.ORDER_BOOK,
+                                     backtesting_enums.ExchangeDataTables.KLINE]
+    select_from_timestamp = importer.database.select_from_timestamp
+
+    async def _select_mutable_rows(*args, **kwargs):
+        # selected rows are decoded in place by the importer
+        return [list(row) for row in await select_from_timestamp(*args, **kwargs)]
+
+    try:
+        with mock.patch.object(importer.database, "select_from_timestamp",
+                               mock.AsyncMock(side_effect=_select_mutable_rows)):
+            yield importer
+    finally:
+        await importer.stop()
+
+
+async def test_get_next_data(importer):
+    with mock.patch.object(importer, "get_order_book", mock.AsyncMock(wraps=importer.get_order_book)) \
+            as get_order_book_mock:
+        prefetcher = util.BacktestingDataPrefetcher(
+            importer, backtesting_enums.ExchangeDataTables.ORDER_BOOK, EXCHANGE_NAME, MINUTE, window_ticks=15
+        )
+        for timestamp in range(START - 5 * MINUTE, START + 99 * MINUTE, MINUTE):
+            for symbol in ("BTC/USDT", "ETH/USDT"):
+                # first order book from timestamp
+                index, order_book_time = next(
+                    (index, order_book_time)
+                    for index, order_book_time in enumerate(ORDER_BOOK_TIMES)
+                    if order_book_time >= timestamp
+                )
+                asks, bids = _order_book(index, order_book_time)
+                order_book = await prefetcher.get_next_data(symbol, timestamp)
+                assert order_book[0] == order_book_time
+                assert order_book[3] == symbol
+                assert order_book[-2:] == [asks, bids]
+        # 1 query per 15 minutes and per symbol
+        assert get_order_book_mock.await_count == prefetcher.loaded_windows_count == 7 * 2
+        # after data end
+        assert await prefetcher.get_next_data("BTC/USDT", START + 99 * MINUTE) is None
+        assert get_order_book_mock.await_count == 7 * 2
+        # unknown symbol: empty windows are read until data end
+        assert await prefetcher.get_next_data("XRP/USDT", START) is None
+        assert await prefetcher.get_next_data("XRP/USDT", START + MINUTE) is None
+        assert get_order_book_mock.await_count == 7 * 3
+
+
+async def test_get_next_data_after_gap(importer):
+    prefetcher = util.BacktestingDataPrefetcher(
+        importer, backtesting_enums.ExchangeDataTables.ORDER_BOOK, EXCHANGE_NAME, MINUTE, window_ticks=1
+    )
+    assert (await prefetcher.get_next_data("BTC/USDT", START - 10 * MINUTE))[0] == START
+    assert prefetcher.loaded_windows_count == 10
+    # data are selected from the given timestamp
+    assert (await prefetcher.get_next_data("BTC/USDT", START + 19 * MINUTE))[0] == START + 22 * MINUTE
+    assert prefetcher.loaded_windows_count == 10 + 3
+
+
+async def test_get_next_data_with_time_frame(importer):
+    prefetcher = util.BacktestingDataPrefetcher(
+        importer, backtesting_enums.ExchangeDataTables.KLINE, EXCHANGE_NAME, MINUTE, window_ticks=4
+    )
+    for timestamp in range(START, START + 10 * MINUTE, MINUTE):
+        assert await prefetcher.get_next_data("BTC/USDT", timestamp, time_frame=commons_enums.TimeFrames.ONE_MINUTE) \
+            == [timestamp, EXCHANGE_NAME, "BTC", "BTC/USDT", commons_enums.TimeFrames.ONE_MINUTE.value,
+                [timestamp, 1, 2, 0.5, 1.5, (timestamp - START) // MINUTE]]
+        assert (await prefetcher.get_next_data("BTC/USDT", timestamp, time_frame=commons_enums.TimeFrames.ONE_HOUR)
+                )[-1] == [timestamp, 1, 2, 0.5, 1.5, -1]
+    assert await prefetcher.get_next_data("BTC/USDT", START + 10 * MINUTE,
+                                          time_frame=commons_enums.TimeFrames.ONE_MINUTE) is None
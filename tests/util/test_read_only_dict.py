@@ -0,0 +1,64 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import copy
+import pickle
+import pytest
+
+import octobot_trading.util as util
+
+
+def test_to_read_only():
+    value = {"a": {"b": [1, {"c": 2}]}, "d": None}
+    read_only = util.to_read_only(value)
+    assert read_only == {"a": {"b": (1, {"c": 2})}, "d": None}
+    assert isinstance(read_only, util.ReadOnlyDict)
+    assert isinstance(read_only["a"], util.ReadOnlyDict)
+    assert isinstance(read_only["a"]["b"][1], util.ReadOnlyDict)
+    # source value is not shared
+    value["a"]["b"].append(3)
+    assert read_only["a"]["b"] == (1, {"c": 2})
+
+
+def test_read_only_dict_updates():
+    read_only = util.to_read_only({"a": {"b": 1}})
+    with pytest.raises(TypeError):
+        read_only["c"] = 1
+    with pytest.raises(TypeError):
+        del read_only["a"]
+    with pytest.raises(TypeError):
+        read_only["a"].update({"b": 2})
+    with pytest.raises(TypeError):
+        read_only["a"].pop("b")
+    with pytest.raises(TypeError):
+        read_only.setdefault("c", 1)
+    with pytest.raises(TypeError):
+        read_only.clear()
+    assert read_only == {"a": {"b": 1}}
+
+
+def test_read_only_dict_copies():
+    read_only = util.to_read_only({"a": {"b": 1}})
+    shallow_copy = read_only.copy()
+    shallow_copy["c"] = 1
+    assert type(shallow_copy) is dict
+    assert type(copy.copy(read_only)) is dict
+    deep_copy = copy.deepcopy(read_only)
+    deep_copy["a"]["b"] = 2
+    assert type(deep_copy["a"]) is dict
+    assert read_only == {"a": {"b": 1}}
+    unpickled = pickle.loads(pickle.dumps(read_only))
+    assert unpickled == read_only
+    assert isinstance(unpickled, util.ReadOnlyDict)